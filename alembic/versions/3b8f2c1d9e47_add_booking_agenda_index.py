@@ -0,0 +1,31 @@
+"""Add per-professional agenda index on bookings
+
+Revision ID: 3b8f2c1d9e47
+Revises: 91d45968ac75
+Create Date: 2026-10-16 09:12:41.508211
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f2c1d9e47'
+down_revision = '91d45968ac75'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_bookings_professional_scheduled',
+        'bookings',
+        ['professional_id', 'scheduled_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_bookings_professional_scheduled', table_name='bookings', if_exists=True)
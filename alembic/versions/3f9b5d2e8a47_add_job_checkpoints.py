@@ -0,0 +1,43 @@
+"""Add job checkpoints
+
+Revision ID: 3f9b5d2e8a47
+Revises: 8c4e1f7a2b36
+Create Date: 2026-10-16 19:11:27.840152
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9b5d2e8a47'
+down_revision = '8c4e1f7a2b36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'job_checkpoints',
+        sa.Column('job_name', sa.String(length=100), nullable=False),
+        sa.Column('phase', sa.String(length=50), nullable=False, comment="Phase of the run ('completed' once it finished)"),
+        sa.Column('run_started_at', sa.DateTime(timezone=True), nullable=False, comment='Reference time of the run, kept when it is resumed'),
+        sa.Column('cursor', sa.Integer(), nullable=False, comment='Last ID processed in the current phase'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('job_name'),
+    )
+    # Candidates of the batch no-show detection, scanned in ID order
+    op.create_index(
+        'idx_bookings_no_show_candidates',
+        'bookings',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('CONFIRMED', 'IN_PROGRESS') AND marked_no_show_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_bookings_no_show_candidates', table_name='bookings')
+    op.drop_table('job_checkpoints')
@@ -0,0 +1,172 @@
+"""Rebuild booking reporting views and add refresh log
+
+Revision ID: 5d7e9a1c3f20
+Revises: 3b8f2c1d9e47
+Create Date: 2026-10-16 14:03:27.118604
+
+Booking statuses are stored by enum name (e.g. 'COMPLETED'), so the
+booking-based views created in 91d45968ac75 never matched any status.
+professional_performance_mv is now aggregated per month only: grouping by
+week and month produced duplicate (week, professional) rows for weeks that
+span two months, which breaks REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7e9a1c3f20'
+down_revision = '3b8f2c1d9e47'
+branch_labels = None
+depends_on = None
+
+
+BOOKING_METRICS_VIEW = """
+    CREATE MATERIALIZED VIEW booking_metrics_mv AS
+    SELECT
+        DATE_TRUNC('day', b.scheduled_at) as metric_date,
+        p.salon_id,
+        -- Booking counts
+        COUNT(*) as total_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'COMPLETED') as completed_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'CANCELLED') as cancelled_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'NO_SHOW') as no_show_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'CONFIRMED') as confirmed_bookings,
+
+        -- Revenue metrics
+        COALESCE(SUM(b.service_price) FILTER (WHERE b.status = 'COMPLETED'), 0) as completed_revenue,
+        AVG(b.service_price) FILTER (WHERE b.status = 'COMPLETED') as avg_booking_value,
+        COALESCE(SUM(b.cancellation_fee_amount), 0) as cancellation_fees,
+        COALESCE(SUM(b.no_show_fee_amount), 0) as no_show_fees,
+
+        -- Service metrics
+        COUNT(DISTINCT b.service_id) as unique_services,
+        COUNT(DISTINCT b.professional_id) as unique_professionals,
+        COUNT(DISTINCT b.client_id) as unique_clients,
+
+        -- Time slots analysis
+        COUNT(*) FILTER (WHERE EXTRACT(hour FROM b.scheduled_at) BETWEEN 6 AND 11) as morning_bookings,
+        COUNT(*) FILTER (WHERE EXTRACT(hour FROM b.scheduled_at) BETWEEN 12 AND 17) as afternoon_bookings,
+        COUNT(*) FILTER (WHERE EXTRACT(hour FROM b.scheduled_at) BETWEEN 18 AND 23) as evening_bookings
+    FROM bookings b
+    JOIN professionals p ON b.professional_id = p.id
+    WHERE b.scheduled_at >= CURRENT_DATE - INTERVAL '2 years'
+    GROUP BY
+        DATE_TRUNC('day', b.scheduled_at),
+        p.salon_id;
+"""
+
+PROFESSIONAL_PERFORMANCE_VIEW = """
+    CREATE MATERIALIZED VIEW professional_performance_mv AS
+    SELECT
+        DATE_TRUNC('month', b.scheduled_at) as metric_month,
+        b.professional_id,
+        u.full_name as professional_name,
+        p.salon_id,
+
+        -- Booking metrics
+        COUNT(*) as total_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'COMPLETED') as completed_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'CANCELLED') as cancelled_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'NO_SHOW') as no_show_bookings,
+
+        -- Revenue metrics
+        COALESCE(SUM(b.service_price) FILTER (WHERE b.status = 'COMPLETED'), 0) as total_revenue,
+        AVG(b.service_price) FILTER (WHERE b.status = 'COMPLETED') as avg_booking_value,
+        COALESCE(SUM(b.duration_minutes) FILTER (WHERE b.status = 'COMPLETED'), 0) as total_service_minutes,
+
+        -- Client relationship
+        COUNT(DISTINCT b.client_id) as unique_clients,
+        COUNT(DISTINCT b.service_id) as unique_services,
+        COUNT(DISTINCT DATE(b.scheduled_at)) as active_days
+    FROM bookings b
+    JOIN professionals p ON b.professional_id = p.id
+    JOIN users u ON p.user_id = u.id
+    WHERE b.scheduled_at >= CURRENT_DATE - INTERVAL '1 year'
+    GROUP BY
+        DATE_TRUNC('month', b.scheduled_at),
+        b.professional_id,
+        u.full_name,
+        p.salon_id;
+"""
+
+CUSTOMER_ANALYTICS_VIEW = """
+    CREATE MATERIALIZED VIEW customer_analytics_mv AS
+    SELECT
+        b.client_id,
+        DATE_TRUNC('month', MIN(b.scheduled_at)) as cohort_month,
+        MIN(b.scheduled_at) as first_booking_date,
+        MAX(b.scheduled_at) as last_booking_date,
+
+        -- Customer lifecycle
+        COUNT(*) as total_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'COMPLETED') as completed_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'CANCELLED') as cancelled_bookings,
+        COUNT(*) FILTER (WHERE b.status = 'NO_SHOW') as no_show_bookings,
+
+        -- Revenue metrics
+        COALESCE(SUM(b.service_price) FILTER (WHERE b.status = 'COMPLETED'), 0) as lifetime_value,
+        AVG(b.service_price) FILTER (WHERE b.status = 'COMPLETED') as avg_booking_value,
+
+        -- Behavior patterns
+        COUNT(DISTINCT b.professional_id) as unique_professionals_used,
+        COUNT(DISTINCT b.service_id) as unique_services_used
+    FROM bookings b
+    WHERE b.scheduled_at >= CURRENT_DATE - INTERVAL '2 years'
+    GROUP BY b.client_id;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS booking_metrics_mv;")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS professional_performance_mv;")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS customer_analytics_mv;")
+
+    op.execute(BOOKING_METRICS_VIEW)
+    op.execute("""
+        CREATE UNIQUE INDEX idx_booking_metrics_mv_date_salon
+        ON booking_metrics_mv (metric_date, salon_id);
+    """)
+    op.execute("""
+        CREATE INDEX idx_booking_metrics_mv_salon_date
+        ON booking_metrics_mv (salon_id, metric_date DESC);
+    """)
+
+    op.execute(PROFESSIONAL_PERFORMANCE_VIEW)
+    op.execute("""
+        CREATE UNIQUE INDEX idx_professional_performance_mv_month_prof
+        ON professional_performance_mv (metric_month, professional_id);
+    """)
+    op.execute("""
+        CREATE INDEX idx_professional_performance_mv_salon
+        ON professional_performance_mv (salon_id, metric_month DESC);
+    """)
+
+    op.execute(CUSTOMER_ANALYTICS_VIEW)
+    op.execute("""
+        CREATE UNIQUE INDEX idx_customer_analytics_mv_client
+        ON customer_analytics_mv (client_id);
+    """)
+    op.execute("""
+        CREATE INDEX idx_customer_analytics_mv_last_booking
+        ON customer_analytics_mv (last_booking_date DESC);
+    """)
+
+    op.create_table(
+        'report_view_refreshes',
+        sa.Column('view_name', sa.String(length=100), nullable=False, comment='Materialized view name'),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False, comment='Start time of the last successful refresh'),
+        sa.Column('duration_ms', sa.Integer(), nullable=False, comment='Duration of the last successful refresh'),
+        sa.PrimaryKeyConstraint('view_name'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    The rebuilt views are kept: the previous definitions never matched a
+    booking status.
+    """
+    op.drop_table('report_view_refreshes')
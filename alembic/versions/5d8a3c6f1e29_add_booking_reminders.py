@@ -0,0 +1,35 @@
+"""Add booking reminders
+
+Revision ID: 5d8a3c6f1e29
+Revises: 3f9b5d2e8a47
+Create Date: 2026-10-16 21:02:14.518336
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8a3c6f1e29'
+down_revision = '3f9b5d2e8a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'booking_reminders',
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('minutes_before', sa.Integer(), nullable=False, comment='Minutes before the appointment the reminder fires'),
+        sa.Column('fire_at', sa.DateTime(timezone=True), nullable=False, comment='When the reminder fires'),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('booking_id', 'minutes_before'),
+    )
+    op.create_index('idx_booking_reminders_fire_at', 'booking_reminders', ['fire_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_booking_reminders_fire_at', table_name='booking_reminders')
+    op.drop_table('booking_reminders')
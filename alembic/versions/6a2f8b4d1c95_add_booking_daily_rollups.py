@@ -0,0 +1,90 @@
+"""Add booking daily rollups and their rebuild queue
+
+Revision ID: 6a2f8b4d1c95
+Revises: 5d7e9a1c3f20
+Create Date: 2026-10-16 16:41:08.302917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a2f8b4d1c95'
+down_revision = '5d7e9a1c3f20'
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_ROLLUPS = """
+    INSERT INTO booking_daily_rollups (
+        rollup_date, professional_id, service_id, salon_id,
+        total_bookings, completed_bookings, cancelled_bookings, no_show_bookings,
+        completed_revenue, paid_amount, refunded_amount
+    )
+    SELECT
+        DATE(b.scheduled_at),
+        b.professional_id,
+        b.service_id,
+        p.salon_id,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE b.status = 'COMPLETED'),
+        COUNT(*) FILTER (WHERE b.status = 'CANCELLED'),
+        COUNT(*) FILTER (WHERE b.status = 'NO_SHOW'),
+        COALESCE(SUM(b.service_price) FILTER (WHERE b.status = 'COMPLETED'), 0),
+        COALESCE(SUM(pay.paid_amount), 0),
+        COALESCE(SUM(pay.refunded_amount), 0)
+    FROM bookings b
+    JOIN professionals p ON b.professional_id = p.id
+    LEFT JOIN (
+        SELECT
+            booking_id,
+            SUM(amount) FILTER (WHERE status IN ('succeeded', 'partially_refunded')) as paid_amount,
+            SUM(amount) FILTER (WHERE status = 'refunded') as refunded_amount
+        FROM payments
+        GROUP BY booking_id
+    ) pay ON pay.booking_id = b.id
+    GROUP BY DATE(b.scheduled_at), b.professional_id, b.service_id, p.salon_id;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'booking_daily_rollups',
+        sa.Column('rollup_date', sa.Date(), nullable=False, comment='Day of the bookings (scheduled_at)'),
+        sa.Column('professional_id', sa.Integer(), nullable=False, comment='Professional of the bookings'),
+        sa.Column('service_id', sa.Integer(), nullable=False, comment='Service of the bookings'),
+        sa.Column('salon_id', sa.Integer(), nullable=False, comment='Salon of the professional'),
+        sa.Column('total_bookings', sa.Integer(), nullable=False),
+        sa.Column('completed_bookings', sa.Integer(), nullable=False),
+        sa.Column('cancelled_bookings', sa.Integer(), nullable=False),
+        sa.Column('no_show_bookings', sa.Integer(), nullable=False),
+        sa.Column('completed_revenue', sa.Numeric(precision=12, scale=2), nullable=False, comment='Sum of service_price of completed bookings'),
+        sa.Column('paid_amount', sa.Numeric(precision=12, scale=2), nullable=False, comment='Sum of succeeded (incl. partially refunded) payments'),
+        sa.Column('refunded_amount', sa.Numeric(precision=12, scale=2), nullable=False, comment='Sum of fully refunded payments'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('rollup_date', 'professional_id', 'service_id'),
+    )
+    op.create_index('idx_booking_daily_rollups_salon_date', 'booking_daily_rollups', ['salon_id', 'rollup_date'], unique=False)
+    op.create_index('idx_booking_daily_rollups_service_date', 'booking_daily_rollups', ['service_id', 'rollup_date'], unique=False)
+
+    op.create_table(
+        'rollup_dirty_days',
+        sa.Column('rollup_date', sa.Date(), nullable=False),
+        sa.Column('professional_id', sa.Integer(), nullable=False),
+        sa.Column('marked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('rollup_date', 'professional_id'),
+    )
+    op.create_index(op.f('ix_rollup_dirty_days_marked_at'), 'rollup_dirty_days', ['marked_at'], unique=False)
+
+    op.execute(BACKFILL_ROLLUPS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_rollup_dirty_days_marked_at'), table_name='rollup_dirty_days')
+    op.drop_table('rollup_dirty_days')
+    op.drop_index('idx_booking_daily_rollups_service_date', table_name='booking_daily_rollups')
+    op.drop_index('idx_booking_daily_rollups_salon_date', table_name='booking_daily_rollups')
+    op.drop_table('booking_daily_rollups')
@@ -0,0 +1,67 @@
+"""Add no-show daily rollups
+
+Revision ID: 8c4e1f7a2b36
+Revises: 6a2f8b4d1c95
+Create Date: 2026-10-16 18:02:44.517309
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e1f7a2b36'
+down_revision = '6a2f8b4d1c95'
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_NO_SHOW_ROLLUPS = """
+    INSERT INTO no_show_daily_rollups (
+        rollup_date, professional_id, service_id, reason, salon_id,
+        no_show_bookings, no_show_fees
+    )
+    SELECT
+        DATE(b.scheduled_at),
+        b.professional_id,
+        b.service_id,
+        COALESCE(b.no_show_reason, 'unknown'),
+        p.salon_id,
+        COUNT(*),
+        COALESCE(SUM(b.no_show_fee_amount), 0)
+    FROM bookings b
+    JOIN professionals p ON b.professional_id = p.id
+    WHERE b.status = 'NO_SHOW'
+    GROUP BY DATE(b.scheduled_at), b.professional_id, b.service_id,
+             COALESCE(b.no_show_reason, 'unknown'), p.salon_id;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_booking_daily_rollups_professional_date', 'booking_daily_rollups', ['professional_id', 'rollup_date'], unique=False)
+
+    op.create_table(
+        'no_show_daily_rollups',
+        sa.Column('rollup_date', sa.Date(), nullable=False, comment='Day of the bookings (scheduled_at)'),
+        sa.Column('professional_id', sa.Integer(), nullable=False, comment='Professional of the bookings'),
+        sa.Column('service_id', sa.Integer(), nullable=False, comment='Service of the bookings'),
+        sa.Column('reason', sa.String(length=255), nullable=False, comment="no_show_reason of the bookings ('unknown' when not set)"),
+        sa.Column('salon_id', sa.Integer(), nullable=False, comment='Salon of the professional'),
+        sa.Column('no_show_bookings', sa.Integer(), nullable=False),
+        sa.Column('no_show_fees', sa.Numeric(precision=12, scale=2), nullable=False, comment='Sum of no_show_fee_amount (BRL)'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('rollup_date', 'professional_id', 'service_id', 'reason'),
+    )
+    op.create_index('idx_no_show_daily_rollups_professional_date', 'no_show_daily_rollups', ['professional_id', 'rollup_date'], unique=False)
+    op.create_index('idx_no_show_daily_rollups_salon_date', 'no_show_daily_rollups', ['salon_id', 'rollup_date'], unique=False)
+
+    op.execute(BACKFILL_NO_SHOW_ROLLUPS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_no_show_daily_rollups_salon_date', table_name='no_show_daily_rollups')
+    op.drop_index('idx_no_show_daily_rollups_professional_date', table_name='no_show_daily_rollups')
+    op.drop_table('no_show_daily_rollups')
+    op.drop_index('idx_booking_daily_rollups_professional_date', table_name='booking_daily_rollups')
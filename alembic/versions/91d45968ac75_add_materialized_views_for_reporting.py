@@ -124,7 +124,7 @@ def upgrade() -> None:
             EXTRACT(month FROM p.created_at) as metric_month,
             EXTRACT(year FROM p.created_at) as metric_year,
             1 as unit_id,  -- Default unit ID
-            s.salon_id,
+            s.id as salon_id,
             sv.category,
 
             -- Payment totals
@@ -176,7 +176,7 @@ def upgrade() -> None:
             DATE_TRUNC('day', p.created_at),
             EXTRACT(month FROM p.created_at),
             EXTRACT(year FROM p.created_at),
-            s.salon_id,
+            s.id,
             sv.category;
     """)
 
@@ -201,7 +201,7 @@ def upgrade() -> None:
             DATE_TRUNC('week', b.scheduled_at) as metric_week,
             DATE_TRUNC('month', b.scheduled_at) as metric_month,
             b.professional_id,
-            p.name as professional_name,
+            u.full_name as professional_name,
             p.salon_id,
             s.name as salon_name,
 
@@ -252,6 +252,7 @@ def upgrade() -> None:
             NOW() as last_updated
         FROM bookings b
         JOIN professionals p ON b.professional_id = p.id
+        JOIN users u ON p.user_id = u.id
         JOIN salons s ON p.salon_id = s.id
         JOIN services sv ON b.service_id = sv.id
         LEFT JOIN (
@@ -265,7 +266,7 @@ def upgrade() -> None:
             DATE_TRUNC('week', b.scheduled_at),
             DATE_TRUNC('month', b.scheduled_at),
             b.professional_id,
-            p.name,
+            u.full_name,
             p.salon_id,
             s.name;
     """)
@@ -0,0 +1,90 @@
+"""Add salon search documents
+
+Revision ID: a4c7e2d9f183
+Revises: 5d8a3c6f1e29
+Create Date: 2026-10-16 21:40:27.183904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c7e2d9f183'
+down_revision = '5d8a3c6f1e29'
+branch_labels = None
+depends_on = None
+
+
+# Weighted document: name (A), services (B), professionals (C), description and location (D)
+ADD_SEARCH_VECTOR = """
+    ALTER TABLE salon_search_documents ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese'::regconfig, coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('portuguese'::regconfig, coalesce(services_text, '')), 'B') ||
+        setweight(to_tsvector('portuguese'::regconfig, coalesce(professionals_text, '')), 'C') ||
+        setweight(to_tsvector('portuguese'::regconfig,
+            coalesce(description, '') || ' ' || neighborhood || ' ' || city), 'D')
+    ) STORED;
+"""
+
+# Every existing salon is indexed by the next search.apply_search_index run
+QUEUE_EXISTING_SALONS = """
+    INSERT INTO search_dirty_salons (salon_id)
+    SELECT id FROM salons;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_table(
+        'salon_search_documents',
+        sa.Column('salon_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('city', sa.String(length=100), nullable=False),
+        sa.Column('state', sa.String(length=2), nullable=False),
+        sa.Column('neighborhood', sa.String(length=100), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('categories', postgresql.ARRAY(sa.String(length=100)), nullable=False, comment='Lower-cased categories of the active services'),
+        sa.Column('services_text', sa.Text(), nullable=False, comment='Names and categories of the active services'),
+        sa.Column('professionals_text', sa.Text(), nullable=False, comment='Names and specialties of the active professionals'),
+        sa.Column('min_price', sa.Numeric(precision=10, scale=2), nullable=True, comment='Lowest active service price (BRL)'),
+        sa.Column('max_price', sa.Numeric(precision=10, scale=2), nullable=True, comment='Highest active service price (BRL)'),
+        sa.Column('average_rating', sa.Float(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.Column('indexed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['salon_id'], ['salons.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('salon_id'),
+    )
+    op.execute(ADD_SEARCH_VECTOR)
+    op.create_index('idx_salon_search_documents_vector', 'salon_search_documents', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('idx_salon_search_documents_name_trgm', 'salon_search_documents', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('idx_salon_search_documents_categories', 'salon_search_documents', ['categories'], unique=False, postgresql_using='gin')
+    op.create_index('idx_salon_search_documents_city', 'salon_search_documents', ['city', 'state'], unique=False)
+    op.create_index('idx_salon_search_documents_rating', 'salon_search_documents', ['average_rating'], unique=False)
+
+    op.create_table(
+        'search_dirty_salons',
+        sa.Column('salon_id', sa.Integer(), nullable=False),
+        sa.Column('marked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('salon_id'),
+    )
+    op.create_index(op.f('ix_search_dirty_salons_marked_at'), 'search_dirty_salons', ['marked_at'], unique=False)
+
+    op.execute(QUEUE_EXISTING_SALONS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_search_dirty_salons_marked_at'), table_name='search_dirty_salons')
+    op.drop_table('search_dirty_salons')
+    op.drop_index('idx_salon_search_documents_rating', table_name='salon_search_documents')
+    op.drop_index('idx_salon_search_documents_city', table_name='salon_search_documents')
+    op.drop_index('idx_salon_search_documents_categories', table_name='salon_search_documents')
+    op.drop_index('idx_salon_search_documents_name_trgm', table_name='salon_search_documents')
+    op.drop_index('idx_salon_search_documents_vector', table_name='salon_search_documents')
+    op.drop_table('salon_search_documents')
@@ -0,0 +1,30 @@
+"""Add salon location
+
+Revision ID: c2e8b4f6a091
+Revises: a4c7e2d9f183
+Create Date: 2026-10-16 22:05:51.604128
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2e8b4f6a091'
+down_revision = 'a4c7e2d9f183'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('salons', sa.Column('latitude', sa.Float(), nullable=True, comment='GPS latitude (decimal degrees)'))
+    op.add_column('salons', sa.Column('longitude', sa.Float(), nullable=True, comment='GPS longitude (decimal degrees)'))
+    op.create_index('idx_salons_location', 'salons', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_salons_location', table_name='salons')
+    op.drop_column('salons', 'longitude')
+    op.drop_column('salons', 'latitude')
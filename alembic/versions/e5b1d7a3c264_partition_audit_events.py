@@ -0,0 +1,122 @@
+"""Partition audit_events by month
+
+Revision ID: e5b1d7a3c264
+Revises: c2e8b4f6a091
+Create Date: 2026-10-16 23:12:40.318225
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b1d7a3c264'
+down_revision = 'c2e8b4f6a091'
+branch_labels = None
+depends_on = None
+
+AUDIT_EVENT_INDEXES = [
+    'correlation_id',
+    'event_type',
+    'ip_address',
+    'parent_event_id',
+    'request_id',
+    'resource_id',
+    'resource_type',
+    'session_id',
+    'timestamp',
+    'user_id',
+]
+
+# Months created ahead of the current one; the beat task keeps this window
+MONTHS_AHEAD = 3
+
+
+def _create_audit_events_table(partitioned: bool) -> None:
+    """Create audit_events, range partitioned on timestamp or plain."""
+    op.create_table('audit_events',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('audit_events_id_seq')"), nullable=False),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('severity', sa.String(length=20), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('session_id', sa.String(length=255), nullable=True),
+    sa.Column('user_role', sa.String(length=50), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('user_agent', sa.Text(), nullable=True),
+    sa.Column('request_id', sa.String(length=255), nullable=True),
+    sa.Column('endpoint', sa.String(length=255), nullable=True),
+    sa.Column('http_method', sa.String(length=10), nullable=True),
+    sa.Column('resource_type', sa.String(length=50), nullable=True),
+    sa.Column('resource_id', sa.String(length=100), nullable=True),
+    sa.Column('action', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('old_values', sa.JSON(), nullable=True),
+    sa.Column('new_values', sa.JSON(), nullable=True),
+    sa.Column('event_metadata', sa.JSON(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.Column('correlation_id', sa.String(length=255), nullable=True),
+    sa.Column('parent_event_id', sa.Integer(), nullable=True),
+    sa.Column('success', sa.String(length=10), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    # The partition key must be part of the primary key
+    sa.PrimaryKeyConstraint('id', 'timestamp') if partitioned else sa.PrimaryKeyConstraint('id'),
+    **({'postgresql_partition_by': 'RANGE (timestamp)'} if partitioned else {})
+    )
+    for column in AUDIT_EVENT_INDEXES + ([] if partitioned else ['id']):
+        op.create_index(op.f(f'ix_audit_events_{column}'), 'audit_events', [column], unique=False)
+    op.execute("ALTER SEQUENCE audit_events_id_seq OWNED BY audit_events.id")
+
+
+def _set_aside_audit_events() -> None:
+    """Rename audit_events and free its constraint and index names."""
+    op.execute("ALTER TABLE audit_events RENAME TO audit_events_old")
+    op.execute("ALTER TABLE audit_events_old RENAME CONSTRAINT audit_events_pkey TO audit_events_old_pkey")
+    # Keep the id sequence when the old table is dropped
+    op.execute("ALTER SEQUENCE audit_events_id_seq OWNED BY NONE")
+    for column in AUDIT_EVENT_INDEXES + ['id']:
+        op.execute(f"DROP INDEX IF EXISTS ix_audit_events_{column}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_aside_audit_events()
+    _create_audit_events_table(partitioned=True)
+
+    # One partition per month from the oldest event up to MONTHS_AHEAD
+    # months from now; the names match backend.app.db.partitions
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE((SELECT min("timestamp") FROM audit_events_old), now())),
+                    date_trunc('month', now()) + interval '{MONTHS_AHEAD} months',
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_events FOR VALUES FROM (%L) TO (%L)',
+                    'audit_events_' || to_char(month, '"y"YYYY"m"MM'),
+                    month,
+                    (month + interval '1 month')::date
+                );
+            END LOOP;
+        END $$;
+    """)
+
+    # Catches rows outside every monthly partition, so audit writes keep
+    # working if partition maintenance falls behind
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+
+    op.execute("INSERT INTO audit_events SELECT * FROM audit_events_old")
+    op.drop_table('audit_events_old')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_aside_audit_events()
+    _create_audit_events_table(partitioned=False)
+    op.execute("INSERT INTO audit_events SELECT * FROM audit_events_old")
+    op.drop_table('audit_events_old')
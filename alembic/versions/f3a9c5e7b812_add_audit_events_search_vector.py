@@ -0,0 +1,35 @@
+"""Add audit_events search vector
+
+Revision ID: f3a9c5e7b812
+Revises: e5b1d7a3c264
+Create Date: 2026-10-16 23:48:09.542716
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c5e7b812'
+down_revision = 'e5b1d7a3c264'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Computed on insert; partitions inherit the column and the index
+    op.execute("""
+        ALTER TABLE audit_events ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple'::regconfig, coalesce(action, '')), 'A') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(event_type, '')), 'A') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')
+        ) STORED
+    """)
+    op.create_index('ix_audit_events_search_vector', 'audit_events', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_events_search_vector', table_name='audit_events')
+    op.drop_column('audit_events', 'search_vector')
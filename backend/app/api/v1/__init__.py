@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from backend.app.api.v1.routes import auth, bookings, professionals, scheduling, services, payments, webhooks, refunds, payment_metrics, waitlist, overbooking, multi_service_booking, loyalty, notifications, cancellation_policies, no_show_jobs, audit, reports, platform_reports, optimized_reports, review
+from backend.app.api.v1.routes import auth, bookings, professionals, scheduling, services, payments, webhooks, refunds, payment_metrics, waitlist, overbooking, multi_service_booking, loyalty, notifications, cancellation_policies, no_show_jobs, audit, reports, platform_reports, optimized_reports, review, search
 
 api_router = APIRouter(prefix="/v1")
 
@@ -28,5 +28,6 @@ api_router.include_router(reports.router)
 api_router.include_router(platform_reports.router)
 api_router.include_router(optimized_reports.router)
 api_router.include_router(review.router)
+api_router.include_router(search.router)
 
 __all__ = ["api_router"]
@@ -10,6 +10,7 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.exceptions import NotFoundError, ValidationError
 from backend.app.core.security.rbac import get_current_user, require_role
 from backend.app.db.session import get_db
 from backend.app.db.models.user import User, UserRole
@@ -38,6 +39,7 @@ from backend.app.api.v1.schemas.notifications import (
 )
 from backend.app.db.models.user import User
 from backend.app.db.repositories.notifications import NotificationRepository
+from backend.app.db.repositories.user import UserRepository
 from backend.app.services.notifications import NotificationService
 
 
@@ -320,28 +322,33 @@ async def update_notification_template(
     """
     Update an existing notification template (admin only).
 
-    Updates the specified notification template with new content.
-    Only accessible by superusers.
+    Updates the specified notification template with new content after
+    checking its syntax. Only accessible by superusers.
     """
-    repo = NotificationRepository(db)
-
-    template = await repo.update_template(
-        template_id=template_id,
-        name=request.name,
-        event_type=request.event_type.value,
-        channel=request.channel.value,
-        subject=request.subject,
-        body_template=request.body_template,
-        variables=request.variables,
-        priority=request.priority.value,
-        locale=request.locale
-    )
-
-    if not template:
+    service = NotificationService(NotificationRepository(db), UserRepository(db))
+
+    try:
+        template = await service.update_template(
+            template_id=template_id,
+            name=request.name,
+            event_type=request.event_type.value,
+            channel=request.channel.value,
+            subject=request.subject,
+            body_template=request.body_template,
+            variables=request.variables,
+            priority=request.priority.value,
+            locale=request.locale
+        )
+    except NotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Template not found"
         )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
     return NotificationTemplateResponse.from_orm(template)
 
@@ -7,12 +7,15 @@ including filtering, searching, and reporting capabilities.
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Type, TypeVar
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.config import settings
+from backend.app.core.exceptions import ValidationError
+from backend.app.core.performance.reporting import report_cache
 from backend.app.core.security.rbac import require_role
 from backend.app.db.models.audit_event import AuditEventType, AuditEventSeverity
 from backend.app.db.models.user import UserRole
@@ -21,6 +24,8 @@ from backend.app.db.session import get_db
 
 logger = logging.getLogger(__name__)
 
+E = TypeVar("E", AuditEventType, AuditEventSeverity)
+
 router = APIRouter(prefix="/audit", tags=["🎯 Policies - Audit Events"])
 
 
@@ -65,6 +70,29 @@ class AuditEventListResponse(BaseModel):
     total_pages: int
 
 
+class AuditEventSearchResponse(BaseModel):
+    """Response model for ranked audit event search."""
+
+    events: List[AuditEventResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page")
+    total_count: Optional[int] = Field(None, description="Total matches (first page only)")
+    total_is_estimate: bool = Field(False, description="Whether total_count is an estimate")
+
+
+def _parse_enum_list(value: Optional[str], enum: Type[E], label: str) -> Optional[List[E]]:
+    """Parse a comma-separated query parameter into enum members."""
+    if not value:
+        return None
+
+    try:
+        return [enum(item.strip()) for item in value.split(",") if item.strip()]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {label}: {e}"
+        )
+
+
 class AuditStatisticsResponse(BaseModel):
     """Response model for audit statistics."""
 
@@ -107,7 +135,7 @@ async def list_audit_events(
     ip_address: Optional[str] = Query(None, description="Filter by IP address"),
     start_date: Optional[datetime] = Query(None, description="Start of date range"),
     end_date: Optional[datetime] = Query(None, description="End of date range"),
-    search_term: Optional[str] = Query(None, description="Search in descriptions"),
+    search_term: Optional[str] = Query(None, description="Search words in descriptions and actions"),
     success_status: Optional[str] = Query(None, description="Filter by success status"),
     correlation_id: Optional[str] = Query(None, description="Filter by correlation ID"),
     page: int = Query(1, ge=1, description="Page number"),
@@ -121,31 +149,8 @@ async def list_audit_events(
     try:
         audit_repo = AuditEventRepository(db)
 
-        # Parse event types
-        parsed_event_types = None
-        if event_types:
-            try:
-                parsed_event_types = [
-                    AuditEventType(t.strip()) for t in event_types.split(",") if t.strip()
-                ]
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid event type: {e}"
-                )
-
-        # Parse severities
-        parsed_severities = None
-        if severities:
-            try:
-                parsed_severities = [
-                    AuditEventSeverity(s.strip()) for s in severities.split(",") if s.strip()
-                ]
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid severity: {e}"
-                )
+        parsed_event_types = _parse_enum_list(event_types, AuditEventType, "event type")
+        parsed_severities = _parse_enum_list(severities, AuditEventSeverity, "severity")
 
         # Calculate skip
         skip = (page - 1) * page_size
@@ -190,6 +195,77 @@ async def list_audit_events(
         )
 
 
+@router.get(
+    "/events/search",
+    response_model=AuditEventSearchResponse,
+    summary="Search audit events",
+    description="""
+    Full-text search of audit events, best matches first.
+
+    `q` accepts web search syntax: quoted phrases, `or` and `-word`.
+    Pages are fetched with the `next_cursor` of the previous page.
+    Narrow `start_date` / `end_date` ranges are much faster, since only
+    the matching months are searched.
+
+    **Counting:** `count=estimate` (default) counts exactly up to 10,000
+    matches and reports an estimate beyond; `count=exact` always counts;
+    `count=none` skips counting.
+
+    **Authentication Required:** Admin or Salon Owner
+    """,
+)
+async def search_audit_events(
+    q: str = Query(..., min_length=2, max_length=200, description="Words to search for"),
+    user_id: Optional[int] = Query(None, description="Filter by user ID"),
+    event_types: Optional[str] = Query(None, description="Comma-separated event types"),
+    severities: Optional[str] = Query(None, description="Comma-separated severity levels"),
+    resource_type: Optional[str] = Query(None, description="Filter by resource type"),
+    start_date: Optional[datetime] = Query(None, description="Start of date range"),
+    end_date: Optional[datetime] = Query(None, description="End of date range"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    page_size: int = Query(50, ge=1, le=200, description="Page size"),
+    count: str = Query("estimate", pattern="^(exact|estimate|none)$", description="Total count mode"),
+    current_user: dict = Depends(require_role([UserRole.ADMIN, UserRole.SALON_OWNER])),
+    db: AsyncSession = Depends(get_db),
+) -> AuditEventSearchResponse:
+    """Search audit events by text."""
+    try:
+        audit_repo = AuditEventRepository(db)
+        events, total_count, total_is_estimate = await audit_repo.search_events(
+            search_term=q,
+            user_id=user_id,
+            event_types=_parse_enum_list(event_types, AuditEventType, "event type"),
+            severities=_parse_enum_list(severities, AuditEventSeverity, "severity"),
+            resource_type=resource_type,
+            start_date=start_date,
+            end_date=end_date,
+            limit=page_size,
+            cursor=cursor,
+            count_mode=count,
+        )
+
+        return AuditEventSearchResponse(
+            events=[AuditEventResponse.model_validate(event) for event in events],
+            next_cursor=events.next_cursor,
+            total_count=total_count,
+            total_is_estimate=total_is_estimate,
+        )
+
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to search audit events: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search audit events"
+        )
+
+
 @router.get(
     "/events/{event_id}",
     response_model=AuditEventResponse,
@@ -301,6 +377,8 @@ async def get_resource_history(
     resource_type: str,
     resource_id: str,
     limit: int = Query(50, ge=1, le=200, description="Maximum events to return"),
+    start_date: Optional[datetime] = Query(None, description="Start of date range"),
+    end_date: Optional[datetime] = Query(None, description="End of date range"),
     current_user: dict = Depends(require_role([UserRole.ADMIN, UserRole.SALON_OWNER])),
     db: AsyncSession = Depends(get_db),
 ) -> List[AuditEventResponse]:
@@ -311,6 +389,8 @@ async def get_resource_history(
             resource_type=resource_type,
             resource_id=resource_id,
             limit=limit,
+            start_date=start_date,
+            end_date=end_date,
         )
 
         return [AuditEventResponse.model_validate(event) for event in events]
@@ -332,6 +412,8 @@ async def get_resource_history(
 async def get_related_events(
     correlation_id: str,
     limit: int = Query(100, ge=1, le=500, description="Maximum events to return"),
+    start_date: Optional[datetime] = Query(None, description="Start of date range"),
+    end_date: Optional[datetime] = Query(None, description="End of date range"),
     current_user: dict = Depends(require_role([UserRole.ADMIN, UserRole.SALON_OWNER])),
     db: AsyncSession = Depends(get_db),
 ) -> List[AuditEventResponse]:
@@ -341,6 +423,8 @@ async def get_related_events(
         events = await audit_repo.get_events_by_correlation(
             correlation_id=correlation_id,
             limit=limit,
+            start_date=start_date,
+            end_date=end_date,
         )
 
         return [AuditEventResponse.model_validate(event) for event in events]
@@ -357,7 +441,7 @@ async def get_related_events(
     "/statistics",
     response_model=AuditStatisticsResponse,
     summary="Get audit statistics",
-    description="Get comprehensive audit statistics and metrics.",
+    description="Get comprehensive audit statistics and metrics, computed in one pass and cached briefly.",
 )
 async def get_audit_statistics(
     start_date: Optional[datetime] = Query(None, description="Start of date range"),
@@ -369,16 +453,28 @@ async def get_audit_statistics(
     try:
         audit_repo = AuditEventRepository(db)
 
-        # Default to last 30 days if no dates provided
-        if not start_date:
-            start_date = datetime.utcnow() - timedelta(days=30)
-        if not end_date:
-            end_date = datetime.utcnow()
+        # Cache entries of the default window are keyed without dates
+        cache_params = {
+            "start_date": start_date.isoformat() if start_date else "30 days ago",
+            "end_date": end_date.isoformat() if end_date else "now",
+        }
 
-        stats = await audit_repo.get_statistics(
-            start_date=start_date,
-            end_date=end_date,
-        )
+        async def compute_statistics() -> dict:
+            return await audit_repo.get_statistics(
+                # Default to last 30 days if no dates provided
+                start_date=start_date or datetime.utcnow() - timedelta(days=30),
+                end_date=end_date or datetime.utcnow(),
+            )
+
+        if settings.AUDIT_STATISTICS_CACHE_TTL_SECONDS > 0:
+            stats = await report_cache.get_or_compute(
+                "audit_statistics",
+                cache_params,
+                compute_statistics,
+                settings.AUDIT_STATISTICS_CACHE_TTL_SECONDS,
+            )
+        else:
+            stats = await compute_statistics()
 
         return AuditStatisticsResponse(**stats)
 
@@ -398,6 +494,8 @@ async def get_audit_statistics(
 
     **Warning:** This operation permanently deletes audit events.
     Only events older than the specified number of days will be deleted.
+    On PostgreSQL whole months are dropped, so up to one more month is kept
+    and the deleted count is an estimate.
 
     **Authentication Required:** Admin only
     """,
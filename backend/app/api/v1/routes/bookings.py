@@ -1,7 +1,7 @@
 """Booking endpoints for reservation management."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +13,9 @@ from backend.app.api.v1.schemas.booking import (
     BookingStatusUpdate,
     CancellationFeeRequest,
     CancellationFeeResponse,
+    CancellationFeeQuote,
+    CancellationFeeQuoteRequest,
+    CancellationFeeQuoteResponse,
     BookingCancellationRequest,
     BookingCancellationResponse,
     NoShowEvaluationRequest,
@@ -23,18 +26,22 @@ from backend.app.api.v1.schemas.booking import (
     NoShowDisputeResponse,
     NoShowStatisticsResponse,
 )
+from backend.app.core.exceptions import ConflictError, ValidationError
 from backend.app.core.security.rbac import get_current_user
 from backend.app.db.models.booking import BookingStatus
 from backend.app.db.models.user import User, UserRole
 from backend.app.db.repositories.booking import BookingRepository
+from backend.app.db.repositories.pagination import KeysetPage
 from backend.app.db.repositories.service import ServiceRepository
 from backend.app.db.repositories.cancellation_policy import CancellationPolicyRepository
 from backend.app.db.repositories.user import UserRepository
 from backend.app.db.session import get_db
-from backend.app.domain.scheduling.services.slot_service import SlotService
+from backend.app.domain.scheduling.services.booking_admission import BookingAdmissionService
 from backend.app.domain.policies.booking_cancellation import BookingCancellationService
+from backend.app.domain.policies.registry import as_utc, cancellation_policy_registry
 from backend.app.services.no_show import NoShowService
 from backend.app.services.booking_notifications import BookingNotificationService
+from backend.app.services.reminder_scheduler import REMINDABLE_STATUSES, ReminderScheduler
 from backend.app.domain.policies.no_show import NoShowReason
 
 logger = logging.getLogger(__name__)
@@ -51,8 +58,11 @@ router = APIRouter(prefix="/bookings", tags=["Bookings"])
     Create a new service booking with slot validation.
 
     This endpoint:
-    - Validates slot availability before creating the booking
-    - Prevents double-booking conflicts
+    - Locks the professional's agenda for the duration of the transaction
+    - Checks the requested interval against existing bookings and working hours
+    - Prevents double-booking conflicts, including concurrent requests
+    - Accepts an overlapping booking only within the overbooking capacity
+      configured for the salon, professional or service
     - Retrieves service details (price, duration)
     - Creates booking in PENDING status
 
@@ -101,9 +111,7 @@ async def create_booking(
         HTTPException: 409 if slot already booked
     """
     # Repositories
-    booking_repo = BookingRepository(session)
     service_repo = ServiceRepository(session)
-    slot_service = SlotService(session)
 
     # 1. Validate service exists
     service = await service_repo.get_by_id(request.service_id)
@@ -113,57 +121,39 @@ async def create_booking(
             detail=f"Service with ID {request.service_id} not found",
         )
 
-    # 2. Check slot availability
-    target_date = request.scheduled_at.date()
+    # 2. Determine applicable cancellation policy (before taking the agenda lock)
+    policies = await cancellation_policy_registry.snapshot(session)
+    applicable_policy = policies.resolve(service.salon_id)
+
+    # 3. Check the requested interval (and overbooking capacity, if it
+    #    overlaps) and create the booking under the professional's agenda
+    #    lock, which is held until commit
+    admission_service = BookingAdmissionService(session)
     try:
-        available_slots = await slot_service.calculate_available_slots(
+        booking = await admission_service.admit(
+            client_id=current_user.id,
             professional_id=request.professional_id,
-            target_date=target_date,
-            service_id=request.service_id,
-            slot_interval_minutes=service.duration_minutes,
-        )
-
-        # Check if the requested slot is in available slots
-        requested_time = request.scheduled_at.time()
-        slot_available = any(
-            slot.start_time.time() == requested_time
-            for slot in available_slots.slots
+            service=service,
+            scheduled_at=request.scheduled_at,
+            notes=request.notes,
+            cancellation_policy_id=applicable_policy.id if applicable_policy else None,
+            allow_overbooking=True,
+            salon_id=service.salon_id,
         )
-
-        if not slot_available:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Slot at {request.scheduled_at} is not available",
-            )
-
-    except ValueError as e:
+    except ConflictError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.message,
         ) from e
 
-    # 3. Determine applicable cancellation policy
-    policy_repo = CancellationPolicyRepository(session)
-    applicable_policy = await policy_repo.get_applicable_policy(
-        salon_id=service.salon_id if hasattr(service, 'salon_id') else None
-    )
-
-    # 4. Create booking
-    booking = await booking_repo.create(
-        client_id=current_user.id,
-        professional_id=request.professional_id,
-        service_id=request.service_id,
-        scheduled_at=request.scheduled_at,
-        duration_minutes=service.duration_minutes,
-        service_price=float(service.price),
-        notes=request.notes,
-        cancellation_policy_id=applicable_policy.id if applicable_policy else None,
-    )
+    # Reminder firing times are stored with the booking; they are rendered
+    # and queued when they fire
+    await ReminderScheduler(session).schedule(booking)
 
     await session.commit()
     await session.refresh(booking)
 
-    # 5. Send notifications
+    # 4. Send notifications
     try:
         notification_service = BookingNotificationService(session)
 
@@ -173,11 +163,6 @@ async def create_booking(
             correlation_id=f"booking_create_{booking.id}"
         )
 
-        # Schedule booking reminders
-        await notification_service.schedule_booking_reminders(
-            booking_id=booking.id
-        )
-
     except Exception as e:
         # Log notification errors but don't fail the booking creation
         logger.error(f"Failed to send booking notifications for booking {booking.id}: {str(e)}")
@@ -212,7 +197,7 @@ async def list_bookings(
     professional_id: int | None = Query(None, description="Filter by professional"),
     date_from: datetime | None = Query(None, description="Filter from date"),
     date_to: datetime | None = Query(None, description="Filter to date"),
-    page: int = Query(1, gt=0, description="Page number"),
+    cursor: str | None = Query(None, description="Cursor returned as next_cursor by the previous page"),
     page_size: int = Query(10, gt=0, le=100, description="Items per page"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
@@ -225,7 +210,7 @@ async def list_bookings(
         professional_id: Optional professional filter
         date_from: Optional start date filter
         date_to: Optional end date filter
-        page: Page number
+        cursor: Cursor of the previous page
         page_size: Items per page
         current_user: Authenticated user
         session: Database session
@@ -253,24 +238,27 @@ async def list_bookings(
     if professional_id and current_user.role in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
         filters["professional_id"] = professional_id
 
-    # Fetch bookings (simplified - repository needs pagination support)
-    if current_user.role == UserRole.CLIENT:
-        bookings = await booking_repo.list_by_client_id(current_user.id)
-    elif professional_id and current_user.role == UserRole.PROFESSIONAL:
-        bookings = await booking_repo.list_by_professional_id(professional_id)
-    else:
-        # List all (needs implementation in repository)
-        bookings = []
-
-    # Apply pagination (simplified)
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_bookings = bookings[start_idx:end_idx]
+    # Fetch one page of bookings, newest first
+    try:
+        if current_user.role == UserRole.CLIENT:
+            bookings = await booking_repo.list_by_client_id(
+                current_user.id, limit=page_size, cursor=cursor
+            )
+        elif professional_id and current_user.role == UserRole.PROFESSIONAL:
+            bookings = await booking_repo.list_by_professional_id(
+                professional_id, limit=page_size, cursor=cursor
+            )
+        else:
+            # List all (needs implementation in repository)
+            bookings = KeysetPage(total=0)
+    except ValidationError as e:
+        # The status filter shadows fastapi.status here
+        raise HTTPException(status_code=400, detail=str(e))
 
     return BookingListResponse(
-        bookings=[BookingResponse.model_validate(b) for b in paginated_bookings],
-        total=len(bookings),
-        page=page,
+        bookings=[BookingResponse.model_validate(b) for b in bookings],
+        total=bookings.total,
+        next_cursor=bookings.next_cursor,
         page_size=page_size,
     )
 
@@ -423,6 +411,8 @@ async def update_booking_status(
         new_status=status_update.status,
         cancellation_reason=status_update.cancellation_reason,
     )
+    if status_update.status not in REMINDABLE_STATUSES:
+        await ReminderScheduler(session).cancel(booking_id)
 
     await session.commit()
     await session.refresh(updated_booking)
@@ -497,6 +487,7 @@ async def cancel_booking(
         new_status=BookingStatus.CANCELLED,
         cancellation_reason=cancellation_reason,
     )
+    await ReminderScheduler(session).cancel(booking_id)
 
     await session.commit()
 
@@ -543,7 +534,9 @@ async def get_cancellation_fee(
     """Calculate cancellation fee for a booking."""
     booking_repo = BookingRepository(session)
     policy_repo = CancellationPolicyRepository(session)
-    cancellation_service = BookingCancellationService(booking_repo, policy_repo)
+    cancellation_service = BookingCancellationService(
+        booking_repo, policy_repo, cancellation_policy_registry
+    )
 
     # Verify booking exists and user has permission
     booking = await booking_repo.get_by_id(booking_id)
@@ -607,7 +600,9 @@ async def cancel_booking_with_policy(
     """Cancel a booking with policy-based fee calculation."""
     booking_repo = BookingRepository(session)
     policy_repo = CancellationPolicyRepository(session)
-    cancellation_service = BookingCancellationService(booking_repo, policy_repo)
+    cancellation_service = BookingCancellationService(
+        booking_repo, policy_repo, cancellation_policy_registry
+    )
 
     # Verify booking exists and user has permission
     booking = await booking_repo.get_by_id(booking_id)
@@ -631,6 +626,7 @@ async def cancel_booking_with_policy(
             reason=request.reason,
             cancellation_time=request.cancellation_time,
         )
+        await ReminderScheduler(session).cancel(booking_id)
 
         await session.commit()
 
@@ -694,7 +690,9 @@ async def calculate_cancellation_fee(
     """Calculate cancellation fee for a booking."""
     booking_repo = BookingRepository(session)
     policy_repo = CancellationPolicyRepository(session)
-    cancellation_service = BookingCancellationService(booking_repo, policy_repo)
+    cancellation_service = BookingCancellationService(
+        booking_repo, policy_repo, cancellation_policy_registry
+    )
 
     # Verify booking exists and user has permission
     booking = await booking_repo.get_by_id(booking_id)
@@ -743,6 +741,62 @@ async def calculate_cancellation_fee(
         )
 
 
+@router.post(
+    "/cancellation-fees",
+    response_model=CancellationFeeQuoteResponse,
+    summary="Quote cancellation fees of several bookings",
+    description="""
+    Quote the cancellation fee of up to 100 bookings in one request.
+
+    This endpoint:
+    - Loads the bookings in one query and their policies from memory
+    - Returns, per booking, the fee, the refund and the deadline until which that fee applies
+    - Reports bookings that cannot be cancelled with the reason instead of failing the request
+    - Returns fee information without actually cancelling any booking
+
+    Clients only get quotes for their own bookings; others are reported as not found.
+
+    **Authentication Required:** Client (own bookings), Professional, Receptionist, or Admin
+    """,
+    responses={
+        200: {"description": "Cancellation fees quoted successfully"},
+        422: {"description": "Invalid request"},
+    },
+)
+async def quote_cancellation_fees(
+    request: CancellationFeeQuoteRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+) -> CancellationFeeQuoteResponse:
+    """Quote cancellation fees of several bookings."""
+    cancellation_service = BookingCancellationService(
+        BookingRepository(session),
+        CancellationPolicyRepository(session),
+        cancellation_policy_registry,
+    )
+    cancel_time = as_utc(request.cancellation_time) if request.cancellation_time else datetime.now(timezone.utc)
+
+    quotes = await cancellation_service.quote_cancellation_fees(
+        request.booking_ids,
+        cancellation_time=cancel_time,
+        client_id=current_user.id if current_user.role == UserRole.CLIENT else None,
+    )
+
+    return CancellationFeeQuoteResponse(
+        quotes=[
+            CancellationFeeQuote(
+                **{
+                    **quote,
+                    'fee_amount': float(quote['fee_amount']) if 'fee_amount' in quote else None,
+                    'refund_amount': float(quote['refund_amount']) if 'refund_amount' in quote else None,
+                }
+            )
+            for quote in quotes
+        ],
+        cancellation_time=cancel_time,
+    )
+
+
 @router.get(
     "/{booking_id}/can-cancel",
     summary="Check if booking can be cancelled",
@@ -771,7 +825,9 @@ async def check_can_cancel(
     """Check if a booking can be cancelled."""
     booking_repo = BookingRepository(session)
     policy_repo = CancellationPolicyRepository(session)
-    cancellation_service = BookingCancellationService(booking_repo, policy_repo)
+    cancellation_service = BookingCancellationService(
+        booking_repo, policy_repo, cancellation_policy_registry
+    )
 
     # Verify booking exists and user has permission
     booking = await booking_repo.get_by_id(booking_id)
@@ -24,6 +24,7 @@ from backend.app.domain.policies.cancellation import (
     CancellationPolicy as CancellationPolicyDomain,
     CancellationTier as CancellationTierDomain,
 )
+from backend.app.domain.policies.registry import cancellation_policy_registry
 
 logger = logging.getLogger(__name__)
 
@@ -206,6 +207,9 @@ async def create_policy(
                 display_order=tier_data.display_order,
             )
 
+        await db.commit()
+        cancellation_policy_registry.invalidate()
+
         # Get complete policy with tiers
         complete_policy = await policy_repo.get_by_id_with_tiers(policy.id)
 
@@ -373,6 +377,9 @@ async def update_policy(
                 display_order=tier_data.display_order,
             )
 
+        await db.commit()
+        cancellation_policy_registry.invalidate()
+
         # Get complete updated policy
         complete_policy = await policy_repo.get_by_id_with_tiers(policy_id)
 
@@ -428,6 +435,9 @@ async def delete_policy(
         # Delete policy (cascades to tiers)
         await policy_repo.delete_policy(policy_id)
 
+        await db.commit()
+        cancellation_policy_registry.invalidate()
+
         logger.info(f"Deleted cancellation policy {policy_id} by user {current_user.id}")
 
     except HTTPException:
@@ -476,6 +486,9 @@ async def activate_policy(
             status=CancellationPolicyStatus.ACTIVE
         )
 
+        await db.commit()
+        cancellation_policy_registry.invalidate()
+
         # Get complete policy with tiers
         complete_policy = await policy_repo.get_by_id_with_tiers(policy_id)
 
@@ -528,6 +541,9 @@ async def deactivate_policy(
             status=CancellationPolicyStatus.INACTIVE
         )
 
+        await db.commit()
+        cancellation_policy_registry.invalidate()
+
         # Get complete policy with tiers
         complete_policy = await policy_repo.get_by_id_with_tiers(policy_id)
 
@@ -35,6 +35,9 @@ router = APIRouter(prefix="/no-show", tags=["🚫 No-Show Detection"])
     - Sends notifications for detected no-shows
     - Returns detailed job execution statistics
 
+    With `batch=true` bookings are marked in set-based batches and an
+    interrupted run is resumed from its checkpoint.
+
     **Authentication Required:** Admin or Professional
 
     **Use Cases:**
@@ -55,6 +58,10 @@ async def run_no_show_detection(
         le=24,
         description="Hours after scheduled time to check for no-shows"
     ),
+    batch: bool = Query(
+        default=False,
+        description="Mark bookings in set-based batches with a resumable checkpoint"
+    ),
     current_user: dict = Depends(require_role([UserRole.ADMIN, UserRole.PROFESSIONAL])),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
@@ -63,6 +70,7 @@ async def run_no_show_detection(
 
     Args:
         detection_window_hours: Grace period after scheduled time
+        batch: Use the batch detection mode
         current_user: Authenticated user
         db: Database session
 
@@ -74,7 +82,10 @@ async def run_no_show_detection(
 
         # Create and run the job
         job = NoShowDetectionJob(detection_window_hours=detection_window_hours)
-        results = await job.run(db_session=db)
+        if batch:
+            results = await job.run_batch(db_session=db)
+        else:
+            results = await job.run(db_session=db)
 
         # Add metadata
         results["triggered_by"] = current_user.get("id")
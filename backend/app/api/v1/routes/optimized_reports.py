@@ -27,19 +27,27 @@ from backend.app.core.performance.reporting import (
     QueryOptimizer,
     ReportCache,
     cache_report,
+    report_cache,
 )
 from backend.app.core.security.rbac import require_role
 from backend.app.db.models.user import UserRole
 from backend.app.db.session import get_db
+from backend.app.domain.reporting import ReportingViewService, ViewFreshness
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/optimized-reports", tags=["📊 Reports - Optimized (Cache)"])
 
 
+class OptimizedDashboardMetrics(DashboardMetrics):
+    """Dashboard metrics whose trends are read from booking_metrics_mv."""
+
+    data_freshness: ViewFreshness
+
+
 @router.get(
     "/dashboard",
-    response_model=DashboardMetrics,
+    response_model=OptimizedDashboardMetrics,
     summary="Get optimized dashboard metrics",
     description="""
     Get comprehensive dashboard metrics with performance optimizations.
@@ -50,6 +58,9 @@ router = APIRouter(prefix="/optimized-reports", tags=["📊 Reports - Optimized
     - Performance monitoring
     - Efficient aggregations
 
+    Trends are served from the booking_metrics_mv materialized view;
+    `data_freshness` reports when it was last refreshed.
+
     **Authentication Required:** Salon Owner, Admin, or Receptionist
     """,
 )
@@ -72,7 +83,7 @@ async def get_optimized_dashboard_metrics(
         require_role([UserRole.ADMIN, UserRole.SALON_OWNER, UserRole.SALON_OWNER])
     ),
     db: AsyncSession = Depends(get_db),
-) -> DashboardMetrics:
+) -> OptimizedDashboardMetrics:
     """Get optimized dashboard metrics."""
     try:
         # Default time period - last 30 days
@@ -172,18 +183,43 @@ async def get_optimized_dashboard_metrics(
         # Simplified service metrics for dashboard
         top_services = []  # Could be implemented with similar optimization
 
-        # Simplified trends for dashboard
-        revenue_trend = []
-        booking_trend = []
+        # Daily trends from booking_metrics_mv
+        view_service = ReportingViewService(db)
+        trend_rows = await view_service.get_booking_trend(
+            start_date,
+            end_date,
+            salon_id=salon_id,
+        )
+        freshness = await view_service.get_freshness("booking_metrics_mv")
+
+        revenue_trend = [
+            {
+                "date": row["period"].date().isoformat(),
+                "revenue": row["revenue"],
+                "completed_bookings": row["completed_bookings"],
+            }
+            for row in trend_rows
+        ]
+        booking_trend = [
+            {
+                "date": row["period"].date().isoformat(),
+                "total_bookings": row["total_bookings"],
+                "completed_bookings": row["completed_bookings"],
+                "cancelled_bookings": row["cancelled_bookings"],
+                "no_show_bookings": row["no_show_bookings"],
+            }
+            for row in trend_rows
+        ]
 
-        return DashboardMetrics(
+        return OptimizedDashboardMetrics(
             period_start=start_date,
             period_end=end_date,
             booking_metrics=booking_metrics,
             top_professionals=top_professionals,
             top_services=top_services,
             revenue_trend=revenue_trend,
-            booking_trend=booking_trend
+            booking_trend=booking_trend,
+            data_freshness=freshness,
         )
 
     except HTTPException:
@@ -378,17 +414,23 @@ async def get_optimized_professional_metrics(
     """,
 )
 async def clear_report_cache(
-    pattern: str = Query("*", description="Cache pattern to clear"),
+    pattern: str = Query(
+        "*",
+        description="Report to clear (e.g. dashboard), or * for all reports",
+    ),
     current_user: dict = Depends(require_role([UserRole.ADMIN])),
 ) -> dict:
     """Clear report cache."""
     try:
-        deleted_count = ReportCache.delete_pattern(pattern)
+        # Entries are invalidated per report; "dashboard:*" means "dashboard"
+        prefix = pattern.rstrip("*").rstrip(":") or ReportCache.ALL
+        version = await report_cache.invalidate(prefix)
 
         return {
             "status": "success",
-            "message": f"Cleared {deleted_count} cache entries",
+            "message": f"Invalidated cached reports for {prefix}",
             "pattern": pattern,
+            "version": version,
             "timestamp": datetime.utcnow().isoformat()
         }
 
@@ -419,9 +461,9 @@ async def get_performance_stats(
     try:
         # Get cache statistics
         cache_stats = {}
-        if ReportCache.redis_client:
+        if report_cache.redis is not None:
             try:
-                info = ReportCache.redis_client.info()
+                info = await report_cache.redis.info()
                 cache_stats = {
                     "connected": True,
                     "used_memory": info.get("used_memory_human", "N/A"),
@@ -205,6 +205,7 @@ async def update_overbooking_config(
             config_id, update_data.dict(exclude_unset=True)
         )
         await session.commit()
+        await overbooking_service.config_index.publish_change()
 
         logger.info(f"Overbooking configuration {config_id} updated by user {current_user.id}")
         return updated_config
@@ -239,6 +240,7 @@ async def delete_overbooking_config(
         )
 
     await session.commit()
+    await overbooking_service.config_index.publish_change()
     logger.info(f"Overbooking configuration {config_id} deleted by user {current_user.id}")
 
 
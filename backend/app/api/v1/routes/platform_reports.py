@@ -11,7 +11,7 @@ from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import and_, func, text
+from sqlalchemy import and_, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -23,6 +23,7 @@ from backend.app.db.models.salon import Salon
 from backend.app.db.models.service import Service
 from backend.app.db.models.user import User, UserRole
 from backend.app.db.session import get_db
+from backend.app.domain.reporting import DailyRollupService, ReportingViewService, ViewFreshness
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +81,7 @@ class UserAnalytics(BaseModel):
     user_retention_rate: float
     avg_bookings_per_user: float
     user_lifetime_value: float
+    data_freshness: Optional[ViewFreshness] = None
 
 
 @router.get(
@@ -283,74 +285,26 @@ async def get_salon_performance_comparison(
         if not end_date:
             end_date = datetime.utcnow()
 
-        # Validate sort_by parameter
-        valid_sorts = ["revenue", "bookings", "completion_rate"]
-        if sort_by not in valid_sorts:
+        try:
+            rows = await DailyRollupService(db).get_salon_performance(
+                start_date, end_date, sort_by=sort_by, limit=limit
+            )
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid sort_by. Use: {', '.join(valid_sorts)}"
+                detail=f"Invalid sort_by. Use: {', '.join(DailyRollupService.SALON_SORTS)}"
             )
 
-        # SQL query for salon performance
-        order_by_mapping = {
-            "revenue": "total_revenue DESC",
-            "bookings": "total_bookings DESC",
-            "completion_rate": "completion_rate DESC"
-        }
-
-        salon_performance_query = text(f"""
-            SELECT
-                s.id as salon_id,
-                s.name as salon_name,
-                COUNT(b.id) as total_bookings,
-                COUNT(CASE WHEN b.status = 'completed' THEN 1 END) as completed_bookings,
-                CASE
-                    WHEN COUNT(b.id) > 0 THEN
-                        (COUNT(CASE WHEN b.status = 'completed' THEN 1 END)::float / COUNT(b.id) * 100)
-                    ELSE 0
-                END as completion_rate,
-                COALESCE(SUM(CASE WHEN b.status = 'completed' THEN b.service_price ELSE 0 END), 0) as total_revenue,
-                COUNT(DISTINCT p.id) as professional_count,
-                COUNT(DISTINCT srv.id) as service_count,
-                COUNT(DISTINCT b.client_id) as client_count
-            FROM salons s
-            LEFT JOIN professionals p ON s.id = p.salon_id
-            LEFT JOIN services srv ON s.id = srv.salon_id
-            LEFT JOIN bookings b ON p.id = b.professional_id
-                AND b.scheduled_at >= :start_date
-                AND b.scheduled_at <= :end_date
-            GROUP BY s.id, s.name
-            ORDER BY {order_by_mapping[sort_by]}
-            LIMIT :limit
-        """)
-
-        result = await db.execute(
-            salon_performance_query,
-            {
-                "start_date": start_date,
-                "end_date": end_date,
-                "limit": limit
-            }
-        )
-
         salon_performances = []
-        for row in result.fetchall():
+        for row in rows:
             avg_booking_value = (
-                (row.total_revenue / row.completed_bookings)
-                if row.completed_bookings > 0 else None
+                (row["total_revenue"] / row["completed_bookings"])
+                if row["completed_bookings"] > 0 else None
             )
 
             salon_perf = SalonPerformance(
-                salon_id=row.salon_id,
-                salon_name=row.salon_name,
-                total_bookings=row.total_bookings,
-                completed_bookings=row.completed_bookings,
-                completion_rate=round(float(row.completion_rate), 2),
-                total_revenue=float(row.total_revenue),
+                **row,
                 avg_booking_value=round(avg_booking_value, 2) if avg_booking_value else None,
-                professional_count=row.professional_count,
-                service_count=row.service_count,
-                client_count=row.client_count,
                 growth_rate=None  # Would require additional query for growth calculation
             )
             salon_performances.append(salon_perf)
@@ -400,44 +354,23 @@ async def get_category_analytics(
             end_date = datetime.utcnow()
 
         # Get total salon count for adoption rate calculation
-        total_salons = await db.query(func.count(Salon.id)).scalar()
-
-        # Category analytics query
-        category_query = text("""
-            SELECT
-                s.category,
-                COUNT(DISTINCT s.id) as total_services,
-                COUNT(b.id) as total_bookings,
-                COALESCE(SUM(CASE WHEN b.status = 'completed' THEN b.service_price ELSE 0 END), 0) as total_revenue,
-                AVG(s.price) as avg_price,
-                COUNT(DISTINCT s.salon_id) as salon_count
-            FROM services s
-            LEFT JOIN bookings b ON s.id = b.service_id
-                AND b.scheduled_at >= :start_date
-                AND b.scheduled_at <= :end_date
-            WHERE s.category IS NOT NULL
-            GROUP BY s.category
-            ORDER BY total_revenue DESC
-        """)
+        total_salons = await db.scalar(select(func.count(Salon.id))) or 0
 
-        result = await db.execute(
-            category_query,
-            {"start_date": start_date, "end_date": end_date}
-        )
+        rows = await DailyRollupService(db).get_category_analytics(start_date, end_date)
 
         category_analytics = []
-        for row in result.fetchall():
-            popularity_score = row.total_bookings  # Simple popularity metric
+        for row in rows:
+            popularity_score = row["total_bookings"]  # Simple popularity metric
             salon_adoption_rate = (
-                (row.salon_count / total_salons * 100) if total_salons > 0 else 0
+                (row["salon_count"] / total_salons * 100) if total_salons > 0 else 0
             )
 
             analytics = CategoryAnalytics(
-                category=row.category,
-                total_services=row.total_services,
-                total_bookings=row.total_bookings,
-                total_revenue=float(row.total_revenue),
-                avg_price=float(row.avg_price) if row.avg_price else 0.0,
+                category=row["category"],
+                total_services=row["total_services"],
+                total_bookings=row["total_bookings"],
+                total_revenue=row["total_revenue"],
+                avg_price=row["avg_price"],
                 popularity_score=popularity_score,
                 salon_adoption_rate=round(salon_adoption_rate, 2)
             )
@@ -482,9 +415,9 @@ async def get_user_analytics(
         thirty_days_ago = now - timedelta(days=30)
 
         # Total users
-        total_users = await db.query(func.count(User.id)).filter(
-            User.role == UserRole.CLIENT
-        ).scalar()
+        total_users = await db.scalar(
+            select(func.count(User.id)).where(User.role == UserRole.CLIENT)
+        )
 
         # Active users (users with bookings in last 30 days)
         active_users_query = text("""
@@ -499,12 +432,12 @@ async def get_user_analytics(
         active_users_30d = active_users_result.scalar() or 0
 
         # New users (registered in last 30 days)
-        new_users_30d = await db.query(func.count(User.id)).filter(
-            and_(
+        new_users_30d = await db.scalar(
+            select(func.count(User.id)).where(
                 User.role == UserRole.CLIENT,
-                User.created_at >= thirty_days_ago
+                User.created_at >= thirty_days_ago,
             )
-        ).scalar()
+        )
 
         # User retention rate (simplified - users who made bookings both in last 30 days and previous 30 days)
         retention_query = text("""
@@ -557,19 +490,11 @@ async def get_user_analytics(
         )
         avg_bookings_per_user = float(avg_bookings_result.scalar() or 0)
 
-        # User lifetime value (simplified - average revenue per user for completed bookings)
-        ltv_query = text("""
-            SELECT AVG(user_revenue) as avg_ltv
-            FROM (
-                SELECT client_id, SUM(service_price) as user_revenue
-                FROM bookings
-                WHERE status = 'completed'
-                GROUP BY client_id
-            ) user_revenues
-        """)
-
-        ltv_result = await db.execute(ltv_query)
-        user_lifetime_value = float(ltv_result.scalar() or 0)
+        # User lifetime value from customer_analytics_mv (a full bookings scan otherwise)
+        view_service = ReportingViewService(db)
+        customer_values = await view_service.get_customer_value_summary()
+        user_lifetime_value = customer_values["avg_lifetime_value"]
+        freshness = await view_service.get_freshness("customer_analytics_mv")
 
         return UserAnalytics(
             total_users=total_users,
@@ -577,7 +502,8 @@ async def get_user_analytics(
             new_users_30d=new_users_30d,
             user_retention_rate=round(user_retention_rate, 2),
             avg_bookings_per_user=round(avg_bookings_per_user, 2),
-            user_lifetime_value=round(user_lifetime_value, 2)
+            user_lifetime_value=round(user_lifetime_value, 2),
+            data_freshness=freshness,
         )
 
     except Exception as e:
@@ -612,75 +538,70 @@ async def get_growth_trends(
 ) -> dict:
     """Get platform growth trends."""
     try:
-        # Growth trends query
-        growth_query = text("""
-            WITH monthly_stats AS (
-                SELECT
-                    DATE_TRUNC('month', period_date) as month,
-                    COUNT(DISTINCT CASE WHEN data_type = 'user' THEN entity_id END) as new_users,
-                    COUNT(DISTINCT CASE WHEN data_type = 'salon' THEN entity_id END) as new_salons,
-                    COUNT(DISTINCT CASE WHEN data_type = 'booking' THEN entity_id END) as total_bookings,
-                    SUM(CASE WHEN data_type = 'revenue' THEN amount ELSE 0 END) as total_revenue
-                FROM (
-                    SELECT id as entity_id, created_at as period_date, 'user' as data_type, 0 as amount
-                    FROM users WHERE role = 'client'
-
-                    UNION ALL
-
-                    SELECT id as entity_id, created_at as period_date, 'salon' as data_type, 0 as amount
-                    FROM salons
-
-                    UNION ALL
-
-                    SELECT id as entity_id, scheduled_at as period_date, 'booking' as data_type, 0 as amount
-                    FROM bookings
-
-                    UNION ALL
-
-                    SELECT id as entity_id, scheduled_at as period_date, 'revenue' as data_type, service_price as amount
-                    FROM bookings WHERE status = 'completed'
-                ) combined_data
-                WHERE period_date >= NOW() - INTERVAL ':months_back months'
-                GROUP BY DATE_TRUNC('month', period_date)
-                ORDER BY month
-            )
-            SELECT
-                month,
-                new_users,
-                new_salons,
-                total_bookings,
-                total_revenue,
-                LAG(new_users) OVER (ORDER BY month) as prev_users,
-                LAG(total_revenue) OVER (ORDER BY month) as prev_revenue
-            FROM monthly_stats
-        """)
-
-        result = await db.execute(growth_query, {"months_back": months_back})
+        now = datetime.utcnow()
+        month_index = now.year * 12 + now.month - 1 - (months_back - 1)
+        since = datetime(month_index // 12, month_index % 12 + 1, 1)
+
+        # Bookings and revenue come from booking_metrics_mv
+        view_service = ReportingViewService(db)
+        booking_rows = await view_service.get_booking_trend(since, now, granularity="month")
+        freshness = await view_service.get_freshness("booking_metrics_mv")
+
+        # New clients and salons are small per-month counts on their own tables
+        user_month = func.date_trunc("month", User.created_at)
+        new_users = dict((await db.execute(
+            select(user_month, func.count())
+            .where(User.role == UserRole.CLIENT, User.created_at >= since)
+            .group_by(user_month)
+        )).all())
+
+        salon_month = func.date_trunc("month", Salon.created_at)
+        new_salons = dict((await db.execute(
+            select(salon_month, func.count())
+            .where(Salon.created_at >= since)
+            .group_by(salon_month)
+        )).all())
+
+        def month_key(value: datetime) -> str:
+            return value.strftime("%Y-%m")
+
+        bookings_by_month = {month_key(row["period"]): row for row in booking_rows}
+        users_by_month = {month_key(month): count for month, count in new_users.items()}
+        salons_by_month = {month_key(month): count for month, count in new_salons.items()}
 
         growth_data = []
-        for row in result.fetchall():
+        prev_users = None
+        prev_revenue = None
+        for month in sorted(set(bookings_by_month) | set(users_by_month) | set(salons_by_month)):
+            booking_row = bookings_by_month.get(month, {})
+            month_users = users_by_month.get(month, 0)
+            month_revenue = booking_row.get("revenue", 0.0)
+
             user_growth = (
-                ((row.new_users - row.prev_users) / row.prev_users * 100)
-                if row.prev_users and row.prev_users > 0 else 0
+                ((month_users - prev_users) / prev_users * 100)
+                if prev_users else 0
             )
             revenue_growth = (
-                ((row.total_revenue - row.prev_revenue) / row.prev_revenue * 100)
-                if row.prev_revenue and row.prev_revenue > 0 else 0
+                ((month_revenue - prev_revenue) / prev_revenue * 100)
+                if prev_revenue else 0
             )
 
             growth_data.append({
-                "month": row.month.strftime("%Y-%m"),
-                "new_users": row.new_users,
-                "new_salons": row.new_salons,
-                "total_bookings": row.total_bookings,
-                "total_revenue": float(row.total_revenue),
+                "month": month,
+                "new_users": month_users,
+                "new_salons": salons_by_month.get(month, 0),
+                "total_bookings": booking_row.get("total_bookings", 0),
+                "total_revenue": month_revenue,
                 "user_growth_rate": round(user_growth, 2),
                 "revenue_growth_rate": round(revenue_growth, 2)
             })
+            prev_users = month_users
+            prev_revenue = month_revenue
 
         return {
             "period_months": months_back,
             "data": growth_data,
+            "data_freshness": freshness.model_dump(mode="json"),
             "summary": {
                 "total_months": len(growth_data),
                 "avg_monthly_users": (
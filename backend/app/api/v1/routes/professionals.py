@@ -11,6 +11,7 @@ from backend.app.api.v1.schemas.professional import (
     ProfessionalResponse,
     ProfessionalUpdateRequest,
 )
+from backend.app.core.exceptions import ValidationError
 from backend.app.core.security.rbac import (
     get_current_user,
     get_current_user_optional,
@@ -141,7 +142,7 @@ async def create_professional(
                             }
                         ],
                         "total": 1,
-                        "page": 1,
+                        "next_cursor": None,
                         "page_size": 10,
                     }
                 }
@@ -153,35 +154,37 @@ async def list_professionals(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User | None, Depends(get_current_user_optional)] = None,
     salon_id: Annotated[int | None, Query(description="Filter by salon ID", ge=1)] = None,
-    page: Annotated[int, Query(description="Page number", ge=1)] = 1,
+    is_active: Annotated[bool | None, Query(description="Filter by active status")] = None,
+    cursor: Annotated[str | None, Query(description="Cursor returned as next_cursor by the previous page")] = None,
     page_size: Annotated[int, Query(description="Items per page", ge=1, le=100)] = 10,
 ) -> ProfessionalListResponse:
     """
     List professionals with optional filtering.
 
     Available to all users (authenticated or not).
+    Results are cursor-paginated; the total is only reported on the first page.
     """
     prof_repo = ProfessionalRepository(db)
 
-    if salon_id:
-        # Filter by salon
-        professionals = await prof_repo.list_by_salon_id(salon_id)
-    else:
-        # Get all professionals (implement pagination if needed)
-        professionals = await prof_repo.list_by_salon_id(0)  # Placeholder
-
-    # TODO: Implement proper pagination in repository
-    total = len(professionals)
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_professionals = professionals[start:end]
+    try:
+        professionals = await prof_repo.list_page(
+            salon_id=salon_id,
+            is_active=is_active,
+            limit=page_size,
+            cursor=cursor,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     return ProfessionalListResponse(
         professionals=[
-            ProfessionalResponse.model_validate(p) for p in paginated_professionals
+            ProfessionalResponse.model_validate(p) for p in professionals
         ],
-        total=total,
-        page=page,
+        total=professionals.total,
+        next_cursor=professionals.next_cursor,
         page_size=page_size,
     )
 
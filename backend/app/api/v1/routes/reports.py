@@ -11,22 +11,25 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, func, text
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from backend.app.core.security.rbac import require_role
-from backend.app.db.models.booking import Booking
+from backend.app.db.models.booking import Booking, BookingStatus
 from backend.app.db.models.payment import Payment
 from backend.app.db.models.professional import Professional
 from backend.app.db.models.service import Service
 from backend.app.db.models.user import User, UserRole
 from backend.app.db.session import get_db
+from backend.app.domain.reporting import ReportingViewService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/reports", tags=["📊 Reports - Operational"])
 
+# Number of professionals/services shown on the dashboard
+DASHBOARD_TOP_LIMIT = 5
+
 
 class BookingMetrics(BaseModel):
     """Booking metrics response model."""
@@ -83,6 +86,237 @@ class DashboardMetrics(BaseModel):
     booking_trend: List[dict]
 
 
+def _percentage(part: int, total: int) -> float:
+    """Percentage of part over total, rounded to 2 decimals."""
+    return round(part / total * 100, 2) if total else 0.0
+
+
+def _status_count(booking_status: BookingStatus):
+    """COUNT(*) FILTER (WHERE status = ...) aggregate."""
+    return func.count().filter(Booking.status == booking_status)
+
+
+def _completed_revenue():
+    """Revenue of completed bookings (0 when there are none)."""
+    return func.coalesce(
+        func.sum(Booking.service_price).filter(Booking.status == BookingStatus.COMPLETED),
+        0,
+    )
+
+
+def _booking_filters(
+    start_date: datetime,
+    end_date: datetime,
+    salon_id: Optional[int] = None,
+    professional_id: Optional[int] = None,
+    service_id: Optional[int] = None,
+) -> list:
+    """Build the WHERE clauses shared by the booking aggregates."""
+    filters = [
+        Booking.scheduled_at >= start_date,
+        Booking.scheduled_at <= end_date,
+    ]
+
+    if salon_id:
+        filters.append(
+            Booking.professional_id.in_(
+                select(Professional.id).where(Professional.salon_id == salon_id)
+            )
+        )
+    if professional_id:
+        filters.append(Booking.professional_id == professional_id)
+    if service_id:
+        filters.append(Booking.service_id == service_id)
+
+    return filters
+
+
+async def _query_booking_metrics(db: AsyncSession, filters: list) -> BookingMetrics:
+    """Aggregate booking counts and revenue in a single query."""
+    stmt = select(
+        func.count().label("total_bookings"),
+        _status_count(BookingStatus.COMPLETED).label("completed_bookings"),
+        _status_count(BookingStatus.CANCELLED).label("cancelled_bookings"),
+        _status_count(BookingStatus.NO_SHOW).label("no_show_bookings"),
+        _status_count(BookingStatus.CONFIRMED).label("confirmed_bookings"),
+        _completed_revenue().label("total_revenue"),
+    ).where(*filters)
+
+    row = (await db.execute(stmt)).one()
+
+    total_bookings = row.total_bookings or 0
+    completed_bookings = row.completed_bookings or 0
+    total_revenue = float(row.total_revenue or 0)
+
+    return BookingMetrics(
+        total_bookings=total_bookings,
+        completed_bookings=completed_bookings,
+        cancelled_bookings=row.cancelled_bookings or 0,
+        no_show_bookings=row.no_show_bookings or 0,
+        confirmed_bookings=row.confirmed_bookings or 0,
+        completion_rate=_percentage(completed_bookings, total_bookings),
+        cancellation_rate=_percentage(row.cancelled_bookings or 0, total_bookings),
+        no_show_rate=_percentage(row.no_show_bookings or 0, total_bookings),
+        avg_booking_value=(
+            round(total_revenue / completed_bookings, 2) if completed_bookings else None
+        ),
+        total_revenue=round(total_revenue, 2),
+    )
+
+
+async def _query_professional_metrics(
+    db: AsyncSession,
+    filters: list,
+    limit: int,
+) -> List[ProfessionalMetrics]:
+    """
+    Aggregate per-professional metrics, ordered by revenue.
+
+    Bookings are first grouped per (professional, client) so that unique and
+    repeat clients fall out of the outer GROUP BY without a second query.
+    """
+    per_client = (
+        select(
+            Booking.professional_id,
+            Booking.client_id,
+            func.count().label("bookings"),
+            _status_count(BookingStatus.COMPLETED).label("completed"),
+            _completed_revenue().label("revenue"),
+        )
+        .where(*filters)
+        .group_by(Booking.professional_id, Booking.client_id)
+        .subquery()
+    )
+
+    total_revenue = func.sum(per_client.c.revenue)
+    stmt = (
+        select(
+            per_client.c.professional_id,
+            User.full_name.label("professional_name"),
+            func.sum(per_client.c.bookings).label("total_bookings"),
+            func.sum(per_client.c.completed).label("completed_bookings"),
+            total_revenue.label("total_revenue"),
+            func.count().label("unique_clients"),
+            func.count().filter(per_client.c.bookings > 1).label("repeat_clients"),
+        )
+        .join(Professional, Professional.id == per_client.c.professional_id)
+        .join(User, User.id == Professional.user_id)
+        .group_by(per_client.c.professional_id, User.full_name)
+        .order_by(total_revenue.desc(), per_client.c.professional_id)
+        .limit(limit)
+    )
+
+    metrics_list = []
+    for row in (await db.execute(stmt)).all():
+        total_bookings = int(row.total_bookings)
+        completed_bookings = int(row.completed_bookings)
+        revenue = float(row.total_revenue or 0)
+
+        metrics_list.append(
+            ProfessionalMetrics(
+                professional_id=row.professional_id,
+                professional_name=row.professional_name,
+                total_bookings=total_bookings,
+                completed_bookings=completed_bookings,
+                completion_rate=_percentage(completed_bookings, total_bookings),
+                total_revenue=round(revenue, 2),
+                avg_booking_value=(
+                    round(revenue / completed_bookings, 2) if completed_bookings else None
+                ),
+                unique_clients=row.unique_clients,
+                repeat_clients=row.repeat_clients,
+                client_retention_rate=_percentage(row.repeat_clients, row.unique_clients),
+            )
+        )
+
+    return metrics_list
+
+
+async def _query_service_metrics(
+    db: AsyncSession,
+    filters: list,
+    limit: int,
+) -> List[ServiceMetrics]:
+    """Aggregate per-service metrics, ordered by number of bookings."""
+    total_bookings = func.count(Booking.id)
+    stmt = (
+        select(
+            Service.id,
+            Service.name,
+            Service.category,
+            Service.price,
+            total_bookings.label("total_bookings"),
+            _status_count(BookingStatus.COMPLETED).label("completed_bookings"),
+            _completed_revenue().label("total_revenue"),
+        )
+        .join(Booking, Booking.service_id == Service.id)
+        .where(*filters)
+        .group_by(Service.id, Service.name, Service.category, Service.price)
+        .order_by(total_bookings.desc(), Service.id)
+        .limit(limit)
+    )
+
+    return [
+        ServiceMetrics(
+            service_id=row.id,
+            service_name=row.name,
+            category=row.category,
+            total_bookings=row.total_bookings,
+            completed_bookings=row.completed_bookings,
+            total_revenue=round(float(row.total_revenue or 0), 2),
+            avg_price=float(row.price),
+            popularity_score=float(row.total_bookings),
+        )
+        for row in (await db.execute(stmt)).all()
+    ]
+
+
+async def _query_daily_trends(
+    db: AsyncSession,
+    filters: list,
+) -> tuple[List[dict], List[dict]]:
+    """
+    Aggregate daily revenue and booking trends in a single query.
+
+    Returns:
+        Tuple of (revenue_trend, booking_trend), one entry per day with bookings
+    """
+    day = func.date(Booking.scheduled_at).label("day")
+    stmt = (
+        select(
+            day,
+            func.count().label("total_bookings"),
+            _status_count(BookingStatus.COMPLETED).label("completed_bookings"),
+            _status_count(BookingStatus.CANCELLED).label("cancelled_bookings"),
+            _status_count(BookingStatus.NO_SHOW).label("no_show_bookings"),
+            _completed_revenue().label("revenue"),
+        )
+        .where(*filters)
+        .group_by(day)
+        .order_by(day)
+    )
+
+    revenue_trend = []
+    booking_trend = []
+    for row in (await db.execute(stmt)).all():
+        # DATE() yields a date on PostgreSQL and an ISO string on SQLite
+        day_value = str(row.day)
+        revenue_trend.append({
+            "date": day_value,
+            "revenue": round(float(row.revenue or 0), 2),
+            "completed_bookings": row.completed_bookings,
+        })
+        booking_trend.append({
+            "date": day_value,
+            "total_bookings": row.total_bookings,
+            "completed_bookings": row.completed_bookings,
+            "cancelled_bookings": row.cancelled_bookings,
+            "no_show_bookings": row.no_show_bookings,
+        })
+
+    return revenue_trend, booking_trend
+
+
 @router.get(
     "/dashboard",
     response_model=DashboardMetrics,
@@ -136,60 +370,12 @@ async def get_dashboard_metrics(
                 )
             # TODO: Verify user has access to this salon
 
-        # Build base booking query
-        booking_query = db.query(Booking).filter(
-            and_(
-                Booking.scheduled_at >= start_date,
-                Booking.scheduled_at <= end_date
-            )
-        )
-
-        # Filter by salon if specified
-        if salon_id:
-            booking_query = booking_query.join(Professional).filter(
-                Professional.salon_id == salon_id
-            )
-
-        # Get booking metrics
-        bookings = await booking_query.all()
-
-        total_bookings = len(bookings)
-        completed_bookings = len([b for b in bookings if b.status == 'completed'])
-        cancelled_bookings = len([b for b in bookings if b.status == 'cancelled'])
-        no_show_bookings = len([b for b in bookings if b.status == 'no_show'])
-        confirmed_bookings = len([b for b in bookings if b.status == 'confirmed'])
-
-        completion_rate = (completed_bookings / total_bookings * 100) if total_bookings > 0 else 0
-        cancellation_rate = (cancelled_bookings / total_bookings * 100) if total_bookings > 0 else 0
-        no_show_rate = (no_show_bookings / total_bookings * 100) if total_bookings > 0 else 0
-
-        # Calculate revenue from completed bookings
-        completed_booking_prices = [b.service_price for b in bookings if b.status == 'completed']
-        total_revenue = sum(completed_booking_prices)
-        avg_booking_value = (total_revenue / completed_bookings) if completed_bookings > 0 else None
-
-        booking_metrics = BookingMetrics(
-            total_bookings=total_bookings,
-            completed_bookings=completed_bookings,
-            cancelled_bookings=cancelled_bookings,
-            no_show_bookings=no_show_bookings,
-            confirmed_bookings=confirmed_bookings,
-            completion_rate=round(completion_rate, 2),
-            cancellation_rate=round(cancellation_rate, 2),
-            no_show_rate=round(no_show_rate, 2),
-            avg_booking_value=round(avg_booking_value, 2) if avg_booking_value else None,
-            total_revenue=round(total_revenue, 2)
-        )
-
-        # Get top professionals (placeholder - will implement detailed version)
-        top_professionals = []
+        filters = _booking_filters(start_date, end_date, salon_id=salon_id)
 
-        # Get top services (placeholder - will implement detailed version)
-        top_services = []
-
-        # Get trends (placeholder - will implement detailed version)
-        revenue_trend = []
-        booking_trend = []
+        booking_metrics = await _query_booking_metrics(db, filters)
+        top_professionals = await _query_professional_metrics(db, filters, DASHBOARD_TOP_LIMIT)
+        top_services = await _query_service_metrics(db, filters, DASHBOARD_TOP_LIMIT)
+        revenue_trend, booking_trend = await _query_daily_trends(db, filters)
 
         return DashboardMetrics(
             period_start=start_date,
@@ -246,67 +432,15 @@ async def get_booking_metrics(
         if not end_date:
             end_date = datetime.utcnow()
 
-        # Build query with filters
-        query = db.query(Booking).filter(
-            and_(
-                Booking.scheduled_at >= start_date,
-                Booking.scheduled_at <= end_date
-            )
+        filters = _booking_filters(
+            start_date,
+            end_date,
+            salon_id=salon_id,
+            professional_id=professional_id,
+            service_id=service_id,
         )
 
-        if salon_id:
-            query = query.join(Professional).filter(Professional.salon_id == salon_id)
-
-        if professional_id:
-            query = query.filter(Booking.professional_id == professional_id)
-
-        if service_id:
-            query = query.filter(Booking.service_id == service_id)
-
-        bookings = await query.all()
-
-        # Calculate metrics
-        total_bookings = len(bookings)
-        if total_bookings == 0:
-            return BookingMetrics(
-                total_bookings=0,
-                completed_bookings=0,
-                cancelled_bookings=0,
-                no_show_bookings=0,
-                confirmed_bookings=0,
-                completion_rate=0.0,
-                cancellation_rate=0.0,
-                no_show_rate=0.0,
-                avg_booking_value=None,
-                total_revenue=0.0
-            )
-
-        completed_bookings = len([b for b in bookings if b.status == 'completed'])
-        cancelled_bookings = len([b for b in bookings if b.status == 'cancelled'])
-        no_show_bookings = len([b for b in bookings if b.status == 'no_show'])
-        confirmed_bookings = len([b for b in bookings if b.status == 'confirmed'])
-
-        completion_rate = (completed_bookings / total_bookings * 100)
-        cancellation_rate = (cancelled_bookings / total_bookings * 100)
-        no_show_rate = (no_show_bookings / total_bookings * 100)
-
-        # Revenue calculations
-        completed_booking_prices = [b.service_price for b in bookings if b.status == 'completed']
-        total_revenue = sum(completed_booking_prices)
-        avg_booking_value = (total_revenue / completed_bookings) if completed_bookings > 0 else None
-
-        return BookingMetrics(
-            total_bookings=total_bookings,
-            completed_bookings=completed_bookings,
-            cancelled_bookings=cancelled_bookings,
-            no_show_bookings=no_show_bookings,
-            confirmed_bookings=confirmed_bookings,
-            completion_rate=round(completion_rate, 2),
-            cancellation_rate=round(cancellation_rate, 2),
-            no_show_rate=round(no_show_rate, 2),
-            avg_booking_value=round(avg_booking_value, 2) if avg_booking_value else None,
-            total_revenue=round(total_revenue, 2)
-        )
+        return await _query_booking_metrics(db, filters)
 
     except Exception as e:
         logger.error(f"Failed to get booking metrics: {str(e)}")
@@ -350,69 +484,9 @@ async def get_professional_metrics(
         if not end_date:
             end_date = datetime.utcnow()
 
-        # Get professionals with their bookings
-        query = (
-            db.query(Professional)
-            .options(selectinload(Professional.bookings))
-        )
+        filters = _booking_filters(start_date, end_date, salon_id=salon_id)
 
-        if salon_id:
-            query = query.filter(Professional.salon_id == salon_id)
-
-        professionals = await query.limit(limit).all()
-
-        metrics_list = []
-
-        for professional in professionals:
-            # Filter bookings by date range
-            period_bookings = [
-                b for b in professional.bookings
-                if start_date <= b.scheduled_at <= end_date
-            ]
-
-            total_bookings = len(period_bookings)
-            completed_bookings = len([b for b in period_bookings if b.status == 'completed'])
-
-            if total_bookings == 0:
-                continue
-
-            completion_rate = (completed_bookings / total_bookings * 100)
-
-            # Revenue calculations
-            completed_revenues = [b.service_price for b in period_bookings if b.status == 'completed']
-            total_revenue = sum(completed_revenues)
-            avg_booking_value = (total_revenue / completed_bookings) if completed_bookings > 0 else None
-
-            # Client metrics
-            unique_clients = len(set(b.client_id for b in period_bookings))
-
-            # Simple repeat client calculation (clients with more than 1 booking)
-            client_booking_counts = {}
-            for booking in period_bookings:
-                client_booking_counts[booking.client_id] = client_booking_counts.get(booking.client_id, 0) + 1
-
-            repeat_clients = len([count for count in client_booking_counts.values() if count > 1])
-            client_retention_rate = (repeat_clients / unique_clients * 100) if unique_clients > 0 else 0
-
-            metrics = ProfessionalMetrics(
-                professional_id=professional.id,
-                professional_name=professional.name,
-                total_bookings=total_bookings,
-                completed_bookings=completed_bookings,
-                completion_rate=round(completion_rate, 2),
-                total_revenue=round(total_revenue, 2),
-                avg_booking_value=round(avg_booking_value, 2) if avg_booking_value else None,
-                unique_clients=unique_clients,
-                repeat_clients=repeat_clients,
-                client_retention_rate=round(client_retention_rate, 2)
-            )
-
-            metrics_list.append(metrics)
-
-        # Sort by total revenue descending
-        metrics_list.sort(key=lambda x: x.total_revenue, reverse=True)
-
-        return metrics_list
+        return await _query_professional_metrics(db, filters, limit)
 
     except Exception as e:
         logger.error(f"Failed to get professional metrics: {str(e)}")
@@ -457,59 +531,13 @@ async def get_service_metrics(
         if not end_date:
             end_date = datetime.utcnow()
 
-        # Get services with their bookings in the period
-        query = db.query(Service)
-
+        filters = _booking_filters(start_date, end_date)
         if salon_id:
-            query = query.filter(Service.salon_id == salon_id)
-
+            filters.append(Service.salon_id == salon_id)
         if category:
-            query = query.filter(Service.category == category)
+            filters.append(Service.category == category)
 
-        services = await query.limit(limit).all()
-
-        metrics_list = []
-
-        for service in services:
-            # Get bookings for this service in the period
-            bookings = await db.query(Booking).filter(
-                and_(
-                    Booking.service_id == service.id,
-                    Booking.scheduled_at >= start_date,
-                    Booking.scheduled_at <= end_date
-                )
-            ).all()
-
-            total_bookings = len(bookings)
-            if total_bookings == 0:
-                continue
-
-            completed_bookings = len([b for b in bookings if b.status == 'completed'])
-
-            # Revenue calculations
-            completed_revenues = [b.service_price for b in bookings if b.status == 'completed']
-            total_revenue = sum(completed_revenues)
-
-            # Popularity score (simple metric based on booking frequency)
-            popularity_score = total_bookings
-
-            metrics = ServiceMetrics(
-                service_id=service.id,
-                service_name=service.name,
-                category=service.category,
-                total_bookings=total_bookings,
-                completed_bookings=completed_bookings,
-                total_revenue=round(total_revenue, 2),
-                avg_price=float(service.price),
-                popularity_score=popularity_score
-            )
-
-            metrics_list.append(metrics)
-
-        # Sort by popularity score descending
-        metrics_list.sort(key=lambda x: x.popularity_score, reverse=True)
-
-        return metrics_list
+        return await _query_service_metrics(db, filters, limit)
 
     except Exception as e:
         logger.error(f"Failed to get service metrics: {str(e)}")
@@ -525,6 +553,9 @@ async def get_service_metrics(
     description="""
     Get revenue trends over time with various aggregation options.
 
+    Served from the booking_metrics_mv materialized view; `data_freshness`
+    reports when the view was last refreshed.
+
     **Aggregation Options:**
     - daily: Daily revenue data
     - weekly: Weekly aggregated revenue
@@ -564,43 +595,24 @@ async def get_revenue_trend(
                 detail="Invalid aggregation. Use: daily, weekly, monthly"
             )
 
-        # Raw SQL query for revenue trend
-        sql_query = text(f"""
-            SELECT
-                DATE_TRUNC('{date_trunc}', b.scheduled_at) as period,
-                COUNT(*) as total_bookings,
-                COUNT(CASE WHEN b.status = 'completed' THEN 1 END) as completed_bookings,
-                SUM(CASE WHEN b.status = 'completed' THEN b.service_price ELSE 0 END) as revenue
-            FROM bookings b
-            {"JOIN professionals p ON b.professional_id = p.id" if salon_id else ""}
-            WHERE b.scheduled_at >= :start_date
-                AND b.scheduled_at <= :end_date
-                {f"AND p.salon_id = :salon_id" if salon_id else ""}
-            GROUP BY DATE_TRUNC('{date_trunc}', b.scheduled_at)
-            ORDER BY period
-        """)
-
-        params = {
-            "start_date": start_date,
-            "end_date": end_date
-        }
-        if salon_id:
-            params["salon_id"] = salon_id
-
-        result = await db.execute(sql_query, params)
-        rows = result.fetchall()
+        # Served from booking_metrics_mv (refreshed by celery beat)
+        view_service = ReportingViewService(db)
+        rows = await view_service.get_booking_trend(
+            start_date,
+            end_date,
+            granularity=date_trunc,
+            salon_id=salon_id,
+        )
+        freshness = await view_service.get_freshness("booking_metrics_mv")
 
         trend_data = []
         for row in rows:
             trend_data.append({
-                "period": row.period.isoformat(),
-                "total_bookings": row.total_bookings,
-                "completed_bookings": row.completed_bookings,
-                "revenue": float(row.revenue),
-                "completion_rate": round(
-                    (row.completed_bookings / row.total_bookings * 100) if row.total_bookings > 0 else 0,
-                    2
-                )
+                "period": row["period"].isoformat(),
+                "total_bookings": row["total_bookings"],
+                "completed_bookings": row["completed_bookings"],
+                "revenue": row["revenue"],
+                "completion_rate": _percentage(row["completed_bookings"], row["total_bookings"]),
             })
 
         return {
@@ -608,6 +620,7 @@ async def get_revenue_trend(
             "end_date": end_date.isoformat(),
             "aggregation": aggregation,
             "data": trend_data,
+            "data_freshness": freshness.model_dump(mode="json"),
             "summary": {
                 "total_periods": len(trend_data),
                 "total_revenue": sum(item["revenue"] for item in trend_data),
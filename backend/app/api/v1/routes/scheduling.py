@@ -6,11 +6,19 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.db.session import get_db
-from backend.app.domain.scheduling.schemas import SlotResponse
+from backend.app.domain.scheduling.schemas import (
+    BatchSlotResponse,
+    NextAvailableSlotResponse,
+    SlotResponse,
+)
 from backend.app.domain.scheduling.services.slot_service import SlotService
 
 router = APIRouter(prefix="/scheduling", tags=["Scheduling"])
 
+# Upper bounds for batch availability requests
+MAX_BATCH_DAYS = 31
+MAX_BATCH_PROFESSIONALS = 50
+
 
 @router.get(
     "/slots",
@@ -167,3 +175,184 @@ async def get_available_slots(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         ) from e
+
+
+async def _resolve_batch_professionals(
+    slot_service: SlotService,
+    professional_ids: list[int] | None,
+    salon_id: int | None,
+) -> list[int]:
+    """Resolve and validate the professionals of a batch request."""
+    if not professional_ids and salon_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either professional_ids or salon_id must be provided",
+        )
+
+    resolved = await slot_service.resolve_professional_ids(
+        professional_ids=professional_ids,
+        salon_id=salon_id,
+    )
+
+    if len(resolved) > MAX_BATCH_PROFESSIONALS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_PROFESSIONALS} professionals per request",
+        )
+
+    return resolved
+
+
+@router.get(
+    "/slots/batch",
+    response_model=BatchSlotResponse,
+    summary="Get available time slots for several professionals and days",
+    description="""
+    Calculate available time slots for a list of professionals (or every active
+    professional of a salon) over a date range.
+
+    Availabilities and bookings are loaded with one query each and the whole
+    professional x date matrix is computed in memory.
+
+    **Query Parameters:**
+    - `professional_ids`: Repeated professional IDs (e.g. `professional_ids=1&professional_ids=2`)
+    - `salon_id`: Salon whose active professionals should be included
+    - `start_date` / `end_date`: Inclusive date range (at most 31 days)
+    - `service_id`: The ID of the service to book
+    - `slot_interval_minutes`: Optional interval between slots (default: 30 minutes)
+    """,
+)
+async def get_batch_available_slots(
+    service_id: int = Query(..., gt=0, description="ID of the service to book"),
+    start_date: date = Query(..., description="First date of the range (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="Last date of the range (YYYY-MM-DD)"),
+    professional_ids: list[int] | None = Query(None, description="Professional IDs"),
+    salon_id: int | None = Query(None, gt=0, description="Salon ID"),
+    slot_interval_minutes: int = Query(
+        30,
+        gt=0,
+        le=120,
+        description="Interval between slot start times in minutes (default: 30)",
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> BatchSlotResponse:
+    """
+    Get available time slots for several professionals over a date range.
+
+    Args:
+        service_id: ID of the service
+        start_date: First date of the range
+        end_date: Last date of the range
+        professional_ids: Optional list of professional IDs
+        salon_id: Optional salon ID
+        slot_interval_minutes: Interval between slots (default: 30 minutes)
+        session: Database session
+
+    Returns:
+        BatchSlotResponse with slots per professional and date
+
+    Raises:
+        HTTPException: 400 for invalid ranges, 404 if service not found
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must be on or after start_date",
+        )
+
+    if (end_date - start_date).days + 1 > MAX_BATCH_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {MAX_BATCH_DAYS} days",
+        )
+
+    slot_service = SlotService(session)
+    resolved_ids = await _resolve_batch_professionals(slot_service, professional_ids, salon_id)
+
+    try:
+        return await slot_service.calculate_batch_slots(
+            professional_ids=resolved_ids,
+            start_date=start_date,
+            end_date=end_date,
+            service_id=service_id,
+            slot_interval_minutes=slot_interval_minutes,
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+
+@router.get(
+    "/slots/next",
+    response_model=NextAvailableSlotResponse,
+    summary="Get the next available slot",
+    description="""
+    Find the earliest available slot for a service among a list of professionals
+    or every active professional of a salon.
+
+    Bookings are loaded one week at a time and the search stops at the first
+    week containing a free slot.
+    """,
+)
+async def get_next_available_slot(
+    service_id: int = Query(..., gt=0, description="ID of the service to book"),
+    professional_ids: list[int] | None = Query(None, description="Professional IDs"),
+    salon_id: int | None = Query(None, gt=0, description="Salon ID"),
+    from_date: date | None = Query(None, description="Search start date (default: today)"),
+    max_days_ahead: int = Query(30, gt=0, le=90, description="Days to search ahead"),
+    slot_interval_minutes: int = Query(
+        30,
+        gt=0,
+        le=120,
+        description="Interval between slot start times in minutes (default: 30)",
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> NextAvailableSlotResponse:
+    """
+    Get the earliest available slot among several professionals.
+
+    Args:
+        service_id: ID of the service
+        professional_ids: Optional list of professional IDs
+        salon_id: Optional salon ID
+        from_date: Search start date
+        max_days_ahead: Maximum number of days to search
+        slot_interval_minutes: Interval between slots (default: 30 minutes)
+        session: Database session
+
+    Returns:
+        NextAvailableSlotResponse (slot is null when nothing is free)
+
+    Raises:
+        HTTPException: 400 for invalid parameters, 404 if service not found
+    """
+    slot_service = SlotService(session)
+    resolved_ids = await _resolve_batch_professionals(slot_service, professional_ids, salon_id)
+
+    try:
+        next_slot = await slot_service.get_next_available_slot_for_professionals(
+            professional_ids=resolved_ids,
+            service_id=service_id,
+            from_date=from_date,
+            max_days_ahead=max_days_ahead,
+            slot_interval_minutes=slot_interval_minutes,
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+    if next_slot is None:
+        return NextAvailableSlotResponse(service_id=service_id)
+
+    professional_id, slot = next_slot
+    return NextAvailableSlotResponse(
+        service_id=service_id,
+        professional_id=professional_id,
+        slot=slot,
+    )
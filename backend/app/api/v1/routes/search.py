@@ -0,0 +1,131 @@
+"""Salon discovery search endpoints."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.api.v1.schemas.search import (
+    NearbySalonResponse,
+    NearbySalonResult,
+    SalonSearchResponse,
+    SalonSearchResult,
+)
+from backend.app.db.session import get_db
+from backend.app.domain.search import NearbySalonService, SalonSearchService
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get(
+    "",
+    response_model=SalonSearchResponse,
+    summary="Search salons",
+    description="Search salons by text over their services and professionals, category, price range, rating and location.",
+)
+async def search_salons(
+    db: AsyncSession = Depends(get_db),
+    q: str | None = Query(None, max_length=200, description="Free text query"),
+    category: str | None = Query(None, description="Service category"),
+    min_price: float | None = Query(None, ge=0, description="Minimum service price (BRL)"),
+    max_price: float | None = Query(None, ge=0, description="Maximum service price (BRL)"),
+    min_rating: float | None = Query(None, ge=0, le=5, description="Minimum average rating"),
+    city: str | None = Query(None, description="City"),
+    state: str | None = Query(None, min_length=2, max_length=2, description="State code (UF)"),
+    page: int = Query(1, ge=1, le=50, description="Page number"),
+    page_size: int = Query(20, ge=1, le=50, description="Items per page"),
+) -> SalonSearchResponse:
+    """
+    Search salons, best matches first.
+
+    Available to all users (authenticated or not).
+    Results reflect writes after the next search index run.
+    """
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_price must not exceed max_price",
+        )
+
+    hits, total = await SalonSearchService(db).search(
+        query=q,
+        category=category,
+        min_price=min_price,
+        max_price=max_price,
+        min_rating=min_rating,
+        city=city,
+        state=state,
+        limit=page_size,
+        offset=(page - 1) * page_size,
+    )
+
+    return SalonSearchResponse(
+        results=[
+            SalonSearchResult(
+                salon_id=hit.document.salon_id,
+                name=hit.document.name,
+                city=hit.document.city,
+                state=hit.document.state,
+                neighborhood=hit.document.neighborhood,
+                categories=hit.document.categories,
+                min_price=hit.document.min_price,
+                max_price=hit.document.max_price,
+                average_rating=hit.document.average_rating,
+                review_count=hit.document.review_count,
+                rank=hit.rank,
+            )
+            for hit in hits
+        ],
+        total=total,
+        page=page,
+        page_size=page_size,
+    )
+
+
+@router.get(
+    "/nearby",
+    response_model=NearbySalonResponse,
+    summary="Find nearby salons",
+    description="List active salons around a point, nearest first, optionally only those with a free professional later today.",
+)
+async def find_nearby_salons(
+    db: AsyncSession = Depends(get_db),
+    lat: float = Query(..., ge=-90, le=90, description="Latitude"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude"),
+    radius_km: float = Query(5.0, gt=0, le=50, description="Search radius (km)"),
+    available_now: bool = Query(False, description="Only salons with a free professional later today"),
+    duration_minutes: int = Query(30, ge=15, le=480, description="Minimum free time for available_now"),
+    limit: int = Query(20, ge=1, le=50, description="Maximum number of salons"),
+) -> NearbySalonResponse:
+    """
+    Find nearby salons.
+
+    Available to all users (authenticated or not).
+    Salons without coordinates are never returned.
+    """
+    salons = await NearbySalonService(db).find_nearby(
+        latitude=lat,
+        longitude=lon,
+        radius_km=radius_km,
+        limit=limit,
+        available_after=datetime.now() if available_now else None,
+        duration_minutes=duration_minutes,
+    )
+
+    return NearbySalonResponse(
+        results=[
+            NearbySalonResult(
+                salon_id=salon.salon_id,
+                name=salon.name,
+                neighborhood=salon.neighborhood,
+                city=salon.city,
+                state=salon.state,
+                latitude=salon.latitude,
+                longitude=salon.longitude,
+                distance_km=round(salon.distance_km, 3),
+            )
+            for salon in salons
+        ],
+        radius_km=radius_km,
+        available_now=available_now,
+    )
@@ -9,6 +9,7 @@ from backend.app.api.v1.schemas.service import (
     ServiceResponse,
     ServiceUpdateRequest,
 )
+from backend.app.core.exceptions import ValidationError
 from backend.app.core.security.rbac import (
     get_current_user,
     get_current_user_optional,
@@ -110,41 +111,35 @@ async def list_services(
     salon_id: int | None = Query(None, description="Filter by salon ID"),
     category: str | None = Query(None, description="Filter by category"),
     is_active: bool | None = Query(None, description="Filter by active status"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: str | None = Query(None, description="Cursor returned as next_cursor by the previous page"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
 ) -> ServiceListResponse:
     """
     List services with optional filters.
 
     Available to all users (authenticated or not).
-    Results are paginated.
+    Results are cursor-paginated; the total is only reported on the first page.
     """
     service_repo = ServiceRepository(db)
 
-    # Get services based on filters
-    if salon_id and category:
-        services = await service_repo.list_by_category(salon_id, category)
-    elif salon_id:
-        services = await service_repo.list_by_salon_id(salon_id)
-    else:
-        # TODO: Implement list_all with pagination in repository
-        # For now, return empty list if no salon_id provided
-        services = []
-
-    # Filter by is_active if provided
-    if is_active is not None:
-        services = [s for s in services if s.is_active == is_active]
-
-    # Apply pagination
-    total = len(services)
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_services = services[start:end]
+    try:
+        services = await service_repo.list_page(
+            salon_id=salon_id,
+            category=category,
+            is_active=is_active,
+            limit=page_size,
+            cursor=cursor,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     return ServiceListResponse(
-        services=[ServiceResponse.model_validate(s) for s in paginated_services],
-        total=total,
-        page=page,
+        services=[ServiceResponse.model_validate(s) for s in services],
+        total=services.total,
+        next_cursor=services.next_cursor,
         page_size=page_size,
     )
 
@@ -90,6 +90,79 @@ class CancellationFeeResponse(BaseModel):
     refund_amount: float = Field(..., description="Amount to be refunded (BRL)")
 
 
+class CancellationFeeQuoteRequest(BaseModel):
+    """Request to quote cancellation fees of several bookings."""
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "booking_ids": [101, 102, 103],
+                "cancellation_time": "2025-10-19T15:00:00",
+            }
+        }
+    }
+
+    booking_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Bookings to quote",
+    )
+    cancellation_time: datetime | None = Field(
+        None,
+        description="When cancellation would occur (default: now)",
+    )
+
+
+class CancellationFeeQuote(BaseModel):
+    """Cancellation fee quote of one booking."""
+
+    booking_id: int = Field(..., description="Booking ID")
+    can_cancel: bool = Field(..., description="Whether the booking can be cancelled")
+    reason: str = Field(..., description="Why the booking can or cannot be cancelled")
+    fee_amount: float | None = Field(None, description="Cancellation fee amount (BRL)")
+    refund_amount: float | None = Field(None, description="Amount to be refunded (BRL)")
+    tier_name: str | None = Field(None, description="Applied tier name")
+    allows_refund: bool | None = Field(None, description="Whether refund is allowed")
+    policy_name: str | None = Field(None, description="Policy name used")
+    advance_hours: int | None = Field(None, description="Hours of advance notice")
+    deadline: datetime | None = Field(None, description="Last moment this fee applies")
+
+
+class CancellationFeeQuoteResponse(BaseModel):
+    """Response with the cancellation fee quotes of several bookings."""
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "quotes": [
+                    {
+                        "booking_id": 101,
+                        "can_cancel": True,
+                        "reason": "Cancellation allowed",
+                        "fee_amount": 15.00,
+                        "refund_amount": 35.00,
+                        "tier_name": "Standard (24-72h)",
+                        "allows_refund": True,
+                        "policy_name": "Default Platform Policy",
+                        "advance_hours": 48,
+                        "deadline": "2025-10-20T15:00:00Z",
+                    },
+                    {
+                        "booking_id": 102,
+                        "can_cancel": False,
+                        "reason": "Booking already cancelled",
+                    },
+                ],
+                "cancellation_time": "2025-10-19T15:00:00Z",
+            }
+        }
+    }
+
+    quotes: list[CancellationFeeQuote] = Field(..., description="Quotes in request order")
+    cancellation_time: datetime = Field(..., description="Cancellation time the quotes assume")
+
+
 class BookingCancellationRequest(BaseModel):
     """Request to cancel a booking."""
 
@@ -201,15 +274,15 @@ class BookingListResponse(BaseModel):
                     }
                 ],
                 "total": 1,
-                "page": 1,
+                "next_cursor": None,
                 "page_size": 10,
             }
         }
     }
 
     bookings: list[BookingResponse] = Field(default_factory=list, description="List of bookings")
-    total: int = Field(..., description="Total number of bookings")
-    page: int = Field(default=1, description="Current page number")
+    total: int | None = Field(default=None, description="Total number of bookings (first page only)")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page, None on the last page")
     page_size: int = Field(default=10, description="Number of items per page")
 
 
@@ -148,17 +148,16 @@ class ProfessionalListResponse(BaseModel):
         default_factory=list,
         description="List of professionals",
     )
-    total: int = Field(
-        ...,
+    total: int | None = Field(
+        default=None,
         ge=0,
-        description="Total number of professionals",
+        description="Total number of professionals (first page only)",
         examples=[10],
     )
-    page: int = Field(
-        ...,
-        ge=1,
-        description="Current page number",
-        examples=[1],
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor of the next page, None on the last page",
+        examples=["WzEwXQ"],
     )
     page_size: int = Field(
         ...,
@@ -0,0 +1,97 @@
+"""Search API schemas."""
+
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+
+class SalonSearchResult(BaseModel):
+    """One salon matching a search."""
+
+    salon_id: int = Field(..., description="Salon ID")
+    name: str = Field(..., description="Salon name")
+    city: str = Field(..., description="City")
+    state: str = Field(..., description="State code (UF)")
+    neighborhood: str = Field(..., description="Neighborhood/district")
+    categories: list[str] = Field(default_factory=list, description="Categories of the active services")
+    min_price: Decimal | None = Field(None, description="Lowest active service price (BRL)")
+    max_price: Decimal | None = Field(None, description="Highest active service price (BRL)")
+    average_rating: float = Field(..., description="Average rating of approved reviews")
+    review_count: int = Field(..., description="Number of approved reviews")
+    rank: float = Field(..., description="Relevance to the text query (0 without query)")
+
+
+class SalonSearchResponse(BaseModel):
+    """Response schema for salon search."""
+
+    results: list[SalonSearchResult] = Field(default_factory=list, description="Matching salons, best first")
+    total: int = Field(..., description="Total number of matching salons")
+    page: int = Field(default=1, description="Current page number")
+    page_size: int = Field(default=20, description="Number of items per page")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "results": [
+                    {
+                        "salon_id": 1,
+                        "name": "Studio Bela",
+                        "city": "São Paulo",
+                        "state": "SP",
+                        "neighborhood": "Pinheiros",
+                        "categories": ["hair", "nails"],
+                        "min_price": 40.00,
+                        "max_price": 250.00,
+                        "average_rating": 4.7,
+                        "review_count": 128,
+                        "rank": 0.83,
+                    }
+                ],
+                "total": 1,
+                "page": 1,
+                "page_size": 20,
+            }
+        },
+    }
+
+
+class NearbySalonResult(BaseModel):
+    """One salon near the requested point."""
+
+    salon_id: int = Field(..., description="Salon ID")
+    name: str = Field(..., description="Salon name")
+    neighborhood: str = Field(..., description="Neighborhood/district")
+    city: str = Field(..., description="City")
+    state: str = Field(..., description="State code (UF)")
+    latitude: float = Field(..., description="GPS latitude")
+    longitude: float = Field(..., description="GPS longitude")
+    distance_km: float = Field(..., description="Distance from the requested point (km)")
+
+
+class NearbySalonResponse(BaseModel):
+    """Response schema for nearby salons."""
+
+    results: list[NearbySalonResult] = Field(default_factory=list, description="Salons, nearest first")
+    radius_km: float = Field(..., description="Search radius (km)")
+    available_now: bool = Field(..., description="Whether only salons bookable later today were kept")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "results": [
+                    {
+                        "salon_id": 1,
+                        "name": "Studio Bela",
+                        "neighborhood": "Pinheiros",
+                        "city": "São Paulo",
+                        "state": "SP",
+                        "latitude": -23.5614,
+                        "longitude": -46.6820,
+                        "distance_km": 0.42,
+                    }
+                ],
+                "radius_km": 5.0,
+                "available_now": True,
+            }
+        },
+    }
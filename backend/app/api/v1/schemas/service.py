@@ -153,8 +153,8 @@ class ServiceListResponse(BaseModel):
     """Response schema for list of services."""
 
     services: list[ServiceResponse] = Field(..., description="List of services")
-    total: int = Field(..., description="Total number of services")
-    page: int = Field(default=1, description="Current page number")
+    total: int | None = Field(default=None, description="Total number of services (first page only)")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page, None on the last page")
     page_size: int = Field(default=50, description="Number of items per page")
 
     model_config = {
@@ -177,7 +177,7 @@ class ServiceListResponse(BaseModel):
                     }
                 ],
                 "total": 1,
-                "page": 1,
+                "next_cursor": None,
                 "page_size": 50,
             }
         },
@@ -4,6 +4,7 @@ Celery configuration for payment processing background tasks.
 
 import os
 from celery import Celery
+from celery.schedules import crontab
 from backend.app.core.config import settings
 
 # Create Celery app instance
@@ -15,6 +16,10 @@ celery_app = Celery(
         "backend.app.core.celery.tasks.payment_tasks",
         "backend.app.core.celery.tasks.notification_tasks",
         "backend.app.core.celery.tasks.reconciliation_tasks",
+        "backend.app.core.celery.tasks.reporting_tasks",
+        "backend.app.core.celery.tasks.search_tasks",
+        "backend.app.core.celery.tasks.audit_tasks",
+        "backend.app.core.celery.tasks.loyalty_tasks",
     ],
 )
 
@@ -32,6 +37,10 @@ celery_app.conf.update(
         "payment.*": {"queue": "payments"},
         "notification.*": {"queue": "notifications"},
         "reconciliation.*": {"queue": "reconciliation"},
+        "reporting.*": {"queue": "reporting"},
+        "search.*": {"queue": "search"},
+        "audit.*": {"queue": "audit"},
+        "loyalty.*": {"queue": "loyalty"},
     },
 
     # Retry settings
@@ -73,8 +82,37 @@ celery_app.conf.task_routes.update({
     "notification.send_payment_failed": {"queue": "notifications", "priority": 8},
     "reconciliation.daily_reconciliation": {"queue": "reconciliation", "priority": 3},
     "reconciliation.sync_provider_payments": {"queue": "reconciliation", "priority": 4},
+    "reporting.refresh_materialized_views": {"queue": "reporting", "priority": 3},
+    "reporting.apply_daily_rollups": {"queue": "reporting", "priority": 4},
+    "search.apply_search_index": {"queue": "search", "priority": 4},
+    "audit.maintain_partitions": {"queue": "audit", "priority": 3},
+    "loyalty.expire_points": {"queue": "loyalty", "priority": 3},
 })
 
+# Periodic tasks (celery beat)
+celery_app.conf.beat_schedule = {
+    "refresh-reporting-views": {
+        "task": "reporting.refresh_materialized_views",
+        "schedule": settings.REPORTING_VIEWS_REFRESH_INTERVAL_SECONDS,
+    },
+    "apply-daily-rollups": {
+        "task": "reporting.apply_daily_rollups",
+        "schedule": settings.REPORTING_ROLLUP_INTERVAL_SECONDS,
+    },
+    "apply-search-index": {
+        "task": "search.apply_search_index",
+        "schedule": settings.SEARCH_INDEX_INTERVAL_SECONDS,
+    },
+    "maintain-audit-partitions": {
+        "task": "audit.maintain_partitions",
+        "schedule": settings.AUDIT_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+    },
+    "expire-loyalty-points": {
+        "task": "loyalty.expire_points",
+        "schedule": crontab(hour=settings.LOYALTY_EXPIRY_HOUR_UTC, minute=0),
+    },
+}
+
 # Custom task base class for payment tasks
 class PaymentTask(celery_app.Task):
     """Base task class with payment-specific error handling."""
@@ -6,9 +6,11 @@ Celery tasks module.
 from backend.app.core.celery.tasks import payment_tasks
 from backend.app.core.celery.tasks import notification_tasks
 from backend.app.core.celery.tasks import reconciliation_tasks
+from backend.app.core.celery.tasks import reporting_tasks
 
 __all__ = [
     "payment_tasks",
     "notification_tasks",
     "reconciliation_tasks",
+    "reporting_tasks",
 ]
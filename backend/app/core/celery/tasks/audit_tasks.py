@@ -0,0 +1,59 @@
+"""
+Celery tasks for audit event partitions.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from backend.app.core.celery.app import celery_app
+from backend.app.core.config import settings
+from backend.app.db.partitions import (
+    AUDIT_EVENTS_TABLE,
+    drop_monthly_partitions_before,
+    ensure_monthly_partitions,
+    purge_default_partition_before,
+)
+from backend.app.db.session import get_sync_db
+
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name="audit.maintain_partitions")
+def maintain_audit_partitions(
+    self,
+    months_ahead: Optional[int] = None,
+    retention_days: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Create upcoming audit_events partitions and drop expired ones.
+
+    Future months are created first and committed on their own, so a failed
+    drop never leaves the audit writer without a partition to insert into.
+
+    Args:
+        months_ahead: Future months to keep created (default: AUDIT_PARTITION_MONTHS_AHEAD)
+        retention_days: Days of events to keep (default: AUDIT_RETENTION_DAYS)
+
+    Returns:
+        Names of the created and dropped partitions and the number of
+        expired rows deleted from the default partition
+    """
+    months_ahead = months_ahead if months_ahead is not None else settings.AUDIT_PARTITION_MONTHS_AHEAD
+    retention_days = retention_days or settings.AUDIT_RETENTION_DAYS
+
+    with get_sync_db() as db:
+        created = ensure_monthly_partitions(db, AUDIT_EVENTS_TABLE, months_ahead)
+        db.commit()
+
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        dropped = drop_monthly_partitions_before(db, AUDIT_EVENTS_TABLE, cutoff)
+        purged = purge_default_partition_before(db, AUDIT_EVENTS_TABLE, cutoff)
+        db.commit()
+
+    return {
+        "created": created,
+        "dropped": [name for name, _ in dropped],
+        "purged_default_rows": purged,
+    }
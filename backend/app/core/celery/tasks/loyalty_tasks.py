@@ -0,0 +1,39 @@
+"""
+Celery tasks for loyalty points.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from backend.app.core.celery.app import celery_app
+from backend.app.core.config import settings
+from backend.app.db.repositories.loyalty import expire_due_points
+from backend.app.db.session import get_sync_db
+
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name="loyalty.expire_points")
+def expire_loyalty_points(self, chunk_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Expire due loyalty points of every account in keyset chunks.
+
+    Each chunk is committed on its own (see expire_points_chunk), so a
+    failed run keeps the chunks already expired and the next run resumes
+    with the remaining due transactions.
+
+    Args:
+        chunk_size: Transactions expired per transaction (default: LOYALTY_EXPIRY_CHUNK_SIZE)
+
+    Returns:
+        Expired accounts, points, transactions and chunks
+    """
+    chunk_size = chunk_size or settings.LOYALTY_EXPIRY_CHUNK_SIZE
+
+    with get_sync_db() as db:
+        stats = expire_due_points(db, datetime.now(timezone.utc), chunk_size=chunk_size)
+
+    logger.info(f"Expired loyalty points: {stats}")
+    return stats
@@ -0,0 +1,127 @@
+"""
+Celery tasks for reporting materialized views.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from backend.app.core.celery.app import celery_app
+from backend.app.core.config import settings
+from backend.app.db.materialized_views import REPORTING_VIEWS
+from backend.app.db.session import get_sync_db
+from backend.app.domain.reporting.rollups import claim_rollup_days, rebuild_rollups
+
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock namespace (first key) for view refreshes
+REFRESH_LOCK_NAMESPACE = 7302
+
+# Upper bound of batches per run, so one run cannot hog a worker
+MAX_ROLLUP_BATCHES_PER_RUN = 20
+
+
+@celery_app.task(bind=True, name="reporting.refresh_materialized_views")
+def refresh_materialized_views(
+    self,
+    views: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Refresh the reporting materialized views without blocking readers.
+
+    Each view is refreshed with REFRESH MATERIALIZED VIEW CONCURRENTLY in its
+    own transaction and its refresh time is recorded in report_view_refreshes.
+    A view whose refresh is still running in another worker is skipped.
+
+    Args:
+        views: Views to refresh (default: all reporting views)
+
+    Returns:
+        Lists of refreshed, skipped and failed views
+    """
+    result: Dict[str, Any] = {"refreshed": {}, "skipped": [], "failed": {}}
+
+    with get_sync_db() as db:
+        for view_name in views or REPORTING_VIEWS:
+            if view_name not in REPORTING_VIEWS:
+                result["failed"][view_name] = "unknown view"
+                continue
+
+            try:
+                acquired = db.execute(
+                    text("SELECT pg_try_advisory_xact_lock(:namespace, hashtext(:view_name))"),
+                    {"namespace": REFRESH_LOCK_NAMESPACE, "view_name": view_name},
+                ).scalar()
+                if not acquired:
+                    db.rollback()
+                    result["skipped"].append(view_name)
+                    continue
+
+                started = time.monotonic()
+                # view_name is validated against REPORTING_VIEWS above
+                db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}"))
+                duration_ms = int((time.monotonic() - started) * 1000)
+
+                db.execute(
+                    text("""
+                        INSERT INTO report_view_refreshes (view_name, refreshed_at, duration_ms)
+                        VALUES (:view_name, NOW(), :duration_ms)
+                        ON CONFLICT (view_name) DO UPDATE
+                        SET refreshed_at = EXCLUDED.refreshed_at,
+                            duration_ms = EXCLUDED.duration_ms
+                    """),
+                    {"view_name": view_name, "duration_ms": duration_ms},
+                )
+                db.commit()
+
+                result["refreshed"][view_name] = duration_ms
+                logger.info(f"Refreshed {view_name} in {duration_ms}ms")
+
+            except Exception as e:
+                db.rollback()
+                result["failed"][view_name] = str(e)
+                logger.error(f"Failed to refresh {view_name}: {str(e)}")
+
+    return result
+
+
+@celery_app.task(bind=True, name="reporting.apply_daily_rollups")
+def apply_daily_rollups(
+    self,
+    batch_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Rebuild the daily rollup rows of queued (day, professional) pairs.
+
+    Each batch is claimed, rebuilt and committed in one transaction, so a
+    failed batch goes back to the queue.
+
+    Args:
+        batch_size: Pairs per batch (default: REPORTING_ROLLUP_BATCH_SIZE)
+
+    Returns:
+        Number of rebuilt pairs and batches
+    """
+    batch_size = batch_size or settings.REPORTING_ROLLUP_BATCH_SIZE
+    rebuilt = 0
+    batches = 0
+
+    with get_sync_db() as db:
+        while batches < MAX_ROLLUP_BATCHES_PER_RUN:
+            keys = claim_rollup_days(db, batch_size)
+            if not keys:
+                break
+
+            rebuild_rollups(db, keys)
+            db.commit()
+
+            rebuilt += len(keys)
+            batches += 1
+
+    if rebuilt:
+        logger.info(f"Rebuilt {rebuilt} daily rollup days in {batches} batches")
+
+    return {"rebuilt_days": rebuilt, "batches": batches}
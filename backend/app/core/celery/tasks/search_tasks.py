@@ -0,0 +1,56 @@
+"""
+Celery tasks for the salon discovery search index.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from backend.app.core.celery.app import celery_app
+from backend.app.core.config import settings
+from backend.app.db.session import get_sync_db
+from backend.app.domain.search.index import claim_search_salons, rebuild_search_documents
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of batches per run, so one run cannot hog a worker
+MAX_SEARCH_BATCHES_PER_RUN = 20
+
+
+@celery_app.task(bind=True, name="search.apply_search_index")
+def apply_search_index(
+    self,
+    batch_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Rebuild the search documents of queued salons.
+
+    Each batch is claimed, rebuilt and committed in one transaction, so a
+    failed batch goes back to the queue.
+
+    Args:
+        batch_size: Salons per batch (default: SEARCH_INDEX_BATCH_SIZE)
+
+    Returns:
+        Number of reindexed salons and batches
+    """
+    batch_size = batch_size or settings.SEARCH_INDEX_BATCH_SIZE
+    reindexed = 0
+    batches = 0
+
+    with get_sync_db() as db:
+        while batches < MAX_SEARCH_BATCHES_PER_RUN:
+            salon_ids = claim_search_salons(db, batch_size)
+            if not salon_ids:
+                break
+
+            rebuild_search_documents(db, salon_ids)
+            db.commit()
+
+            reindexed += len(salon_ids)
+            batches += 1
+
+    if reindexed:
+        logger.info(f"Reindexed {reindexed} salons in {batches} batches")
+
+    return {"reindexed_salons": reindexed, "batches": batches}
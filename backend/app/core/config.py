@@ -103,6 +103,68 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = Field(default=True)
     RATE_LIMIT_PER_MINUTE: int = Field(default=60)
 
+    # Availability cache (free intervals per professional and date)
+    AVAILABILITY_CACHE_ENABLED: bool = Field(default=True)
+    AVAILABILITY_CACHE_TTL_SECONDS: int = Field(default=600)
+    AVAILABILITY_CACHE_L1_TTL_SECONDS: int = Field(default=5)
+    AVAILABILITY_CACHE_L1_MAX_ENTRIES: int = Field(default=10000)
+
+    # Overbooking configuration snapshot
+    OVERBOOKING_CONFIG_SNAPSHOT_MAX_AGE_SECONDS: int = Field(default=300)
+
+    # Report cache (optimized report endpoints)
+    REPORT_CACHE_ENABLED: bool = Field(default=True)
+    REPORT_CACHE_STALE_TTL_SECONDS: int = Field(default=300)
+    REPORT_CACHE_LOCK_TIMEOUT_SECONDS: int = Field(default=30)
+
+    # Audit sink (batched audit event writes)
+    AUDIT_SINK_MAX_QUEUE_SIZE: int = Field(default=10000)
+    AUDIT_SINK_BATCH_SIZE: int = Field(default=500)
+    AUDIT_SINK_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0)
+    AUDIT_SINK_PUT_TIMEOUT_SECONDS: float = Field(default=0.5)
+
+    # Notification dispatcher (per-channel limits keyed by channel value)
+    NOTIFICATION_DISPATCH_BATCH_SIZE: int = Field(default=200)
+    NOTIFICATION_DISPATCH_POLL_INTERVAL_SECONDS: float = Field(default=1.0)
+    NOTIFICATION_CHANNEL_CONCURRENCY: dict[str, int] = Field(
+        default={"email": 20, "sms": 10, "whatsapp": 10, "push": 50, "in_app": 100}
+    )
+    NOTIFICATION_CHANNEL_RATE_PER_SECOND: dict[str, float] = Field(
+        default={"email": 50.0, "sms": 10.0, "whatsapp": 20.0, "push": 200.0}
+    )
+
+    # Compiled notification template LRU cache
+    NOTIFICATION_TEMPLATE_CACHE_SIZE: int = Field(default=256)
+
+    # Booking reminder time wheel
+    BOOKING_REMINDER_TICK_SECONDS: float = Field(default=60.0)
+    BOOKING_REMINDER_BATCH_SIZE: int = Field(default=500)
+
+    # Loyalty points expiry (Celery beat task)
+    LOYALTY_EXPIRY_HOUR_UTC: int = Field(default=3)
+    LOYALTY_EXPIRY_CHUNK_SIZE: int = Field(default=1000)
+
+    # Reporting materialized views
+    REPORTING_VIEWS_REFRESH_INTERVAL_SECONDS: int = Field(default=900)
+    REPORTING_VIEWS_MAX_STALENESS_SECONDS: int = Field(default=3600)
+
+    # Incremental daily reporting rollups
+    REPORTING_ROLLUP_INTERVAL_SECONDS: int = Field(default=60)
+    REPORTING_ROLLUP_BATCH_SIZE: int = Field(default=500)
+
+    # Salon discovery search index
+    SEARCH_INDEX_INTERVAL_SECONDS: int = Field(default=30)
+    SEARCH_INDEX_BATCH_SIZE: int = Field(default=200)
+
+    # Audit event partitions and retention
+    AUDIT_RETENTION_DAYS: int = Field(default=365)
+    AUDIT_PARTITION_MONTHS_AHEAD: int = Field(default=3)
+    AUDIT_PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = Field(default=21600)
+    AUDIT_STATISTICS_CACHE_TTL_SECONDS: int = Field(default=60)
+
+    # Cancellation policy registry (seconds between version checks)
+    CANCELLATION_POLICY_REFRESH_SECONDS: float = Field(default=30.0)
+
     # Observability
     OTEL_ENABLED: bool = Field(default=False)
     OTEL_SERVICE_NAME: str = "esalao-api"
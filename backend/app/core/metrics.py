@@ -1,10 +1,11 @@
 """Prometheus metrics middleware and endpoints."""
 
-from prometheus_client import Counter, Histogram, generate_latest
+import time
+
+from prometheus_client import Counter, Gauge, Histogram, generate_latest
 from prometheus_client.core import CollectorRegistry
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Create registry
 registry = CollectorRegistry()
@@ -24,34 +25,115 @@ http_request_duration_seconds = Histogram(
     registry=registry
 )
 
+audit_events_written_total = Counter(
+    'audit_events_written_total',
+    'Audit events persisted by the audit sink',
+    registry=registry
+)
+
+audit_events_dropped_total = Counter(
+    'audit_events_dropped_total',
+    'Audit events lost by the audit sink',
+    ['reason'],
+    registry=registry
+)
+
+audit_sink_queue_depth = Gauge(
+    'audit_sink_queue_depth',
+    'Audit events waiting to be written',
+    registry=registry
+)
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect HTTP metrics."""
+audit_sink_flush_duration_seconds = Histogram(
+    'audit_sink_flush_duration_seconds',
+    'Duration of one audit sink batch insert',
+    registry=registry
+)
+
+notifications_dispatched_total = Counter(
+    'notifications_dispatched_total',
+    'Notification delivery attempts by the dispatcher',
+    ['channel', 'status'],
+    registry=registry
+)
+
+notification_dispatch_batch_duration_seconds = Histogram(
+    'notification_dispatch_batch_duration_seconds',
+    'Duration of one claimed notification batch, from claim to commit',
+    registry=registry
+)
 
-    async def dispatch(self, request: Request, call_next):
+
+# Label for requests that matched no route (404s, scanners)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the route that handled a request.
+
+    Routing stores the matched route in the scope, so this is only meaningful
+    once the application has processed the request.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        Template such as "/api/v1/bookings/{booking_id}", or UNMATCHED_ROUTE
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """
+    ASGI middleware to collect HTTP metrics.
+
+    Requests are labelled by route template instead of raw path, which keeps
+    label cardinality bounded by the number of routes.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple[str, ...] = ("/metrics",)):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            excluded_paths: Paths that are not measured
+        """
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics."""
-        # Skip metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
-
-        method = request.method
-        path = request.url.path
-
-        # Start timer
-        with http_request_duration_seconds.labels(
-            method=method,
-            endpoint=path
-        ).time():
-            response = await call_next(request)
-
-        # Record metrics
-        http_requests_total.labels(
-            method=method,
-            endpoint=path,
-            status_code=response.status_code
-        ).inc()
-
-        return response
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            method = scope["method"]
+            endpoint = route_template(scope)
+
+            http_request_duration_seconds.labels(
+                method=method,
+                endpoint=endpoint
+            ).observe(time.perf_counter() - started)
+            http_requests_total.labels(
+                method=method,
+                endpoint=endpoint,
+                status_code=status_code
+            ).inc()
 
 
 async def metrics_endpoint():
@@ -5,117 +5,271 @@ This module provides caching, query optimization, and performance monitoring
 utilities specifically designed for the reporting system.
 """
 
+import asyncio
+import inspect
 import json
 import logging
-from datetime import datetime, timedelta
+import time
+import uuid
+from datetime import datetime
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
 
-import redis
-from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.config import settings
+from backend.app.core.redis import get_async_redis
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
-# Redis client for caching
-try:
-    redis_client = redis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=settings.REDIS_DB,
-        decode_responses=True,
-        socket_connect_timeout=5,
-        socket_timeout=5,
-    )
-    redis_client.ping()
-    logger.info("Redis connection established for reporting cache")
-except Exception as e:
-    logger.warning(f"Redis not available for reporting cache: {e}")
-    redis_client = None
+# Seconds to skip Redis after a connection error
+REDIS_RETRY_BACKOFF_SECONDS = 30
+
+# Deletes the refresh lock only if it is still held by the caller
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 
 class ReportCache:
-    """Redis-based caching for reporting endpoints."""
+    """
+    Redis cache for report endpoints with stampede protection.
+
+    Entries are stored with a freshness deadline and kept for an extra
+    stale_ttl_seconds. Once an entry is stale, one caller recomputes it while
+    concurrent callers keep receiving the stale data. Concurrent misses in a
+    process share one computation, and a short Redis lock extends this across
+    processes.
+
+    Keys embed a version number per prefix plus a global one, so invalidation
+    is a single INCR instead of a KEYS scan; orphaned entries expire by TTL.
+    """
 
+    KEY_PREFIX = "reports"
     DEFAULT_TTL = 900  # 15 minutes
+    ALL = "*"
+
+    # Polling of a miss whose computation runs in another process
+    LOCK_POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        redis_client: "aioredis.Redis | None" = None,
+        stale_ttl_seconds: int = 300,
+        lock_timeout_seconds: int = 30,
+        lock_wait_seconds: float = 5.0,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: asyncio Redis client (None disables caching)
+            stale_ttl_seconds: How long an expired entry may still be served
+                while it is being recomputed
+            lock_timeout_seconds: Expiry of the cross-process refresh lock
+            lock_wait_seconds: How long a miss waits for another process to
+                fill the entry before computing it itself
+            enabled: When False every call computes the report
+        """
+        self.redis = redis_client
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+        self.enabled = enabled
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis_retry_at = 0.0
 
     @staticmethod
-    def _make_cache_key(prefix: str, **kwargs) -> str:
-        """Generate cache key from prefix and parameters."""
+    def _make_params_key(params: Dict[str, Any]) -> str:
+        """Generate the parameter part of a cache key."""
         # Sort parameters for consistent keys
-        params = sorted(kwargs.items())
-        params_str = "&".join(f"{k}={v}" for k, v in params if v is not None)
-        return f"reports:{prefix}:{params_str}"
-
-    @staticmethod
-    def _serialize_datetime(obj: Any) -> str:
-        """Custom JSON serializer for datetime objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object {obj} is not JSON serializable")
+        return "&".join(f"{k}={v}" for k, v in sorted(params.items()) if v is not None)
 
     @classmethod
-    def get(cls, prefix: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """Get cached report data."""
-        if not redis_client:
-            return None
+    def _version_key(cls, prefix: str) -> str:
+        return f"{cls.KEY_PREFIX}:version:{prefix}"
+
+    def _redis_available(self) -> bool:
+        return (
+            self.enabled
+            and self.redis is not None
+            and time.monotonic() >= self._redis_retry_at
+        )
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_BACKOFF_SECONDS
+        logger.warning(f"Report cache {operation} failed, bypassing cache: {error}")
+
+    async def _make_cache_key(self, prefix: str, params: Dict[str, Any]) -> str:
+        """Generate the versioned cache key of a report."""
+        global_version, prefix_version = await self.redis.mget(
+            self._version_key(self.ALL), self._version_key(prefix)
+        )
+        return (
+            f"{self.KEY_PREFIX}:{prefix}:"
+            f"v{global_version or 0}.{prefix_version or 0}:{self._make_params_key(params)}"
+        )
+
+    async def get_or_compute(
+        self,
+        prefix: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Return the cached report or compute and cache it.
+
+        Args:
+            prefix: Report name
+            params: Report parameters
+            compute: Coroutine function producing the report
+            ttl: Seconds the entry is fresh (default: 15 minutes)
+
+        Returns:
+            Cached (JSON-decoded) or freshly computed report
+        """
+        if not self._redis_available():
+            return await compute()
 
         try:
-            cache_key = cls._make_cache_key(prefix, **kwargs)
-            cached_data = redis_client.get(cache_key)
+            cache_key = await self._make_cache_key(prefix, params)
+            cached = await self.redis.get(cache_key)
+        except Exception as e:
+            self._redis_failed("read", e)
+            return await compute()
 
-            if cached_data:
+        stale = None
+        if cached:
+            entry = json.loads(cached)
+            if entry["fresh_until"] > time.time():
                 logger.debug(f"Cache hit for {cache_key}")
-                return json.loads(cached_data)
-            else:
-                logger.debug(f"Cache miss for {cache_key}")
-                return None
+                return entry["data"]
+            stale = entry["data"]
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            if stale is not None:
+                return stale
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The computing request went away; compute it ourselves
+                return await compute()
 
-        except Exception as e:
-            logger.error(f"Cache get error: {e}")
-            return None
+        logger.debug(f"Cache {'stale' if stale is not None else 'miss'} for {cache_key}")
+        future = asyncio.get_running_loop().create_future()
+        # Waiters may all have gone away; don't log an unretrieved exception
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[cache_key] = future
 
-    @classmethod
-    def set(cls, prefix: str, data: Dict[str, Any], ttl: int = None, **kwargs) -> bool:
-        """Set cached report data."""
-        if not redis_client:
-            return False
+        try:
+            result = await self._refresh(cache_key, compute, ttl or self.DEFAULT_TTL, stale)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _refresh(
+        self,
+        cache_key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale: Any,
+    ) -> Any:
+        """Compute an entry unless another process already does."""
+        lock_key = f"{cache_key}:lock"
+        token = uuid.uuid4().hex
 
         try:
-            cache_key = cls._make_cache_key(prefix, **kwargs)
-            ttl = ttl or cls.DEFAULT_TTL
+            locked = await self.redis.set(lock_key, token, nx=True, ex=self.lock_timeout_seconds)
+        except Exception as e:
+            self._redis_failed("lock", e)
+            return await compute()
 
-            serialized_data = json.dumps(data, default=cls._serialize_datetime)
-            redis_client.setex(cache_key, ttl, serialized_data)
+        if not locked:
+            if stale is not None:
+                return stale
 
-            logger.debug(f"Cached data for {cache_key} with TTL {ttl}s")
-            return True
+            deadline = time.monotonic() + self.lock_wait_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.LOCK_POLL_INTERVAL_SECONDS)
+                try:
+                    cached = await self.redis.get(cache_key)
+                except Exception as e:
+                    self._redis_failed("read", e)
+                    break
+                if cached:
+                    return json.loads(cached)["data"]
+
+        try:
+            result = await compute()
+            if result is not None:
+                await self._store(cache_key, result, ttl)
+            return result
+        finally:
+            if locked:
+                try:
+                    await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    self._redis_failed("unlock", e)
 
+    async def _store(self, cache_key: str, result: Any, ttl: int) -> None:
+        entry = {"data": jsonable_encoder(result), "fresh_until": time.time() + ttl}
+        try:
+            await self.redis.set(cache_key, json.dumps(entry), ex=ttl + self.stale_ttl_seconds)
+            logger.debug(f"Cached data for {cache_key} with TTL {ttl}s")
         except Exception as e:
-            logger.error(f"Cache set error: {e}")
-            return False
+            self._redis_failed("write", e)
 
-    @classmethod
-    def delete_pattern(cls, pattern: str) -> int:
-        """Delete cache entries matching pattern."""
-        if not redis_client:
-            return 0
+    async def invalidate(self, prefix: str = ALL) -> int:
+        """
+        Invalidate the cached entries of one report, or of all reports.
 
-        try:
-            keys = redis_client.keys(f"reports:{pattern}")
-            if keys:
-                deleted = redis_client.delete(*keys)
-                logger.info(f"Deleted {deleted} cache entries matching {pattern}")
-                return deleted
+        Args:
+            prefix: Report name, or ALL
+
+        Returns:
+            New version number of the prefix (0 if Redis is unavailable)
+        """
+        if not self._redis_available():
             return 0
 
+        try:
+            version = await self.redis.incr(self._version_key(prefix))
         except Exception as e:
-            logger.error(f"Cache delete pattern error: {e}")
+            self._redis_failed("invalidate", e)
             return 0
 
+        logger.info(f"Invalidated report cache for {prefix} (version {version})")
+        return version
+
+
+report_cache = ReportCache(
+    redis_client=get_async_redis(),
+    stale_ttl_seconds=settings.REPORT_CACHE_STALE_TTL_SECONDS,
+    lock_timeout_seconds=settings.REPORT_CACHE_LOCK_TIMEOUT_SECONDS,
+    enabled=settings.REPORT_CACHE_ENABLED,
+)
+
 
 def cache_report(prefix: str, ttl: int = None):
     """
@@ -123,17 +277,16 @@ def cache_report(prefix: str, ttl: int = None):
 
     Args:
         prefix: Cache key prefix
-        ttl: Time to live in seconds (default: 15 minutes)
+        ttl: Seconds the result is fresh (default: 15 minutes)
     """
     def decorator(func: Callable) -> Callable:
+        sig = inspect.signature(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Extract request parameters for cache key
             cache_params = {}
 
-            # Get function arguments
-            import inspect
-            sig = inspect.signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
@@ -145,19 +298,12 @@ def cache_report(prefix: str, ttl: int = None):
                     elif value is not None:
                         cache_params[name] = str(value)
 
-            # Try to get from cache
-            cached_result = ReportCache.get(prefix, **cache_params)
-            if cached_result:
-                return cached_result
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-
-            # Cache the result
-            if isinstance(result, dict):
-                ReportCache.set(prefix, result, ttl, **cache_params)
-
-            return result
+            return await report_cache.get_or_compute(
+                prefix,
+                cache_params,
+                lambda: func(*args, **kwargs),
+                ttl,
+            )
 
         return wrapper
     return decorator
@@ -0,0 +1,32 @@
+"""Shared asyncio Redis client."""
+
+import redis.asyncio as aioredis
+
+from backend.app.core.config import settings
+
+_async_client: aioredis.Redis | None = None
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    Get the process-wide asyncio Redis client.
+
+    The client is created lazily; connections are opened on first use, so
+    importing modules that depend on Redis never blocks or fails when Redis
+    is unavailable.
+
+    Returns:
+        Shared redis.asyncio.Redis instance
+    """
+    global _async_client
+
+    if _async_client is None:
+        _async_client = aioredis.from_url(
+            str(settings.REDIS_URL),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            health_check_interval=30,
+        )
+
+    return _async_client
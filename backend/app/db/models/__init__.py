@@ -26,6 +26,10 @@ from .review import (
     Review, ReviewHelpfulness, ReviewFlag,
     ReviewStatus, ReviewModerationReason
 )
+from .reporting_rollup import BookingDailyRollup, NoShowDailyRollup, RollupDirtyDay
+from .job_checkpoint import JobCheckpoint
+from .booking_reminder import BookingReminder
+from .search_document import SalonSearchDocument, SearchDirtySalon
 
 __all__ = [
     "Base",
@@ -82,4 +86,11 @@ __all__ = [
     "ReviewFlag",
     "ReviewStatus",
     "ReviewModerationReason",
+    "BookingDailyRollup",
+    "NoShowDailyRollup",
+    "RollupDirtyDay",
+    "JobCheckpoint",
+    "BookingReminder",
+    "SalonSearchDocument",
+    "SearchDirtySalon",
 ]
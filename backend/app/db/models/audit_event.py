@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Any, Dict, Optional
 
 from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, query_expression
 
 from backend.app.db.models.base import Base
 
@@ -96,11 +96,16 @@ class AuditEvent(Base):
 
     This model captures detailed information about user actions,
     system events, and data changes for compliance and security purposes.
+
+    On PostgreSQL the table is range partitioned by month on timestamp (see
+    backend.app.db.partitions) and its primary key is (id, timestamp); ids
+    still come from a single sequence, so the mapper keys rows on id alone.
+    Filter on timestamp whenever possible so that queries skip partitions.
     """
 
     __tablename__ = "audit_events"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Event identification
     event_type = Column(String(50), nullable=False, index=True)
@@ -142,6 +147,9 @@ class AuditEvent(Base):
     success = Column(String(10), nullable=True)  # success, failure, partial
     error_message = Column(Text, nullable=True)
 
+    # Text search rank, loaded only by ranked searches (see with_expression)
+    search_rank = query_expression()
+
     def __repr__(self) -> str:
         """String representation of audit event."""
         return (
@@ -9,7 +9,9 @@ from sqlalchemy import (
     Text,
     Numeric,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -36,6 +38,18 @@ class Booking(Base, IDMixin, TimestampMixin):
     """
 
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Per-professional agenda lookups (admission checks, day and range listings)
+        Index("idx_bookings_professional_scheduled", "professional_id", "scheduled_at"),
+        # Candidates of the batch no-show detection, scanned in ID order
+        Index(
+            "idx_bookings_no_show_candidates",
+            "id",
+            postgresql_where=text(
+                "status IN ('CONFIRMED', 'IN_PROGRESS') AND marked_no_show_at IS NULL"
+            ),
+        ),
+    )
 
     # Client relationship
     client_id: Mapped[int] = mapped_column(
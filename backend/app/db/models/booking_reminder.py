@@ -0,0 +1,44 @@
+"""Pending booking reminders of the reminder time wheel."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.models.base import Base
+
+
+class BookingReminder(Base):
+    """
+    One reminder of a booking waiting for its firing time.
+
+    Only the booking and the firing time are stored; the reminder is
+    rendered from the booking when it fires, so it always reflects the
+    booking's current data.
+    """
+
+    __tablename__ = "booking_reminders"
+
+    booking_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("bookings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    minutes_before: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        comment="Minutes before the appointment the reminder fires",
+    )
+    fire_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="When the reminder fires",
+    )
+
+    __table_args__ = (
+        Index("idx_booking_reminders_fire_at", "fire_at"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of BookingReminder."""
+        return f"<BookingReminder(booking_id={self.booking_id}, fire_at={self.fire_at})>"
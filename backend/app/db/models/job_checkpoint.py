@@ -0,0 +1,46 @@
+"""Checkpoints of resumable background jobs."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.models.base import Base
+
+
+class JobCheckpoint(Base):
+    """
+    Progress of the latest run of a resumable background job.
+
+    Jobs commit their checkpoint in the same transaction as each unit of
+    work, so a run that crashed is resumed from the last committed position.
+    """
+
+    __tablename__ = "job_checkpoints"
+
+    job_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    phase: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Phase of the run ('completed' once it finished)",
+    )
+    run_started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Reference time of the run, kept when it is resumed",
+    )
+    cursor: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+        comment="Last ID processed in the current phase",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of JobCheckpoint."""
+        return f"<JobCheckpoint(job={self.job_name}, phase={self.phase}, cursor={self.cursor})>"
@@ -0,0 +1,160 @@
+"""Daily reporting rollup models."""
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Index, Numeric, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.models.base import Base
+
+
+class BookingDailyRollup(Base):
+    """
+    Booking and payment aggregates per day, professional and service.
+
+    Rows are rebuilt for the (day, professional) pairs queued in
+    RollupDirtyDay, so maintenance cost follows the volume of changes
+    instead of the size of the bookings table.
+    """
+
+    __tablename__ = "booking_daily_rollups"
+    __table_args__ = (
+        Index("idx_booking_daily_rollups_professional_date", "professional_id", "rollup_date"),
+        Index("idx_booking_daily_rollups_salon_date", "salon_id", "rollup_date"),
+        Index("idx_booking_daily_rollups_service_date", "service_id", "rollup_date"),
+    )
+
+    rollup_date: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        comment="Day of the bookings (scheduled_at)",
+    )
+    professional_id: Mapped[int] = mapped_column(
+        primary_key=True,
+        comment="Professional of the bookings",
+    )
+    service_id: Mapped[int] = mapped_column(
+        primary_key=True,
+        comment="Service of the bookings",
+    )
+    salon_id: Mapped[int] = mapped_column(
+        nullable=False,
+        comment="Salon of the professional",
+    )
+
+    # Booking counts
+    total_bookings: Mapped[int] = mapped_column(nullable=False, default=0)
+    completed_bookings: Mapped[int] = mapped_column(nullable=False, default=0)
+    cancelled_bookings: Mapped[int] = mapped_column(nullable=False, default=0)
+    no_show_bookings: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    # Amounts (BRL)
+    completed_revenue: Mapped[float] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=0,
+        comment="Sum of service_price of completed bookings",
+    )
+    paid_amount: Mapped[float] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=0,
+        comment="Sum of succeeded (incl. partially refunded) payments",
+    )
+    refunded_amount: Mapped[float] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=0,
+        comment="Sum of fully refunded payments",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of BookingDailyRollup."""
+        return (
+            f"<BookingDailyRollup(date={self.rollup_date}, "
+            f"professional_id={self.professional_id}, service_id={self.service_id})>"
+        )
+
+
+class NoShowDailyRollup(Base):
+    """
+    No-show counts and fees per day, professional, service and reason.
+
+    Maintained together with BookingDailyRollup: the rows of a queued
+    (day, professional) pair are rebuilt in the same pass.
+    """
+
+    __tablename__ = "no_show_daily_rollups"
+    __table_args__ = (
+        Index("idx_no_show_daily_rollups_professional_date", "professional_id", "rollup_date"),
+        Index("idx_no_show_daily_rollups_salon_date", "salon_id", "rollup_date"),
+    )
+
+    rollup_date: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        comment="Day of the bookings (scheduled_at)",
+    )
+    professional_id: Mapped[int] = mapped_column(
+        primary_key=True,
+        comment="Professional of the bookings",
+    )
+    service_id: Mapped[int] = mapped_column(
+        primary_key=True,
+        comment="Service of the bookings",
+    )
+    reason: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="no_show_reason of the bookings ('unknown' when not set)",
+    )
+    salon_id: Mapped[int] = mapped_column(
+        nullable=False,
+        comment="Salon of the professional",
+    )
+
+    no_show_bookings: Mapped[int] = mapped_column(nullable=False, default=0)
+    no_show_fees: Mapped[float] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=0,
+        comment="Sum of no_show_fee_amount (BRL)",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of NoShowDailyRollup."""
+        return (
+            f"<NoShowDailyRollup(date={self.rollup_date}, "
+            f"professional_id={self.professional_id}, reason={self.reason!r})>"
+        )
+
+
+class RollupDirtyDay(Base):
+    """(day, professional) pair whose rollup rows must be rebuilt."""
+
+    __tablename__ = "rollup_dirty_days"
+
+    rollup_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    professional_id: Mapped[int] = mapped_column(primary_key=True)
+    marked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of RollupDirtyDay."""
+        return f"<RollupDirtyDay(date={self.rollup_date}, professional_id={self.professional_id})>"
@@ -1,7 +1,7 @@
 """Salon model for beauty establishments."""
 
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.db.models.base import Base, IDMixin, TimestampMixin
@@ -19,6 +19,10 @@ class Salon(Base, IDMixin, TimestampMixin):
     """
 
     __tablename__ = "salons"
+    __table_args__ = (
+        # Bounding-box range scans of nearby-salon lookups
+        Index("idx_salons_location", "latitude", "longitude"),
+    )
 
     # Basic information
     name: Mapped[str] = mapped_column(
@@ -90,6 +94,16 @@ class Salon(Base, IDMixin, TimestampMixin):
         nullable=False,
         comment="ZIP/Postal code (CEP)",
     )
+    latitude: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        comment="GPS latitude (decimal degrees)",
+    )
+    longitude: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        comment="GPS longitude (decimal degrees)",
+    )
 
     # Status
     is_active: Mapped[bool] = mapped_column(
@@ -0,0 +1,99 @@
+"""Denormalised salon discovery documents."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Numeric, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.models.base import Base
+
+
+class SalonSearchDocument(Base):
+    """
+    One search document per salon, rebuilt from its catalog and reviews.
+
+    The migration adds a weighted ``search_vector`` tsvector generated from
+    the text columns (name > services > professionals > description and
+    location), a GIN index on it and a trigram index on ``name``. The column
+    is not mapped so the model stays usable on SQLite.
+    """
+
+    __tablename__ = "salon_search_documents"
+    __table_args__ = (
+        Index("idx_salon_search_documents_city", "city", "state"),
+        Index("idx_salon_search_documents_rating", "average_rating"),
+    )
+
+    salon_id: Mapped[int] = mapped_column(
+        ForeignKey("salons.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    city: Mapped[str] = mapped_column(String(100), nullable=False)
+    state: Mapped[str] = mapped_column(String(2), nullable=False)
+    neighborhood: Mapped[str] = mapped_column(String(100), nullable=False)
+    is_active: Mapped[bool] = mapped_column(nullable=False)
+
+    # Catalog
+    categories: Mapped[list[str]] = mapped_column(
+        ARRAY(String(100)).with_variant(JSON(), "sqlite"),
+        nullable=False,
+        default=list,
+        comment="Lower-cased categories of the active services",
+    )
+    services_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        default="",
+        comment="Names and categories of the active services",
+    )
+    professionals_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        default="",
+        comment="Names and specialties of the active professionals",
+    )
+    min_price: Mapped[float | None] = mapped_column(
+        Numeric(10, 2),
+        nullable=True,
+        comment="Lowest active service price (BRL)",
+    )
+    max_price: Mapped[float | None] = mapped_column(
+        Numeric(10, 2),
+        nullable=True,
+        comment="Highest active service price (BRL)",
+    )
+
+    # Ratings (approved reviews)
+    average_rating: Mapped[float] = mapped_column(nullable=False, default=0)
+    review_count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of SalonSearchDocument."""
+        return f"<SalonSearchDocument(salon_id={self.salon_id}, name='{self.name}')>"
+
+
+class SearchDirtySalon(Base):
+    """Salon whose search document must be rebuilt."""
+
+    __tablename__ = "search_dirty_salons"
+
+    salon_id: Mapped[int] = mapped_column(primary_key=True)
+    marked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of SearchDirtySalon."""
+        return f"<SearchDirtySalon(salon_id={self.salon_id})>"
@@ -0,0 +1,219 @@
+"""
+Monthly range partitions (PostgreSQL).
+
+Large append-only tables such as audit_events are partitioned by month on
+their timestamp column. Partitions are named <table>_yYYYYmMM and cover
+[first day of the month, first day of the next month).
+
+Future partitions are created ahead of time by a beat task, and retention
+detaches and drops whole partitions instead of deleting rows, so expiring
+old data neither rewrites the table nor leaves dead tuples to vacuum.
+
+A DEFAULT partition (<table>_default) catches rows outside every monthly
+partition, so writes keep working if the beat task falls behind. Rows it
+holds are moved into their month when that partition is created, and
+expired ones are deleted by retention.
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+AUDIT_EVENTS_TABLE = "audit_events"
+
+# Partition key column of the monthly partitioned tables
+PARTITION_KEY = "timestamp"
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of the month containing moment."""
+    return datetime(moment.year, moment.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift the first day of a month by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Name of the partition of table holding the given month."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def default_partition_name(table: str) -> str:
+    """Name of the DEFAULT partition of table."""
+    return f"{table}_default"
+
+
+def partition_month(table: str, name: str) -> datetime | None:
+    """Month held by a partition, or None if name is not a monthly partition of table."""
+    match = re.fullmatch(rf"{re.escape(table)}_y(\d{{4}})m(\d{{2}})", name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def partition_bounds(month: datetime) -> Tuple[datetime, datetime]:
+    """Lower (inclusive) and upper (exclusive) bounds of a monthly partition."""
+    start = month_start(month)
+    return start, add_months(start, 1)
+
+
+def list_partitions(db: Session, table: str) -> List[str]:
+    """Names of the partitions currently attached to table."""
+    result = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table "
+            "ORDER BY child.relname"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in result]
+
+
+def ensure_monthly_partitions(
+    db: Session,
+    table: str,
+    months_ahead: int,
+    now: datetime | None = None,
+) -> List[str]:
+    """
+    Create the partitions of the current month and the next months_ahead months.
+
+    Args:
+        db: Database session (PostgreSQL)
+        table: Partitioned parent table
+        months_ahead: Number of future months to create
+        now: Reference time (default: current UTC time)
+
+    Returns:
+        Names of the partitions that were created
+    """
+    current = month_start(now or datetime.utcnow())
+    existing = set(list_partitions(db, table))
+    default = default_partition_name(table)
+    created = []
+
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(table, month)
+        if name in existing:
+            continue
+
+        start, end = partition_bounds(month)
+        in_month = f"\"{PARTITION_KEY}\" >= '{start.isoformat()}' AND \"{PARTITION_KEY}\" < '{end.isoformat()}'"
+
+        # Creating the partition fails while the default one holds rows of
+        # its month: park those rows in a temporary table meanwhile
+        moved = default in existing and db.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {in_month})')
+        ).scalar()
+        if moved:
+            columns = ", ".join(f'"{column}"' for column in insertable_columns(db, table))
+            db.execute(text(
+                f'CREATE TEMPORARY TABLE "{name}_moved" ON COMMIT DROP AS '
+                f'SELECT {columns} FROM "{default}" WHERE {in_month}'
+            ))
+            db.execute(text(f'DELETE FROM "{default}" WHERE {in_month}'))
+
+        db.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        if moved:
+            db.execute(text(f'INSERT INTO "{table}" ({columns}) SELECT {columns} FROM "{name}_moved"'))
+            logger.info(f"Moved rows of {name} out of {default}")
+        created.append(name)
+
+    if created:
+        logger.info(f"Created partitions of {table}: {', '.join(created)}")
+
+    return created
+
+
+def insertable_columns(db: Session, table: str) -> List[str]:
+    """Columns of table that accept inserted values (not generated)."""
+    result = db.execute(
+        text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = :table AND is_generated = 'NEVER' "
+            "ORDER BY ordinal_position"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in result]
+
+
+def drop_monthly_partitions_before(
+    db: Session,
+    table: str,
+    cutoff: datetime,
+) -> List[Tuple[str, int]]:
+    """
+    Detach and drop the partitions whose every row is older than cutoff.
+
+    A month is only dropped once its whole range has expired, so up to one
+    month of data older than cutoff is kept.
+
+    Args:
+        db: Database session (PostgreSQL)
+        table: Partitioned parent table
+        cutoff: Rows older than this may be dropped
+
+    Returns:
+        Dropped partition names with their estimated row counts
+    """
+    dropped = []
+
+    for name in list_partitions(db, table):
+        month = partition_month(table, name)
+        if month is None or partition_bounds(month)[1] > cutoff:
+            continue
+
+        estimated_rows = db.execute(
+            text("SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE relname = :name"),
+            {"name": name},
+        ).scalar() or 0
+
+        db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+        db.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append((name, estimated_rows))
+
+    if dropped:
+        logger.info(f"Dropped partitions of {table}: {', '.join(name for name, _ in dropped)}")
+
+    return dropped
+
+
+def purge_default_partition_before(db: Session, table: str, cutoff: datetime) -> int:
+    """
+    Delete the rows of the DEFAULT partition older than cutoff.
+
+    Args:
+        db: Database session (PostgreSQL)
+        table: Partitioned parent table
+        cutoff: Rows older than this are deleted
+
+    Returns:
+        Number of deleted rows
+    """
+    default = default_partition_name(table)
+    if default not in list_partitions(db, table):
+        return 0
+
+    result = db.execute(
+        text(f'DELETE FROM "{default}" WHERE "{PARTITION_KEY}" < :cutoff'),
+        {"cutoff": cutoff},
+    )
+    return result.rowcount
@@ -8,10 +8,33 @@ including filtering, searching, and reporting capabilities.
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, delete, desc, func, literal, literal_column, null, or_, select, union_all
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import with_expression
 
 from backend.app.db.models.audit_event import AuditEvent, AuditEventType, AuditEventSeverity
+from backend.app.db.partitions import (
+    AUDIT_EVENTS_TABLE,
+    drop_monthly_partitions_before,
+    purge_default_partition_before,
+)
+from backend.app.db.repositories.pagination import KeysetPage, count_capped, paginate
+
+# Text search configuration of the generated search_vector column
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+# Generated by the migration (PostgreSQL only) and not mapped on the model
+search_vector = literal_column("audit_events.search_vector", TSVECTOR)
+
+# Largest exact total of a search; larger totals are planner estimates
+SEARCH_COUNT_CAP = 10_000
+
+# GROUPING(event_type, severity, user_id) of each statistics breakdown
+STATS_BY_TYPE = 0b011
+STATS_BY_SEVERITY = 0b101
+STATS_BY_USER = 0b110
+STATS_TOTAL = 0b111
 
 
 class AuditEventRepository:
@@ -143,7 +166,7 @@ class AuditEventRepository:
             end_date: Filter events before this date
             correlation_id: Filter by correlation ID
             success_status: Filter by success status
-            search_term: Search in description and action fields
+            search_term: Search words in description, action and event type
             skip: Number of records to skip
             limit: Maximum number of records to return
             order_by: Field to order by
@@ -177,11 +200,7 @@ class AuditEventRepository:
         if ip_address:
             conditions.append(AuditEvent.ip_address == ip_address)
 
-        if start_date:
-            conditions.append(AuditEvent.timestamp >= start_date)
-
-        if end_date:
-            conditions.append(AuditEvent.timestamp <= end_date)
+        conditions.extend(self._timestamp_range(start_date, end_date))
 
         if correlation_id:
             conditions.append(AuditEvent.correlation_id == correlation_id)
@@ -190,12 +209,7 @@ class AuditEventRepository:
             conditions.append(AuditEvent.success == success_status)
 
         if search_term:
-            search_conditions = [
-                AuditEvent.description.ilike(f"%{search_term}%"),
-                AuditEvent.action.ilike(f"%{search_term}%"),
-                AuditEvent.event_type.ilike(f"%{search_term}%"),
-            ]
-            conditions.append(or_(*search_conditions))
+            conditions.append(self._search_condition(search_term))
 
         if conditions:
             stmt = stmt.where(and_(*conditions))
@@ -231,6 +245,91 @@ class AuditEventRepository:
 
         return list(events), total_count
 
+    async def search_events(
+        self,
+        search_term: str,
+        user_id: Optional[int] = None,
+        event_types: Optional[List[AuditEventType]] = None,
+        severities: Optional[List[AuditEventSeverity]] = None,
+        resource_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        count_mode: str = "estimate",
+    ) -> Tuple[KeysetPage[AuditEvent], Optional[int], bool]:
+        """
+        Full-text search of audit events, best matches first.
+
+        On PostgreSQL the words are matched against the GIN-indexed
+        search_vector (web search syntax) and ranked with ts_rank_cd; other
+        databases fall back to substring matching with rank 0. Pages follow
+        (rank, timestamp, id) with a cursor, and a date range lets PostgreSQL
+        skip partitions.
+
+        Args:
+            search_term: Words to search for
+            user_id: Filter by user ID
+            event_types: Filter by event types
+            severities: Filter by severity levels
+            resource_type: Filter by resource type
+            start_date: Filter events after this date
+            end_date: Filter events before this date
+            limit: Page size
+            cursor: Cursor of the previous page
+            count_mode: "exact", "estimate" (exact up to SEARCH_COUNT_CAP,
+                then the planner's estimate) or "none"
+
+        Returns:
+            Tuple of (page of events with search_rank set, total or None,
+            whether the total is an estimate)
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        conditions = [self._search_condition(search_term)]
+        conditions.extend(self._timestamp_range(start_date, end_date))
+
+        if user_id is not None:
+            conditions.append(AuditEvent.user_id == user_id)
+
+        if event_types:
+            conditions.append(AuditEvent.event_type.in_(event_types))
+
+        if severities:
+            conditions.append(AuditEvent.severity.in_(severities))
+
+        if resource_type:
+            conditions.append(AuditEvent.resource_type == resource_type)
+
+        if self._is_postgres():
+            rank = func.ts_rank_cd(search_vector, func.websearch_to_tsquery(SEARCH_CONFIG, search_term))
+        else:
+            rank = literal(0.0)
+
+        stmt = select(AuditEvent).where(and_(*conditions))
+        page = await paginate(
+            self.session,
+            stmt.options(with_expression(AuditEvent.search_rank, rank)),
+            sort_columns=[rank, AuditEvent.timestamp, AuditEvent.id],
+            sort_key=lambda event: (event.search_rank, event.timestamp, event.id),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+            with_total=False,
+        )
+
+        # Totals are only computed for the first page
+        total, is_estimate = None, False
+        if cursor is None and count_mode == "exact":
+            total = await self.session.scalar(
+                select(func.count()).select_from(stmt.subquery())
+            )
+        elif cursor is None and count_mode == "estimate":
+            total, is_estimate = await count_capped(self.session, stmt, SEARCH_COUNT_CAP)
+
+        return page, total, is_estimate
+
     async def get_user_activity(
         self,
         user_id: int,
@@ -329,6 +428,8 @@ class AuditEventRepository:
         self,
         correlation_id: str,
         limit: int = 100,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
     ) -> List[AuditEvent]:
         """
         Get all events with the same correlation ID.
@@ -336,13 +437,18 @@ class AuditEventRepository:
         Args:
             correlation_id: Correlation ID to search for
             limit: Maximum number of events to return
+            start_date: Only events after this date
+            end_date: Only events before this date
 
         Returns:
             List of related audit events
         """
         stmt = (
             select(AuditEvent)
-            .where(AuditEvent.correlation_id == correlation_id)
+            .where(
+                AuditEvent.correlation_id == correlation_id,
+                *self._timestamp_range(start_date, end_date),
+            )
             .order_by(AuditEvent.timestamp)
             .limit(limit)
         )
@@ -355,6 +461,8 @@ class AuditEventRepository:
         resource_type: str,
         resource_id: str,
         limit: int = 50,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
     ) -> List[AuditEvent]:
         """
         Get audit history for a specific resource.
@@ -363,6 +471,8 @@ class AuditEventRepository:
             resource_type: Type of resource
             resource_id: ID of the resource
             limit: Maximum number of events to return
+            start_date: Only events after this date
+            end_date: Only events before this date
 
         Returns:
             List of audit events for the resource
@@ -372,7 +482,8 @@ class AuditEventRepository:
             .where(
                 and_(
                     AuditEvent.resource_type == resource_type,
-                    AuditEvent.resource_id == resource_id
+                    AuditEvent.resource_id == resource_id,
+                    *self._timestamp_range(start_date, end_date),
                 )
             )
             .order_by(desc(AuditEvent.timestamp))
@@ -402,54 +513,39 @@ class AuditEventRepository:
         if not end_date:
             end_date = datetime.utcnow()
 
-        # Build base condition
         base_condition = and_(
             AuditEvent.timestamp >= start_date,
             AuditEvent.timestamp <= end_date
         )
 
-        # Total events
-        total_stmt = select(func.count(AuditEvent.id)).where(base_condition)
-        total_result = await self.session.execute(total_stmt)
-        total_events = total_result.scalar()
-
-        # Events by type
-        type_stmt = (
-            select(AuditEvent.event_type, func.count(AuditEvent.id))
-            .where(base_condition)
-            .group_by(AuditEvent.event_type)
-            .order_by(desc(func.count(AuditEvent.id)))
-        )
-        type_result = await self.session.execute(type_stmt)
-        events_by_type = dict(type_result.fetchall())
-
-        # Events by severity
-        severity_stmt = (
-            select(AuditEvent.severity, func.count(AuditEvent.id))
-            .where(base_condition)
-            .group_by(AuditEvent.severity)
-            .order_by(desc(func.count(AuditEvent.id)))
-        )
-        severity_result = await self.session.execute(severity_stmt)
-        events_by_severity = dict(severity_result.fetchall())
-
-        # Top users by activity
-        user_stmt = (
-            select(AuditEvent.user_id, func.count(AuditEvent.id))
-            .where(and_(base_condition, AuditEvent.user_id.is_not(None)))
-            .group_by(AuditEvent.user_id)
-            .order_by(desc(func.count(AuditEvent.id)))
-            .limit(10)
-        )
-        user_result = await self.session.execute(user_stmt)
-        top_users = dict(user_result.fetchall())
-
-        # Failed events
-        failed_stmt = select(func.count(AuditEvent.id)).where(
-            and_(base_condition, AuditEvent.success == "failure")
+        # Every breakdown in one pass: one row per group of each grouping set
+        grouped = self._statistics_groups(base_condition).subquery()
+        position = func.row_number().over(
+            partition_by=grouped.c.grouping_id,
+            order_by=[grouped.c.user_id.is_(None), grouped.c.events.desc()],
         )
-        failed_result = await self.session.execute(failed_stmt)
-        failed_events = failed_result.scalar()
+        ranked = select(grouped, position.label("position")).subquery()
+        stmt = select(ranked).where(
+            or_(
+                ranked.c.grouping_id != STATS_BY_USER,
+                and_(ranked.c.position <= 10, ranked.c.user_id.is_not(None)),
+            )
+        ).order_by(ranked.c.grouping_id, ranked.c.position)
+
+        total_events = failed_events = 0
+        events_by_type: Dict[str, int] = {}
+        events_by_severity: Dict[str, int] = {}
+        top_users: Dict[int, int] = {}
+
+        for row in (await self.session.execute(stmt)).all():
+            if row.grouping_id == STATS_TOTAL:
+                total_events, failed_events = row.events, row.failed
+            elif row.grouping_id == STATS_BY_TYPE:
+                events_by_type[row.event_type] = row.events
+            elif row.grouping_id == STATS_BY_SEVERITY:
+                events_by_severity[row.severity] = row.events
+            elif row.grouping_id == STATS_BY_USER:
+                top_users[row.user_id] = row.events
 
         return {
             "total_events": total_events,
@@ -472,29 +568,38 @@ class AuditEventRepository:
         """
         Clean up old audit events.
 
+        On PostgreSQL whole monthly partitions are detached and dropped once
+        all their events are older than the cutoff, so up to one more month
+        is kept and the returned count is the planner's row estimate; expired
+        events in the default partition are deleted. Other databases delete
+        the events in batches.
+
         Args:
             days_to_keep: Number of days of events to keep
-            batch_size: Number of events to delete per batch
+            batch_size: Number of events to delete per batch (non-PostgreSQL)
 
         Returns:
             Number of events deleted
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
 
-        # Count events to be deleted
-        count_stmt = select(func.count(AuditEvent.id)).where(
-            AuditEvent.timestamp < cutoff_date
-        )
-        count_result = await self.session.execute(count_stmt)
-        total_to_delete = count_result.scalar()
-
-        if total_to_delete == 0:
-            return 0
+        if self._is_postgres():
+            dropped = await self.session.run_sync(
+                lambda sync_session: drop_monthly_partitions_before(
+                    sync_session, AUDIT_EVENTS_TABLE, cutoff_date
+                )
+            )
+            purged = await self.session.run_sync(
+                lambda sync_session: purge_default_partition_before(
+                    sync_session, AUDIT_EVENTS_TABLE, cutoff_date
+                )
+            )
+            await self.session.commit()
+            return sum(estimated_rows for _, estimated_rows in dropped) + purged
 
         # Delete in batches to avoid long-running transactions
         deleted_count = 0
-        while deleted_count < total_to_delete:
-            # Get batch of IDs to delete
+        while True:
             id_stmt = (
                 select(AuditEvent.id)
                 .where(AuditEvent.timestamp < cutoff_date)
@@ -506,12 +611,86 @@ class AuditEventRepository:
             if not ids_to_delete:
                 break
 
-            # Delete the batch
-            from sqlalchemy import delete as sql_delete
-            delete_stmt = sql_delete(AuditEvent).where(AuditEvent.id.in_(ids_to_delete))
-            await self.session.execute(delete_stmt)
-
+            await self.session.execute(delete(AuditEvent).where(AuditEvent.id.in_(ids_to_delete)))
             await self.session.commit()
             deleted_count += len(ids_to_delete)
 
         return deleted_count
+
+    def _statistics_groups(self, condition: Any) -> Any:
+        """
+        Event and failure counts per type, severity and user, plus totals.
+
+        PostgreSQL computes every grouping in one scan with GROUPING SETS;
+        other databases get the same rows from a UNION ALL.
+        """
+        counts = [
+            func.count().label("events"),
+            func.count().filter(AuditEvent.success == "failure").label("failed"),
+        ]
+
+        if self._is_postgres():
+            return (
+                select(
+                    func.grouping(AuditEvent.event_type, AuditEvent.severity, AuditEvent.user_id).label("grouping_id"),
+                    AuditEvent.event_type,
+                    AuditEvent.severity,
+                    AuditEvent.user_id,
+                    *counts,
+                )
+                .where(condition)
+                .group_by(func.grouping_sets(
+                    literal_column("()"),
+                    AuditEvent.event_type,
+                    AuditEvent.severity,
+                    AuditEvent.user_id,
+                ))
+            )
+
+        def grouping(grouping_id: int, *columns: Any) -> Any:
+            keys = {column.key: column for column in columns}
+            return (
+                select(
+                    literal(grouping_id).label("grouping_id"),
+                    keys.get("event_type", null()).label("event_type"),
+                    keys.get("severity", null()).label("severity"),
+                    keys.get("user_id", null()).label("user_id"),
+                    *counts,
+                )
+                .where(condition)
+                .group_by(*columns)
+            )
+
+        return union_all(
+            grouping(STATS_TOTAL),
+            grouping(STATS_BY_TYPE, AuditEvent.event_type),
+            grouping(STATS_BY_SEVERITY, AuditEvent.severity),
+            grouping(STATS_BY_USER, AuditEvent.user_id),
+        )
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _search_condition(self, search_term: str) -> Any:
+        """Match search words in description, action and event type."""
+        if self._is_postgres():
+            return search_vector.op("@@")(func.websearch_to_tsquery(SEARCH_CONFIG, search_term))
+
+        return or_(
+            AuditEvent.description.ilike(f"%{search_term}%"),
+            AuditEvent.action.ilike(f"%{search_term}%"),
+            AuditEvent.event_type.ilike(f"%{search_term}%"),
+        )
+
+    @staticmethod
+    def _timestamp_range(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> List[Any]:
+        """Timestamp conditions, which let PostgreSQL skip whole partitions."""
+        conditions = []
+        if start_date:
+            conditions.append(AuditEvent.timestamp >= start_date)
+        if end_date:
+            conditions.append(AuditEvent.timestamp <= end_date)
+        return conditions
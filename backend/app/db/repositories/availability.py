@@ -16,6 +16,19 @@ class AvailabilityRepository:
         """Initialize repository with database session."""
         self.session = session
 
+    async def _invalidate_availability(self, *professional_ids: int) -> None:
+        """
+        Drop every cached free-interval day of the given professionals.
+
+        Availability windows apply to every matching weekday, so the whole
+        professional is invalidated.
+        """
+        # Imported lazily: the scheduling domain imports this repository
+        from backend.app.domain.scheduling.cache import availability_cache
+
+        for professional_id in set(professional_ids):
+            await availability_cache.invalidate_professional(professional_id)
+
     async def create(
         self,
         professional_id: int,
@@ -51,6 +64,7 @@ class AvailabilityRepository:
         self.session.add(availability)
         await self.session.commit()
         await self.session.refresh(availability)
+        await self._invalidate_availability(professional_id)
 
         return availability
 
@@ -157,6 +171,40 @@ class AvailabilityRepository:
 
         return active
 
+    async def list_active_by_professional_ids(
+        self,
+        professional_ids: list[int],
+    ) -> list[Availability]:
+        """
+        List active availability slots for several professionals in one query.
+
+        Args:
+            professional_ids: Professional IDs
+
+        Returns:
+            List of active Availability instances ordered by professional,
+            day of week and start time
+        """
+        if not professional_ids:
+            return []
+
+        stmt = (
+            select(Availability)
+            .where(
+                and_(
+                    Availability.professional_id.in_(professional_ids),
+                    Availability.is_active.is_(True),
+                )
+            )
+            .order_by(
+                Availability.professional_id,
+                Availability.day_of_week,
+                Availability.start_time,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def update(
         self,
         availability_id: int,
@@ -176,12 +224,17 @@ class AvailabilityRepository:
         if not availability:
             return None
 
+        previous_professional_id = availability.professional_id
+
         for key, value in fields.items():
             if hasattr(availability, key):
                 setattr(availability, key, value)
 
         await self.session.commit()
         await self.session.refresh(availability)
+        await self._invalidate_availability(
+            previous_professional_id, availability.professional_id
+        )
 
         return availability
 
@@ -199,8 +252,11 @@ class AvailabilityRepository:
         if not availability:
             return False
 
+        professional_id = availability.professional_id
+
         await self.session.delete(availability)
         await self.session.commit()
+        await self._invalidate_availability(professional_id)
 
         return True
 
@@ -220,6 +276,7 @@ class AvailabilityRepository:
             await self.session.delete(availability)
 
         await self.session.commit()
+        await self._invalidate_availability(professional_id)
 
         return len(availabilities)
 
@@ -1,17 +1,141 @@
 """Booking repository for database operations."""
 
-from datetime import date, datetime
+import logging
+from datetime import date, datetime, timedelta
+from itertools import chain, product
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, event, exists, func, inspect, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import MissingGreenlet
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.util import await_only
 
 from backend.app.db.models.booking import Booking, BookingStatus
 from backend.app.db.models.professional import Professional
+from backend.app.db.repositories.pagination import KeysetPage, paginate
+
+# Namespace (first key) of the per-professional agenda advisory locks
+AGENDA_LOCK_NAMESPACE = 7301
+
+# Statuses that occupy a professional's agenda
+ACTIVE_BOOKING_STATUSES = [BookingStatus.PENDING, BookingStatus.CONFIRMED]
+
+# Booking fields whose changes alter the free intervals of an agenda day
+AGENDA_FIELDS = ("professional_id", "scheduled_at", "duration_minutes", "status")
+
+# Session.info key of the agenda days written by the current transaction
+AGENDA_DAYS_KEY = "availability_agenda_days"
+
+logger = logging.getLogger(__name__)
+
+
+def booking_end_expression():
+    """SQL expression for the end of a booking (scheduled_at + duration)."""
+    return Booking.scheduled_at + func.make_interval(0, 0, 0, 0, 0, Booking.duration_minutes)
+
+
+async def invalidate_availability(*agenda_days: tuple[int, datetime]) -> None:
+    """
+    Drop cached free intervals for the given agenda days.
+
+    Args:
+        *agenda_days: (professional_id, scheduled_at) pairs
+    """
+    # Imported lazily: the scheduling domain imports this repository
+    from backend.app.domain.scheduling.cache import availability_cache
+
+    dates_by_professional: dict[int, set[date]] = {}
+    for professional_id, scheduled_at in agenda_days:
+        dates_by_professional.setdefault(professional_id, set()).add(scheduled_at.date())
+
+    for professional_id, dates in dates_by_professional.items():
+        await availability_cache.invalidate(professional_id, dates)
+
+
+def _current_and_previous(state, key: str) -> set:
+    """Current and pre-flush values of an attribute, without None."""
+    history = state.attrs[key].history
+    return {
+        value for value in chain(history.added, history.unchanged, history.deleted)
+        if value is not None
+    }
+
+
+def _collect_agenda_days(session: Session, flush_context) -> None:
+    """after_flush hook: remember the agenda days touched by this flush."""
+    days: set[tuple[int, datetime]] = set()
+    booking_ids: set[int] = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Booking):
+            continue
+
+        state = inspect(obj)
+        if obj in session.dirty and not any(
+            state.attrs[key].history.has_changes() for key in AGENDA_FIELDS
+        ):
+            continue
+
+        if "scheduled_at" not in state.dict or "professional_id" not in state.dict:
+            # Unloaded columns: read the flushed row instead
+            if state.identity:
+                booking_ids.add(state.identity[0])
+            continue
+
+        days |= set(product(
+            _current_and_previous(state, "professional_id"),
+            _current_and_previous(state, "scheduled_at"),
+        ))
+
+    if booking_ids:
+        days |= set(session.execute(
+            select(Booking.professional_id, Booking.scheduled_at).where(Booking.id.in_(booking_ids))
+        ).tuples())
+
+    if days:
+        session.info.setdefault(AGENDA_DAYS_KEY, set()).update(days)
+
+
+def _invalidate_committed_agenda_days(session: Session) -> None:
+    """
+    after_commit hook: drop the cached agenda days written by the transaction.
+
+    Runs only once the changes are visible to other sessions, so a reader
+    can no longer re-cache the pre-commit state of these days. AsyncSession
+    commits inside a greenlet, where the async cache can be awaited.
+    """
+    days = session.info.pop(AGENDA_DAYS_KEY, None)
+    if not days:
+        return
+
+    invalidation = invalidate_availability(*days)
+    try:
+        await_only(invalidation)
+    except MissingGreenlet:
+        # Plain sync session (e.g. Celery): no event loop to reach the cache
+        invalidation.close()
+        logger.debug("Skipped availability cache invalidation outside an async session")
+
+
+def _discard_agenda_days(session: Session) -> None:
+    """after_rollback hook: nothing was written, nothing to invalidate."""
+    session.info.pop(AGENDA_DAYS_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_agenda_days)
+event.listen(Session, "after_commit", _invalidate_committed_agenda_days)
+event.listen(Session, "after_rollback", _discard_agenda_days)
 
 
 class BookingRepository:
-    """Repository for Booking model database operations."""
+    """
+    Repository for Booking model database operations.
+
+    Cached free intervals of the agenda days a transaction writes are
+    dropped when it commits (see the session hooks above), so write methods
+    do not invalidate the availability cache themselves.
+    """
 
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session."""
@@ -89,15 +213,22 @@ class BookingRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_by_client_id(self, client_id: int) -> list[Booking]:
+    async def list_by_client_id(
+        self,
+        client_id: int,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> KeysetPage[Booking]:
         """
-        List all bookings for a client.
+        List bookings for a client.
 
         Args:
             client_id: Client (User) ID
+            limit: Optional page size (None: every booking)
+            cursor: Cursor of the previous page
 
         Returns:
-            List of Booking instances ordered by scheduled_at descending
+            Page of Booking instances ordered by scheduled_at descending
         """
         stmt = (
             select(Booking)
@@ -106,20 +237,25 @@ class BookingRepository:
                 selectinload(Booking.professional).selectinload(Professional.user),
                 selectinload(Booking.service),
             )
-            .order_by(Booking.scheduled_at.desc())
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate_by_schedule(stmt, limit, cursor)
 
-    async def list_by_professional_id(self, professional_id: int) -> list[Booking]:
+    async def list_by_professional_id(
+        self,
+        professional_id: int,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> KeysetPage[Booking]:
         """
-        List all bookings for a professional.
+        List bookings for a professional.
 
         Args:
             professional_id: Professional ID
+            limit: Optional page size (None: every booking)
+            cursor: Cursor of the previous page
 
         Returns:
-            List of Booking instances ordered by scheduled_at descending
+            Page of Booking instances ordered by scheduled_at descending
         """
         stmt = (
             select(Booking)
@@ -128,10 +264,27 @@ class BookingRepository:
                 selectinload(Booking.client),
                 selectinload(Booking.service),
             )
-            .order_by(Booking.scheduled_at.desc())
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._paginate_by_schedule(stmt, limit, cursor)
+
+    async def _paginate_by_schedule(
+        self,
+        stmt,
+        limit: int | None,
+        cursor: str | None,
+    ) -> KeysetPage[Booking]:
+        """Page bookings newest first by (scheduled_at, id)."""
+        return await paginate(
+            self.session,
+            stmt,
+            sort_columns=[Booking.scheduled_at, Booking.id],
+            sort_key=lambda booking: [booking.scheduled_at, booking.id],
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+            # Unpaginated listings need no separate total
+            with_total=limit is not None,
+        )
 
     async def list_by_professional_and_date(
         self,
@@ -158,7 +311,7 @@ class BookingRepository:
                     Booking.professional_id == professional_id,
                     Booking.scheduled_at >= start_datetime,
                     Booking.scheduled_at <= end_datetime,
-                    Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
+                    Booking.status.in_(ACTIVE_BOOKING_STATUSES),
                 )
             )
             .order_by(Booking.scheduled_at)
@@ -166,6 +319,81 @@ class BookingRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_by_professionals_and_date_range(
+        self,
+        professional_ids: list[int],
+        start_date: date,
+        end_date: date,
+    ) -> list[Booking]:
+        """
+        List active bookings for several professionals over a date range.
+
+        Uses a single range query so callers computing availability for many
+        professionals and days avoid one query per (professional, date).
+
+        Args:
+            professional_ids: Professional IDs
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            List of Booking instances ordered by professional and scheduled_at
+        """
+        if not professional_ids:
+            return []
+
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+
+        stmt = (
+            select(Booking)
+            .where(
+                and_(
+                    Booking.professional_id.in_(professional_ids),
+                    Booking.scheduled_at >= start_datetime,
+                    Booking.scheduled_at <= end_datetime,
+                    Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+                )
+            )
+            .order_by(Booking.professional_id, Booking.scheduled_at)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_cancellation_facts(self, booking_ids: list[int]) -> list[Row]:
+        """
+        Load what a cancellation fee quote needs for many bookings at once.
+
+        Selects plain columns (no ORM instances or relationships) in a single
+        query, joined to the professional for the salon.
+
+        Args:
+            booking_ids: Booking IDs
+
+        Returns:
+            Rows with id, client_id, professional_id, status, scheduled_at,
+            service_price, cancellation_policy_id and salon_id
+        """
+        if not booking_ids:
+            return []
+
+        stmt = (
+            select(
+                Booking.id,
+                Booking.client_id,
+                Booking.professional_id,
+                Booking.status,
+                Booking.scheduled_at,
+                Booking.service_price,
+                Booking.cancellation_policy_id,
+                Professional.salon_id,
+            )
+            .join(Professional, Professional.id == Booking.professional_id)
+            .where(Booking.id.in_(booking_ids))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
     async def list_by_status(self, status: BookingStatus) -> list[Booking]:
         """
         List all bookings with a specific status.
@@ -208,41 +436,44 @@ class BookingRepository:
         Returns:
             True if there's a conflict, False otherwise
         """
-        from datetime import timedelta
-
         end_time = scheduled_at + timedelta(minutes=duration_minutes)
 
-        stmt = select(Booking).where(
-            and_(
-                Booking.professional_id == professional_id,
-                Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
-                or_(
-                    # New booking starts during existing booking
-                    and_(
-                        Booking.scheduled_at <= scheduled_at,
-                        Booking.scheduled_at + timedelta(minutes=Booking.duration_minutes) > scheduled_at,
-                    ),
-                    # New booking ends during existing booking
-                    and_(
-                        Booking.scheduled_at < end_time,
-                        Booking.scheduled_at + timedelta(minutes=Booking.duration_minutes) >= end_time,
-                    ),
-                    # New booking completely contains existing booking
-                    and_(
-                        Booking.scheduled_at >= scheduled_at,
-                        Booking.scheduled_at + timedelta(minutes=Booking.duration_minutes) <= end_time,
-                    ),
-                ),
-            )
-        )
+        conditions = [
+            Booking.professional_id == professional_id,
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+            # Existing booking starts before the new one ends AND ends after it starts
+            Booking.scheduled_at < end_time,
+            booking_end_expression() > scheduled_at,
+        ]
 
         if exclude_booking_id:
-            stmt = stmt.where(Booking.id != exclude_booking_id)
+            conditions.append(Booking.id != exclude_booking_id)
 
+        stmt = select(exists().where(and_(*conditions)))
         result = await self.session.execute(stmt)
-        conflicting = result.scalar_one_or_none()
 
-        return conflicting is not None
+        return bool(result.scalar())
+
+    async def lock_professional_agenda(self, professional_id: int) -> None:
+        """
+        Serialize agenda writes for a professional until the transaction ends.
+
+        Takes a transaction-scoped Postgres advisory lock, so concurrent
+        admissions for the same professional run their check-then-insert one
+        at a time while other professionals are unaffected. An exclusion
+        constraint is not used because controlled overbooking intentionally
+        stores overlapping bookings. No-op on other database backends.
+
+        Args:
+            professional_id: Professional ID
+        """
+        bind = self.session.bind
+        if bind is None or bind.dialect.name != "postgresql":
+            return
+
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(AGENDA_LOCK_NAMESPACE, professional_id))
+        )
 
     async def find_overlapping_bookings(
         self,
@@ -265,18 +496,12 @@ class BookingRepository:
         Returns:
             List of overlapping bookings
         """
-        from datetime import timedelta
-
         stmt = select(Booking).where(
             and_(
                 Booking.professional_id == professional_id,
-                or_(
-                    # Booking starts before range ends AND booking ends after range starts
-                    and_(
-                        Booking.scheduled_at < end_time,
-                        Booking.scheduled_at + timedelta(minutes=Booking.duration_minutes) > start_time,
-                    )
-                ),
+                # Booking starts before range ends AND booking ends after range starts
+                Booking.scheduled_at < end_time,
+                booking_end_expression() > start_time,
             )
         )
 
@@ -543,3 +768,100 @@ class BookingRepository:
 
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def mark_no_shows_batch(
+        self,
+        cutoff_time: datetime,
+        marked_at: datetime,
+        reason: str,
+        fee_amount,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[Row]:
+        """
+        Mark the next batch of eligible bookings as no-show in one statement.
+
+        Eligible bookings are selected like find_eligible_for_no_show_detection,
+        in ID order after after_id. Rows locked by a concurrent writer are
+        skipped instead of waited for.
+
+        Args:
+            cutoff_time: Bookings scheduled before this time are eligible
+            marked_at: Value of marked_no_show_at
+            reason: Value of no_show_reason
+            fee_amount: Fee value or SQL expression over Booking columns
+            after_id: Only bookings with a greater ID are marked
+            limit: Maximum number of bookings to mark
+
+        Returns:
+            (id, client_id, professional_id, scheduled_at, no_show_fee_amount)
+            of the marked bookings
+        """
+        candidates = (
+            select(Booking.id)
+            .where(
+                Booking.id > after_id,
+                Booking.scheduled_at < cutoff_time,
+                Booking.status.in_([BookingStatus.CONFIRMED, BookingStatus.IN_PROGRESS]),
+                Booking.marked_no_show_at.is_(None),
+            )
+            .order_by(Booking.id)
+            .limit(limit)
+        )
+        if self.session.get_bind().dialect.name != "sqlite":
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        stmt = (
+            update(Booking)
+            .where(Booking.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=BookingStatus.NO_SHOW,
+                marked_no_show_at=marked_at,
+                marked_no_show_by_id=None,
+                no_show_fee_amount=fee_amount,
+                no_show_reason=reason,
+            )
+            .returning(
+                Booking.id,
+                Booking.client_id,
+                Booking.professional_id,
+                Booking.scheduled_at,
+                Booking.no_show_fee_amount,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def find_system_no_shows(
+        self,
+        marked_at: datetime,
+        after_id: int = 0,
+        limit: int = 100,
+    ) -> list[Row]:
+        """
+        Find bookings marked as no-show by the system at a given time.
+
+        Args:
+            marked_at: marked_no_show_at of the detection run
+            after_id: Only bookings with a greater ID are returned
+            limit: Maximum number of bookings to return
+
+        Returns:
+            (id, no_show_reason, no_show_fee_amount) in ID order
+        """
+        stmt = (
+            select(Booking.id, Booking.no_show_reason, Booking.no_show_fee_amount)
+            .where(
+                Booking.id > after_id,
+                Booking.marked_no_show_at == marked_at,
+                Booking.marked_no_show_by_id.is_(None),
+                Booking.status == BookingStatus.NO_SHOW,
+            )
+            .order_by(Booking.id)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
@@ -3,9 +3,9 @@
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, and_, or_, desc, asc, case, update
+from sqlalchemy import select, func, and_, or_, desc, asc, case, update, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import Session, selectinload, joinedload
 
 from backend.app.db.models.loyalty import (
     LoyaltyAccount, PointTransaction, LoyaltyReward,
@@ -15,6 +15,160 @@ from backend.app.db.models.user import User
 from backend.app.db.models.booking import Booking
 
 
+def expire_points_chunk(
+    db: Session,
+    now: datetime,
+    after: Optional[tuple[datetime, int]] = None,
+    limit: int = 1000
+) -> Dict[str, Any]:
+    """
+    Expire one keyset chunk of due earned transactions across accounts.
+
+    Due transactions are scanned in (expiry_date, id) order through
+    idx_point_transaction_expiry. In one transaction the chunk is marked
+    expired, its EXPIRED ledger rows are inserted with a single
+    multi-row INSERT and the affected balances are decremented by a
+    single aggregated UPDATE. Balances never go below zero. The caller
+    commits.
+
+    Args:
+        db: Database session
+        now: Expiry reference time
+        after: (expiry_date, id) of the last transaction of the
+            previous chunk
+        limit: Maximum transactions in the chunk
+
+    Returns:
+        Dict with the next cursor (None when no transactions are left),
+        expired transactions, points and per-account totals
+    """
+    due = and_(
+        PointTransaction.transaction_type == PointTransactionType.EARNED,
+        PointTransaction.is_expired == False,
+        PointTransaction.expiry_date <= now,
+    )
+    query = (
+        select(
+            PointTransaction.id,
+            PointTransaction.loyalty_account_id,
+            PointTransaction.points_amount,
+            PointTransaction.expiry_date,
+        )
+        .where(due)
+        .order_by(PointTransaction.expiry_date, PointTransaction.id)
+        .limit(limit)
+    )
+    if after is not None:
+        query = query.where(
+            tuple_(PointTransaction.expiry_date, PointTransaction.id) > tuple_(*after)
+        )
+    if db.get_bind().dialect.name != "sqlite":
+        query = query.with_for_update(skip_locked=True)
+
+    transactions = db.execute(query).all()
+    if not transactions:
+        return {"cursor": None, "transactions": 0, "points": 0, "accounts": {}}
+
+    transaction_ids = [row.id for row in transactions]
+    expired_by_account: Dict[int, int] = {}
+    for row in transactions:
+        expired_by_account[row.loyalty_account_id] = (
+            expired_by_account.get(row.loyalty_account_id, 0) + row.points_amount
+        )
+
+    # Lock the balances and compute each ledger row's balance_after
+    balances = dict(db.execute(
+        select(LoyaltyAccount.id, LoyaltyAccount.current_points)
+        .where(LoyaltyAccount.id.in_(expired_by_account))
+        .with_for_update()
+    ).all())
+
+    ledger_rows = []
+    for row in transactions:
+        balance = max(balances.get(row.loyalty_account_id, 0) - row.points_amount, 0)
+        balances[row.loyalty_account_id] = balance
+        ledger_rows.append({
+            "loyalty_account_id": row.loyalty_account_id,
+            "transaction_type": PointTransactionType.EXPIRED,
+            "points_amount": -row.points_amount,
+            "balance_after": balance,
+            "description": f"Points expired from transaction {row.id}",
+            "reference_id": str(row.id),
+            "transaction_date": now,
+        })
+
+    db.execute(
+        update(PointTransaction)
+        .where(PointTransaction.id.in_(transaction_ids))
+        .values(is_expired=True)
+    )
+    db.execute(insert(PointTransaction), ledger_rows)
+
+    expired_points = (
+        select(func.sum(PointTransaction.points_amount))
+        .where(and_(
+            PointTransaction.loyalty_account_id == LoyaltyAccount.id,
+            PointTransaction.id.in_(transaction_ids),
+        ))
+        .scalar_subquery()
+    )
+    db.execute(
+        update(LoyaltyAccount)
+        .where(LoyaltyAccount.id.in_(expired_by_account))
+        .values(
+            current_points=case(
+                (LoyaltyAccount.current_points > expired_points,
+                 LoyaltyAccount.current_points - expired_points),
+                else_=0
+            ),
+            updated_at=now
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    last = transactions[-1]
+    return {
+        "cursor": (last.expiry_date, last.id),
+        "transactions": len(transactions),
+        "points": sum(expired_by_account.values()),
+        "accounts": expired_by_account,
+    }
+
+def expire_due_points(db: Session, now: datetime, chunk_size: int = 1000) -> Dict[str, int]:
+    """
+    Expire the due points of every account, committing after each chunk.
+
+    Args:
+        db: Database session
+        now: Expiry reference time
+        chunk_size: Transactions expired per transaction
+
+    Returns:
+        Dict with expired accounts, points, transactions and chunks
+    """
+    stats = {"expired_accounts": 0, "total_expired_points": 0, "expired_transactions": 0, "chunks": 0}
+    accounts = set()
+    cursor = None
+
+    while True:
+        chunk = expire_points_chunk(db, now, after=cursor, limit=chunk_size)
+        db.commit()
+        if chunk["transactions"] == 0:
+            break
+
+        stats["chunks"] += 1
+        stats["expired_transactions"] += chunk["transactions"]
+        stats["total_expired_points"] += chunk["points"]
+        accounts.update(chunk["accounts"])
+
+        if chunk["transactions"] < chunk_size:
+            break
+        cursor = chunk["cursor"]
+
+    stats["expired_accounts"] = len(accounts)
+    return stats
+
+
 class LoyaltyRepository:
     """Repository for loyalty system operations."""
 
@@ -196,6 +350,15 @@ class LoyaltyRepository:
         await self.session.commit()
         return total_expired_points
 
+    async def expire_due_points(self, now: datetime, chunk_size: int = 1000) -> Dict[str, int]:
+        """
+        Expire the due points of every account in keyset chunks.
+
+        Runs the sync expire_due_points on this session, one transaction
+        per chunk.
+        """
+        return await self.session.run_sync(expire_due_points, now, chunk_size)
+
     async def get_points_summary(
         self,
         loyalty_account_id: int,
@@ -0,0 +1,189 @@
+"""
+Keyset (cursor) pagination for repository listings.
+
+A page is fetched with ``WHERE (sort columns) > (last row's values)`` (or
+``<`` for descending listings) instead of ``OFFSET``, so every page costs
+the same index range scan no matter how deep the client paginates. The
+position is handed to clients as an opaque, URL-safe cursor.
+
+Totals use a cheap strategy: they are computed only for the first page,
+and without a COUNT query when the first page already holds every row.
+Later pages report ``total=None``. For listings too large to count,
+count_capped counts up to a cap and falls back to the planner's estimate.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from backend.app.core.exceptions import ValidationError
+
+T = TypeVar("T")
+
+
+class KeysetPage(list, Generic[T]):
+    """Items of one page plus the cursor of the next page."""
+
+    def __init__(self, items: Sequence[T] = (), next_cursor: Optional[str] = None, total: Optional[int] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+        self.total = total
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def _decode_value(value: dict) -> Any:
+    if set(value) == {"dt"}:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page."""
+    payload = json.dumps(list(values), default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor
+        size: Expected number of sort key values
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded), object_hook=_decode_value)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError("Invalid cursor", field="cursor") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Invalid cursor", field="cursor")
+    return values
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    sort_columns: Sequence[Any],
+    sort_key: Callable[[T], Sequence[Any]],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    with_total: bool = True,
+) -> KeysetPage[T]:
+    """
+    Fetch one keyset page of a filtered ORM select.
+
+    Args:
+        session: Database session
+        stmt: Filtered select of one entity, without ORDER BY
+        sort_columns: Unique sort key columns (end with the primary key)
+        sort_key: Sort key values of a loaded row, matching sort_columns
+        limit: Page size (None: every row, no cursor)
+        cursor: Cursor of the previous page
+        descending: Sort newest/highest first
+        with_total: Compute the total for the first page
+
+    Returns:
+        Page of rows with next_cursor and total
+    """
+    page_stmt = stmt
+    if cursor is not None:
+        after = decode_cursor(cursor, len(sort_columns))
+        key = tuple_(*sort_columns)
+        page_stmt = page_stmt.where(key < tuple_(*after) if descending else key > tuple_(*after))
+
+    page_stmt = page_stmt.order_by(*[column.desc() if descending else column for column in sort_columns])
+    if limit is not None:
+        # One extra row tells whether there is a next page
+        page_stmt = page_stmt.limit(limit + 1)
+
+    result = await session.execute(page_stmt)
+    rows = list(result.scalars().all())
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort_key(rows[-1]))
+
+    total = None
+    if with_total and cursor is None:
+        if next_cursor is None:
+            total = len(rows)
+        else:
+            total = await session.scalar(
+                select(func.count()).select_from(stmt.order_by(None).subquery())
+            )
+
+    return KeysetPage(rows, next_cursor=next_cursor, total=total)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a select, with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_count(session: AsyncSession, stmt: Select) -> Optional[int]:
+    """
+    Planner row estimate of a select, without running it (PostgreSQL only).
+
+    Returns:
+        Estimated number of rows, or None on other databases
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+
+    plan = await session.scalar(_Explain(stmt))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_capped(session: AsyncSession, stmt: Select, cap: int) -> tuple[int, bool]:
+    """
+    Count the rows of a select, exactly up to cap and estimated beyond.
+
+    Counting stops after cap rows, so a broad filter never scans the whole
+    table; past the cap the planner's estimate is reported instead.
+
+    Args:
+        session: Database session
+        stmt: Filtered select, without ORDER BY
+        cap: Largest exact count
+
+    Returns:
+        Tuple of (count, whether the count is an estimate)
+    """
+    counted = await session.scalar(
+        select(func.count()).select_from(stmt.order_by(None).limit(cap).subquery())
+    )
+    if counted < cap:
+        return counted, False
+
+    estimated = await estimate_count(session, stmt.order_by(None))
+    return max(estimated or 0, cap), True
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.db.models.professional import Professional
+from backend.app.db.repositories.pagination import KeysetPage, paginate
 
 
 class ProfessionalRepository:
@@ -110,6 +111,90 @@ class ProfessionalRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        salon_id: int | None = None,
+        is_active: bool | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> KeysetPage[Professional]:
+        """
+        List professionals one keyset page at a time, ordered by ID.
+
+        Args:
+            salon_id: Optional salon filter
+            is_active: Optional active status filter
+            limit: Page size
+            cursor: Cursor of the previous page
+
+        Returns:
+            Page of Professional instances with next_cursor and total
+        """
+        stmt = select(Professional)
+        if salon_id is not None:
+            stmt = stmt.where(Professional.salon_id == salon_id)
+        if is_active is not None:
+            stmt = stmt.where(Professional.is_active.is_(is_active))
+
+        return await paginate(
+            self.session,
+            stmt,
+            sort_columns=[Professional.id],
+            sort_key=lambda professional: [professional.id],
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def list_active_ids_by_salon_id(self, salon_id: int) -> list[int]:
+        """
+        List IDs of active professionals in a salon.
+
+        Args:
+            salon_id: Salon ID
+
+        Returns:
+            List of professional IDs ordered by ID
+        """
+        stmt = (
+            select(Professional.id)
+            .where(
+                Professional.salon_id == salon_id,
+                Professional.is_active.is_(True),
+            )
+            .order_by(Professional.id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_active_ids_by_salon_ids(self, salon_ids: list[int]) -> dict[int, list[int]]:
+        """
+        List IDs of active professionals of several salons.
+
+        Args:
+            salon_ids: Salon IDs
+
+        Returns:
+            Professional IDs ordered by ID, keyed by salon ID (salons
+            without active professionals are omitted)
+        """
+        if not salon_ids:
+            return {}
+
+        stmt = (
+            select(Professional.salon_id, Professional.id)
+            .where(
+                Professional.salon_id.in_(salon_ids),
+                Professional.is_active.is_(True),
+            )
+            .order_by(Professional.salon_id, Professional.id)
+        )
+        result = await self.session.execute(stmt)
+
+        ids_by_salon: dict[int, list[int]] = {}
+        for salon_id, professional_id in result.all():
+            ids_by_salon.setdefault(salon_id, []).append(professional_id)
+        return ids_by_salon
+
     async def update(
         self,
         professional_id: int,
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.db.models.service import Service
+from backend.app.db.repositories.pagination import KeysetPage, paginate
 
 
 class ServiceRepository:
@@ -107,6 +108,44 @@ class ServiceRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        salon_id: int | None = None,
+        category: str | None = None,
+        is_active: bool | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Service]:
+        """
+        List services one keyset page at a time, ordered by name.
+
+        Args:
+            salon_id: Optional salon filter
+            category: Optional category filter
+            is_active: Optional active status filter
+            limit: Page size
+            cursor: Cursor of the previous page
+
+        Returns:
+            Page of Service instances with next_cursor and total
+        """
+        stmt = select(Service)
+        if salon_id is not None:
+            stmt = stmt.where(Service.salon_id == salon_id)
+        if category is not None:
+            stmt = stmt.where(Service.category == category)
+        if is_active is not None:
+            stmt = stmt.where(Service.is_active.is_(is_active))
+
+        return await paginate(
+            self.session,
+            stmt,
+            sort_columns=[Service.name, Service.id],
+            sort_key=lambda service: [service.name, service.id],
+            limit=limit,
+            cursor=cursor,
+        )
+
     async def list_by_price_range(
         self,
         salon_id: int,
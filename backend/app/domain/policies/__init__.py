@@ -13,6 +13,7 @@ from .cancellation import (
     CancellationContext,
 )
 from .booking_cancellation import BookingCancellationService
+from .registry import CancellationPolicyRegistry, PolicySnapshot, cancellation_policy_registry
 
 __all__ = [
     "CancellationPolicy",
@@ -21,4 +22,7 @@ __all__ = [
     "CancellationResult",
     "CancellationContext",
     "BookingCancellationService",
+    "CancellationPolicyRegistry",
+    "PolicySnapshot",
+    "cancellation_policy_registry",
 ]
@@ -3,13 +3,18 @@ Booking Cancellation Service
 Integra o sistema de políticas de cancelamento com o fluxo de booking
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 
 from backend.app.db.repositories.booking import BookingRepository
 from backend.app.db.repositories.cancellation_policy import CancellationPolicyRepository
 from backend.app.domain.policies.cancellation import CancellationContext
+from backend.app.domain.policies.registry import (
+    CancellationPolicyRegistry,
+    as_utc,
+    cancellation_policy_registry,
+)
 
 
 class BookingCancellationService:
@@ -27,10 +32,53 @@ class BookingCancellationService:
         self,
         booking_repo: BookingRepository,
         policy_repo: CancellationPolicyRepository,
+        policy_registry: Optional[CancellationPolicyRegistry] = None,
     ) -> None:
-        """Inicializar serviço de cancelamento."""
+        """
+        Inicializar serviço de cancelamento.
+
+        Com policy_registry as políticas são resolvidas em memória, sem
+        consultas por booking; sem ele, pelo policy_repo.
+        """
         self.booking_repo = booking_repo
         self.policy_repo = policy_repo
+        self.policy_registry = policy_registry
+
+    async def _get_booking_policy(self, booking, cancellation_time: datetime):
+        """Política do booking, ou a política vigente do salão/plataforma."""
+        salon_id = None
+        if hasattr(booking, 'professional') and hasattr(booking.professional, 'salon_id'):
+            salon_id = booking.professional.salon_id
+
+        if self.policy_registry is not None:
+            snapshot = await self.policy_registry.snapshot(self.booking_repo.session)
+            policy = None
+            if booking.cancellation_policy_id:
+                policy = snapshot.get(booking.cancellation_policy_id)
+            return policy or snapshot.resolve(salon_id, cancellation_time)
+
+        # Usar política específica do booking ou política padrão
+        policy = None
+        if booking.cancellation_policy_id:
+            policy = await self.policy_repo.get_by_id(booking.cancellation_policy_id)
+
+        if not policy:
+            # Buscar política padrão para o salão ou plataforma
+            if salon_id is not None:
+                policy = await self.policy_repo.get_default_for_salon(salon_id)
+
+            if not policy:
+                policy = await self.policy_repo.get_platform_default()
+
+        return policy
+
+    async def _get_default_policy(self):
+        """Política padrão da plataforma."""
+        if self.policy_registry is not None:
+            snapshot = await self.policy_registry.snapshot(self.booking_repo.session)
+            return snapshot.resolve()
+
+        return await self.policy_repo.get_platform_default()
 
     async def calculate_cancellation_fee(
         self,
@@ -65,30 +113,16 @@ class BookingCancellationService:
         if booking.status == "cancelled":
             raise ValueError(f"Booking {booking_id} already cancelled")
 
-        # Usar política específica do booking ou política padrão
-        policy = None
-        if booking.cancellation_policy_id:
-            policy = await self.policy_repo.get_by_id(booking.cancellation_policy_id)
-
-        if not policy:
-            # Buscar política padrão para o salão ou plataforma
-            if hasattr(booking, 'professional') and hasattr(booking.professional, 'salon_id'):
-                policy = await self.policy_repo.get_default_for_salon(booking.professional.salon_id)
-
-            if not policy:
-                policy = await self.policy_repo.get_platform_default()
+        cancellation_time = as_utc(cancellation_time) if cancellation_time else datetime.now(timezone.utc)
 
+        policy = await self._get_booking_policy(booking, cancellation_time)
         if not policy:
             raise ValueError("No cancellation policy found")
 
-        # Calcular tempo de antecedência
-        cancellation_time = cancellation_time or datetime.now(timezone.utc)
-        advance_hours = (booking.scheduled_at - cancellation_time).total_seconds() / 3600
-
         # Criar contexto e calcular taxa
         context = CancellationContext(
             booking_id=booking_id,
-            scheduled_time=booking.scheduled_at,
+            scheduled_time=as_utc(booking.scheduled_at),
             cancellation_time=cancellation_time,
             service_price=Decimal(str(booking.service_price)),
             client_id=booking.client_id,
@@ -96,6 +130,8 @@ class BookingCancellationService:
         )
 
         evaluation = policy.evaluate_cancellation(context)
+        if evaluation.applicable_tier is None:
+            raise ValueError(evaluation.message)
 
         return {
             'fee_amount': evaluation.fee_amount,
@@ -106,6 +142,115 @@ class BookingCancellationService:
             'refund_amount': evaluation.refund_amount,
         }
 
+    async def quote_cancellation_fees(
+        self,
+        booking_ids: Sequence[int],
+        cancellation_time: Optional[datetime] = None,
+        client_id: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Cotar a taxa de cancelamento de vários bookings de uma vez.
+
+        Carrega os bookings numa única consulta e as políticas de um único
+        snapshot do registry; os bookings de cada política são avaliados
+        juntos contra a sua tabela de faixas.
+
+        Args:
+            booking_ids: IDs dos bookings (repetidos são cotados uma vez)
+            cancellation_time: Momento do cancelamento (padrão: agora)
+            client_id: Se informado, bookings de outros clientes são tratados
+                como não encontrados
+
+        Returns:
+            Lista de dicts na ordem dos IDs:
+            {
+                'booking_id': int,
+                'can_cancel': bool,
+                'reason': str,
+                # apenas se can_cancel=True
+                'fee_amount': Decimal,
+                'refund_amount': Decimal,
+                'tier_name': str,
+                'allows_refund': bool,
+                'policy_name': str,
+                'advance_hours': int,
+                'deadline': datetime  # até quando esta taxa vale
+            }
+        """
+        booking_ids = list(dict.fromkeys(booking_ids))
+        cancellation_time = as_utc(cancellation_time) if cancellation_time else datetime.now(timezone.utc)
+
+        rows = await self.booking_repo.list_cancellation_facts(booking_ids)
+        bookings = {
+            row.id: row for row in rows
+            if client_id is None or row.client_id == client_id
+        }
+
+        registry = self.policy_registry or cancellation_policy_registry
+        snapshot = await registry.snapshot(self.booking_repo.session)
+
+        quotes = {}
+        pending = {}
+        for booking_id in booking_ids:
+            booking = bookings.get(booking_id)
+            if booking is None:
+                quotes[booking_id] = {'can_cancel': False, 'reason': 'Booking not found'}
+                continue
+
+            if booking.status == "cancelled":
+                quotes[booking_id] = {'can_cancel': False, 'reason': 'Booking already cancelled'}
+                continue
+
+            if booking.status == "completed":
+                quotes[booking_id] = {'can_cancel': False, 'reason': 'Cannot cancel completed booking'}
+                continue
+
+            scheduled_time = as_utc(booking.scheduled_at)
+            if scheduled_time < cancellation_time:
+                quotes[booking_id] = {'can_cancel': False, 'reason': 'Cannot cancel past bookings'}
+                continue
+
+            policy = None
+            if booking.cancellation_policy_id:
+                policy = snapshot.get(booking.cancellation_policy_id)
+            policy = policy or snapshot.resolve(booking.salon_id, cancellation_time)
+            if not policy:
+                quotes[booking_id] = {'can_cancel': False, 'reason': 'No cancellation policy found'}
+                continue
+
+            context = CancellationContext(
+                booking_id=booking_id,
+                scheduled_time=scheduled_time,
+                cancellation_time=cancellation_time,
+                service_price=Decimal(str(booking.service_price)),
+                client_id=booking.client_id,
+                professional_id=booking.professional_id,
+                salon_id=booking.salon_id,
+            )
+            pending.setdefault(policy.id, (policy, []))[1].append(context)
+
+        # Uma passada pela tabela de faixas de cada política
+        for policy, contexts in pending.values():
+            for context, evaluation in zip(contexts, policy.evaluate_cancellations(contexts)):
+                tier = evaluation.applicable_tier
+                if tier is None:
+                    quotes[context.booking_id] = {'can_cancel': False, 'reason': evaluation.message}
+                    continue
+
+                quotes[context.booking_id] = {
+                    'can_cancel': True,
+                    'reason': 'Cancellation allowed',
+                    'fee_amount': evaluation.fee_amount,
+                    'refund_amount': evaluation.refund_amount,
+                    'tier_name': tier.name,
+                    'allows_refund': tier.allows_refund,
+                    'policy_name': policy.name,
+                    'advance_hours': int(context.advance_notice_hours),
+                    'deadline': context.scheduled_time - timedelta(hours=tier.advance_notice_hours),
+                }
+
+        return [{'booking_id': booking_id, **quotes[booking_id]} for booking_id in booking_ids]
+
     async def can_cancel_booking(
         self,
         booking_id: int,
@@ -149,8 +294,8 @@ class BookingCancellationService:
                 }
 
             # Verificar se não é muito próximo ao horário
-            cancellation_time = cancellation_time or datetime.now(timezone.utc)
-            advance_hours = (booking.scheduled_at - cancellation_time).total_seconds() / 3600
+            cancellation_time = as_utc(cancellation_time) if cancellation_time else datetime.now(timezone.utc)
+            advance_hours = (as_utc(booking.scheduled_at) - cancellation_time).total_seconds() / 3600
 
             if advance_hours < 0:
                 return {
@@ -226,7 +371,7 @@ class BookingCancellationService:
 
         # Aplicar política se não estava definida
         if not booking.cancellation_policy_id:
-            policy = await self.policy_repo.get_platform_default()
+            policy = await self._get_default_policy()
             if policy:
                 update_data['cancellation_policy_id'] = policy.id
 
@@ -274,7 +419,7 @@ class BookingCancellationService:
                 raise ValueError("Policy not found")
         else:
             # Usar política padrão
-            policy = await self.policy_repo.get_platform_default()
+            policy = await self._get_default_policy()
             if not policy:
                 raise ValueError("No default policy available")
             policy_id = policy.id
@@ -5,11 +5,12 @@ This module implements the business logic for cancellation policies,
 including policy evaluation, fee calculation, and validation rules.
 """
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Sequence
 import logging
 
 from backend.app.db.models.cancellation_policy import (
@@ -126,6 +127,12 @@ class CancellationPolicy:
     effective_until: Optional[datetime]
     tiers: List[CancellationTier]
 
+    def __post_init__(self) -> None:
+        """Precompute the tier lookup table, sorted by advance notice."""
+        ordered = sorted(self.tiers, key=lambda tier: tier.advance_notice_hours)
+        self._tiers_by_notice = tuple(ordered)
+        self._tier_thresholds = tuple(tier.advance_notice_hours for tier in ordered)
+
     def is_effective_at(self, check_time: datetime) -> bool:
         """Check if policy is effective at given time."""
         if check_time < self.effective_from:
@@ -136,15 +143,33 @@ class CancellationPolicy:
 
     def find_applicable_tier(self, advance_notice_hours: float) -> Optional[CancellationTier]:
         """Find the tier that applies to given advance notice."""
-        # Tiers are ordered by advance_notice_hours DESC
-        # Find the first tier that applies (highest advance notice requirement met)
-        for tier in self.tiers:
-            if tier.applies_to_advance_notice(advance_notice_hours):
-                return tier
-        return None
+        # Highest advance notice requirement met, by binary search
+        index = bisect_right(self._tier_thresholds, advance_notice_hours)
+        return self._tiers_by_notice[index - 1] if index else None
+
+    def find_applicable_tiers(self, advance_notice_hours: Sequence[float]) -> List[Optional[CancellationTier]]:
+        """Find the applicable tier of many advance notices against one tier table."""
+        thresholds, tiers = self._tier_thresholds, self._tiers_by_notice
+        return [
+            tiers[index - 1] if index else None
+            for index in (bisect_right(thresholds, hours) for hours in advance_notice_hours)
+        ]
 
     def evaluate_cancellation(self, context: CancellationContext) -> CancellationEvaluation:
         """Evaluate cancellation request against this policy."""
+        return self._evaluate(context, self.find_applicable_tier(context.advance_notice_hours))
+
+    def evaluate_cancellations(self, contexts: Sequence[CancellationContext]) -> List[CancellationEvaluation]:
+        """Evaluate many cancellation requests, looking their tiers up in one pass."""
+        tiers = self.find_applicable_tiers([context.advance_notice_hours for context in contexts])
+        return [self._evaluate(context, tier) for context, tier in zip(contexts, tiers)]
+
+    def _evaluate(
+        self,
+        context: CancellationContext,
+        applicable_tier: Optional[CancellationTier],
+    ) -> CancellationEvaluation:
+        """Evaluate a cancellation request given its applicable tier."""
         if not self.is_effective_at(context.cancellation_time):
             return CancellationEvaluation(
                 result=CancellationResult.NOT_ALLOWED,
@@ -155,8 +180,6 @@ class CancellationPolicy:
                 policy_used=self,
             )
 
-        applicable_tier = self.find_applicable_tier(context.advance_notice_hours)
-
         if not applicable_tier:
             # No tier found - cancellation not allowed
             return CancellationEvaluation(
@@ -216,9 +239,18 @@ class CancellationPolicy:
 class CancellationPolicyService:
     """Service for managing cancellation policies."""
 
-    def __init__(self, db_session):
-        """Initialize service with database session."""
+    def __init__(self, db_session, registry=None):
+        """
+        Initialize service with database session.
+
+        Args:
+            db_session: Async database session
+            registry: Policy registry (default: the process-wide registry)
+        """
+        from backend.app.domain.policies.registry import cancellation_policy_registry
+
         self.db_session = db_session
+        self.registry = registry or cancellation_policy_registry
 
     async def get_applicable_policy(
         self,
@@ -228,6 +260,9 @@ class CancellationPolicyService:
         """
         Get the applicable cancellation policy for a salon.
 
+        Resolved from the in-memory policy registry: the salon's active
+        policy, or else the platform default.
+
         Args:
             salon_id: Salon ID to find policy for
             evaluation_time: Time to evaluate policy effectiveness
@@ -235,62 +270,8 @@ class CancellationPolicyService:
         Returns:
             Applicable cancellation policy or None
         """
-        if evaluation_time is None:
-            evaluation_time = datetime.utcnow()
-
-        # Try to find salon-specific active policy first
-        if salon_id:
-            salon_policy = await self._find_policy(
-                salon_id=salon_id,
-                evaluation_time=evaluation_time
-            )
-            if salon_policy:
-                return salon_policy
-
-        # Fall back to default policy
-        default_policy = await self._find_policy(
-            salon_id=None,
-            evaluation_time=evaluation_time,
-            is_default=True
-        )
-
-        return default_policy
-
-    async def _find_policy(
-        self,
-        salon_id: Optional[int] = None,
-        evaluation_time: Optional[datetime] = None,
-        is_default: bool = False
-    ) -> Optional[CancellationPolicy]:
-        """Find policy based on criteria."""
-        from sqlalchemy import and_, or_
-        from backend.app.db.models.cancellation_policy import (
-            CancellationPolicyStatus,
-        )
-
-        query = self.db_session.query(CancellationPolicyModel).filter(
-            CancellationPolicyModel.status == CancellationPolicyStatus.ACTIVE,
-            CancellationPolicyModel.effective_from <= evaluation_time,
-            or_(
-                CancellationPolicyModel.effective_until.is_(None),
-                CancellationPolicyModel.effective_until > evaluation_time
-            )
-        )
-
-        if salon_id is not None:
-            query = query.filter(CancellationPolicyModel.salon_id == salon_id)
-        else:
-            query = query.filter(CancellationPolicyModel.salon_id.is_(None))
-
-        if is_default:
-            query = query.filter(CancellationPolicyModel.is_default == True)
-
-        model = query.first()
-
-        if model:
-            return CancellationPolicy.from_model(model)
-
-        return None
+        snapshot = await self.registry.snapshot(self.db_session)
+        return snapshot.resolve(salon_id=salon_id, evaluation_time=evaluation_time)
 
     async def evaluate_cancellation(
         self,
@@ -305,7 +286,15 @@ class CancellationPolicyService:
         Returns:
             Evaluation result with fee calculation
         """
+        from backend.app.domain.policies.registry import as_utc
+
         try:
+            # Registry policies carry aware UTC validity periods
+            context = replace(
+                context,
+                scheduled_time=as_utc(context.scheduled_time),
+                cancellation_time=as_utc(context.cancellation_time),
+            )
             policy = await self.get_applicable_policy(
                 salon_id=context.salon_id,
                 evaluation_time=context.cancellation_time
@@ -0,0 +1,189 @@
+"""
+In-process registry of cancellation policies.
+
+Policies change rarely but are resolved on every booking, fee preview
+and cancellation. The registry loads every policy with its tiers once into
+domain objects (tiers precompiled into a bisectable table, see
+CancellationPolicy) and serves lookups from memory. A cheap version query
+(row counts and latest updated_at of policies and tiers) runs at most once
+per refresh interval and triggers a reload when anything changed; writers
+call invalidate() after committing so this process checks it on the next
+lookup.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.db.models.cancellation_policy import (
+    CancellationPolicy as CancellationPolicyModel,
+    CancellationPolicyStatus,
+    CancellationTier as CancellationTierModel,
+)
+from backend.app.domain.policies.cancellation import CancellationPolicy
+
+PolicyVersion = Tuple[int, Optional[datetime], int, Optional[datetime]]
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Aware UTC datetime; naive values are taken as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class PolicySnapshot:
+    """
+    Every cancellation policy at one version.
+
+    The mappings are read-only; the policies are plain dataclasses shared by
+    all callers and must not be modified.
+    """
+
+    version: PolicyVersion
+    by_id: Mapping[int, CancellationPolicy] = field(default_factory=dict)
+    # Active policies per salon (None: platform), latest effective_from first
+    active_by_salon: Mapping[Optional[int], Tuple[CancellationPolicy, ...]] = field(default_factory=dict)
+
+    def get(self, policy_id: int) -> Optional[CancellationPolicy]:
+        """Policy by ID, whatever its status."""
+        return self.by_id.get(policy_id)
+
+    def resolve(
+        self,
+        salon_id: Optional[int] = None,
+        evaluation_time: Optional[datetime] = None,
+    ) -> Optional[CancellationPolicy]:
+        """
+        Policy applying to a salon at a given time.
+
+        The salon's own active policy wins; otherwise the platform default.
+
+        Args:
+            salon_id: Salon ID (None: platform default only)
+            evaluation_time: Time to evaluate policy effectiveness (default: now)
+
+        Returns:
+            Applicable policy or None
+        """
+        moment = as_utc(evaluation_time or datetime.utcnow())
+
+        if salon_id:
+            for policy in self.active_by_salon.get(salon_id, ()):
+                if policy.is_effective_at(moment):
+                    return policy
+
+        for policy in self.active_by_salon.get(None, ()):
+            if policy.is_default and policy.is_effective_at(moment):
+                return policy
+
+        return None
+
+
+class CancellationPolicyRegistry:
+    """Versioned, lazily refreshed cache of cancellation policies."""
+
+    def __init__(self, refresh_interval_seconds: float = 30.0):
+        """
+        Initialize the registry.
+
+        Args:
+            refresh_interval_seconds: Minimum time between version checks
+        """
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._snapshot: Optional[PolicySnapshot] = None
+        self._stale = True
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Check the version on the next lookup."""
+        self._stale = True
+
+    def _needs_check(self) -> bool:
+        return (
+            self._stale
+            or self._snapshot is None
+            or time.monotonic() - self._checked_at >= self.refresh_interval_seconds
+        )
+
+    async def snapshot(self, session: AsyncSession) -> PolicySnapshot:
+        """
+        Current policies, reloaded when their version changed.
+
+        Args:
+            session: Async database session used for version checks and reloads
+
+        Returns:
+            Policy snapshot
+        """
+        if not self._needs_check():
+            return self._snapshot
+
+        async with self._lock:
+            # Another coroutine may have refreshed while we waited
+            if not self._needs_check():
+                return self._snapshot
+
+            version = await self._load_version(session)
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = await self._load_snapshot(session, version)
+            self._stale = False
+            self._checked_at = time.monotonic()
+
+        return self._snapshot
+
+    async def _load_version(self, session: AsyncSession) -> PolicyVersion:
+        policies = (
+            await session.execute(
+                select(func.count(CancellationPolicyModel.id), func.max(CancellationPolicyModel.updated_at))
+            )
+        ).one()
+        tiers = (
+            await session.execute(
+                select(func.count(CancellationTierModel.id), func.max(CancellationTierModel.updated_at))
+            )
+        ).one()
+        return (policies[0], policies[1], tiers[0], tiers[1])
+
+    async def _load_snapshot(self, session: AsyncSession, version: PolicyVersion) -> PolicySnapshot:
+        result = await session.execute(
+            select(CancellationPolicyModel).order_by(CancellationPolicyModel.effective_from.desc())
+        )
+
+        by_id = {}
+        active_by_salon: dict[Optional[int], list[CancellationPolicy]] = {}
+        for model in result.scalars().all():
+            loaded = CancellationPolicy.from_model(model)
+            # Effective dates comparable with the aware times of evaluations
+            policy = replace(
+                loaded,
+                tiers=tuple(loaded.tiers),
+                effective_from=as_utc(loaded.effective_from),
+                effective_until=as_utc(loaded.effective_until) if loaded.effective_until else None,
+            )
+            by_id[policy.id] = policy
+
+            if model.status == CancellationPolicyStatus.ACTIVE:
+                active_by_salon.setdefault(model.salon_id, []).append(policy)
+
+        return PolicySnapshot(
+            version=version,
+            by_id=MappingProxyType(by_id),
+            active_by_salon=MappingProxyType({
+                salon_id: tuple(policies) for salon_id, policies in active_by_salon.items()
+            }),
+        )
+
+
+cancellation_policy_registry = CancellationPolicyRegistry(
+    refresh_interval_seconds=settings.CANCELLATION_POLICY_REFRESH_SECONDS,
+)
@@ -0,0 +1,11 @@
+"""Reporting domain."""
+
+from .rollups import DailyRollupService
+from .schemas import ViewFreshness
+from .views import ReportingViewService
+
+__all__ = [
+    "DailyRollupService",
+    "ReportingViewService",
+    "ViewFreshness",
+]
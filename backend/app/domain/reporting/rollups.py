@@ -0,0 +1,625 @@
+"""Incremental daily rollups of bookings and payments.
+
+Every flush that creates, deletes or changes a report-relevant column of a
+Booking or Payment queues the affected (day, professional) pairs in
+``rollup_dirty_days`` inside the same transaction. The
+``reporting.apply_daily_rollups`` task claims queued pairs and rebuilds only
+their rows of ``booking_daily_rollups`` and ``no_show_daily_rollups`` from the
+source tables, so late changes to old bookings are picked up by re-aggregating
+just the touched days. Readers therefore lag writes by up to
+REPORTING_ROLLUP_INTERVAL_SECONDS.
+
+Writers that bypass the ORM (bulk UPDATE statements) must call
+``mark_rollup_days`` themselves. Days are calendar days of ``scheduled_at``
+in UTC, the timezone of the database sessions.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import chain
+
+from sqlalchemy import Date, and_, delete, event, func, insert, inspect, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.payment import Payment, PaymentStatus
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.reporting_rollup import (
+    BookingDailyRollup,
+    NoShowDailyRollup,
+    RollupDirtyDay,
+)
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.service import Service
+
+logger = logging.getLogger(__name__)
+
+RollupKey = tuple[date, int]
+
+# Columns whose changes affect the rollups
+BOOKING_ROLLUP_FIELDS = (
+    "scheduled_at",
+    "professional_id",
+    "service_id",
+    "status",
+    "service_price",
+    "no_show_fee_amount",
+    "no_show_reason",
+)
+PAYMENT_ROLLUP_FIELDS = ("booking_id", "status", "amount")
+
+PAID_PAYMENT_STATUSES = (PaymentStatus.SUCCEEDED.value, PaymentStatus.PARTIALLY_REFUNDED.value)
+
+# Reason recorded for no-shows without no_show_reason
+UNKNOWN_NO_SHOW_REASON = "unknown"
+
+
+def rollup_day(value: datetime) -> date:
+    """Calendar day (UTC) a booking time is rolled up into."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def _insert_ignore(session: Session, table):
+    """INSERT ... ON CONFLICT DO NOTHING for the session's dialect."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(table)
+    return pg_insert(table)
+
+
+def _changed(obj, fields: Iterable[str]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _current_and_previous(state, field: str) -> set:
+    """Loaded value of an attribute plus the values it replaced in this flush.
+
+    Reads the instance dict only: a lazy load inside a flush hook would fail
+    under AsyncSession.
+    """
+    values = set(state.attrs[field].history.deleted)
+    values.add(state.dict.get(field))
+    values.discard(None)
+    return values
+
+
+def _booking_keys(state) -> set[RollupKey]:
+    """Current and previous (day, professional) pairs of a booking."""
+    return {
+        (rollup_day(scheduled_at), professional_id)
+        for scheduled_at in _current_and_previous(state, "scheduled_at")
+        for professional_id in _current_and_previous(state, "professional_id")
+    }
+
+
+def mark_rollup_days(session: Session, keys: Iterable[RollupKey]) -> None:
+    """
+    Queue (day, professional) pairs for a rollup rebuild.
+
+    Args:
+        session: Sync session (use ``AsyncSession.run_sync`` from async code)
+        keys: (day, professional_id) pairs touched by a write
+    """
+    rows = [
+        {"rollup_date": rollup_date, "professional_id": professional_id}
+        for rollup_date, professional_id in set(keys)
+    ]
+    if not rows:
+        return
+
+    session.execute(_insert_ignore(session, RollupDirtyDay).values(rows).on_conflict_do_nothing())
+
+
+def mark_rollup_days_for_bookings(session: Session, booking_ids: Iterable[int]) -> None:
+    """
+    Queue the (day, professional) pairs of existing bookings.
+
+    Args:
+        session: Sync session
+        booking_ids: IDs of bookings whose rollups must be rebuilt
+    """
+    booking_ids = set(booking_ids)
+    if not booking_ids:
+        return
+
+    source = select(
+        func.date(Booking.scheduled_at, type_=Date),
+        Booking.professional_id,
+    ).where(Booking.id.in_(booking_ids)).distinct()
+
+    session.execute(
+        _insert_ignore(session, RollupDirtyDay)
+        .from_select(["rollup_date", "professional_id"], source)
+        .on_conflict_do_nothing()
+    )
+
+
+def _queue_touched_rollup_days(session: Session, flush_context) -> None:
+    """after_flush hook: queue the rollup days touched by this flush."""
+    keys: set[RollupKey] = set()
+    booking_ids: set[int] = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Booking):
+            fields = BOOKING_ROLLUP_FIELDS
+        elif isinstance(obj, Payment):
+            fields = PAYMENT_ROLLUP_FIELDS
+        else:
+            continue
+
+        state = inspect(obj)
+        if obj in session.dirty and not _changed(obj, fields):
+            continue
+
+        if isinstance(obj, Payment):
+            booking_ids |= _current_and_previous(state, "booking_id")
+            continue
+
+        keys |= _booking_keys(state)
+        if "scheduled_at" not in state.dict or "professional_id" not in state.dict:
+            # Unloaded columns: read the flushed row instead
+            booking_ids.add(state.identity[0] if state.identity else obj.id)
+
+    if keys:
+        mark_rollup_days(session, keys)
+    if booking_ids:
+        mark_rollup_days_for_bookings(session, booking_ids)
+
+
+event.listen(Session, "after_flush", _queue_touched_rollup_days)
+
+
+def claim_rollup_days(session: Session, batch_size: int) -> list[RollupKey]:
+    """
+    Take up to batch_size queued pairs off the queue.
+
+    Rows locked by a concurrent worker are skipped, so several workers can
+    drain the queue without rebuilding the same day twice at once. The claim
+    is undone if the caller's transaction rolls back.
+
+    Args:
+        session: Sync session
+        batch_size: Maximum number of pairs to claim
+
+    Returns:
+        Claimed (day, professional_id) pairs
+    """
+    stmt = (
+        select(RollupDirtyDay.rollup_date, RollupDirtyDay.professional_id)
+        .order_by(RollupDirtyDay.marked_at)
+        .limit(batch_size)
+    )
+    if session.get_bind().dialect.name != "sqlite":
+        stmt = stmt.with_for_update(skip_locked=True)
+
+    keys = [tuple(row) for row in session.execute(stmt).all()]
+    if keys:
+        session.execute(delete(RollupDirtyDay).where(_keys_clause(RollupDirtyDay, keys)))
+    return keys
+
+
+def _keys_clause(model, keys: Iterable[RollupKey]):
+    """WHERE clause matching (rollup_date, professional_id) pairs, grouped by professional."""
+    days_by_professional: dict[int, set[date]] = defaultdict(set)
+    for rollup_date, professional_id in keys:
+        days_by_professional[professional_id].add(rollup_date)
+
+    return or_(*[
+        and_(model.professional_id == professional_id, model.rollup_date.in_(days))
+        for professional_id, days in days_by_professional.items()
+    ])
+
+
+def rebuild_rollups(session: Session, keys: Iterable[RollupKey]) -> None:
+    """
+    Recompute the rollup rows of the given (day, professional) pairs.
+
+    Args:
+        session: Sync session
+        keys: (day, professional_id) pairs to rebuild
+    """
+    keys = set(keys)
+    if not keys:
+        return
+
+    days_by_professional: dict[int, set[date]] = defaultdict(set)
+    for rollup_date, professional_id in keys:
+        days_by_professional[professional_id].add(rollup_date)
+
+    day = func.date(Booking.scheduled_at, type_=Date)
+    booking_conditions = or_(*[
+        and_(
+            Booking.professional_id == professional_id,
+            # Range on the (professional_id, scheduled_at) index, then exact days
+            Booking.scheduled_at >= datetime.combine(min(days), time.min),
+            Booking.scheduled_at < datetime.combine(max(days) + timedelta(days=1), time.min),
+            day.in_(days),
+        )
+        for professional_id, days in days_by_professional.items()
+    ])
+
+    def payment_sum(statuses):
+        return (
+            select(func.coalesce(func.sum(Payment.amount), 0))
+            .where(Payment.booking_id == Booking.id, Payment.status.in_(statuses))
+            .scalar_subquery()
+        )
+
+    per_booking = (
+        select(
+            day.label("rollup_date"),
+            Booking.professional_id,
+            Booking.service_id,
+            Professional.salon_id,
+            Booking.status,
+            Booking.service_price,
+            payment_sum(PAID_PAYMENT_STATUSES).label("paid_amount"),
+            payment_sum((PaymentStatus.REFUNDED.value,)).label("refunded_amount"),
+        )
+        .join(Professional, Professional.id == Booking.professional_id)
+        .where(booking_conditions)
+        .subquery()
+    )
+
+    def status_count(booking_status: BookingStatus):
+        return func.count().filter(per_booking.c.status == booking_status)
+
+    aggregated = select(
+        per_booking.c.rollup_date,
+        per_booking.c.professional_id,
+        per_booking.c.service_id,
+        per_booking.c.salon_id,
+        func.count(),
+        status_count(BookingStatus.COMPLETED),
+        status_count(BookingStatus.CANCELLED),
+        status_count(BookingStatus.NO_SHOW),
+        func.coalesce(
+            func.sum(per_booking.c.service_price).filter(
+                per_booking.c.status == BookingStatus.COMPLETED
+            ),
+            0,
+        ),
+        func.sum(per_booking.c.paid_amount),
+        func.sum(per_booking.c.refunded_amount),
+    ).group_by(
+        per_booking.c.rollup_date,
+        per_booking.c.professional_id,
+        per_booking.c.service_id,
+        per_booking.c.salon_id,
+    )
+
+    no_show_reason = func.coalesce(Booking.no_show_reason, UNKNOWN_NO_SHOW_REASON)
+    no_shows = (
+        select(
+            day,
+            Booking.professional_id,
+            Booking.service_id,
+            Professional.salon_id,
+            no_show_reason,
+            func.count(),
+            func.coalesce(func.sum(Booking.no_show_fee_amount), 0),
+        )
+        .join(Professional, Professional.id == Booking.professional_id)
+        .where(booking_conditions, Booking.status == BookingStatus.NO_SHOW)
+        .group_by(day, Booking.professional_id, Booking.service_id, Professional.salon_id, no_show_reason)
+    )
+
+    session.execute(delete(BookingDailyRollup).where(_keys_clause(BookingDailyRollup, keys)))
+    session.execute(
+        insert(BookingDailyRollup).from_select(
+            [
+                "rollup_date",
+                "professional_id",
+                "service_id",
+                "salon_id",
+                "total_bookings",
+                "completed_bookings",
+                "cancelled_bookings",
+                "no_show_bookings",
+                "completed_revenue",
+                "paid_amount",
+                "refunded_amount",
+            ],
+            aggregated,
+        )
+    )
+
+    session.execute(delete(NoShowDailyRollup).where(_keys_clause(NoShowDailyRollup, keys)))
+    session.execute(
+        insert(NoShowDailyRollup).from_select(
+            [
+                "rollup_date",
+                "professional_id",
+                "service_id",
+                "salon_id",
+                "reason",
+                "no_show_bookings",
+                "no_show_fees",
+            ],
+            no_shows,
+        )
+    )
+
+
+class DailyRollupService:
+    """Analytics read from the daily booking and no-show rollups."""
+
+    SALON_SORTS = ("revenue", "bookings", "completion_rate")
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize service with database session.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+
+    @staticmethod
+    def _period_filter(start_date: datetime, end_date: datetime) -> list:
+        return [
+            BookingDailyRollup.rollup_date >= rollup_day(start_date),
+            BookingDailyRollup.rollup_date <= rollup_day(end_date),
+        ]
+
+    async def get_salon_performance(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        sort_by: str = "revenue",
+        limit: int = 50,
+    ) -> list[dict]:
+        """
+        Compare salons over whole days of the period.
+
+        Args:
+            start_date: Start of the period
+            end_date: End of the period
+            sort_by: One of "revenue", "bookings" or "completion_rate"
+            limit: Maximum number of salons
+
+        Returns:
+            One dict per salon, including salons without bookings
+
+        Raises:
+            ValueError: If sort_by is not supported
+        """
+        if sort_by not in self.SALON_SORTS:
+            raise ValueError(f"Unsupported sort: {sort_by}")
+
+        totals = (
+            select(
+                BookingDailyRollup.salon_id,
+                func.sum(BookingDailyRollup.total_bookings).label("total_bookings"),
+                func.sum(BookingDailyRollup.completed_bookings).label("completed_bookings"),
+                func.sum(BookingDailyRollup.completed_revenue).label("total_revenue"),
+            )
+            .where(*self._period_filter(start_date, end_date))
+            .group_by(BookingDailyRollup.salon_id)
+            .subquery()
+        )
+
+        total_bookings = func.coalesce(totals.c.total_bookings, 0)
+        completed_bookings = func.coalesce(totals.c.completed_bookings, 0)
+        total_revenue = func.coalesce(totals.c.total_revenue, 0)
+        completion_rate = func.coalesce(
+            completed_bookings * 100.0 / func.nullif(total_bookings, 0), 0
+        )
+        order_by = {
+            "revenue": total_revenue,
+            "bookings": total_bookings,
+            "completion_rate": completion_rate,
+        }[sort_by]
+
+        stmt = (
+            select(
+                Salon.id.label("salon_id"),
+                Salon.name.label("salon_name"),
+                total_bookings.label("total_bookings"),
+                completed_bookings.label("completed_bookings"),
+                total_revenue.label("total_revenue"),
+                completion_rate.label("completion_rate"),
+            )
+            .outerjoin(totals, totals.c.salon_id == Salon.id)
+            .order_by(order_by.desc(), Salon.id)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        salon_ids = [row.salon_id for row in rows]
+        if not salon_ids:
+            return []
+
+        professional_counts = dict((await self.session.execute(
+            select(Professional.salon_id, func.count())
+            .where(Professional.salon_id.in_(salon_ids))
+            .group_by(Professional.salon_id)
+        )).all())
+        service_counts = dict((await self.session.execute(
+            select(Service.salon_id, func.count())
+            .where(Service.salon_id.in_(salon_ids))
+            .group_by(Service.salon_id)
+        )).all())
+
+        # Distinct clients are not additive across days; count them on the
+        # bookings of the page's salons within the period
+        client_counts = dict((await self.session.execute(
+            select(Professional.salon_id, func.count(func.distinct(Booking.client_id)))
+            .join(Professional, Professional.id == Booking.professional_id)
+            .where(
+                Professional.salon_id.in_(salon_ids),
+                Booking.scheduled_at >= start_date,
+                Booking.scheduled_at <= end_date,
+            )
+            .group_by(Professional.salon_id)
+        )).all())
+
+        return [
+            {
+                "salon_id": row.salon_id,
+                "salon_name": row.salon_name,
+                "total_bookings": int(row.total_bookings),
+                "completed_bookings": int(row.completed_bookings),
+                "completion_rate": round(float(row.completion_rate), 2),
+                "total_revenue": round(float(row.total_revenue), 2),
+                "professional_count": professional_counts.get(row.salon_id, 0),
+                "service_count": service_counts.get(row.salon_id, 0),
+                "client_count": client_counts.get(row.salon_id, 0),
+            }
+            for row in rows
+        ]
+
+    async def get_category_analytics(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[dict]:
+        """
+        Aggregate bookings and revenue per service category.
+
+        Args:
+            start_date: Start of the period
+            end_date: End of the period
+
+        Returns:
+            One dict per category, ordered by revenue
+        """
+        booking_rows = (await self.session.execute(
+            select(
+                Service.category,
+                func.sum(BookingDailyRollup.total_bookings).label("total_bookings"),
+                func.sum(BookingDailyRollup.completed_revenue).label("total_revenue"),
+            )
+            .join(Service, Service.id == BookingDailyRollup.service_id)
+            .where(Service.category.is_not(None), *self._period_filter(start_date, end_date))
+            .group_by(Service.category)
+        )).all()
+        bookings_by_category = {row.category: row for row in booking_rows}
+
+        catalog_rows = (await self.session.execute(
+            select(
+                Service.category,
+                func.count().label("total_services"),
+                func.avg(Service.price).label("avg_price"),
+                func.count(func.distinct(Service.salon_id)).label("salon_count"),
+            )
+            .where(Service.category.is_not(None))
+            .group_by(Service.category)
+        )).all()
+
+        categories = []
+        for row in catalog_rows:
+            booking_row = bookings_by_category.get(row.category)
+            categories.append({
+                "category": row.category,
+                "total_services": row.total_services,
+                "total_bookings": int(booking_row.total_bookings) if booking_row else 0,
+                "total_revenue": round(float(booking_row.total_revenue), 2) if booking_row else 0.0,
+                "avg_price": float(row.avg_price) if row.avg_price else 0.0,
+                "salon_count": row.salon_count,
+            })
+
+        categories.sort(key=lambda item: item["total_revenue"], reverse=True)
+        return categories
+
+    @staticmethod
+    def _no_show_filter(
+        model,
+        start_date: datetime,
+        end_date: datetime,
+        professional_id: int | None,
+        salon_id: int | None,
+        service_id: int | None,
+    ) -> list:
+        conditions = [
+            model.rollup_date >= rollup_day(start_date),
+            model.rollup_date <= rollup_day(end_date),
+        ]
+        if professional_id:
+            conditions.append(model.professional_id == professional_id)
+        if salon_id:
+            conditions.append(model.salon_id == salon_id)
+        if service_id:
+            conditions.append(model.service_id == service_id)
+        return conditions
+
+    async def get_no_show_totals(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        professional_id: int | None = None,
+        salon_id: int | None = None,
+        service_id: int | None = None,
+    ) -> dict:
+        """
+        Count bookings and no-shows over whole days of the period.
+
+        Args:
+            start_date: Start of the period
+            end_date: End of the period
+            professional_id: Optional professional filter
+            salon_id: Optional salon filter
+            service_id: Optional service filter
+
+        Returns:
+            Dict with total_bookings, no_show_bookings and no_show_rate (%)
+        """
+        row = (await self.session.execute(
+            select(
+                func.coalesce(func.sum(BookingDailyRollup.total_bookings), 0),
+                func.coalesce(func.sum(BookingDailyRollup.no_show_bookings), 0),
+            ).where(*self._no_show_filter(
+                BookingDailyRollup, start_date, end_date, professional_id, salon_id, service_id
+            ))
+        )).one()
+
+        total_bookings, no_show_bookings = int(row[0]), int(row[1])
+        return {
+            "total_bookings": total_bookings,
+            "no_show_bookings": no_show_bookings,
+            "no_show_rate": (no_show_bookings / total_bookings * 100) if total_bookings > 0 else 0.0,
+        }
+
+    async def get_no_show_reasons(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        professional_id: int | None = None,
+        salon_id: int | None = None,
+        service_id: int | None = None,
+    ) -> dict[str, dict]:
+        """
+        Break no-shows down by reason over whole days of the period.
+
+        Args:
+            start_date: Start of the period
+            end_date: End of the period
+            professional_id: Optional professional filter
+            salon_id: Optional salon filter
+            service_id: Optional service filter
+
+        Returns:
+            Mapping of reason to {"no_shows": count, "fees": amount}
+        """
+        rows = (await self.session.execute(
+            select(
+                NoShowDailyRollup.reason,
+                func.sum(NoShowDailyRollup.no_show_bookings).label("no_shows"),
+                func.sum(NoShowDailyRollup.no_show_fees).label("fees"),
+            )
+            .where(*self._no_show_filter(
+                NoShowDailyRollup, start_date, end_date, professional_id, salon_id, service_id
+            ))
+            .group_by(NoShowDailyRollup.reason)
+        )).all()
+
+        return {
+            row.reason: {"no_shows": int(row.no_shows), "fees": float(row.fees)}
+            for row in rows
+        }
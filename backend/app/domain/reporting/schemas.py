@@ -0,0 +1,27 @@
+"""Reporting domain schemas."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ViewFreshness(BaseModel):
+    """Staleness metadata of data served from materialized views."""
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "views": ["booking_metrics_mv"],
+                "refreshed_at": "2025-10-16T09:15:00+00:00",
+                "age_seconds": 312.5,
+                "is_stale": False,
+            }
+        }
+    }
+
+    views: list[str] = Field(..., description="Materialized views the data was read from")
+    refreshed_at: datetime | None = Field(
+        None, description="Last refresh of the oldest view (None if never refreshed)"
+    )
+    age_seconds: float | None = Field(None, description="Seconds since refreshed_at")
+    is_stale: bool = Field(..., description="Whether the data is older than the allowed staleness")
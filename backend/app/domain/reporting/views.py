@@ -0,0 +1,185 @@
+"""Read access to the reporting materialized views.
+
+The views defined in ``db/materialized_views.py`` are refreshed by the
+``reporting.refresh_materialized_views`` Celery-beat task, which records the
+time of every successful refresh in ``report_view_refreshes``. Endpoints that
+read from the views pair their data with ``get_freshness`` so that clients can
+see how old the aggregates are.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.domain.reporting.schemas import ViewFreshness
+
+logger = logging.getLogger(__name__)
+
+TREND_GRANULARITIES = ("day", "week", "month")
+
+booking_metrics_mv = table(
+    "booking_metrics_mv",
+    column("metric_date"),
+    column("salon_id"),
+    column("total_bookings"),
+    column("completed_bookings"),
+    column("cancelled_bookings"),
+    column("no_show_bookings"),
+    column("confirmed_bookings"),
+    column("completed_revenue"),
+)
+
+customer_analytics_mv = table(
+    "customer_analytics_mv",
+    column("client_id"),
+    column("last_booking_date"),
+    column("total_bookings"),
+    column("lifetime_value"),
+)
+
+report_view_refreshes = table(
+    "report_view_refreshes",
+    column("view_name"),
+    column("refreshed_at"),
+    column("duration_ms"),
+)
+
+
+class ReportingViewService:
+    """Query the reporting materialized views and their refresh metadata."""
+
+    def __init__(self, session: AsyncSession, max_staleness_seconds: int | None = None):
+        """
+        Initialize service with database session.
+
+        Args:
+            session: Async database session
+            max_staleness_seconds: Age after which view data is reported as
+                stale (default: REPORTING_VIEWS_MAX_STALENESS_SECONDS)
+        """
+        self.session = session
+        self.max_staleness_seconds = (
+            max_staleness_seconds
+            if max_staleness_seconds is not None
+            else settings.REPORTING_VIEWS_MAX_STALENESS_SECONDS
+        )
+
+    async def get_freshness(self, *view_names: str) -> ViewFreshness:
+        """
+        Get the staleness of data combined from one or more views.
+
+        The oldest refresh wins; a view that was never refreshed makes the
+        whole result stale.
+
+        Args:
+            view_names: Materialized views the data was read from
+
+        Returns:
+            ViewFreshness metadata
+        """
+        stmt = select(
+            report_view_refreshes.c.view_name,
+            report_view_refreshes.c.refreshed_at,
+        ).where(report_view_refreshes.c.view_name.in_(view_names))
+        refreshed = dict((await self.session.execute(stmt)).all())
+
+        if any(refreshed.get(name) is None for name in view_names):
+            return ViewFreshness(views=list(view_names), is_stale=True)
+
+        refreshed_at = min(refreshed.values())
+        if refreshed_at.tzinfo is None:
+            refreshed_at = refreshed_at.replace(tzinfo=timezone.utc)
+        age_seconds = (datetime.now(timezone.utc) - refreshed_at).total_seconds()
+
+        return ViewFreshness(
+            views=list(view_names),
+            refreshed_at=refreshed_at,
+            age_seconds=round(age_seconds, 1),
+            is_stale=age_seconds > self.max_staleness_seconds,
+        )
+
+    async def get_booking_trend(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str = "day",
+        salon_id: int | None = None,
+    ) -> list[dict]:
+        """
+        Aggregate the daily rows of booking_metrics_mv into a trend.
+
+        Args:
+            start_date: Start of the period (truncated to its day)
+            end_date: End of the period
+            granularity: One of "day", "week" or "month"
+            salon_id: Restrict to a single salon
+
+        Returns:
+            One dict per period with booking counts and completed revenue
+
+        Raises:
+            ValueError: If granularity is not supported
+        """
+        if granularity not in TREND_GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+
+        view = booking_metrics_mv.c
+        # Literal unit so that the SELECT and GROUP BY expressions are identical
+        period = func.date_trunc(literal_column(f"'{granularity}'"), view.metric_date)
+
+        stmt = (
+            select(
+                period.label("period"),
+                func.sum(view.total_bookings).label("total_bookings"),
+                func.sum(view.completed_bookings).label("completed_bookings"),
+                func.sum(view.cancelled_bookings).label("cancelled_bookings"),
+                func.sum(view.no_show_bookings).label("no_show_bookings"),
+                func.sum(view.confirmed_bookings).label("confirmed_bookings"),
+                func.sum(view.completed_revenue).label("revenue"),
+            )
+            .where(
+                view.metric_date >= func.date_trunc("day", start_date),
+                view.metric_date <= end_date,
+            )
+            .group_by(period)
+            .order_by(period)
+        )
+        if salon_id:
+            stmt = stmt.where(view.salon_id == salon_id)
+
+        return [
+            {
+                "period": row.period,
+                "total_bookings": int(row.total_bookings or 0),
+                "completed_bookings": int(row.completed_bookings or 0),
+                "cancelled_bookings": int(row.cancelled_bookings or 0),
+                "no_show_bookings": int(row.no_show_bookings or 0),
+                "confirmed_bookings": int(row.confirmed_bookings or 0),
+                "revenue": round(float(row.revenue or 0), 2),
+            }
+            for row in (await self.session.execute(stmt)).all()
+        ]
+
+    async def get_customer_value_summary(self) -> dict:
+        """
+        Summarize customer lifetime value from customer_analytics_mv.
+
+        Returns:
+            Dict with customers, avg_lifetime_value and avg_bookings_per_customer
+        """
+        view = customer_analytics_mv.c
+        stmt = select(
+            func.count().label("customers"),
+            func.avg(view.lifetime_value).label("avg_lifetime_value"),
+            func.avg(view.total_bookings).label("avg_bookings"),
+        )
+        row = (await self.session.execute(stmt)).one()
+
+        return {
+            "customers": row.customers or 0,
+            "avg_lifetime_value": round(float(row.avg_lifetime_value or 0), 2),
+            "avg_bookings_per_customer": round(float(row.avg_bookings or 0), 2),
+        }
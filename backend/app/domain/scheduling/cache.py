@@ -0,0 +1,251 @@
+"""Two-level cache of computed free intervals per professional and date.
+
+Entries hold the output of the slot engine (free intervals with their grid
+anchors), which only changes when a booking or an availability row of the
+professional changes. Lookups go through a small in-process L1 first and then
+Redis, where every professional has one hash keyed by ISO date so that a
+single date or the whole professional can be invalidated in O(1).
+
+Booking writes are invalidated when their transaction commits (session hooks
+in the booking repository module) and availability writes right after their
+commit (AvailabilityRepository), so readers cannot re-cache a day between
+the write and its commit. L1 entries of other processes are not notified and
+expire after AVAILABILITY_CACHE_L1_TTL_SECONDS, which bounds their staleness;
+booking admission always re-checks the database, so a stale read can never
+cause a double booking.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date
+from typing import TYPE_CHECKING
+
+from backend.app.core.config import settings
+from backend.app.core.redis import get_async_redis
+from backend.app.domain.scheduling.services.slot_engine import FreeInterval
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[int, date]
+
+# Seconds to skip Redis after a connection error
+REDIS_RETRY_BACKOFF_SECONDS = 30
+
+
+class AvailabilityCache:
+    """L1 (in-process LRU) + L2 (Redis hash) cache of free intervals."""
+
+    KEY_PREFIX = "availability:free"
+
+    def __init__(
+        self,
+        redis_client: "aioredis.Redis | None" = None,
+        ttl_seconds: int = 600,
+        l1_ttl_seconds: int = 5,
+        l1_max_entries: int = 10000,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: asyncio Redis client (None for an L1-only cache)
+            ttl_seconds: Redis entry time to live
+            l1_ttl_seconds: In-process entry time to live
+            l1_max_entries: Maximum number of in-process entries (LRU eviction)
+            enabled: When False every lookup misses and writes are ignored
+        """
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.l1_max_entries = l1_max_entries
+        self.enabled = enabled
+        self._l1: OrderedDict[CacheKey, tuple[float, list[FreeInterval]]] = OrderedDict()
+        self._redis_retry_at = 0.0
+
+    @classmethod
+    def _redis_key(cls, professional_id: int) -> str:
+        """Redis hash holding every cached date of a professional."""
+        return f"{cls.KEY_PREFIX}:{professional_id}"
+
+    @staticmethod
+    def _serialize(intervals: list[FreeInterval]) -> str:
+        return json.dumps([list(interval) for interval in intervals])
+
+    @staticmethod
+    def _deserialize(raw: str) -> list[FreeInterval]:
+        return [FreeInterval(*values) for values in json.loads(raw)]
+
+    def _redis_available(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_BACKOFF_SECONDS
+        logger.warning(f"Availability cache {operation} failed, using L1 only: {error}")
+
+    def _l1_get(self, key: CacheKey) -> list[FreeInterval] | None:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+
+        expires_at, intervals = entry
+        if expires_at < time.monotonic():
+            del self._l1[key]
+            return None
+
+        self._l1.move_to_end(key)
+        return intervals
+
+    def _l1_set(self, key: CacheKey, intervals: list[FreeInterval]) -> None:
+        self._l1[key] = (time.monotonic() + self.l1_ttl_seconds, intervals)
+        self._l1.move_to_end(key)
+
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    async def get_many(self, keys: Iterable[CacheKey]) -> dict[CacheKey, list[FreeInterval]]:
+        """
+        Look up several (professional_id, date) entries.
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            Mapping of the keys that were found to their free intervals
+        """
+        if not self.enabled:
+            return {}
+
+        found: dict[CacheKey, list[FreeInterval]] = {}
+        misses: list[CacheKey] = []
+
+        for key in keys:
+            intervals = self._l1_get(key)
+            if intervals is None:
+                misses.append(key)
+            else:
+                found[key] = intervals
+
+        if not misses or not self._redis_available():
+            return found
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for professional_id, target_date in misses:
+                    pipe.hget(self._redis_key(professional_id), target_date.isoformat())
+                values = await pipe.execute()
+        except Exception as e:
+            self._redis_failed("read", e)
+            return found
+
+        for key, raw in zip(misses, values):
+            if raw is not None:
+                intervals = self._deserialize(raw)
+                self._l1_set(key, intervals)
+                found[key] = intervals
+
+        return found
+
+    async def get(self, professional_id: int, target_date: date) -> list[FreeInterval] | None:
+        """Look up the free intervals of one professional and date."""
+        key = (professional_id, target_date)
+        return (await self.get_many([key])).get(key)
+
+    async def set_many(self, entries: dict[CacheKey, list[FreeInterval]]) -> None:
+        """
+        Store several (professional_id, date) entries.
+
+        Args:
+            entries: Free intervals keyed by (professional_id, date)
+        """
+        if not self.enabled or not entries:
+            return
+
+        for key, intervals in entries.items():
+            self._l1_set(key, intervals)
+
+        if not self._redis_available():
+            return
+
+        by_professional: dict[int, dict[str, str]] = {}
+        for (professional_id, target_date), intervals in entries.items():
+            by_professional.setdefault(professional_id, {})[target_date.isoformat()] = (
+                self._serialize(intervals)
+            )
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for professional_id, mapping in by_professional.items():
+                    redis_key = self._redis_key(professional_id)
+                    pipe.hset(redis_key, mapping=mapping)
+                    pipe.expire(redis_key, self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            self._redis_failed("write", e)
+
+    async def set(
+        self,
+        professional_id: int,
+        target_date: date,
+        intervals: list[FreeInterval],
+    ) -> None:
+        """Store the free intervals of one professional and date."""
+        await self.set_many({(professional_id, target_date): intervals})
+
+    async def invalidate(self, professional_id: int, dates: Iterable[date]) -> None:
+        """
+        Drop the entries of a professional for specific dates.
+
+        Args:
+            professional_id: Professional whose agenda changed
+            dates: Dates affected by the change
+        """
+        fields = []
+        for target_date in set(dates):
+            self._l1.pop((professional_id, target_date), None)
+            fields.append(target_date.isoformat())
+
+        if not fields or not self._redis_available():
+            return
+
+        try:
+            await self.redis.hdel(self._redis_key(professional_id), *fields)
+        except Exception as e:
+            self._redis_failed("invalidate", e)
+
+    async def invalidate_professional(self, professional_id: int) -> None:
+        """
+        Drop every cached date of a professional.
+
+        Used when availability windows change, since they apply to every
+        matching weekday.
+        """
+        for key in [key for key in self._l1 if key[0] == professional_id]:
+            del self._l1[key]
+
+        if not self._redis_available():
+            return
+
+        try:
+            await self.redis.delete(self._redis_key(professional_id))
+        except Exception as e:
+            self._redis_failed("invalidate", e)
+
+    def clear_local(self) -> None:
+        """Drop every in-process entry."""
+        self._l1.clear()
+
+
+availability_cache = AvailabilityCache(
+    redis_client=get_async_redis(),
+    ttl_seconds=settings.AVAILABILITY_CACHE_TTL_SECONDS,
+    l1_ttl_seconds=settings.AVAILABILITY_CACHE_L1_TTL_SECONDS,
+    l1_max_entries=settings.AVAILABILITY_CACHE_L1_MAX_ENTRIES,
+    enabled=settings.AVAILABILITY_CACHE_ENABLED,
+)
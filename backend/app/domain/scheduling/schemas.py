@@ -74,3 +74,69 @@ class SlotResponse(BaseModel):
     service_duration_minutes: int = Field(..., description="Duration of the service in minutes")
     slots: list[TimeSlot] = Field(default_factory=list, description="List of available time slots")
     total_slots: int = Field(..., description="Total number of available slots")
+
+
+class BatchSlotResponse(BaseModel):
+    """Available slots for several professionals over a date range."""
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "service_id": 1,
+                "service_duration_minutes": 60,
+                "start_date": "2025-10-20",
+                "end_date": "2025-10-21",
+                "professional_ids": [1, 2],
+                "results": [
+                    {
+                        "professional_id": 1,
+                        "date": "2025-10-20",
+                        "service_id": 1,
+                        "service_duration_minutes": 60,
+                        "slots": [
+                            {
+                                "start_time": "2025-10-20T09:00:00",
+                                "end_time": "2025-10-20T10:00:00",
+                                "available": True,
+                            }
+                        ],
+                        "total_slots": 1,
+                    }
+                ],
+                "total_slots": 1,
+            }
+        }
+    }
+
+    service_id: int = Field(..., description="ID of the service")
+    service_duration_minutes: int = Field(..., description="Duration of the service in minutes")
+    start_date: str = Field(..., description="First date of the range in ISO format")
+    end_date: str = Field(..., description="Last date of the range in ISO format")
+    professional_ids: list[int] = Field(default_factory=list, description="Professionals included")
+    results: list[SlotResponse] = Field(
+        default_factory=list,
+        description="Slots per professional and date, ordered by professional then date",
+    )
+    total_slots: int = Field(..., description="Total number of available slots in the range")
+
+
+class NextAvailableSlotResponse(BaseModel):
+    """Earliest available slot among a set of professionals."""
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "service_id": 1,
+                "professional_id": 2,
+                "slot": {
+                    "start_time": "2025-10-20T09:00:00",
+                    "end_time": "2025-10-20T10:00:00",
+                    "available": True,
+                },
+            }
+        }
+    }
+
+    service_id: int = Field(..., description="ID of the service")
+    professional_id: int | None = Field(None, description="Professional owning the slot")
+    slot: TimeSlot | None = Field(None, description="Earliest available slot, if any")
@@ -1,5 +1,6 @@
 """Scheduling services."""
 
+from backend.app.domain.scheduling.services.booking_admission import BookingAdmissionService
 from backend.app.domain.scheduling.services.slot_service import SlotService
 
-__all__ = ["SlotService"]
+__all__ = ["BookingAdmissionService", "SlotService"]
@@ -0,0 +1,124 @@
+"""Race-free booking admission."""
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.exceptions import ConflictError
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.domain.scheduling.services.slot_service import SlotService
+
+if TYPE_CHECKING:
+    from backend.app.db.models.service import Service
+
+logger = logging.getLogger(__name__)
+
+
+class BookingAdmissionService:
+    """
+    Admit new bookings without double-booking a professional.
+
+    The professional's agenda lock is taken before the availability check, so
+    the check and the insert behave atomically with respect to other
+    admissions for the same professional. The lock is released when the
+    caller's transaction commits or rolls back.
+    """
+
+    def __init__(self, session: AsyncSession, slot_service: SlotService | None = None):
+        """
+        Initialize service with database session.
+
+        Args:
+            session: Async database session
+            slot_service: Slot service to use (default: a new one on the session)
+        """
+        self.session = session
+        self.slot_service = slot_service or SlotService(session)
+        self.booking_repo = self.slot_service.booking_repo
+
+    async def admit(
+        self,
+        client_id: int,
+        professional_id: int,
+        service: "Service",
+        scheduled_at: datetime,
+        notes: str | None = None,
+        cancellation_policy_id: int | None = None,
+        allow_overbooking: bool = False,
+        salon_id: int | None = None,
+    ) -> Booking:
+        """
+        Check the requested interval and create the booking under the agenda lock.
+
+        The start must be one of the slots offered for the service: inside an
+        availability window and on its service-duration grid.
+
+        Args:
+            client_id: ID of the client (User)
+            professional_id: ID of the professional
+            service: Service being booked
+            scheduled_at: Requested start time
+            notes: Optional booking notes
+            cancellation_policy_id: ID of applicable cancellation policy
+            allow_overbooking: Accept overlapping bookings within the
+                overbooking capacity of the professional
+            salon_id: Salon ID for overbooking configuration lookup
+
+        Returns:
+            Created (flushed, not committed) Booking instance
+
+        Raises:
+            ConflictError: If the interval is not available
+        """
+        await self.booking_repo.lock_professional_agenda(professional_id)
+
+        available = await self.slot_service.is_within_availability(
+            professional_id=professional_id,
+            scheduled_at=scheduled_at,
+            duration_minutes=service.duration_minutes,
+            slot_interval_minutes=service.duration_minutes,
+        )
+
+        if available:
+            has_conflict = await self.booking_repo.check_conflict(
+                professional_id=professional_id,
+                scheduled_at=scheduled_at,
+                duration_minutes=service.duration_minutes,
+            )
+
+            if has_conflict and allow_overbooking:
+                # The agenda lock is already held by this transaction
+                available, _ = await self.slot_service.overbooking_service.can_accept_booking(
+                    professional_id=professional_id,
+                    target_datetime=scheduled_at,
+                    service_duration_minutes=service.duration_minutes,
+                    salon_id=salon_id,
+                    service_id=service.id,
+                )
+            else:
+                available = not has_conflict
+
+        if not available:
+            logger.info(
+                f"Rejected booking for professional {professional_id} at {scheduled_at}: "
+                "slot not available"
+            )
+            raise ConflictError(
+                f"Slot at {scheduled_at} is not available",
+                conflicting_resource="booking",
+                details={"professional_id": professional_id},
+            )
+
+        return await self.booking_repo.create(
+            client_id=client_id,
+            professional_id=professional_id,
+            service_id=service.id,
+            scheduled_at=scheduled_at,
+            duration_minutes=service.duration_minutes,
+            service_price=float(service.price),
+            status=BookingStatus.PENDING,
+            notes=notes,
+            cancellation_policy_id=cancellation_policy_id,
+        )
@@ -0,0 +1,240 @@
+"""Interval-based slot engine for scheduling.
+
+Availability windows and bookings are normalised into sorted integer-minute
+intervals, measured from midnight of the target date. Free time is then
+obtained by subtracting the merged busy intervals from each window in a
+single sweep, and slot start times are laid out on the grid anchored at the
+start of the window they belong to.
+"""
+
+import math
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+from backend.app.domain.scheduling.schemas import TimeSlot
+
+if TYPE_CHECKING:
+    from backend.app.db.models.availability import Availability
+    from backend.app.db.models.booking import Booking
+
+# Half-open interval [start, end) in minutes from midnight of the target date
+Interval = tuple[int, int]
+
+
+class FreeInterval(NamedTuple):
+    """Free part of an availability window.
+
+    ``anchor`` is the start of the originating window; slot start times are
+    generated on the ``anchor + k * slot_interval`` grid so that subtracting
+    bookings never shifts the slot grid of a window.
+    """
+
+    start: int
+    end: int
+    anchor: int
+
+
+def time_to_minutes(value: time) -> int:
+    """Convert a wall-clock time to minutes since midnight."""
+    return value.hour * 60 + value.minute
+
+
+def datetime_to_minutes(value: datetime, target_date: date) -> float:
+    """
+    Convert a datetime to (fractional) minutes since midnight of target_date.
+
+    Timezone information is dropped so that wall-clock times are compared,
+    matching how slots are generated from naive availability times.
+    """
+    naive = value.replace(tzinfo=None)
+    delta = naive - datetime.combine(target_date, time.min)
+    return delta.total_seconds() / 60
+
+
+def minutes_to_datetime(target_date: date, minutes: int) -> datetime:
+    """Convert minutes since midnight of target_date back to a datetime."""
+    return datetime.combine(target_date, time.min) + timedelta(minutes=minutes)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """
+    Sort and merge overlapping or touching intervals.
+
+    Args:
+        intervals: Intervals in any order
+
+    Returns:
+        Sorted list of disjoint intervals
+    """
+    merged: list[Interval] = []
+
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def availability_intervals(availabilities: Iterable["Availability"]) -> list[Interval]:
+    """
+    Convert availability windows to sorted minute intervals.
+
+    Windows are not merged: each keeps its own slot grid.
+    """
+    return sorted(
+        (time_to_minutes(a.start_time), time_to_minutes(a.end_time))
+        for a in availabilities
+    )
+
+
+def booking_intervals(
+    bookings: Iterable["Booking"],
+    target_date: date,
+) -> list[Interval]:
+    """
+    Convert bookings to merged busy intervals using each booking's own duration.
+
+    Start times are floored and end times ceiled to whole minutes so that a
+    booking is never treated as shorter than it is.
+
+    Args:
+        bookings: Existing bookings for the professional
+        target_date: Date the intervals are relative to
+
+    Returns:
+        Sorted list of disjoint busy intervals
+    """
+    intervals = []
+
+    for booking in bookings:
+        start = datetime_to_minutes(booking.scheduled_at, target_date)
+        end = start + booking.duration_minutes
+        intervals.append((math.floor(start), math.ceil(end)))
+
+    return merge_intervals(intervals)
+
+
+def subtract_intervals(
+    windows: list[Interval],
+    busy: list[Interval],
+) -> list[FreeInterval]:
+    """
+    Subtract merged busy intervals from availability windows.
+
+    Because ``busy`` is sorted and disjoint, its end points are sorted too,
+    so the first busy interval relevant to a window is found by bisection and
+    the window is then swept left to right.
+
+    Args:
+        windows: Sorted availability windows
+        busy: Sorted, merged busy intervals
+
+    Returns:
+        Free intervals ordered by window, then by start
+    """
+    free: list[FreeInterval] = []
+    busy_ends = [end for _, end in busy]
+
+    for window_start, window_end in windows:
+        cursor = window_start
+        index = bisect_right(busy_ends, window_start)
+
+        while index < len(busy) and busy[index][0] < window_end:
+            busy_start, busy_end = busy[index]
+            if busy_start > cursor:
+                free.append(FreeInterval(cursor, busy_start, window_start))
+            cursor = max(cursor, busy_end)
+            index += 1
+
+        if cursor < window_end:
+            free.append(FreeInterval(cursor, window_end, window_start))
+
+    return free
+
+
+def compute_free_intervals(
+    availabilities: Iterable["Availability"],
+    bookings: Iterable["Booking"],
+    target_date: date,
+) -> list[FreeInterval]:
+    """
+    Compute the free intervals of a professional's day.
+
+    Args:
+        availabilities: Active availability windows for the day
+        bookings: Bookings blocking time on that day
+        target_date: Date being computed
+
+    Returns:
+        Free intervals of every availability window
+    """
+    return subtract_intervals(
+        availability_intervals(availabilities),
+        booking_intervals(bookings, target_date),
+    )
+
+
+def slot_start_minutes(
+    free_intervals: Iterable[FreeInterval],
+    service_duration: int,
+    slot_interval: int,
+) -> list[int]:
+    """
+    Lay out slot start times that fit entirely inside a free interval.
+
+    Args:
+        free_intervals: Free intervals with their grid anchors
+        service_duration: Duration of the service in minutes
+        slot_interval: Interval between slot start times in minutes
+
+    Returns:
+        Sorted, de-duplicated slot start minutes
+    """
+    starts: set[int] = set()
+
+    for start, end, anchor in free_intervals:
+        steps = -((anchor - start) // slot_interval)  # ceil((start - anchor) / step)
+        current = anchor + steps * slot_interval
+        last_start = end - service_duration
+
+        if current <= last_start:
+            starts.update(range(current, last_start + 1, slot_interval))
+
+    return sorted(starts)
+
+
+def build_time_slots(
+    target_date: date,
+    free_intervals: Iterable[FreeInterval],
+    service_duration: int,
+    slot_interval: int,
+) -> list[TimeSlot]:
+    """
+    Build TimeSlot objects for every slot that fits in the free intervals.
+
+    Args:
+        target_date: Date of the slots
+        free_intervals: Free intervals of the day
+        service_duration: Duration of the service in minutes
+        slot_interval: Interval between slot start times in minutes
+
+    Returns:
+        List of available TimeSlot objects sorted by start time
+    """
+    midnight = datetime.combine(target_date, time.min)
+
+    return [
+        TimeSlot(
+            start_time=midnight + timedelta(minutes=start),
+            end_time=midnight + timedelta(minutes=start + service_duration),
+            available=True,
+        )
+        for start in slot_start_minutes(free_intervals, service_duration, slot_interval)
+    ]
@@ -1,5 +1,6 @@
 """Slot calculation service for scheduling."""
 
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Optional
 
@@ -8,30 +9,51 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.db.models.availability import DayOfWeek
 from backend.app.db.repositories.availability import AvailabilityRepository
 from backend.app.db.repositories.booking import BookingRepository
+from backend.app.db.repositories.professional import ProfessionalRepository
 from backend.app.db.repositories.service import ServiceRepository
-from backend.app.domain.scheduling.schemas import SlotResponse, TimeSlot
+from backend.app.domain.scheduling.cache import AvailabilityCache
+from backend.app.domain.scheduling.cache import availability_cache as default_availability_cache
+from backend.app.domain.scheduling.schemas import BatchSlotResponse, SlotResponse, TimeSlot
+from backend.app.domain.scheduling.services.slot_engine import (
+    FreeInterval,
+    availability_intervals,
+    build_time_slots,
+    compute_free_intervals,
+    datetime_to_minutes,
+)
 from backend.app.services.overbooking import OverbookingService
 
 if TYPE_CHECKING:
     from backend.app.db.models.availability import Availability
     from backend.app.db.models.booking import Booking
-    from backend.app.db.models.service import Service
+
+# Days loaded per bookings range query when searching for the next free slot
+NEXT_SLOT_SEARCH_CHUNK_DAYS = 7
 
 
 class SlotService:
     """Service for calculating available time slots."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        availability_cache: AvailabilityCache | None = None,
+    ):
         """
         Initialize service with database session.
 
         Args:
             session: Async database session
+            availability_cache: Free-interval cache (default: process-wide cache)
         """
         self.session = session
+        self.availability_cache = (
+            availability_cache if availability_cache is not None else default_availability_cache
+        )
         self.availability_repo = AvailabilityRepository(session)
         self.booking_repo = BookingRepository(session)
         self.service_repo = ServiceRepository(session)
+        self.professional_repo = ProfessionalRepository(session)
         self.overbooking_service = OverbookingService(session)
 
     async def calculate_available_slots(
@@ -46,10 +68,12 @@ class SlotService:
 
         This method:
         1. Retrieves the service to get its duration
-        2. Gets the professional's availability for the target date
-        3. Gets all existing bookings for that date
-        4. Generates time slots based on availability windows
-        5. Filters out slots that conflict with existing bookings
+        2. Looks up the professional's free intervals for the date in the
+           availability cache
+        3. On a miss, loads the availability windows and bookings for the date
+           and subtracts the bookings (with their own durations) from the
+           windows as sorted integer-minute intervals
+        4. Generates time slots inside the free intervals
 
         Args:
             professional_id: ID of the professional
@@ -70,47 +94,22 @@ class SlotService:
 
         service_duration = service.duration_minutes
 
-        # Get day of week from target date
-        day_of_week = DayOfWeek(target_date.weekday())
-
-        # Get active availabilities for the professional on this day
-        availabilities = await self.availability_repo.list_active_by_professional_and_day(
-            professional_id=professional_id,
-            day_of_week=day_of_week,
-            check_date=target_date,
-        )
+        free_intervals = await self.availability_cache.get(professional_id, target_date)
 
-        if not availabilities:
-            return SlotResponse(
+        if free_intervals is None:
+            free_intervals = await self._compute_day_free_intervals(
                 professional_id=professional_id,
-                date=target_date.isoformat(),
-                service_id=service_id,
-                service_duration_minutes=service_duration,
-                slots=[],
-                total_slots=0,
+                target_date=target_date,
             )
+            await self.availability_cache.set(professional_id, target_date, free_intervals)
 
-        # Get existing bookings for this date
-        existing_bookings = await self.booking_repo.list_by_professional_and_date(
-            professional_id=professional_id,
-            target_date=target_date,
-        )
-
-        # Generate slots from availability windows
-        all_slots = self._generate_slots_from_availabilities(
-            availabilities=availabilities,
+        available_slots = build_time_slots(
             target_date=target_date,
+            free_intervals=free_intervals,
             service_duration=service_duration,
             slot_interval=slot_interval_minutes,
         )
 
-        # Filter out slots that conflict with existing bookings
-        available_slots = self._filter_conflicting_slots(
-            slots=all_slots,
-            bookings=existing_bookings,
-            service=service,
-        )
-
         return SlotResponse(
             professional_id=professional_id,
             date=target_date.isoformat(),
@@ -120,101 +119,66 @@ class SlotService:
             total_slots=len(available_slots),
         )
 
-    def _generate_slots_from_availabilities(
+    async def _compute_day_free_intervals(
         self,
-        availabilities: list["Availability"],
+        professional_id: int,
         target_date: date,
-        service_duration: int,
-        slot_interval: int,
-    ) -> list[TimeSlot]:
+    ) -> list[FreeInterval]:
         """
-        Generate time slots from availability windows.
+        Load one professional's day from the database and compute its free intervals.
 
         Args:
-            availabilities: List of availability records
-            target_date: Target date
-            service_duration: Duration of service in minutes
-            slot_interval: Interval between slots in minutes
+            professional_id: ID of the professional
+            target_date: Date to compute
 
         Returns:
-            List of TimeSlot objects
+            Free intervals of the day (empty if the professional does not work)
         """
-        slots = []
-
-        for availability in availabilities:
-            # Combine date with availability times
-            start_datetime = datetime.combine(target_date, availability.start_time)
-            end_datetime = datetime.combine(target_date, availability.end_time)
-
-            # Generate slots within this availability window
-            current_time = start_datetime
-
-            while current_time + timedelta(minutes=service_duration) <= end_datetime:
-                slot_end = current_time + timedelta(minutes=service_duration)
-
-                slots.append(
-                    TimeSlot(
-                        start_time=current_time,
-                        end_time=slot_end,
-                        available=True,
-                    )
-                )
+        availabilities = await self.availability_repo.list_active_by_professional_and_day(
+            professional_id=professional_id,
+            day_of_week=DayOfWeek(target_date.weekday()),
+            check_date=target_date,
+        )
 
-                current_time += timedelta(minutes=slot_interval)
+        if not availabilities:
+            return []
 
-        # Sort slots by start time
-        slots.sort(key=lambda s: s.start_time)
+        existing_bookings = await self.booking_repo.list_by_professional_and_date(
+            professional_id=professional_id,
+            target_date=target_date,
+        )
 
-        return slots
+        return compute_free_intervals(
+            availabilities=availabilities,
+            bookings=existing_bookings,
+            target_date=target_date,
+        )
 
-    def _filter_conflicting_slots(
+    def _generate_slots_from_availabilities(
         self,
-        slots: list[TimeSlot],
-        bookings: list["Booking"],
-        service: "Service",
+        availabilities: list["Availability"],
+        target_date: date,
+        service_duration: int,
+        slot_interval: int,
     ) -> list[TimeSlot]:
         """
-        Filter out slots that conflict with existing bookings.
-
-        A slot conflicts if:
-        - The slot starts during an existing booking
-        - The slot ends during an existing booking
-        - The slot completely contains an existing booking
+        Generate time slots from availability windows.
 
         Args:
-            slots: List of generated time slots
-            bookings: List of existing bookings
-            service: Service being booked
+            availabilities: List of availability records
+            target_date: Target date
+            service_duration: Duration of service in minutes
+            slot_interval: Interval between slots in minutes
 
         Returns:
-            List of available (non-conflicting) time slots
+            List of TimeSlot objects sorted by start time
         """
-        if not bookings:
-            return slots
-
-        available_slots = []
-
-        for slot in slots:
-            is_available = True
-
-            for booking in bookings:
-                booking_end = booking.scheduled_at + timedelta(
-                    minutes=service.duration_minutes
-                )
-
-                # Check for overlap
-                # Slot starts before booking ends AND slot ends after booking starts
-                if slot.start_time < booking_end and slot.end_time > booking.scheduled_at:
-                    is_available = False
-                    break
-
-            if is_available:
-                available_slots.append(slot)
-            else:
-                # Mark slot as unavailable (for debugging/logging purposes)
-                slot.available = False
-
-        return available_slots
+        return build_time_slots(
+            target_date=target_date,
+            free_intervals=compute_free_intervals(availabilities, [], target_date),
+            service_duration=service_duration,
+            slot_interval=slot_interval,
+        )
 
     async def check_slot_availability(
         self,
@@ -241,17 +205,70 @@ class SlotService:
         if not service:
             raise ValueError(f"Service with ID {service_id} not found")
 
+        return await self.check_interval_availability(
+            professional_id=professional_id,
+            scheduled_at=scheduled_at,
+            duration_minutes=service.duration_minutes,
+        )
+
+    async def check_interval_availability(
+        self,
+        professional_id: int,
+        scheduled_at: datetime,
+        duration_minutes: int,
+    ) -> bool:
+        """
+        Check a single interval against bookings and availability windows.
+
+        Issues one conflict query for the interval instead of recomputing
+        every slot of the day, so it is cheap enough to run under the
+        agenda lock during booking admission.
+
+        Args:
+            professional_id: ID of the professional
+            scheduled_at: Proposed booking datetime
+            duration_minutes: Duration of the interval in minutes
+
+        Returns:
+            True if the interval is free and inside a working window
+        """
         # Check if there's a conflict with existing bookings
         has_conflict = await self.booking_repo.check_conflict(
             professional_id=professional_id,
             scheduled_at=scheduled_at,
-            duration_minutes=service.duration_minutes,
+            duration_minutes=duration_minutes,
         )
 
         if has_conflict:
             return False
 
-        # Check if the slot falls within professional's availability
+        return await self.is_within_availability(
+            professional_id=professional_id,
+            scheduled_at=scheduled_at,
+            duration_minutes=duration_minutes,
+        )
+
+    async def is_within_availability(
+        self,
+        professional_id: int,
+        scheduled_at: datetime,
+        duration_minutes: int,
+        slot_interval_minutes: int | None = None,
+    ) -> bool:
+        """
+        Check that an interval fits inside one of the day's availability windows.
+
+        Args:
+            professional_id: Professional ID
+            scheduled_at: Start of the interval
+            duration_minutes: Duration of the interval in minutes
+            slot_interval_minutes: If given, the interval must also start on
+                the window's slot grid (window start + k * slot interval), as
+                the slots from calculate_available_slots do
+
+        Returns:
+            True if the interval fits inside a window
+        """
         target_date = scheduled_at.date()
         day_of_week = DayOfWeek(target_date.weekday())
 
@@ -264,20 +281,20 @@ class SlotService:
         if not availabilities:
             return False
 
-        # Check if scheduled time falls within any availability window
-        scheduled_time = scheduled_at.time()
-        service_end_time = (scheduled_at + timedelta(minutes=service.duration_minutes)).time()
+        # Slot must start at or after availability start
+        # AND end at or before availability end
+        start_minutes = datetime_to_minutes(scheduled_at, target_date)
+        end_minutes = start_minutes + duration_minutes
 
-        for availability in availabilities:
-            # Slot must start at or after availability start
-            # AND end at or before availability end
-            if (
-                availability.start_time <= scheduled_time
-                and service_end_time <= availability.end_time
-            ):
+        def on_grid(window_start: int) -> bool:
+            if not slot_interval_minutes:
                 return True
+            return (start_minutes - window_start) % slot_interval_minutes == 0
 
-        return False
+        return any(
+            window_start <= start_minutes and end_minutes <= window_end and on_grid(window_start)
+            for window_start, window_end in availability_intervals(availabilities)
+        )
 
     async def check_slot_availability_with_overbooking(
         self,
@@ -342,24 +359,114 @@ class SlotService:
                 "message": "Slot not available even with overbooking"
             }
 
-    async def get_next_available_slot(
+    async def resolve_professional_ids(
         self,
-        professional_id: int,
+        professional_ids: list[int] | None = None,
+        salon_id: int | None = None,
+    ) -> list[int]:
+        """
+        Resolve the professionals targeted by a batch availability request.
+
+        Args:
+            professional_ids: Explicit professional IDs
+            salon_id: Salon whose active professionals should be used
+
+        Returns:
+            Sorted, de-duplicated list of professional IDs
+        """
+        ids = set(professional_ids or [])
+
+        if salon_id is not None:
+            ids.update(await self.professional_repo.list_active_ids_by_salon_id(salon_id))
+
+        return sorted(ids)
+
+    async def calculate_batch_slots(
+        self,
+        professional_ids: list[int],
+        start_date: date,
+        end_date: date,
+        service_id: int,
+        slot_interval_minutes: int = 30,
+    ) -> BatchSlotResponse:
+        """
+        Calculate available slots for several professionals over a date range.
+
+        Cached days are served from the availability cache; the remaining
+        days are computed from one availabilities query and one bookings
+        range query, in memory.
+
+        Args:
+            professional_ids: IDs of the professionals
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            service_id: ID of the service to book
+            slot_interval_minutes: Interval between slot start times (default: 30)
+
+        Returns:
+            BatchSlotResponse with one SlotResponse per professional and date
+
+        Raises:
+            ValueError: If service not found or the date range is inverted
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+
+        service = await self.service_repo.get_by_id(service_id)
+        if not service:
+            raise ValueError(f"Service with ID {service_id} not found")
+
+        dates = self._date_range(start_date, end_date)
+        matrix, _ = await self._load_free_interval_matrix(professional_ids, dates)
+
+        results = [
+            self._build_day_response(
+                professional_id=professional_id,
+                target_date=target_date,
+                service_id=service_id,
+                service_duration=service.duration_minutes,
+                slot_interval=slot_interval_minutes,
+                free_intervals=matrix[(professional_id, target_date)],
+            )
+            for professional_id in professional_ids
+            for target_date in dates
+        ]
+
+        return BatchSlotResponse(
+            service_id=service_id,
+            service_duration_minutes=service.duration_minutes,
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+            professional_ids=professional_ids,
+            results=results,
+            total_slots=sum(result.total_slots for result in results),
+        )
+
+    async def get_next_available_slot_for_professionals(
+        self,
+        professional_ids: list[int],
         service_id: int,
         from_date: date | None = None,
         max_days_ahead: int = 30,
-    ) -> TimeSlot | None:
+        slot_interval_minutes: int = 30,
+    ) -> tuple[int, TimeSlot] | None:
         """
-        Find the next available slot for a service.
+        Find the earliest available slot among several professionals.
+
+        Days are loaded in chunks of NEXT_SLOT_SEARCH_CHUNK_DAYS days (cache
+        first, then one bookings range query per chunk for the misses), and
+        the search stops at the first chunk that contains a free slot.
+        Availabilities are loaded at most once per search.
 
         Args:
-            professional_id: ID of the professional
+            professional_ids: IDs of the professionals to search
             service_id: ID of the service
             from_date: Start searching from this date (default: today)
             max_days_ahead: Maximum days to search ahead (default: 30)
+            slot_interval_minutes: Interval between slot start times (default: 30)
 
         Returns:
-            Next available TimeSlot or None if no slots found
+            Tuple of (professional_id, TimeSlot) or None if no slots found
 
         Raises:
             ValueError: If service not found
@@ -367,26 +474,258 @@ class SlotService:
         if from_date is None:
             from_date = date.today()
 
-        # Get service to validate it exists
         service = await self.service_repo.get_by_id(service_id)
         if not service:
             raise ValueError(f"Service with ID {service_id} not found")
 
-        # Search for available slots day by day
-        current_date = from_date
+        if not professional_ids or max_days_ahead <= 0:
+            return None
 
-        for _ in range(max_days_ahead):
-            slots_response = await self.calculate_available_slots(
-                professional_id=professional_id,
-                target_date=current_date,
-                service_id=service_id,
+        last_date = from_date + timedelta(days=max_days_ahead - 1)
+        chunk_start = from_date
+        availability_index = None
+
+        while chunk_start <= last_date:
+            chunk_end = min(
+                chunk_start + timedelta(days=NEXT_SLOT_SEARCH_CHUNK_DAYS - 1),
+                last_date,
             )
+            dates = self._date_range(chunk_start, chunk_end)
+            matrix, availability_index = await self._load_free_interval_matrix(
+                professional_ids, dates, availability_index
+            )
+
+            for target_date in dates:
+                best: tuple[int, TimeSlot] | None = None
+
+                for professional_id in professional_ids:
+                    day = self._build_day_response(
+                        professional_id=professional_id,
+                        target_date=target_date,
+                        service_id=service_id,
+                        service_duration=service.duration_minutes,
+                        slot_interval=slot_interval_minutes,
+                        free_intervals=matrix[(professional_id, target_date)],
+                    )
+                    if day.slots and (
+                        best is None or day.slots[0].start_time < best[1].start_time
+                    ):
+                        best = (professional_id, day.slots[0])
 
-            if slots_response.slots:
-                # Return the first available slot
-                return slots_response.slots[0]
+                if best is not None:
+                    return best
 
-            current_date += timedelta(days=1)
+            chunk_start = chunk_end + timedelta(days=1)
 
-        # No available slots found within the search window
         return None
+
+    async def list_professionals_free_after(
+        self,
+        professional_ids: list[int],
+        after: datetime,
+        duration_minutes: int,
+    ) -> set[int]:
+        """
+        Find the professionals with a free stretch later on the same day.
+
+        Uses the same cached free-interval matrix as the batch availability
+        API, so a whole list of professionals costs at most one
+        availabilities query and one bookings query.
+
+        Args:
+            professional_ids: IDs of the professionals
+            after: Earliest start of the free stretch
+            duration_minutes: Minimum length of the free stretch
+
+        Returns:
+            IDs of the professionals with such a stretch
+        """
+        if not professional_ids:
+            return set()
+
+        target_date = after.date()
+        after_minutes = datetime_to_minutes(after, target_date)
+        matrix, _ = await self._load_free_interval_matrix(professional_ids, [target_date])
+
+        return {
+            professional_id
+            for (professional_id, _), free_intervals in matrix.items()
+            if any(
+                max(interval.start, after_minutes) + duration_minutes <= interval.end
+                for interval in free_intervals
+            )
+        }
+
+    @staticmethod
+    def _date_range(start_date: date, end_date: date) -> list[date]:
+        """List every date from start_date to end_date (inclusive)."""
+        return [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+
+    async def _load_free_interval_matrix(
+        self,
+        professional_ids: list[int],
+        dates: list[date],
+        availability_index: dict[tuple[int, int], list["Availability"]] | None = None,
+    ) -> tuple[
+        dict[tuple[int, date], list[FreeInterval]],
+        dict[tuple[int, int], list["Availability"]] | None,
+    ]:
+        """
+        Load the free intervals of every (professional, date) cell.
+
+        Cells found in the availability cache are used as is. For the rest,
+        availabilities (unless already provided) and bookings are loaded
+        with one query each, computed in memory and written back to the cache.
+
+        Args:
+            professional_ids: IDs of the professionals
+            dates: Dates to load, in ascending order
+            availability_index: Availabilities loaded by a previous call
+
+        Returns:
+            Tuple of (free intervals per cell, availability index or None if
+            every cell was cached)
+        """
+        keys = [
+            (professional_id, target_date)
+            for professional_id in professional_ids
+            for target_date in dates
+        ]
+        matrix = await self.availability_cache.get_many(keys)
+        missing = [key for key in keys if key not in matrix]
+
+        if not missing:
+            return matrix, availability_index
+
+        if availability_index is None:
+            availability_index = await self._load_availability_index(professional_ids)
+
+        # Only days on which a professional works need their bookings
+        working = [
+            key for key in missing
+            if (key[0], key[1].weekday()) in availability_index
+        ]
+        booking_index: dict[tuple[int, date], list["Booking"]] = {}
+        if working:
+            booking_index = await self._load_booking_index(
+                professional_ids=sorted({key[0] for key in working}),
+                start_date=min(key[1] for key in working),
+                end_date=max(key[1] for key in working),
+            )
+
+        computed = {}
+        for professional_id, target_date in missing:
+            availabilities = availability_index.get((professional_id, target_date.weekday()), [])
+            computed[(professional_id, target_date)] = (
+                compute_free_intervals(
+                    availabilities=availabilities,
+                    bookings=booking_index.get((professional_id, target_date), []),
+                    target_date=target_date,
+                )
+                if availabilities
+                else []
+            )
+
+        await self.availability_cache.set_many(computed)
+        matrix.update(computed)
+
+        return matrix, availability_index
+
+    async def _load_availability_index(
+        self,
+        professional_ids: list[int],
+    ) -> dict[tuple[int, int], list["Availability"]]:
+        """Load active availabilities keyed by (professional_id, weekday)."""
+        availabilities = await self.availability_repo.list_active_by_professional_ids(
+            professional_ids
+        )
+
+        index: dict[tuple[int, int], list["Availability"]] = defaultdict(list)
+        for availability in availabilities:
+            index[(availability.professional_id, int(availability.day_of_week))].append(
+                availability
+            )
+
+        return dict(index)
+
+    async def _load_booking_index(
+        self,
+        professional_ids: list[int],
+        start_date: date,
+        end_date: date,
+    ) -> dict[tuple[int, date], list["Booking"]]:
+        """Load active bookings keyed by (professional_id, date)."""
+        bookings = await self.booking_repo.list_by_professionals_and_date_range(
+            professional_ids=professional_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        index: dict[tuple[int, date], list["Booking"]] = defaultdict(list)
+        for booking in bookings:
+            index[(booking.professional_id, booking.scheduled_at.date())].append(booking)
+
+        return dict(index)
+
+    def _build_day_response(
+        self,
+        professional_id: int,
+        target_date: date,
+        service_id: int,
+        service_duration: int,
+        slot_interval: int,
+        free_intervals: list[FreeInterval],
+    ) -> SlotResponse:
+        """Build one cell of the availability matrix from its free intervals."""
+        slots = build_time_slots(
+            target_date=target_date,
+            free_intervals=free_intervals,
+            service_duration=service_duration,
+            slot_interval=slot_interval,
+        )
+
+        return SlotResponse(
+            professional_id=professional_id,
+            date=target_date.isoformat(),
+            service_id=service_id,
+            service_duration_minutes=service_duration,
+            slots=slots,
+            total_slots=len(slots),
+        )
+
+    async def get_next_available_slot(
+        self,
+        professional_id: int,
+        service_id: int,
+        from_date: date | None = None,
+        max_days_ahead: int = 30,
+    ) -> TimeSlot | None:
+        """
+        Find the next available slot for a service.
+
+        Args:
+            professional_id: ID of the professional
+            service_id: ID of the service
+            from_date: Start searching from this date (default: today)
+            max_days_ahead: Maximum days to search ahead (default: 30)
+
+        Returns:
+            Next available TimeSlot or None if no slots found
+
+        Raises:
+            ValueError: If service not found
+        """
+        if from_date is None:
+            from_date = date.today()
+
+        next_slot = await self.get_next_available_slot_for_professionals(
+            professional_ids=[professional_id],
+            service_id=service_id,
+            from_date=from_date,
+            max_days_ahead=max_days_ahead,
+        )
+
+        return next_slot[1] if next_slot else None
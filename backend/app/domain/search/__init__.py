@@ -0,0 +1,15 @@
+"""Search domain."""
+
+from .index import claim_search_salons, mark_search_salons, rebuild_search_documents
+from .nearby import NearbySalon, NearbySalonService
+from .service import SalonSearchHit, SalonSearchService
+
+__all__ = [
+    "NearbySalon",
+    "NearbySalonService",
+    "SalonSearchHit",
+    "SalonSearchService",
+    "claim_search_salons",
+    "mark_search_salons",
+    "rebuild_search_documents",
+]
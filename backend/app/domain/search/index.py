@@ -0,0 +1,262 @@
+"""Incremental maintenance of the salon search documents.
+
+Every flush that creates, deletes or changes a searchable column of a Salon,
+Service, Professional, Review or professional's User queues the affected
+salons in ``search_dirty_salons`` inside the same transaction. The
+``search.apply_search_index`` task claims queued salons and rebuilds only
+their documents, so search results lag writes by up to
+SEARCH_INDEX_INTERVAL_SECONDS.
+
+Writers that bypass the ORM (bulk UPDATE statements) must call
+``mark_search_salons`` themselves.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import chain
+
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.review import Review, ReviewStatus
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.search_document import SalonSearchDocument, SearchDirtySalon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Columns whose changes affect the search documents
+SALON_SEARCH_FIELDS = (
+    "name",
+    "description",
+    "address_city",
+    "address_state",
+    "address_neighborhood",
+    "is_active",
+)
+SERVICE_SEARCH_FIELDS = ("salon_id", "name", "category", "price", "is_active")
+PROFESSIONAL_SEARCH_FIELDS = ("salon_id", "user_id", "specialties", "is_active")
+REVIEW_SEARCH_FIELDS = ("salon_id", "rating", "status")
+
+
+def _insert_ignore(session: Session, table):
+    """INSERT ... ON CONFLICT DO NOTHING for the session's dialect."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(table)
+    return pg_insert(table)
+
+
+def _changed(obj, fields: Iterable[str]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _salon_ids(state) -> set[int]:
+    """Current and previous salon of a row (instance dict only, no lazy load)."""
+    salon_ids = set(state.attrs["salon_id"].history.deleted)
+    salon_ids.add(state.dict.get("salon_id"))
+    salon_ids.discard(None)
+    return salon_ids
+
+
+def mark_search_salons(session: Session, salon_ids: Iterable[int]) -> None:
+    """
+    Queue salons for a search document rebuild.
+
+    Args:
+        session: Sync session (use ``AsyncSession.run_sync`` from async code)
+        salon_ids: IDs of salons touched by a write
+    """
+    rows = [{"salon_id": salon_id} for salon_id in set(salon_ids)]
+    if not rows:
+        return
+
+    session.execute(_insert_ignore(session, SearchDirtySalon).values(rows).on_conflict_do_nothing())
+
+
+def mark_search_salons_for_users(session: Session, user_ids: Iterable[int]) -> None:
+    """
+    Queue the salons of professionals whose user changed.
+
+    Args:
+        session: Sync session
+        user_ids: IDs of users whose name changed
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+
+    source = select(Professional.salon_id).where(Professional.user_id.in_(user_ids)).distinct()
+    session.execute(
+        _insert_ignore(session, SearchDirtySalon)
+        .from_select(["salon_id"], source)
+        .on_conflict_do_nothing()
+    )
+
+
+def _queue_touched_salons(session: Session, flush_context) -> None:
+    """after_flush hook: queue the salons whose documents this flush touched."""
+    salon_ids: set[int] = set()
+    user_ids: set[int] = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Salon):
+            fields = SALON_SEARCH_FIELDS
+        elif isinstance(obj, Service):
+            fields = SERVICE_SEARCH_FIELDS
+        elif isinstance(obj, Professional):
+            fields = PROFESSIONAL_SEARCH_FIELDS
+        elif isinstance(obj, Review):
+            fields = REVIEW_SEARCH_FIELDS
+        elif isinstance(obj, User):
+            # New users are not professionals of any salon yet
+            if obj in session.dirty and _changed(obj, ("full_name",)):
+                user_ids.add(inspect(obj).identity[0])
+            continue
+        else:
+            continue
+
+        state = inspect(obj)
+        if obj in session.dirty and not _changed(obj, fields):
+            continue
+
+        if isinstance(obj, Salon):
+            salon_ids.add(state.identity[0] if state.identity else obj.id)
+        else:
+            salon_ids |= _salon_ids(state)
+
+    if salon_ids:
+        mark_search_salons(session, salon_ids)
+    if user_ids:
+        mark_search_salons_for_users(session, user_ids)
+
+
+event.listen(Session, "after_flush", _queue_touched_salons)
+
+
+def claim_search_salons(session: Session, batch_size: int) -> list[int]:
+    """
+    Take up to batch_size queued salons off the queue.
+
+    Rows locked by a concurrent worker are skipped. The claim is undone if
+    the caller's transaction rolls back.
+
+    Args:
+        session: Sync session
+        batch_size: Maximum number of salons to claim
+
+    Returns:
+        Claimed salon IDs
+    """
+    stmt = (
+        select(SearchDirtySalon.salon_id)
+        .order_by(SearchDirtySalon.marked_at)
+        .limit(batch_size)
+    )
+    if session.get_bind().dialect.name != "sqlite":
+        stmt = stmt.with_for_update(skip_locked=True)
+
+    salon_ids = list(session.execute(stmt).scalars().all())
+    if salon_ids:
+        session.execute(delete(SearchDirtySalon).where(SearchDirtySalon.salon_id.in_(salon_ids)))
+    return salon_ids
+
+
+def rebuild_search_documents(session: Session, salon_ids: Iterable[int]) -> None:
+    """
+    Recompute the search documents of the given salons.
+
+    The whole batch is read with one grouped query per source table.
+    Salons that no longer exist simply lose their document.
+
+    Args:
+        session: Sync session
+        salon_ids: IDs of salons to rebuild
+    """
+    salon_ids = set(salon_ids)
+    if not salon_ids:
+        return
+
+    salons = session.execute(
+        select(
+            Salon.id,
+            Salon.name,
+            Salon.description,
+            Salon.address_city,
+            Salon.address_state,
+            Salon.address_neighborhood,
+            Salon.is_active,
+        ).where(Salon.id.in_(salon_ids))
+    ).all()
+
+    services_by_salon = defaultdict(list)
+    for row in session.execute(
+        select(Service.salon_id, Service.name, Service.category, Service.price)
+        .where(Service.salon_id.in_(salon_ids), Service.is_active.is_(True))
+        .order_by(Service.salon_id, Service.name)
+    ):
+        services_by_salon[row.salon_id].append(row)
+
+    professionals_by_salon = defaultdict(list)
+    for row in session.execute(
+        select(Professional.salon_id, User.full_name, Professional.specialties)
+        .join(User, User.id == Professional.user_id)
+        .where(Professional.salon_id.in_(salon_ids), Professional.is_active.is_(True))
+        .order_by(Professional.salon_id, Professional.id)
+    ):
+        professionals_by_salon[row.salon_id].append(row)
+
+    # Same figures as ReviewRepository.get_rating_statistics (approved reviews)
+    ratings = {
+        row.salon_id: row
+        for row in session.execute(
+            select(
+                Review.salon_id,
+                func.count(Review.id).label("total_reviews"),
+                func.avg(Review.rating).label("average_rating"),
+            )
+            .where(Review.salon_id.in_(salon_ids), Review.status == ReviewStatus.APPROVED)
+            .group_by(Review.salon_id)
+        )
+    }
+
+    documents = []
+    for salon in salons:
+        services = services_by_salon[salon.id]
+        professionals = professionals_by_salon[salon.id]
+        categories = sorted({service.category.lower() for service in services if service.category})
+        prices = [service.price for service in services]
+        rating = ratings.get(salon.id)
+
+        documents.append({
+            "salon_id": salon.id,
+            "name": salon.name,
+            "description": salon.description,
+            "city": salon.address_city,
+            "state": salon.address_state,
+            "neighborhood": salon.address_neighborhood,
+            "is_active": salon.is_active,
+            "categories": categories,
+            "services_text": " ".join(
+                chain((service.name for service in services), categories)
+            ),
+            "professionals_text": " ".join(
+                chain.from_iterable(
+                    [professional.full_name, *(professional.specialties or [])]
+                    for professional in professionals
+                )
+            ),
+            "min_price": min(prices) if prices else None,
+            "max_price": max(prices) if prices else None,
+            "average_rating": float(rating.average_rating or 0) if rating else 0.0,
+            "review_count": rating.total_reviews if rating else 0,
+        })
+
+    session.execute(delete(SalonSearchDocument).where(SalonSearchDocument.salon_id.in_(salon_ids)))
+    if documents:
+        session.execute(insert(SalonSearchDocument), documents)
@@ -0,0 +1,237 @@
+"""Nearest-salon lookup without PostGIS.
+
+Salons are found by expanding rings around the origin. Each ring is one
+bounding-box range scan on the (latitude, longitude) index; the candidates
+are filtered and sorted by haversine distance in Python, and only those
+beyond the previous ring's radius are emitted. Rings double in size, so the
+closest salons are produced first and a caller that stops early never scans
+the outer rings.
+
+Bounding boxes do not wrap around the antimeridian.
+"""
+
+import math
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.db.models.salon import Salon
+from backend.app.db.repositories.professional import ProfessionalRepository
+from backend.app.domain.scheduling.services.slot_service import SlotService
+
+# Mean Earth radius (km)
+EARTH_RADIUS_KM = 6371.0088
+
+# Radius (km) of the first ring
+INITIAL_RING_KM = 1.0
+
+
+@dataclass
+class NearbySalon:
+    """A salon and its distance from the origin."""
+
+    salon_id: int
+    name: str
+    neighborhood: str
+    city: str
+    state: str
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in km."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> tuple[float, float, float, float]:
+    """
+    Smallest latitude/longitude box containing a circle.
+
+    Returns:
+        Tuple of (min_lat, max_lat, min_lon, max_lon)
+    """
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(latitude - d_lat, -90.0), min(latitude + d_lat, 90.0)
+
+    # The box spans every longitude once it reaches a pole
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return min_lat, max_lat, -180.0, 180.0
+
+    d_lon = math.degrees(radius_km / (EARTH_RADIUS_KM * math.cos(math.radians(latitude))))
+    return min_lat, max_lat, max(longitude - d_lon, -180.0), min(longitude + d_lon, 180.0)
+
+
+class NearbySalonService:
+    """Find active salons around a point, nearest first."""
+
+    def __init__(self, session: AsyncSession, slot_service: SlotService | None = None):
+        """
+        Initialize service with database session.
+
+        Args:
+            session: Async database session
+            slot_service: Slot service used for availability (default: new one)
+        """
+        self.session = session
+        self.slot_service = slot_service or SlotService(session)
+        self.professional_repo = ProfessionalRepository(session)
+
+    async def iter_rings(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+    ) -> AsyncIterator[list[NearbySalon]]:
+        """
+        Yield the salons of each ring, each list sorted by distance.
+
+        Args:
+            latitude: Origin latitude
+            longitude: Origin longitude
+            radius_km: Search radius
+
+        Yields:
+            Salons with inner_radius < distance <= ring radius
+        """
+        inner_km = -1.0
+        ring_km = min(INITIAL_RING_KM, radius_km)
+
+        while True:
+            min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, ring_km)
+            rows = await self.session.execute(
+                select(
+                    Salon.id,
+                    Salon.name,
+                    Salon.address_neighborhood,
+                    Salon.address_city,
+                    Salon.address_state,
+                    Salon.latitude,
+                    Salon.longitude,
+                ).where(
+                    Salon.latitude.between(min_lat, max_lat),
+                    Salon.longitude.between(min_lon, max_lon),
+                    Salon.is_active.is_(True),
+                )
+            )
+
+            ring = []
+            for row in rows:
+                distance = haversine_km(latitude, longitude, row.latitude, row.longitude)
+                if inner_km < distance <= ring_km:
+                    ring.append(NearbySalon(
+                        salon_id=row.id,
+                        name=row.name,
+                        neighborhood=row.address_neighborhood,
+                        city=row.address_city,
+                        state=row.address_state,
+                        latitude=row.latitude,
+                        longitude=row.longitude,
+                        distance_km=distance,
+                    ))
+
+            ring.sort(key=lambda salon: (salon.distance_km, salon.salon_id))
+            if ring:
+                yield ring
+
+            if ring_km >= radius_km:
+                return
+            inner_km, ring_km = ring_km, min(ring_km * 2, radius_km)
+
+    async def iter_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+    ) -> AsyncIterator[NearbySalon]:
+        """
+        Stream active salons within radius_km, nearest first.
+
+        Args:
+            latitude: Origin latitude
+            longitude: Origin longitude
+            radius_km: Search radius
+
+        Yields:
+            Salons in ascending distance
+        """
+        async for ring in self.iter_rings(latitude, longitude, radius_km):
+            for salon in ring:
+                yield salon
+
+    async def find_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int,
+        available_after: datetime | None = None,
+        duration_minutes: int = 30,
+    ) -> list[NearbySalon]:
+        """
+        List the nearest salons, optionally only those still bookable today.
+
+        Availability is checked one ring at a time through the slot engine's
+        cached free intervals, and the search stops as soon as limit salons
+        were found.
+
+        Args:
+            latitude: Origin latitude
+            longitude: Origin longitude
+            radius_km: Search radius
+            limit: Maximum number of salons
+            available_after: Only salons with a professional free from this
+                time on, later the same day
+            duration_minutes: Minimum free stretch for available_after
+
+        Returns:
+            Up to limit salons in ascending distance
+        """
+        found: list[NearbySalon] = []
+
+        async for ring in self.iter_rings(latitude, longitude, radius_km):
+            if available_after is not None:
+                ring = await self._filter_available(ring, available_after, duration_minutes)
+
+            found.extend(ring[:limit - len(found)])
+            if len(found) >= limit:
+                break
+
+        return found
+
+    async def _filter_available(
+        self,
+        salons: list[NearbySalon],
+        after: datetime,
+        duration_minutes: int,
+    ) -> list[NearbySalon]:
+        """Keep the salons with a professional free after the given time."""
+        professionals_by_salon = await self.professional_repo.list_active_ids_by_salon_ids(
+            [salon.salon_id for salon in salons]
+        )
+        free = await self.slot_service.list_professionals_free_after(
+            professional_ids=sorted(
+                professional_id
+                for professional_ids in professionals_by_salon.values()
+                for professional_id in professional_ids
+            ),
+            after=after,
+            duration_minutes=duration_minutes,
+        )
+
+        return [
+            salon for salon in salons
+            if any(
+                professional_id in free
+                for professional_id in professionals_by_salon.get(salon.salon_id, [])
+            )
+        ]
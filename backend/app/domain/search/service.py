@@ -0,0 +1,130 @@
+"""Ranked salon discovery over the search documents."""
+
+from dataclasses import dataclass
+
+from sqlalchemy import Float, String, and_, cast, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.db.models.search_document import SalonSearchDocument
+
+# Text search configuration of the generated search_vector column
+SEARCH_CONFIG = literal_column("'portuguese'::regconfig")
+
+# Generated by the migration and not mapped on the model
+search_vector = literal_column("salon_search_documents.search_vector", TSVECTOR)
+
+
+@dataclass
+class SalonSearchHit:
+    """A matching salon document and its relevance."""
+
+    document: SalonSearchDocument
+    rank: float
+
+
+class SalonSearchService:
+    """Search salons by text, category, price range, rating and location."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize service with database session.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def search(
+        self,
+        query: str | None = None,
+        category: str | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        min_rating: float | None = None,
+        city: str | None = None,
+        state: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[SalonSearchHit], int]:
+        """
+        Search active salons, best matches first.
+
+        On PostgreSQL the text query is matched against the weighted
+        search_vector (GIN) and, for typos, the salon name by trigram
+        similarity. Other databases fall back to substring matching.
+
+        Args:
+            query: Free text (web search syntax on PostgreSQL)
+            category: Category of at least one active service
+            min_price: Salons with an active service at or above this price
+            max_price: Salons with an active service at or below this price
+            min_rating: Minimum average rating of approved reviews
+            city: City (exact, case-insensitive)
+            state: State code
+            limit: Page size
+            offset: Number of hits to skip
+
+        Returns:
+            Tuple of (hits, total number of hits)
+        """
+        conditions = [SalonSearchDocument.is_active.is_(True)]
+
+        if category:
+            category = category.lower()
+            if self._is_postgres():
+                conditions.append(SalonSearchDocument.categories.contains([category]))
+            else:
+                conditions.append(cast(SalonSearchDocument.categories, String).like(f'%"{category}"%'))
+        if min_price is not None:
+            conditions.append(SalonSearchDocument.max_price >= min_price)
+        if max_price is not None:
+            conditions.append(SalonSearchDocument.min_price <= max_price)
+        if min_rating is not None:
+            conditions.append(SalonSearchDocument.average_rating >= min_rating)
+        if city:
+            conditions.append(func.lower(SalonSearchDocument.city) == city.lower())
+        if state:
+            conditions.append(SalonSearchDocument.state == state.upper())
+
+        rank = cast(0, Float)
+        query = (query or "").strip()
+        if query and self._is_postgres():
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+            conditions.append(or_(
+                search_vector.op("@@")(ts_query),
+                SalonSearchDocument.name.op("%")(query),
+            ))
+            rank = func.ts_rank_cd(search_vector, ts_query) + func.similarity(
+                SalonSearchDocument.name, query
+            )
+        elif query:
+            text = (
+                SalonSearchDocument.name + " " + SalonSearchDocument.services_text + " "
+                + SalonSearchDocument.professionals_text + " "
+                + func.coalesce(SalonSearchDocument.description, "")
+            )
+            conditions.extend(text.ilike(f"%{term}%") for term in query.split())
+
+        where = and_(*conditions)
+        total = await self.session.scalar(
+            select(func.count()).select_from(SalonSearchDocument).where(where)
+        )
+
+        stmt = (
+            select(SalonSearchDocument, rank.label("rank"))
+            .where(where)
+            .order_by(
+                rank.desc(),
+                SalonSearchDocument.average_rating.desc(),
+                SalonSearchDocument.salon_id,
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await self.session.execute(stmt)).all()
+
+        return [SalonSearchHit(document=row[0], rank=float(row.rank or 0)) for row in rows], total or 0
@@ -1,5 +1,6 @@
 """Background jobs package."""
 
+from backend.app.jobs.booking_reminders import BookingReminderJob
 from backend.app.jobs.no_show_detection import NoShowDetectionJob
 
-__all__ = ["NoShowDetectionJob"]
+__all__ = ["BookingReminderJob", "NoShowDetectionJob"]
@@ -0,0 +1,112 @@
+"""
+Booking reminder background job.
+
+Advances the reminder time wheel once per tick: every reminder whose
+firing time has passed is rendered and queued for the notification
+dispatcher (see ``services/reminder_scheduler.py``).
+
+Run a reminder process with::
+
+    python -m backend.app.jobs.booking_reminders
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.db.session import get_db
+from backend.app.services.reminder_scheduler import ReminderScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class BookingReminderJob:
+    """Background job firing due booking reminders."""
+
+    def __init__(self, batch_size: int = 500):
+        """
+        Initialize the booking reminder job.
+
+        Args:
+            batch_size: Reminders fired per transaction
+        """
+        self.batch_size = batch_size
+
+    async def run(self, db_session: Optional[AsyncSession] = None) -> Dict:
+        """
+        Fire every reminder due at the start of the run.
+
+        Args:
+            db_session: Optional database session (for testing)
+
+        Returns:
+            Dict with job execution results and statistics
+        """
+        start_time = datetime.now(timezone.utc)
+
+        # Use provided session or get new one
+        if db_session:
+            session = db_session
+            should_close = False
+        else:
+            session = await get_db().__anext__()
+            should_close = True
+
+        try:
+            scheduler = ReminderScheduler(session)
+            stats = {"batches": 0, "claimed": 0, "stale": 0, "queued": 0}
+
+            while True:
+                batch = await scheduler.fire_due(now=start_time, limit=self.batch_size)
+                stats["batches"] += 1
+                for key in ("claimed", "stale", "queued"):
+                    stats[key] += batch[key]
+
+                if batch["claimed"] < self.batch_size:
+                    break
+
+            if stats["claimed"]:
+                logger.info(
+                    f"Fired {stats['claimed']} booking reminders: "
+                    f"{stats['queued']} notifications queued, {stats['stale']} stale"
+                )
+            return stats
+
+        except Exception as e:
+            await session.rollback()
+            error_msg = f"Booking reminder job failed: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        finally:
+            if should_close:
+                await session.close()
+
+
+async def run_forever(job: BookingReminderJob, tick_seconds: float) -> None:
+    """Run the job once per tick until cancelled."""
+    while True:
+        try:
+            await job.run()
+        except RuntimeError:
+            # Already logged; the next tick retries
+            pass
+        await asyncio.sleep(tick_seconds)
+
+
+def main() -> None:
+    """Run one reminder process until interrupted."""
+    logging.basicConfig(level=logging.INFO)
+    job = BookingReminderJob(batch_size=settings.BOOKING_REMINDER_BATCH_SIZE)
+    try:
+        asyncio.run(run_forever(job, settings.BOOKING_REMINDER_TICK_SECONDS))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,11 @@ No-show detection background job.
 
 This module provides automated no-show detection and processing
 for bookings that have passed their scheduled time.
+
+``NoShowDetectionJob.run`` evaluates and marks bookings one at a time.
+``NoShowDetectionJob.run_batch`` marks eligible bookings with one set-based
+UPDATE per batch and fans notifications out afterwards, committing a
+checkpoint with every batch and chunk so that a crashed run is resumed.
 """
 
 import logging
@@ -11,6 +16,7 @@ from typing import Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.db.models.job_checkpoint import JobCheckpoint
 from backend.app.db.session import get_db
 from backend.app.db.repositories.booking import BookingRepository
 from backend.app.db.repositories.user import UserRepository
@@ -19,18 +25,34 @@ from backend.app.services.booking_notifications import BookingNotificationServic
 
 logger = logging.getLogger(__name__)
 
+CHECKPOINT_JOB_NAME = "no_show_detection"
+
+# Checkpoint phases of a batch run
+PHASE_MARKING = "marking"
+PHASE_NOTIFYING = "notifying"
+PHASE_COMPLETED = "completed"
+
 
 class NoShowDetectionJob:
     """Background job for automated no-show detection."""
 
-    def __init__(self, detection_window_hours: int = 2):
+    def __init__(
+        self,
+        detection_window_hours: int = 2,
+        batch_size: int = 500,
+        notification_chunk_size: int = 100,
+    ):
         """
         Initialize no-show detection job.
 
         Args:
             detection_window_hours: How many hours after scheduled time to check for no-shows
+            batch_size: Bookings marked per transaction in batch mode
+            notification_chunk_size: Notifications sent per checkpoint in batch mode
         """
         self.detection_window_hours = detection_window_hours
+        self.batch_size = batch_size
+        self.notification_chunk_size = notification_chunk_size
 
     async def run(self, db_session: Optional[AsyncSession] = None) -> Dict:
         """
@@ -163,6 +185,148 @@ class NoShowDetectionJob:
             if should_close:
                 await session.close()
 
+    async def run_batch(self, db_session: Optional[AsyncSession] = None) -> Dict:
+        """
+        Execute the no-show detection job in batch mode.
+
+        This method:
+        1. Resumes the previous run if it did not complete
+        2. Marks eligible bookings in set-based batches, one short
+           transaction per batch
+        3. Sends notifications for the marked bookings in chunks
+        4. Returns summary of actions taken
+
+        A resumed run keeps its original reference time. Notifications are
+        sent at least once: a crash inside a chunk resends that chunk.
+
+        Args:
+            db_session: Optional database session (for testing)
+
+        Returns:
+            Dict with job execution results and statistics
+        """
+        start_time = datetime.utcnow()
+
+        # Use provided session or get new one
+        if db_session:
+            session = db_session
+            should_close = False
+        else:
+            session = await get_db().__anext__()
+            should_close = True
+
+        try:
+            checkpoint = await session.get(JobCheckpoint, CHECKPOINT_JOB_NAME)
+            resumed = checkpoint is not None and checkpoint.phase != PHASE_COMPLETED
+
+            if resumed:
+                logger.info(
+                    f"Resuming no-show detection run of {checkpoint.run_started_at} "
+                    f"({checkpoint.phase}, cursor {checkpoint.cursor})"
+                )
+            else:
+                if checkpoint is None:
+                    checkpoint = JobCheckpoint(job_name=CHECKPOINT_JOB_NAME)
+                    session.add(checkpoint)
+                checkpoint.phase = PHASE_MARKING
+                checkpoint.run_started_at = start_time
+                checkpoint.cursor = 0
+                await session.commit()
+                logger.info(f"Starting batch no-show detection job at {start_time}")
+
+            run_time = checkpoint.run_started_at
+
+            booking_repo = BookingRepository(session)
+            user_repo = UserRepository(session)
+            no_show_service = NoShowService(booking_repo, user_repo)
+            notification_service = BookingNotificationService(session)
+
+            stats = {
+                "job_start_time": start_time,
+                "run_started_at": run_time,
+                "resumed": resumed,
+                "batches": 0,
+                # The UPDATE evaluates and marks in one step
+                "bookings_evaluated": 0,
+                "no_shows_detected": 0,
+                "notifications_sent": 0,
+                "errors": [],
+                "processing_time_seconds": 0,
+            }
+
+            while checkpoint.phase == PHASE_MARKING:
+                marked = await no_show_service.mark_no_shows_batch(
+                    current_time=run_time,
+                    detection_window_hours=self.detection_window_hours,
+                    after_id=checkpoint.cursor,
+                    limit=self.batch_size,
+                )
+
+                stats["batches"] += 1
+                stats["bookings_evaluated"] += len(marked)
+                stats["no_shows_detected"] += len(marked)
+
+                if len(marked) < self.batch_size:
+                    checkpoint.phase = PHASE_NOTIFYING
+                    checkpoint.cursor = 0
+                else:
+                    checkpoint.cursor = max(item["booking_id"] for item in marked)
+                await session.commit()
+
+            while checkpoint.phase == PHASE_NOTIFYING:
+                chunk = await booking_repo.find_system_no_shows(
+                    marked_at=run_time,
+                    after_id=checkpoint.cursor,
+                    limit=self.notification_chunk_size,
+                )
+
+                for booking in chunk:
+                    try:
+                        await notification_service.notify_no_show_detected(
+                            booking_id=booking.id,
+                            no_show_reason=booking.no_show_reason,
+                            fee_charged=float(booking.no_show_fee_amount or 0),
+                            correlation_id=f"auto_no_show_{booking.id}_{run_time.isoformat()}"
+                        )
+                        stats["notifications_sent"] += 1
+
+                    except Exception as e:
+                        error_msg = f"Failed to send no-show notification for booking {booking.id}: {str(e)}"
+                        logger.error(error_msg)
+                        stats["errors"].append(error_msg)
+
+                if len(chunk) < self.notification_chunk_size:
+                    checkpoint.phase = PHASE_COMPLETED
+                else:
+                    checkpoint.cursor = chunk[-1].id
+                await session.commit()
+
+            # Calculate processing time
+            end_time = datetime.utcnow()
+            stats["processing_time_seconds"] = (end_time - start_time).total_seconds()
+            stats["job_end_time"] = end_time
+
+            logger.info(
+                f"Batch no-show detection job completed. "
+                f"Batches: {stats['batches']}, "
+                f"Detected: {stats['no_shows_detected']}, "
+                f"Notified: {stats['notifications_sent']}, "
+                f"Errors: {len(stats['errors'])}, "
+                f"Time: {stats['processing_time_seconds']:.2f}s"
+            )
+
+            return stats
+
+        except Exception as e:
+            await session.rollback()
+            error_msg = f"No-show detection job failed: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        finally:
+            if should_close:
+                await session.close()
+
     async def _find_eligible_bookings(
         self,
         booking_repo: BookingRepository,
@@ -339,7 +503,7 @@ class NoShowDetectionScheduler:
         # This would integrate with your chosen scheduler (Celery, APScheduler, etc.)
         # For now, this is just a placeholder
         job = NoShowDetectionJob(detection_window_hours=1)
-        return await job.run()
+        return await job.run_batch()
 
     @staticmethod
     async def schedule_daily_cleanup():
@@ -14,6 +14,8 @@ from backend.app.core.metrics import (
 from backend.app.core.rate_limit import limiter
 from backend.app.core.tracing import setup_tracing
 from backend.app.middleware.audit import AuditMiddleware
+from backend.app.middleware.audit_sink import audit_sink
+from backend.app.services.overbooking_index import overbooking_config_index
 from backend.app.api.v1 import api_router
 
 
@@ -21,7 +23,10 @@ from backend.app.api.v1 import api_router
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     setup_logging()
+    audit_sink.start()
     yield
+    await audit_sink.stop()
+    await overbooking_config_index.close()
 
 
 app = FastAPI(
@@ -1,5 +1,6 @@
 """Middleware package."""
 
 from backend.app.middleware.audit import AuditMiddleware, AuditEventLogger
+from backend.app.middleware.audit_sink import AuditSink, audit_sink
 
-__all__ = ["AuditMiddleware", "AuditEventLogger"]
+__all__ = ["AuditMiddleware", "AuditEventLogger", "AuditSink", "audit_sink"]
@@ -9,22 +9,23 @@ import json
 import logging
 import time
 import uuid
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Dict, Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, QueryParams
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from backend.app.core.metrics import route_template
 from backend.app.db.models.audit_event import AuditEventType, AuditEventSeverity
-from backend.app.db.repositories.audit_event import AuditEventRepository
-from backend.app.db.session import get_db
+from backend.app.middleware.audit_sink import audit_sink, build_audit_row
 
 
 logger = logging.getLogger(__name__)
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
+class AuditMiddleware:
     """
-    Middleware for automatic audit logging of API requests.
+    ASGI middleware for automatic audit logging of API requests.
 
     This middleware captures:
     - All HTTP requests and responses
@@ -32,11 +33,15 @@ class AuditMiddleware(BaseHTTPMiddleware):
     - Request/response timing
     - Error conditions
     - Resource access patterns
+
+    Messages are passed through untouched, so streaming responses keep
+    streaming; bodies are only buffered (up to max_body_size) when body
+    logging is enabled.
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         excluded_paths: Optional[list] = None,
         log_request_body: bool = False,
         log_response_body: bool = False,
@@ -46,13 +51,13 @@ class AuditMiddleware(BaseHTTPMiddleware):
         Initialize audit middleware.
 
         Args:
-            app: FastAPI application instance
+            app: Wrapped ASGI application
             excluded_paths: List of paths to exclude from auditing
             log_request_body: Whether to log request bodies
             log_response_body: Whether to log response bodies
             max_body_size: Maximum body size to log (in bytes)
         """
-        super().__init__(app)
+        self.app = app
         self.excluded_paths = excluded_paths or [
             "/docs",
             "/redoc",
@@ -64,70 +69,60 @@ class AuditMiddleware(BaseHTTPMiddleware):
         self.log_response_body = log_response_body
         self.max_body_size = max_body_size
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and create audit event.
 
         Args:
-            request: HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        # Skip non-HTTP connections and excluded paths
+        if scope["type"] != "http" or self._should_exclude_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
         request_id = str(uuid.uuid4())
 
-        # Skip excluded paths
-        if self._should_exclude_path(request.url.path):
-            return await call_next(request)
-
         # Record start time
         start_time = time.time()
 
-        # Extract request information
-        request_info = await self._extract_request_info(request, request_id)
+        request_body = _BodyCapture(self.max_body_size) if self.log_request_body else None
+        response_body = _BodyCapture(self.max_body_size) if self.log_response_body else None
+        response_start: Dict[str, Any] = {"status": None, "headers": []}
 
-        # Initialize response info
-        response_info = {
-            "status_code": None,
-            "headers": {},
-            "body": None,
-            "error": None,
-        }
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if request_body is not None and message["type"] == "http.request":
+                request_body.add(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_start["status"] = message["status"]
+                response_start["headers"] = message.get("headers", [])
+            elif response_body is not None and message["type"] == "http.response.body":
+                response_body.add(message.get("body", b""))
+            await send(message)
 
         try:
             # Process request
-            response = await call_next(request)
-
-            # Extract response information
-            response_info = await self._extract_response_info(response)
-
-            # Calculate processing time
-            processing_time = time.time() - start_time
-
-            # Create audit event
-            await self._create_audit_event(
-                request_info=request_info,
-                response_info=response_info,
-                processing_time=processing_time,
-                success=True,
+            await self.app(
+                scope,
+                receive_wrapper if request_body is not None else receive,
+                send_wrapper,
             )
 
-            return response
-
         except Exception as e:
             # Calculate processing time for failed requests
             processing_time = time.time() - start_time
 
-            # Update response info with error
-            response_info["error"] = str(e)
-            response_info["status_code"] = 500
-
             # Create audit event for error
             await self._create_audit_event(
-                request_info=request_info,
-                response_info=response_info,
+                request_info=self._extract_request_info(scope, request_id, request_body),
+                response_info={"status_code": 500, "body": None, "error": str(e)},
                 processing_time=processing_time,
                 success=False,
                 error_message=str(e),
@@ -136,53 +131,63 @@ class AuditMiddleware(BaseHTTPMiddleware):
             # Re-raise the exception
             raise
 
+        # Calculate processing time
+        processing_time = time.time() - start_time
+
+        # Create audit event
+        await self._create_audit_event(
+            request_info=self._extract_request_info(scope, request_id, request_body),
+            response_info=self._extract_response_info(
+                response_start["status"], response_start["headers"], response_body
+            ),
+            processing_time=processing_time,
+            success=True,
+        )
+
     def _should_exclude_path(self, path: str) -> bool:
         """Check if path should be excluded from auditing."""
         return any(path.startswith(excluded) for excluded in self.excluded_paths)
 
-    async def _extract_request_info(self, request: Request, request_id: str) -> Dict[str, Any]:
+    def _extract_request_info(
+        self,
+        scope: Scope,
+        request_id: str,
+        body: Optional["_BodyCapture"] = None,
+    ) -> Dict[str, Any]:
         """
         Extract relevant information from the request.
 
         Args:
-            request: HTTP request
+            scope: ASGI connection scope (after routing)
             request_id: Unique request identifier
+            body: Captured request body, if body logging is enabled
 
         Returns:
             Dictionary with request information
         """
+        request = Request(scope)
+        headers = request.headers
+
         # Get user information if available
         user_info = self._get_user_info(request)
 
         # Extract client information
         client_host = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent", "")
+        user_agent = headers.get("user-agent", "")
 
-        # Extract request body if enabled and within size limits
+        # Decode request body if enabled and within size limits
         request_body = None
-        if self.log_request_body:
-            try:
-                body_bytes = await request.body()
-                if len(body_bytes) <= self.max_body_size:
-                    if body_bytes:
-                        content_type = request.headers.get("content-type", "")
-                        if "application/json" in content_type:
-                            try:
-                                request_body = json.loads(body_bytes.decode())
-                            except (json.JSONDecodeError, UnicodeDecodeError):
-                                request_body = {"raw": body_bytes.decode("utf-8", errors="ignore")}
-                        else:
-                            request_body = {"content_type": content_type, "size": len(body_bytes)}
-            except Exception as e:
-                logger.warning(f"Failed to extract request body: {e}")
+        if body is not None and body.complete:
+            request_body = body.decode(headers.get("content-type", ""))
+
+        query_string = scope.get("query_string", b"")
 
         return {
             "request_id": request_id,
-            "method": request.method,
-            "url": str(request.url),
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "headers": dict(request.headers),
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route_template(scope),
+            "query_params": dict(QueryParams(query_string)) if query_string else {},
             "client_host": client_host,
             "user_agent": user_agent,
             "body": request_body,
@@ -191,36 +196,31 @@ class AuditMiddleware(BaseHTTPMiddleware):
             "session_id": user_info.get("session_id"),
         }
 
-    async def _extract_response_info(self, response: Response) -> Dict[str, Any]:
+    def _extract_response_info(
+        self,
+        status_code: Optional[int],
+        raw_headers: list,
+        body: Optional["_BodyCapture"] = None,
+    ) -> Dict[str, Any]:
         """
         Extract relevant information from the response.
 
         Args:
-            response: HTTP response
+            status_code: Response status code
+            raw_headers: Raw ASGI response headers
+            body: Captured response body, if body logging is enabled
 
         Returns:
             Dictionary with response information
         """
         response_info = {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
+            "status_code": status_code,
             "body": None,
         }
 
-        # Extract response body if enabled
-        if self.log_response_body and hasattr(response, 'body'):
-            try:
-                if len(response.body) <= self.max_body_size:
-                    content_type = response.headers.get("content-type", "")
-                    if "application/json" in content_type:
-                        try:
-                            response_info["body"] = json.loads(response.body.decode())
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            response_info["body"] = {"raw": response.body.decode("utf-8", errors="ignore")}
-                    else:
-                        response_info["body"] = {"content_type": content_type, "size": len(response.body)}
-            except Exception as e:
-                logger.warning(f"Failed to extract response body: {e}")
+        if body is not None and body.complete:
+            content_type = Headers(raw=raw_headers).get("content-type", "")
+            response_info["body"] = body.decode(content_type)
 
         return response_info
 
@@ -249,10 +249,11 @@ class AuditMiddleware(BaseHTTPMiddleware):
                     user_info["user_role"] = getattr(user, "role", None)
 
             # Try to get session ID from various sources
+            authorization = request.headers.get("authorization", "")
             session_id = (
                 request.headers.get("x-session-id") or
                 request.cookies.get("session_id") or
-                request.headers.get("authorization", "").split(" ")[-1] if "Bearer" in request.headers.get("authorization", "") else None
+                authorization.split(" ")[-1] if "Bearer" in authorization else None
             )
             user_info["session_id"] = session_id
 
@@ -270,7 +271,10 @@ class AuditMiddleware(BaseHTTPMiddleware):
         error_message: Optional[str] = None,
     ) -> None:
         """
-        Create an audit event for the request/response.
+        Queue an audit event for the request/response.
+
+        The event is written in a batch by the audit sink; when the sink is
+        saturated the event is dropped rather than delaying the response.
 
         Args:
             request_info: Information about the request
@@ -280,61 +284,54 @@ class AuditMiddleware(BaseHTTPMiddleware):
             error_message: Error message if request failed
         """
         try:
-            # Get database session
-            async for session in get_db():
-                audit_repo = AuditEventRepository(session)
-
-                # Determine event type based on endpoint and method
-                event_type = self._determine_event_type(
-                    request_info["path"],
-                    request_info["method"],
-                    response_info["status_code"]
-                )
-
-                # Determine severity
-                severity = self._determine_severity(
-                    response_info["status_code"],
-                    success,
-                    processing_time
-                )
-
-                # Create metadata
-                metadata = {
-                    "processing_time_ms": round(processing_time * 1000, 2),
-                    "request_size": len(str(request_info.get("body", ""))) if request_info.get("body") else 0,
-                    "response_size": len(str(response_info.get("body", ""))) if response_info.get("body") else 0,
-                    "query_params": request_info.get("query_params", {}),
-                }
-
-                # Extract resource information
-                resource_type, resource_id = self._extract_resource_info(
-                    request_info["path"],
-                    request_info["method"]
-                )
-
-                # Create audit event
-                await audit_repo.create(
-                    event_type=event_type,
-                    action=f"{request_info['method']} {request_info['path']}",
-                    user_id=request_info.get("user_id"),
-                    session_id=request_info.get("session_id"),
-                    user_role=request_info.get("user_role"),
-                    ip_address=request_info.get("client_host"),
-                    user_agent=request_info.get("user_agent"),
-                    request_id=request_info.get("request_id"),
-                    endpoint=request_info["path"],
-                    http_method=request_info["method"],
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    description=self._generate_description(request_info, response_info, success),
-                    metadata=metadata,
-                    severity=severity,
-                    success="success" if success else "failure",
-                    error_message=error_message,
-                )
-
-                await session.commit()
-                break
+            # Determine event type based on endpoint and method
+            event_type = self._determine_event_type(
+                request_info["path"],
+                request_info["method"],
+                response_info["status_code"]
+            )
+
+            # Determine severity
+            severity = self._determine_severity(
+                response_info["status_code"],
+                success,
+                processing_time
+            )
+
+            # Create metadata
+            metadata = {
+                "processing_time_ms": round(processing_time * 1000, 2),
+                "request_size": len(str(request_info.get("body", ""))) if request_info.get("body") else 0,
+                "response_size": len(str(response_info.get("body", ""))) if response_info.get("body") else 0,
+                "query_params": request_info.get("query_params", {}),
+            }
+
+            # Extract resource information
+            resource_type, resource_id = self._extract_resource_info(
+                request_info["path"],
+                request_info["method"]
+            )
+
+            # Queue audit event
+            await audit_sink.put(build_audit_row(
+                event_type=event_type,
+                action=f"{request_info['method']} {request_info['route']}",
+                user_id=request_info.get("user_id"),
+                session_id=request_info.get("session_id"),
+                user_role=request_info.get("user_role"),
+                ip_address=request_info.get("client_host"),
+                user_agent=request_info.get("user_agent"),
+                request_id=request_info.get("request_id"),
+                endpoint=request_info["path"],
+                http_method=request_info["method"],
+                resource_type=resource_type,
+                resource_id=resource_id,
+                description=self._generate_description(request_info, response_info, success),
+                metadata=metadata,
+                severity=severity,
+                success="success" if success else "failure",
+                error_message=error_message,
+            ))
 
         except Exception as e:
             logger.error(f"Failed to create audit event: {e}")
@@ -426,6 +423,40 @@ class AuditMiddleware(BaseHTTPMiddleware):
             return f"Failed {method} request to {path} (HTTP {status_code})"
 
 
+class _BodyCapture:
+    """Copy of a message body, abandoned once it exceeds max_size."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.chunks: list[bytes] = []
+        self.size = 0
+        self.complete = True
+
+    def add(self, chunk: bytes) -> None:
+        if not self.complete or not chunk:
+            return
+
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            self.complete = False
+            self.chunks = []
+        else:
+            self.chunks.append(chunk)
+
+    def decode(self, content_type: str) -> Optional[Dict[str, Any]]:
+        """Body as JSON, raw text or a size summary (None when empty)."""
+        if not self.size:
+            return None
+
+        body = b"".join(self.chunks)
+        if "application/json" in content_type:
+            try:
+                return json.loads(body.decode())
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return {"raw": body.decode("utf-8", errors="ignore")}
+        return {"content_type": content_type, "size": self.size}
+
+
 class AuditEventLogger:
     """Helper class for manual audit event creation."""
 
@@ -460,27 +491,21 @@ class AuditEventLogger:
             ip_address: User's IP address
         """
         try:
-            async for session in get_db():
-                audit_repo = AuditEventRepository(session)
-
-                await audit_repo.create(
-                    event_type=AuditEventType.USER_UPDATED,  # Generic user action
-                    action=action,
-                    user_id=user_id,
-                    session_id=session_id,
-                    ip_address=ip_address,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    description=description or f"User performed action: {action}",
-                    old_values=old_values,
-                    new_values=new_values,
-                    metadata=metadata,
-                    severity=severity,
-                    success="success",
-                )
-
-                await session.commit()
-                break
+            await audit_sink.put(build_audit_row(
+                event_type=AuditEventType.USER_UPDATED,  # Generic user action
+                action=action,
+                user_id=user_id,
+                session_id=session_id,
+                ip_address=ip_address,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                description=description or f"User performed action: {action}",
+                old_values=old_values,
+                new_values=new_values,
+                metadata=metadata,
+                severity=severity,
+                success="success",
+            ), wait=True)
 
         except Exception as e:
             logger.error(f"Failed to log user action: {e}")
@@ -506,21 +531,15 @@ class AuditEventLogger:
             error_message: Error message if applicable
         """
         try:
-            async for session in get_db():
-                audit_repo = AuditEventRepository(session)
-
-                await audit_repo.create(
-                    event_type=event_type,
-                    action=event_type.value,
-                    description=description,
-                    metadata=metadata,
-                    severity=severity,
-                    success="success" if success else "failure",
-                    error_message=error_message,
-                )
-
-                await session.commit()
-                break
+            await audit_sink.put(build_audit_row(
+                event_type=event_type,
+                action=event_type.value,
+                description=description,
+                metadata=metadata,
+                severity=severity,
+                success="success" if success else "failure",
+                error_message=error_message,
+            ), wait=True)
 
         except Exception as e:
             logger.error(f"Failed to log system event: {e}")
@@ -0,0 +1,236 @@
+"""
+Batched, asynchronous persistence of audit events.
+
+Producers (AuditMiddleware and AuditEventLogger) put fully built rows on a
+bounded in-memory queue and return immediately. A background task drains the
+queue and writes each batch with one multi-row INSERT in its own transaction,
+so audit logging no longer adds a transaction to every request.
+
+When the queue is full, request audit events are dropped at once and explicit
+audit calls wait up to AUDIT_SINK_PUT_TIMEOUT_SECONDS for room; every lost
+event is counted in ``audit_events_dropped_total``. Events still queued at
+shutdown are flushed by ``stop``.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.metrics import (
+    audit_events_dropped_total,
+    audit_events_written_total,
+    audit_sink_flush_duration_seconds,
+    audit_sink_queue_depth,
+)
+from backend.app.db.models.audit_event import AuditEvent, AuditEventSeverity, AuditEventType
+from backend.app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def build_audit_row(
+    event_type: AuditEventType,
+    action: str,
+    metadata: Optional[Dict] = None,
+    severity: AuditEventSeverity = AuditEventSeverity.LOW,
+    **fields: Any,
+) -> Dict[str, Any]:
+    """
+    Build an audit_events row with every column set.
+
+    The event time is taken here, not when the batch is written. Accepts the
+    same keyword arguments as AuditEventRepository.create.
+
+    Returns:
+        Column values for a multi-row INSERT
+    """
+    row = {
+        column.name: None
+        for column in AuditEvent.__table__.columns
+        if column.name != "id"
+    }
+    row.update(fields)
+    row.update(
+        event_type=getattr(event_type, "value", event_type),
+        action=action,
+        event_metadata=metadata,
+        severity=getattr(severity, "value", severity),
+        timestamp=fields.get("timestamp") or datetime.utcnow(),
+    )
+    return row
+
+
+class AuditSink:
+    """Bounded queue of audit rows flushed in batches by a background task."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        put_timeout_seconds: float = 0.5,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            session_factory: Factory of async sessions used for batch writes
+            max_queue_size: Maximum number of events waiting to be written
+            batch_size: Maximum number of events per INSERT
+            flush_interval_seconds: Maximum time an event waits for a batch
+                to fill up
+            put_timeout_seconds: How long ``put(wait=True)`` waits for room
+        """
+        self.session_factory = session_factory
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.put_timeout_seconds = put_timeout_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the flush task is running on the current event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self._loop is loop and self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the flush task on the running event loop."""
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = self._loop.create_task(self._run(), name="audit-sink")
+        logger.info("Audit sink started")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Flush the queued events and stop the flush task.
+
+        Args:
+            timeout: Maximum seconds to wait for the final flush
+        """
+        if not self.running:
+            return
+
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(self._worker, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Audit sink did not drain within {timeout}s, dropping queued events")
+            audit_events_dropped_total.labels(reason="shutdown").inc(self._queue.qsize())
+            self._worker.cancel()
+
+        self._worker = None
+        audit_sink_queue_depth.set(0)
+        logger.info("Audit sink stopped")
+
+    async def put(self, row: Dict[str, Any], wait: bool = False) -> bool:
+        """
+        Queue an audit row for writing.
+
+        Args:
+            row: Row built with build_audit_row
+            wait: Wait up to put_timeout_seconds for room when the queue is
+                full, instead of dropping the event at once
+
+        Returns:
+            Whether the event was queued
+        """
+        if not self.running:
+            self.start()
+
+        try:
+            if wait:
+                await asyncio.wait_for(self._queue.put(row), self.put_timeout_seconds)
+            else:
+                self._queue.put_nowait(row)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            audit_events_dropped_total.labels(reason="queue_full").inc()
+            logger.warning("Audit sink queue is full, dropping event")
+            return False
+
+        audit_sink_queue_depth.set(self._queue.qsize())
+        return True
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and write them until stopped."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            first = await self._queue.get()
+            batch: List[Dict[str, Any]] = [] if first is _STOP else [first]
+            stopping = first is _STOP
+            deadline = loop.time() + self.flush_interval_seconds
+
+            while not stopping and len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                if row is _STOP:
+                    stopping = True
+                else:
+                    batch.append(row)
+
+            if stopping:
+                # Flush everything that was queued before the stop marker
+                while not self._queue.empty():
+                    row = self._queue.get_nowait()
+                    if row is not _STOP:
+                        batch.append(row)
+
+            for start in range(0, len(batch), self.batch_size):
+                await self._write(batch[start:start + self.batch_size])
+            audit_sink_queue_depth.set(self._queue.qsize())
+
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert one batch in its own transaction."""
+        if not batch:
+            return
+
+        started = time.monotonic()
+        try:
+            async with self.session_factory() as session:
+                await session.execute(insert(AuditEvent), batch)
+                await session.commit()
+        except Exception as e:
+            audit_events_dropped_total.labels(reason="write_error").inc(len(batch))
+            logger.error(f"Failed to write {len(batch)} audit events: {e}")
+            return
+
+        audit_sink_flush_duration_seconds.observe(time.monotonic() - started)
+        audit_events_written_total.inc(len(batch))
+
+
+audit_sink = AuditSink(
+    max_queue_size=settings.AUDIT_SINK_MAX_QUEUE_SIZE,
+    batch_size=settings.AUDIT_SINK_BATCH_SIZE,
+    flush_interval_seconds=settings.AUDIT_SINK_FLUSH_INTERVAL_SECONDS,
+    put_timeout_seconds=settings.AUDIT_SINK_PUT_TIMEOUT_SECONDS,
+)
@@ -16,6 +16,7 @@ from backend.app.db.repositories.user import UserRepository
 from backend.app.db.repositories.professional import ProfessionalRepository
 from backend.app.db.repositories.service import ServiceRepository
 from backend.app.services.notifications import NotificationService
+from backend.app.services.reminder_scheduler import DEFAULT_REMINDER_OFFSETS, ReminderScheduler
 from backend.app.db.models.booking import Booking, BookingStatus
 from backend.app.db.models.notifications import NotificationEventType, NotificationPriority
 
@@ -39,6 +40,7 @@ class BookingNotificationService:
         self.user_repo = UserRepository(session)
         self.professional_repo = ProfessionalRepository(session)
         self.service_repo = ServiceRepository(session)
+        self.reminder_scheduler = ReminderScheduler(session)
 
     async def notify_booking_created(
         self,
@@ -356,6 +358,10 @@ class BookingNotificationService:
         """
         Schedule booking reminder notifications.
 
+        Only the firing times are stored; reminders are rendered and queued
+        when they fire (see ReminderScheduler). Runs in the caller's
+        transaction.
+
         Args:
             booking_id: ID of the booking
             reminder_times: List of minutes before appointment to send reminders
@@ -365,59 +371,21 @@ class BookingNotificationService:
             Dictionary with scheduled reminders
         """
         try:
-            if reminder_times is None:
-                reminder_times = [1440, 120, 30]  # 24h, 2h, 30min
-
-            # Get booking with related data
-            booking = await self._get_booking_with_relations(booking_id)
+            booking = await self.booking_repo.get_by_id(booking_id)
             if not booking:
                 raise ValueError(f"Booking {booking_id} not found")
 
-            # Prepare context data
-            context = await self._prepare_booking_context(booking)
+            rows = await self.reminder_scheduler.schedule(
+                booking, offsets=reminder_times or DEFAULT_REMINDER_OFFSETS
+            )
 
-            scheduled_reminders = []
-
-            for minutes_before in reminder_times:
-                # Calculate reminder time
-                reminder_time = booking.scheduled_at - timedelta(minutes=minutes_before)
-
-                # Skip if reminder time is in the past
-                if reminder_time <= datetime.now():
-                    continue
-
-                # Determine reminder period text
-                if minutes_before >= 1440:  # 24+ hours
-                    hours = minutes_before // 60
-                    reminder_period = f"em {hours} horas" if hours > 1 else "amanhã"
-                elif minutes_before >= 60:  # 1+ hours
-                    hours = minutes_before // 60
-                    reminder_period = f"em {hours} horas" if hours > 1 else "em 1 hora"
-                else:  # Less than 1 hour
-                    reminder_period = f"em {minutes_before} minutos"
-
-                # Update context with reminder-specific data
-                reminder_context = context.copy()
-                reminder_context.update({
-                    "reminder_period": reminder_period,
-                    "minutes_until_appointment": minutes_before
-                })
-
-                # Schedule reminder notification
-                result = await self.notification_service.send_notification(
-                    user_id=booking.client_id,
-                    event_type=NotificationEventType.BOOKING_REMINDER.value,
-                    context_data=reminder_context,
-                    priority=NotificationPriority.NORMAL.value,
-                    scheduled_at=reminder_time,
-                    correlation_id=f"booking_{booking_id}_reminder_{minutes_before}min"
-                )
-
-                scheduled_reminders.append({
-                    "minutes_before": minutes_before,
-                    "reminder_time": reminder_time.isoformat(),
-                    "notifications_queued": result["notifications_queued"]
-                })
+            scheduled_reminders = [
+                {
+                    "minutes_before": row["minutes_before"],
+                    "reminder_time": row["fire_at"].isoformat(),
+                }
+                for row in rows
+            ]
 
             logger.info(f"Scheduled {len(scheduled_reminders)} reminders for booking {booking_id}")
 
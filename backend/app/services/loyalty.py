@@ -378,12 +378,28 @@ class LoyaltyService:
 
         return expired_points
 
-    async def expire_all_points(self) -> Dict[str, int]:
-        """Expire points for all users (batch operation)."""
-        # This would typically be run as a scheduled task
-        # Implementation would iterate through all accounts
-        # For now, return placeholder
-        return {"expired_accounts": 0, "total_expired_points": 0}
+    async def expire_all_points(
+        self,
+        now: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        Expire due points of every account (batch operation).
+
+        Due transactions are processed across accounts in keyset chunks,
+        one short transaction per chunk (see expire_points_chunk in the
+        loyalty repository module). The ``loyalty.expire_points`` Celery beat
+        task runs the same code on a sync session.
+
+        Args:
+            now: Expiry reference time (default: current time)
+            chunk_size: Transactions expired per transaction
+
+        Returns:
+            Dict with expired accounts, points, transactions and chunks
+        """
+        now = now or datetime.now(timezone.utc)
+        return await self.loyalty_repo.expire_due_points(now, chunk_size=chunk_size)
 
     # Tier Management
     async def calculate_tier_for_points(self, total_points: int) -> LoyaltyTier:
@@ -4,9 +4,13 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from sqlalchemy import case, literal
+
 from backend.app.db.models.booking import Booking, BookingStatus
 from backend.app.db.repositories.booking import BookingRepository
 from backend.app.db.repositories.user import UserRepository
+from backend.app.domain.reporting import DailyRollupService
+from backend.app.domain.reporting.rollups import mark_rollup_days, rollup_day
 from backend.app.domain.policies.no_show import (
     NoShowContext,
     NoShowEvaluation,
@@ -19,6 +23,31 @@ from backend.app.domain.policies.no_show import (
 logger = logging.getLogger(__name__)
 
 
+def no_show_fee_expression(rule: NoShowFeeRule, price):
+    """
+    SQL counterpart of calculate_no_show_fee.
+
+    Args:
+        rule: Fee rule to apply
+        price: Column or expression with the service price
+
+    Returns:
+        SQL expression with the fee amount
+    """
+    if rule.fixed_amount is not None:
+        fee = literal(rule.fixed_amount)
+    elif rule.base_percentage > 0:
+        fee = price * (rule.base_percentage / 100)
+    else:
+        fee = literal(0.0)
+
+    if rule.minimum_fee is not None:
+        fee = case((fee < rule.minimum_fee, rule.minimum_fee), else_=fee)
+    if rule.maximum_fee is not None:
+        fee = case((fee > rule.maximum_fee, rule.maximum_fee), else_=fee)
+    return fee
+
+
 class NoShowService:
     """Service for managing no-show detection and processing."""
 
@@ -26,10 +55,12 @@ class NoShowService:
         self,
         booking_repository: BookingRepository,
         user_repository: UserRepository,
+        rollup_service: Optional[DailyRollupService] = None,
     ):
         """Initialize no-show service."""
         self.booking_repository = booking_repository
         self.user_repository = user_repository
+        self.rollup_service = rollup_service or DailyRollupService(booking_repository.session)
 
     async def get_default_no_show_policy(self) -> NoShowPolicy:
         """Get default no-show policy."""
@@ -249,6 +280,62 @@ class NoShowService:
 
         return results
 
+    async def mark_no_shows_batch(
+        self,
+        current_time: datetime,
+        detection_window_hours: int,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> List[Dict]:
+        """
+        Apply the no-show policy to the next batch of eligible bookings.
+
+        Selection, fee calculation and marking happen in a single UPDATE.
+        Arrival data is not tracked yet, so every booking past the detection
+        window and the policy's detection delay is a client no-show, as in
+        evaluate_booking_for_no_show.
+
+        Args:
+            current_time: Reference time of the detection run
+            detection_window_hours: Hours after scheduled time before detection
+            after_id: Only bookings with a greater ID are considered
+            limit: Maximum number of bookings to mark
+
+        Returns:
+            One dict per marked booking (booking_id, client_id, fee_amount)
+        """
+        policy = await self.get_default_no_show_policy()
+        if not policy.auto_detect_enabled:
+            return []
+
+        delay = max(
+            timedelta(hours=detection_window_hours),
+            timedelta(minutes=policy.detection_delay_minutes),
+        )
+        rows = await self.booking_repository.mark_no_shows_batch(
+            cutoff_time=current_time - delay,
+            marked_at=current_time,
+            reason=NoShowReason.CLIENT_NO_SHOW.value,
+            fee_amount=no_show_fee_expression(policy.client_no_show_rule, Booking.service_price),
+            after_id=after_id,
+            limit=limit,
+        )
+
+        # The bulk UPDATE bypasses the ORM flush hook of the rollups
+        rollup_keys = {(rollup_day(row.scheduled_at), row.professional_id) for row in rows}
+        await self.booking_repository.session.run_sync(
+            lambda sync_session: mark_rollup_days(sync_session, rollup_keys)
+        )
+
+        return [
+            {
+                "booking_id": row.id,
+                "client_id": row.client_id,
+                "fee_amount": float(row.no_show_fee_amount or 0),
+            }
+            for row in rows
+        ]
+
     async def dispute_no_show(
         self,
         booking_id: int,
@@ -347,7 +434,12 @@ class NoShowService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> Dict:
-        """Get no-show statistics for a period."""
+        """
+        Get no-show statistics for a period.
+
+        Read from the daily rollups: whole days of the period are counted and
+        the latest changes appear once the rollups are applied.
+        """
 
         # Default to last 30 days
         if not end_date:
@@ -355,39 +447,23 @@ class NoShowService:
         if not start_date:
             start_date = end_date - timedelta(days=30)
 
-        # Build filter criteria
-        criteria = {
-            "scheduled_after": start_date,
-            "scheduled_before": end_date
-        }
-
-        if unit_id:
-            criteria["unit_id"] = unit_id
-        if professional_id:
-            criteria["professional_id"] = professional_id
+        # Units are salons
+        filters = {"professional_id": professional_id, "salon_id": unit_id}
 
-        # Get all bookings in period
-        all_bookings = await self.booking_repository.find_by_criteria(**criteria)
+        totals = await self.rollup_service.get_no_show_totals(start_date, end_date, **filters)
+        reason_stats = await self.rollup_service.get_no_show_reasons(start_date, end_date, **filters)
 
-        # Calculate statistics
-        total_bookings = len(all_bookings)
-        no_show_bookings = [b for b in all_bookings if b.marked_no_show_at]
-
-        total_no_shows = len(no_show_bookings)
+        total_bookings = totals["total_bookings"]
+        total_no_shows = totals["no_show_bookings"]
 
         # Calculate fees
-        total_fees = sum(
-            float(b.no_show_fee_amount or 0) for b in no_show_bookings
-        )
+        total_fees = sum(stats["fees"] for stats in reason_stats.values())
 
         # Calculate rates
-        no_show_rate = (total_no_shows / total_bookings * 100) if total_bookings > 0 else 0
+        no_show_rate = totals["no_show_rate"]
 
         # Reason breakdown
-        reasons = {}
-        for booking in no_show_bookings:
-            reason = booking.no_show_reason or "unknown"
-            reasons[reason] = reasons.get(reason, 0) + 1
+        reasons = {reason: stats["no_shows"] for reason, stats in reason_stats.items()}
 
         return {
             "period": {
@@ -0,0 +1,370 @@
+"""
+Worker-pool dispatcher for queued notifications.
+
+Each dispatch claims a batch of due rows from ``notification_queue`` with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of dispatcher processes
+can drain the queue in parallel without delivering a notification twice.
+The batch is sent concurrently, bounded per channel by a semaphore
+(NOTIFICATION_CHANNEL_CONCURRENCY) and a rate limit
+(NOTIFICATION_CHANNEL_RATE_PER_SECOND), and the resulting status
+transitions and ``notification_logs`` rows are written with one bulk
+UPDATE and one multi-row INSERT before the claim is committed.
+
+Rows stay locked until the batch commits; if a dispatcher dies mid-batch
+its rows become due again, so delivery is at-least-once.
+
+Run a dispatcher process with::
+
+    python -m backend.app.services.notification_dispatcher
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, case, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from backend.app.core.config import settings
+from backend.app.core.metrics import (
+    notification_dispatch_batch_duration_seconds,
+    notifications_dispatched_total,
+)
+from backend.app.db.models.notifications import (
+    NotificationChannel,
+    NotificationLog,
+    NotificationPriority,
+    NotificationQueue,
+    NotificationStatus,
+)
+from backend.app.db.session import AsyncSessionLocal
+from backend.app.services.notifications import (
+    NotificationChannelHandler,
+    default_channel_handlers,
+    recipient_address,
+)
+
+logger = logging.getLogger(__name__)
+
+# Claim order: most urgent first (the enum is stored by name, so it cannot
+# be ordered directly)
+PRIORITY_RANK = case(
+    *[
+        (NotificationQueue.priority == priority, rank)
+        for rank, priority in enumerate([
+            NotificationPriority.CRITICAL,
+            NotificationPriority.URGENT,
+            NotificationPriority.HIGH,
+            NotificationPriority.NORMAL,
+            NotificationPriority.LOW,
+        ])
+    ],
+    else_=5,
+)
+
+
+class RateLimiter:
+    """Spaces acquisitions at least 1/rate_per_second seconds apart."""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for the next free slot."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class ChannelLimit:
+    """Delivery limits of one channel (provider)."""
+
+    concurrency: int
+    rate_per_second: Optional[float] = None
+
+
+def channel_limits_from_settings() -> Dict[NotificationChannel, ChannelLimit]:
+    """Build the per-channel limits from NOTIFICATION_CHANNEL_* settings."""
+    return {
+        channel: ChannelLimit(
+            concurrency=settings.NOTIFICATION_CHANNEL_CONCURRENCY.get(channel.value, 10),
+            rate_per_second=settings.NOTIFICATION_CHANNEL_RATE_PER_SECOND.get(channel.value),
+        )
+        for channel in NotificationChannel
+    }
+
+
+class NotificationDispatcher:
+    """Claims due notifications in batches and delivers them concurrently."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        handlers: Optional[Dict[NotificationChannel, NotificationChannelHandler]] = None,
+        channel_limits: Optional[Dict[NotificationChannel, ChannelLimit]] = None,
+        batch_size: int = 200,
+        poll_interval_seconds: float = 1.0,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            session_factory: Factory of async sessions used by ``run``
+            handlers: Channel handlers (default: one per channel)
+            channel_limits: Concurrency and rate limit per channel
+                (channels without an entry are sent one at a time)
+            batch_size: Maximum notifications claimed per transaction
+            poll_interval_seconds: Wait before polling an empty queue again
+        """
+        self.session_factory = session_factory
+        self.handlers = handlers or default_channel_handlers()
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+
+        limits = channel_limits or {}
+        self._semaphores = {
+            channel: asyncio.Semaphore(limits.get(channel, ChannelLimit(1)).concurrency)
+            for channel in NotificationChannel
+        }
+        self._rate_limiters = {
+            channel: RateLimiter(limit.rate_per_second)
+            for channel, limit in limits.items()
+            if limit.rate_per_second
+        }
+        self._stopping = asyncio.Event()
+
+    async def claim_batch(self, session: AsyncSession, limit: int) -> List[NotificationQueue]:
+        """
+        Lock up to limit due notifications, skipping rows claimed elsewhere.
+
+        Args:
+            session: Session whose transaction holds the claim
+            limit: Maximum number of notifications
+
+        Returns:
+            Claimed notifications with user and template loaded
+        """
+        now = datetime.now(timezone.utc)
+        due = or_(
+            and_(
+                NotificationQueue.status.in_([NotificationStatus.PENDING, NotificationStatus.QUEUED]),
+                NotificationQueue.scheduled_at <= now,
+            ),
+            and_(
+                NotificationQueue.status == NotificationStatus.RETRYING,
+                NotificationQueue.next_retry_at <= now,
+                NotificationQueue.retry_count < NotificationQueue.max_retries,
+            ),
+        )
+        stmt = (
+            select(NotificationQueue)
+            # Only the user's columns are needed; skip its eager collections
+            .options(selectinload(NotificationQueue.user).lazyload("*"))
+            .options(selectinload(NotificationQueue.template))
+            .where(due)
+            .order_by(PRIORITY_RANK, NotificationQueue.scheduled_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=NotificationQueue)
+        )
+
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def dispatch_batch(self, session: AsyncSession, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Claim, deliver and record one batch, then commit.
+
+        Args:
+            session: Session used for the claim and the bulk writes
+            limit: Maximum notifications (default: batch_size)
+
+        Returns:
+            Counts of claimed, sent, retrying and failed notifications
+        """
+        started = time.monotonic()
+        notifications = await self.claim_batch(session, limit or self.batch_size)
+        stats = {"claimed": len(notifications), "sent": 0, "retrying": 0, "failed": 0}
+        if not notifications:
+            await session.commit()
+            return stats
+
+        outcomes = await asyncio.gather(*[
+            self._deliver(notification) for notification in notifications
+        ])
+
+        now = datetime.now(timezone.utc)
+        status_rows = []
+        log_rows = []
+        for notification, outcome in zip(notifications, outcomes):
+            status_row, log_row = self._transition(notification, outcome, now)
+            status_rows.append(status_row)
+            if log_row:
+                log_rows.append(log_row)
+
+            status = status_row["status"]
+            stats[{
+                NotificationStatus.SENT: "sent",
+                NotificationStatus.DELIVERED: "sent",
+                NotificationStatus.RETRYING: "retrying",
+            }.get(status, "failed")] += 1
+            notifications_dispatched_total.labels(
+                channel=notification.channel.value, status=status.value
+            ).inc()
+
+        await session.execute(update(NotificationQueue), status_rows)
+        if log_rows:
+            await session.execute(insert(NotificationLog), log_rows)
+        await session.commit()
+
+        notification_dispatch_batch_duration_seconds.observe(time.monotonic() - started)
+        return stats
+
+    async def _deliver(self, notification: NotificationQueue) -> Dict[str, Any]:
+        """Send one notification within its channel's limits; never raises."""
+        handler = self.handlers.get(notification.channel)
+        if not handler:
+            return {"error": f"No handler for channel {notification.channel}", "retry": False}
+
+        recipient = recipient_address(notification.user, notification.channel)
+        if not recipient:
+            return {"error": f"No {notification.channel} address for user", "retry": False}
+        if not handler.validate_recipient(recipient):
+            return {"error": f"Invalid recipient format for {notification.channel}", "retry": False}
+
+        async with self._semaphores[notification.channel]:
+            limiter = self._rate_limiters.get(notification.channel)
+            if limiter:
+                await limiter.acquire()
+            try:
+                result = await handler.send(
+                    recipient=recipient,
+                    subject=notification.subject,
+                    body=notification.body,
+                    context=notification.context_data,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to deliver notification {notification.id}: {e}")
+                return {"error": str(e), "retry": True}
+
+        return {"result": result}
+
+    def _transition(
+        self,
+        notification: NotificationQueue,
+        outcome: Dict[str, Any],
+        now: datetime,
+    ) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Queue row update and log row for a delivery outcome."""
+        status_row = {
+            "id": notification.id,
+            "status": NotificationStatus.SENT,
+            "external_id": notification.external_id,
+            "last_error": notification.last_error,
+            "sent_at": notification.sent_at,
+            "retry_count": notification.retry_count,
+            "next_retry_at": notification.next_retry_at,
+            "updated_at": now,
+        }
+        log_row = {
+            "queue_id": notification.id,
+            "user_id": notification.user_id,
+            "channel": notification.channel,
+            "event_type": notification.template.event_type,
+            "subject": notification.subject,
+            "sent_at": now,
+            "delivered_at": None,
+            "external_id": None,
+            "provider_response": None,
+            "error_message": None,
+            "error_code": None,
+            "correlation_id": notification.correlation_id,
+        }
+
+        if "result" in outcome:
+            result = outcome["result"]
+            status_row.update(
+                external_id=result.get("external_id") or notification.external_id,
+                sent_at=now,
+            )
+            log_row.update(
+                status=NotificationStatus.SENT,
+                external_id=result.get("external_id"),
+                provider_response=result.get("provider_response"),
+            )
+            return status_row, log_row
+
+        status_row.update(status=NotificationStatus.FAILED, last_error=outcome["error"])
+        if not outcome["retry"]:
+            # Nothing was sent, so there is no delivery attempt to log
+            return status_row, None
+
+        retry_count = notification.retry_count + 1
+        status_row["retry_count"] = retry_count
+        if retry_count < notification.max_retries:
+            # Exponential backoff: 2, 4, 8 minutes
+            status_row.update(
+                status=NotificationStatus.RETRYING,
+                next_retry_at=now + timedelta(minutes=2 ** retry_count),
+            )
+
+        log_row.update(status=NotificationStatus.FAILED, error_message=outcome["error"])
+        return status_row, log_row
+
+    async def run(self) -> None:
+        """Dispatch batches until stop is called, polling when the queue is empty."""
+        self._stopping.clear()
+        logger.info("Notification dispatcher started")
+
+        while not self._stopping.is_set():
+            try:
+                async with self.session_factory() as session:
+                    stats = await self.dispatch_batch(session)
+            except Exception as e:
+                logger.error(f"Notification dispatch failed: {e}")
+                stats = {"claimed": 0}
+
+            if stats["claimed"] < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+        logger.info("Notification dispatcher stopped")
+
+    def stop(self) -> None:
+        """Finish the current batch and stop ``run``."""
+        self._stopping.set()
+
+
+def main() -> None:
+    """Run one dispatcher process until interrupted."""
+    import signal
+
+    logging.basicConfig(level=logging.INFO)
+    dispatcher = NotificationDispatcher(
+        channel_limits=channel_limits_from_settings(),
+        batch_size=settings.NOTIFICATION_DISPATCH_BATCH_SIZE,
+        poll_interval_seconds=settings.NOTIFICATION_DISPATCH_POLL_INTERVAL_SECONDS,
+    )
+
+    async def serve() -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, dispatcher.stop)
+        await dispatcher.run()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
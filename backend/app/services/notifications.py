@@ -9,7 +9,6 @@ import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List, Optional, Union
-from jinja2 import Template, Environment, DictLoader
 import json
 
 from backend.app.db.repositories.notifications import NotificationRepository
@@ -20,6 +19,7 @@ from backend.app.db.models.notifications import (
 )
 from backend.app.db.models.user import User
 from backend.app.core.exceptions import ValidationError, NotFoundError, BusinessLogicError
+from backend.app.services.template_cache import CompiledTemplateCache, template_cache
 
 logger = logging.getLogger(__name__)
 
@@ -228,31 +228,50 @@ class WhatsAppHandler(NotificationChannelHandler):
         return SMSHandler().validate_recipient(recipient)
 
 
+def default_channel_handlers() -> Dict[NotificationChannel, NotificationChannelHandler]:
+    """Create one handler per supported channel."""
+    return {
+        NotificationChannel.EMAIL: EmailHandler(),
+        NotificationChannel.SMS: SMSHandler(),
+        NotificationChannel.PUSH: PushHandler(),
+        NotificationChannel.IN_APP: InAppHandler(),
+        NotificationChannel.WHATSAPP: WhatsAppHandler(),
+    }
+
+
+def recipient_address(user: User, channel: NotificationChannel) -> Optional[str]:
+    """Get a user's recipient address for the specified channel."""
+    if channel == NotificationChannel.EMAIL:
+        return user.email
+    elif channel == NotificationChannel.SMS or channel == NotificationChannel.WHATSAPP:
+        return user.phone
+    elif channel == NotificationChannel.IN_APP:
+        return str(user.id)
+    elif channel == NotificationChannel.PUSH:
+        # TODO: Get device token from user device registrations
+        return None  # Not implemented yet
+    else:
+        return None
+
+
 class NotificationService:
     """Advanced notification service with multi-channel support."""
 
     def __init__(
         self,
         notification_repo: NotificationRepository,
-        user_repo: UserRepository
+        user_repo: UserRepository,
+        templates: Optional[CompiledTemplateCache] = None
     ):
         self.notification_repo = notification_repo
         self.user_repo = user_repo
 
         # Initialize channel handlers
-        self.handlers = {
-            NotificationChannel.EMAIL: EmailHandler(),
-            NotificationChannel.SMS: SMSHandler(),
-            NotificationChannel.PUSH: PushHandler(),
-            NotificationChannel.IN_APP: InAppHandler(),
-            NotificationChannel.WHATSAPP: WhatsAppHandler(),
-        }
+        self.handlers = default_channel_handlers()
 
-        # Jinja2 environment for template rendering
-        self.jinja_env = Environment(
-            loader=DictLoader({}),
-            autoescape=True
-        )
+        # Compiled templates are shared by every service instance
+        self.templates = templates if templates is not None else template_cache
+        self.jinja_env = self.templates.environment
 
     # ==================== Template Management ====================
 
@@ -270,9 +289,7 @@ class NotificationService:
         """Create a new notification template."""
         # Validate template syntax
         try:
-            if subject_template:
-                Template(subject_template)
-            Template(body_template)
+            self.templates.compile(subject_template, body_template)
         except Exception as e:
             raise ValidationError(f"Invalid template syntax: {str(e)}")
 
@@ -287,6 +304,22 @@ class NotificationService:
             locale=locale
         )
 
+    async def update_template(
+        self,
+        template_id: int,
+        **updates
+    ) -> NotificationTemplate:
+        """Update a notification template and drop its compiled form."""
+        if "subject" in updates or "body_template" in updates:
+            try:
+                self.templates.compile(updates.get("subject"), updates.get("body_template", ""))
+            except Exception as e:
+                raise ValidationError(f"Invalid template syntax: {str(e)}")
+
+        template = await self.notification_repo.update_template(template_id, **updates)
+        self.templates.invalidate(template_id)
+        return template
+
     async def render_template(
         self,
         template: NotificationTemplate,
@@ -294,19 +327,41 @@ class NotificationService:
     ) -> Dict[str, str]:
         """Render notification template with context data."""
         try:
-            rendered = {}
+            return self.templates.get(template).render(context)
+        except Exception as e:
+            raise ValidationError(f"Template rendering failed: {str(e)}")
+
+    async def render_template_batch(
+        self,
+        template: NotificationTemplate,
+        contexts: List[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """
+        Render one template against many contexts.
 
-            if template.subject:
-                subject_template = Template(template.subject)
-                rendered["subject"] = subject_template.render(**context)
+        The template is looked up (and compiled, if needed) once for the
+        whole batch.
 
-            body_template = Template(template.body_template)
-            rendered["body"] = body_template.render(**context)
+        Args:
+            template: Template to render
+            contexts: Context data, one per notification
 
-            return rendered
+        Returns:
+            Rendered subject/body dicts in the order of contexts
+        """
+        try:
+            compiled = self.templates.get(template)
         except Exception as e:
             raise ValidationError(f"Template rendering failed: {str(e)}")
 
+        rendered = []
+        for index, context in enumerate(contexts):
+            try:
+                rendered.append(compiled.render(context))
+            except Exception as e:
+                raise ValidationError(f"Template rendering failed for context {index}: {str(e)}")
+        return rendered
+
     # ==================== Preference Management ====================
 
     async def setup_user_preferences(self, user_id: int) -> List:
@@ -405,9 +460,8 @@ class NotificationService:
                 logger.error(f"Failed to queue notification for channel {channel}: {str(e)}")
                 continue
 
-        # If immediate sending is requested and no scheduling
-        if not scheduled_at or scheduled_at <= datetime.now(timezone.utc):
-            asyncio.create_task(self._process_immediate_notifications(queued_notifications))
+        # Due notifications are delivered by the notification dispatcher
+        # workers (services/notification_dispatcher.py)
 
         return {
             "message": "Notifications queued successfully",
@@ -461,17 +515,6 @@ class NotificationService:
             correlation_id=correlation_id
         )
 
-    async def _process_immediate_notifications(
-        self,
-        notifications: List[NotificationQueue]
-    ) -> None:
-        """Process notifications for immediate delivery."""
-        for notification in notifications:
-            try:
-                await self._deliver_notification(notification)
-            except Exception as e:
-                logger.error(f"Failed to deliver notification {notification.id}: {str(e)}")
-
     async def _deliver_notification(self, notification: NotificationQueue) -> None:
         """Deliver a single notification."""
         handler = self.handlers.get(notification.channel)
@@ -554,36 +597,23 @@ class NotificationService:
         channel: NotificationChannel
     ) -> Optional[str]:
         """Get recipient address for the specified channel."""
-        if channel == NotificationChannel.EMAIL:
-            return user.email
-        elif channel == NotificationChannel.SMS or channel == NotificationChannel.WHATSAPP:
-            return user.phone
-        elif channel == NotificationChannel.IN_APP:
-            return str(user.id)
-        elif channel == NotificationChannel.PUSH:
-            # TODO: Get device token from user device registrations
-            return None  # Not implemented yet
-        else:
-            return None
+        return recipient_address(user, channel)
 
     # ==================== Notification Processing ====================
 
     async def process_pending_notifications(self, limit: int = 100) -> Dict[str, int]:
-        """Process pending notifications for delivery."""
-        notifications = await self.notification_repo.get_pending_notifications(limit=limit)
+        """Deliver one batch of due notifications through the dispatcher."""
+        from backend.app.services.notification_dispatcher import NotificationDispatcher
 
-        processed = 0
-        failed = 0
+        dispatcher = NotificationDispatcher(handlers=self.handlers)
+        stats = await dispatcher.dispatch_batch(self.notification_repo.session, limit=limit)
 
-        for notification in notifications:
-            try:
-                await self._deliver_notification(notification)
-                processed += 1
-            except Exception as e:
-                logger.error(f"Failed to process notification {notification.id}: {str(e)}")
-                failed += 1
-
-        return {"processed": processed, "failed": failed}
+        # "processed" counts delivered notifications, as it always has
+        return {
+            "processed": stats["sent"],
+            "successful": stats["sent"],
+            "failed": stats["failed"] + stats["retrying"],
+        }
 
     async def process_retry_notifications(self, limit: int = 50) -> Dict[str, int]:
         """Process notifications that need retry."""
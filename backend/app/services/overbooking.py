@@ -10,6 +10,8 @@ from backend.app.db.models.booking import BookingStatus
 from backend.app.db.models.overbooking import OverbookingConfig, OverbookingTimeframe
 from backend.app.db.repositories.booking import BookingRepository
 from backend.app.db.repositories.overbooking import OverbookingRepository
+from backend.app.domain.reporting import DailyRollupService
+from backend.app.services.overbooking_index import OverbookingConfigIndex, overbooking_config_index
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +19,20 @@ logger = logging.getLogger(__name__)
 class OverbookingService:
     """Service for managing overbooking capacity and decisions."""
 
-    def __init__(self, session: AsyncSession):
-        """Initialize service with database session."""
+    def __init__(self, session: AsyncSession, config_index: Optional[OverbookingConfigIndex] = None):
+        """
+        Initialize service with database session.
+
+        Args:
+            session: Async database session
+            config_index: Index used to resolve effective configurations
+                (default: the process-wide index)
+        """
         self.session = session
         self.overbooking_repo = OverbookingRepository(session)
         self.booking_repo = BookingRepository(session)
+        self.rollup_service = DailyRollupService(session)
+        self.config_index = config_index or overbooking_config_index
 
     async def calculate_available_capacity(
         self,
@@ -50,7 +61,8 @@ class OverbookingService:
         target_time = target_datetime.time()
 
         # Get effective overbooking configuration
-        config = await self.overbooking_repo.get_effective_config(
+        config = await self.config_index.get_effective_config(
+            self.session,
             salon_id=salon_id,
             professional_id=professional_id,
             service_id=service_id,
@@ -159,6 +171,9 @@ class OverbookingService:
         """
         Check if a booking can be accepted considering overbooking.
 
+        The answer is only binding under the professional's agenda lock, as
+        taken by BookingAdmissionService.admit before it calls this.
+
         Returns:
             Tuple of (can_accept, capacity_info)
         """
@@ -201,32 +216,25 @@ class OverbookingService:
         service_id: Optional[int] = None,
         historical_period_days: int = 30
     ) -> Dict:
-        """Get no-show statistics for the specified period."""
+        """
+        Get no-show statistics for the specified period.
+
+        Counts are read from the daily rollups, so any period is a sum over
+        at most historical_period_days + 1 rows per service.
+        """
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=historical_period_days)
 
-        # Get historical bookings
-        historical_bookings = await self.booking_repo.find_by_criteria(
+        totals = await self.rollup_service.get_no_show_totals(
+            start_date,
+            end_date,
             professional_id=professional_id,
             salon_id=salon_id,
             service_id=service_id,
-            start_date=start_date.date(),
-            end_date=end_date.date(),
-            include_completed=True
         )
 
-        total_bookings = len(historical_bookings)
-        no_show_bookings = len([
-            booking for booking in historical_bookings
-            if booking.status == BookingStatus.NO_SHOW
-        ])
-
-        no_show_rate = (no_show_bookings / total_bookings * 100) if total_bookings > 0 else 0.0
-
         return {
-            "total_bookings": total_bookings,
-            "no_show_bookings": no_show_bookings,
-            "no_show_rate": no_show_rate,
+            **totals,
             "period_start": start_date.date(),
             "period_end": end_date.date()
         }
@@ -240,7 +248,8 @@ class OverbookingService:
     ) -> Dict:
         """Get overbooking status for a specific date."""
         # Get configuration
-        config = await self.overbooking_repo.get_effective_config(
+        config = await self.config_index.get_effective_config(
+            self.session,
             salon_id=salon_id,
             professional_id=professional_id,
             service_id=service_id
@@ -281,6 +290,7 @@ class OverbookingService:
         # Create configuration
         config = await self.overbooking_repo.create(config_data)
         await self.session.commit()
+        await self.config_index.publish_change()
 
         logger.info(f"Created overbooking configuration: {config.name} (ID: {config.id})")
         return config
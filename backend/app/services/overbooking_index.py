@@ -0,0 +1,382 @@
+"""In-process index of active overbooking configurations.
+
+Capacity checks resolve the effective configuration (service -> professional
+-> salon -> global) from an immutable snapshot of every active
+OverbookingConfig row instead of issuing one query per scope. The snapshot
+is loaded with a single query and replaced when:
+
+- a configuration change is published on the ``overbooking:config:changed``
+  Redis channel (see ``publish_change``; every process subscribes), or
+- it is older than OVERBOOKING_CONFIG_SNAPSHOT_MAX_AGE_SECONDS, which bounds
+  staleness if a notification is lost or Redis is unavailable.
+
+Changes must be published after their transaction commits, otherwise other
+processes could reload the previous rows.
+"""
+
+import asyncio
+import logging
+import time as monotonic_time
+from dataclasses import dataclass
+from datetime import datetime, time, timezone
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.redis import get_async_redis
+from backend.app.db.models.overbooking import OverbookingConfig, OverbookingScope, OverbookingTimeframe
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "overbooking:config:version"
+CHANGES_CHANNEL = "overbooking:config:changed"
+
+# Seconds to wait before resubscribing after a Redis error
+LISTENER_RETRY_SECONDS = 5
+
+ScopeKey = tuple[OverbookingScope, Optional[int]]
+
+
+@dataclass(frozen=True)
+class ResolvedOverbookingConfig:
+    """Immutable copy of an OverbookingConfig row."""
+
+    id: int
+    name: str
+    scope: OverbookingScope
+    salon_id: Optional[int]
+    professional_id: Optional[int]
+    service_id: Optional[int]
+    max_overbooking_percentage: float
+    timeframe: OverbookingTimeframe
+    start_time: Optional[time]
+    end_time: Optional[time]
+    min_historical_bookings: int
+    historical_period_days: int
+    min_no_show_rate: float
+    max_no_show_rate: float
+    effective_from: Optional[datetime]
+    effective_until: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, config: OverbookingConfig) -> "ResolvedOverbookingConfig":
+        """Copy the columns of a loaded configuration."""
+        return cls(
+            id=config.id,
+            name=config.name,
+            scope=config.scope,
+            salon_id=config.salon_id,
+            professional_id=config.professional_id,
+            service_id=config.service_id,
+            max_overbooking_percentage=float(config.max_overbooking_percentage),
+            timeframe=config.timeframe,
+            start_time=config.start_time,
+            end_time=config.end_time,
+            min_historical_bookings=config.min_historical_bookings,
+            historical_period_days=config.historical_period_days,
+            min_no_show_rate=float(config.min_no_show_rate),
+            max_no_show_rate=float(config.max_no_show_rate),
+            effective_from=config.effective_from,
+            effective_until=config.effective_until,
+        )
+
+    @property
+    def scope_key(self) -> ScopeKey:
+        """Index key of the entity this configuration applies to."""
+        scope_id = {
+            OverbookingScope.GLOBAL: None,
+            OverbookingScope.SALON: self.salon_id,
+            OverbookingScope.PROFESSIONAL: self.professional_id,
+            OverbookingScope.SERVICE: self.service_id,
+        }[self.scope]
+        return self.scope, scope_id
+
+    @property
+    def max_overbooking_decimal(self) -> float:
+        """Get max overbooking as decimal (0.20 for 20%)."""
+        return self.max_overbooking_percentage / 100.0
+
+    def is_effective_at(self, moment: datetime) -> bool:
+        """Check if the configuration's effective period contains a moment."""
+        if self.effective_from and moment < self.effective_from:
+            return False
+        if self.effective_until and moment > self.effective_until:
+            return False
+        return True
+
+    @property
+    def is_currently_effective(self) -> bool:
+        """Check if configuration is currently effective."""
+        return self.is_effective_at(datetime.utcnow())
+
+    def applies_to_time(self, check_time: time) -> bool:
+        """Check if config applies to a specific time."""
+        if not self.start_time or not self.end_time:
+            return True
+
+        return self.start_time <= check_time <= self.end_time
+
+    def calculate_max_capacity(self, base_capacity: int) -> int:
+        """Calculate maximum capacity including overbooking."""
+        if not self.is_currently_effective:
+            return base_capacity
+
+        additional_capacity = int(base_capacity * self.max_overbooking_decimal)
+        return base_capacity + additional_capacity
+
+
+class OverbookingConfigSnapshot:
+    """Active configurations of one load, indexed by scope and entity."""
+
+    def __init__(self, configs: list[ResolvedOverbookingConfig], version: int = 0):
+        """
+        Build the index.
+
+        Args:
+            configs: Active configurations
+            version: Change version the configurations were loaded at
+        """
+        self.version = version
+        self.loaded_at = monotonic_time.monotonic()
+        self._by_scope: dict[ScopeKey, tuple[ResolvedOverbookingConfig, ...]] = {}
+
+        # Newest configuration first when an entity has several
+        for config in sorted(configs, key=lambda c: c.id, reverse=True):
+            key = config.scope_key
+            self._by_scope[key] = self._by_scope.get(key, ()) + (config,)
+
+    def __len__(self) -> int:
+        return sum(len(configs) for configs in self._by_scope.values())
+
+    def resolve(
+        self,
+        salon_id: Optional[int] = None,
+        professional_id: Optional[int] = None,
+        service_id: Optional[int] = None,
+        check_time: Optional[time] = None,
+        check_datetime: Optional[datetime] = None,
+    ) -> Optional[ResolvedOverbookingConfig]:
+        """
+        Get the most specific effective configuration.
+
+        Priority order: service -> professional -> salon -> global. A
+        configuration whose time window excludes check_time is skipped in
+        favour of the next scope.
+
+        Returns:
+            Most specific effective configuration or None
+        """
+        now = check_datetime or datetime.utcnow()
+        if now.tzinfo is not None:
+            # Effective periods are stored as naive UTC
+            now = now.astimezone(timezone.utc).replace(tzinfo=None)
+
+        candidates = (
+            (OverbookingScope.SERVICE, service_id),
+            (OverbookingScope.PROFESSIONAL, professional_id),
+            (OverbookingScope.SALON, salon_id),
+            (OverbookingScope.GLOBAL, None),
+        )
+
+        for scope, scope_id in candidates:
+            if scope is not OverbookingScope.GLOBAL and not scope_id:
+                continue
+
+            for config in self._by_scope.get((scope, scope_id), ()):
+                if not config.is_effective_at(now):
+                    continue
+                if check_time and not config.applies_to_time(check_time):
+                    continue
+                return config
+
+        return None
+
+
+class OverbookingConfigIndex:
+    """Process-wide, change-notified snapshot of overbooking configurations."""
+
+    def __init__(
+        self,
+        redis_client: "aioredis.Redis | None" = None,
+        max_age_seconds: int = 300,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            redis_client: asyncio Redis client for change notifications
+                (None: snapshots only expire by age)
+            max_age_seconds: Maximum age of a snapshot
+        """
+        self.redis = redis_client
+        self.max_age_seconds = max_age_seconds
+        self._snapshot: Optional[OverbookingConfigSnapshot] = None
+        self._stale = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reload_lock: Optional[asyncio.Lock] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    def _bind_loop(self) -> None:
+        """Create the lock and listener task on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._reload_lock = asyncio.Lock()
+        self._listener = None
+        if self.redis is not None:
+            self._listener = loop.create_task(self._listen(), name="overbooking-config-listener")
+
+    def _needs_reload(self) -> bool:
+        return (
+            self._stale
+            or self._snapshot is None
+            or monotonic_time.monotonic() - self._snapshot.loaded_at > self.max_age_seconds
+        )
+
+    async def get_snapshot(self, session: AsyncSession) -> OverbookingConfigSnapshot:
+        """
+        Get the current snapshot, loading it if needed.
+
+        Args:
+            session: Session used when the snapshot must be (re)loaded
+
+        Returns:
+            Current snapshot
+        """
+        self._bind_loop()
+        if not self._needs_reload():
+            return self._snapshot
+
+        async with self._reload_lock:
+            # Another coroutine may have reloaded while we waited
+            if self._needs_reload():
+                self._stale = False
+                try:
+                    self._snapshot = await self._load(session)
+                except Exception:
+                    self._stale = True
+                    raise
+            return self._snapshot
+
+    async def _load(self, session: AsyncSession) -> OverbookingConfigSnapshot:
+        # Read the version first: a change published during the load makes
+        # the listener mark this snapshot stale again
+        version = await self._current_version()
+
+        result = await session.execute(
+            select(OverbookingConfig).where(OverbookingConfig.is_active == True)
+        )
+        configs = [ResolvedOverbookingConfig.from_model(config) for config in result.scalars()]
+
+        logger.debug(f"Loaded {len(configs)} overbooking configurations (version {version})")
+        return OverbookingConfigSnapshot(configs, version)
+
+    async def _current_version(self) -> int:
+        if self.redis is None:
+            return 0
+
+        try:
+            return int(await self.redis.get(VERSION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read overbooking config version: {e}")
+            return 0
+
+    async def get_effective_config(
+        self,
+        session: AsyncSession,
+        salon_id: Optional[int] = None,
+        professional_id: Optional[int] = None,
+        service_id: Optional[int] = None,
+        check_time: Optional[time] = None,
+        check_datetime: Optional[datetime] = None,
+    ) -> Optional[ResolvedOverbookingConfig]:
+        """
+        Get the most specific effective configuration without querying the DB.
+
+        Args:
+            session: Session used only when the snapshot must be reloaded
+            salon_id: Salon ID to check
+            professional_id: Professional ID to check
+            service_id: Service ID to check
+            check_time: Time to check for time-based restrictions
+            check_datetime: Datetime to check for effective period
+
+        Returns:
+            Most specific effective configuration or None
+        """
+        snapshot = await self.get_snapshot(session)
+        return snapshot.resolve(
+            salon_id=salon_id,
+            professional_id=professional_id,
+            service_id=service_id,
+            check_time=check_time,
+            check_datetime=check_datetime,
+        )
+
+    def invalidate_local(self) -> None:
+        """Reload this process's snapshot on next use."""
+        self._stale = True
+
+    async def publish_change(self) -> None:
+        """
+        Notify every process that configurations changed.
+
+        Call after the transaction with the change has committed.
+        """
+        self.invalidate_local()
+        if self.redis is None:
+            return
+
+        try:
+            version = await self.redis.incr(VERSION_KEY)
+            await self.redis.publish(CHANGES_CHANNEL, version)
+        except Exception as e:
+            logger.warning(f"Failed to publish overbooking config change: {e}")
+
+    async def _listen(self) -> None:
+        """Mark the snapshot stale on every published change."""
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(CHANGES_CHANNEL)
+
+                    # Changes published while we were not subscribed
+                    if self._snapshot is not None and await self._current_version() != self._snapshot.version:
+                        self.invalidate_local()
+
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        if self._snapshot is None or int(message["data"]) != self._snapshot.version:
+                            self.invalidate_local()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Missed changes are detected by the version check on resubscribe
+                logger.warning(f"Overbooking config listener failed, retrying: {e}")
+                await asyncio.sleep(LISTENER_RETRY_SECONDS)
+
+    async def close(self) -> None:
+        """Stop listening for changes."""
+        if self._listener is not None and not self._listener.done():
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+        self._loop = None
+
+
+overbooking_config_index = OverbookingConfigIndex(
+    redis_client=get_async_redis(),
+    max_age_seconds=settings.OVERBOOKING_CONFIG_SNAPSHOT_MAX_AGE_SECONDS,
+)
@@ -0,0 +1,323 @@
+"""
+Booking reminder time wheel.
+
+Scheduling a booking's reminders stores one compact ``booking_reminders``
+row per offset — (booking_id, minutes_before, fire_at) — in the booking's
+own transaction. Nothing is rendered or queued up front. Cancelling or
+rescheduling a booking deletes its rows by primary key prefix.
+
+``fire_due`` advances the wheel: it claims every reminder whose firing
+time has passed (``FOR UPDATE SKIP LOCKED``), reloads the bookings in one
+query, renders each channel's template once for the whole batch through
+the compiled template cache, and inserts the resulting notifications in a
+single multi-row INSERT for the notification dispatcher to deliver.
+
+A reminder whose booking is no longer pending/confirmed, or whose
+appointment moved, is dropped when it fires, so a missed cancellation
+never sends a stale reminder.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, selectinload
+
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.booking_reminder import BookingReminder
+from backend.app.db.models.notifications import (
+    NotificationChannel,
+    NotificationEventType,
+    NotificationPreferences,
+    NotificationPriority,
+    NotificationQueue,
+    NotificationStatus,
+    NotificationTemplate,
+)
+from backend.app.db.models.professional import Professional
+from backend.app.services.template_cache import CompiledTemplateCache, template_cache
+
+logger = logging.getLogger(__name__)
+
+# Minutes before the appointment: 24h, 2h, 30min
+DEFAULT_REMINDER_OFFSETS = (1440, 120, 30)
+
+# Bookings that still expect their reminders
+REMINDABLE_STATUSES = (BookingStatus.PENDING, BookingStatus.CONFIRMED)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Normalize a datetime to aware UTC (naive values are UTC)."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def reminder_period(minutes_before: int) -> str:
+    """Human readable time left until the appointment."""
+    if minutes_before >= 1440:  # 24+ hours
+        hours = minutes_before // 60
+        return f"em {hours} horas" if hours > 1 else "amanhã"
+    if minutes_before >= 60:  # 1+ hours
+        hours = minutes_before // 60
+        return f"em {hours} horas" if hours > 1 else "em 1 hora"
+    return f"em {minutes_before} minutos"
+
+
+def reminder_context(booking: Booking, minutes_before: int) -> Dict[str, Any]:
+    """
+    Build the template context of a booking reminder.
+
+    Args:
+        booking: Booking with client, service and professional (user and
+            salon) loaded
+        minutes_before: Offset of the reminder
+
+    Returns:
+        Context data for template rendering
+    """
+    salon = booking.professional.salon
+    client = booking.client
+
+    return {
+        "user_name": client.full_name,
+        "user_email": client.email,
+        "user_phone": client.phone,
+        "salon_name": salon.name if salon else "eSalão",
+        "service_name": booking.service.name,
+        "service_price": f"{booking.service_price:.2f}",
+        "appointment_date": booking.scheduled_at.strftime("%d/%m/%Y"),
+        "appointment_time": booking.scheduled_at.strftime("%H:%M"),
+        "professional_name": booking.professional.user.full_name,
+        "unit_name": salon.name if salon else "Unidade não informada",
+        "unit_address": (
+            f"{salon.address_street}, {salon.address_number} - {salon.address_city}"
+            if salon else "Endereço não informado"
+        ),
+        "booking_id": str(booking.id),
+        "reminder_period": reminder_period(minutes_before),
+        "minutes_until_appointment": minutes_before,
+    }
+
+
+class ReminderScheduler:
+    """Schedules, cancels and fires booking reminders."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        templates: Optional[CompiledTemplateCache] = None,
+        locale: str = "pt_BR",
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            session: Database session
+            templates: Compiled template cache (default: process-wide cache)
+            locale: Locale of the reminder templates
+        """
+        self.session = session
+        self.templates = templates if templates is not None else template_cache
+        self.locale = locale
+
+    async def schedule(
+        self,
+        booking: Booking,
+        offsets: Iterable[int] = DEFAULT_REMINDER_OFFSETS,
+        now: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Replace a booking's reminders, skipping offsets already past.
+
+        Runs in the caller's transaction; nothing is committed.
+
+        Args:
+            booking: Booking to remind (must have an ID)
+            offsets: Minutes before the appointment to fire reminders
+            now: Reference time (default: current time)
+
+        Returns:
+            Scheduled reminders (booking_id, minutes_before, fire_at)
+        """
+        now = _as_utc(now or datetime.now(timezone.utc))
+        scheduled_at = _as_utc(booking.scheduled_at)
+
+        rows = []
+        for minutes_before in sorted(set(offsets), reverse=True):
+            fire_at = scheduled_at - timedelta(minutes=minutes_before)
+            if fire_at > now:
+                rows.append({
+                    "booking_id": booking.id,
+                    "minutes_before": minutes_before,
+                    "fire_at": fire_at,
+                })
+
+        await self.cancel(booking.id)
+        if rows:
+            await self.session.execute(insert(BookingReminder), rows)
+
+        return rows
+
+    async def cancel(self, booking_id: int) -> None:
+        """
+        Remove a booking's pending reminders.
+
+        Runs in the caller's transaction; nothing is committed.
+        """
+        await self.session.execute(
+            delete(BookingReminder).where(BookingReminder.booking_id == booking_id)
+        )
+
+    async def fire_due(self, now: Optional[datetime] = None, limit: int = 500) -> Dict[str, int]:
+        """
+        Fire up to limit due reminders and commit.
+
+        Args:
+            now: Reference time (default: current time)
+            limit: Maximum reminders claimed
+
+        Returns:
+            Counts of claimed reminders, stale reminders dropped and
+            notifications queued
+        """
+        now = _as_utc(now or datetime.now(timezone.utc))
+
+        result = await self.session.execute(
+            select(BookingReminder)
+            .where(BookingReminder.fire_at <= now)
+            .order_by(BookingReminder.fire_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        reminders = list(result.scalars().all())
+        stats = {"claimed": len(reminders), "stale": 0, "queued": 0}
+        if not reminders:
+            await self.session.commit()
+            return stats
+
+        await self.session.execute(
+            delete(BookingReminder).where(
+                tuple_(BookingReminder.booking_id, BookingReminder.minutes_before).in_(
+                    [(reminder.booking_id, reminder.minutes_before) for reminder in reminders]
+                )
+            )
+        )
+
+        bookings = await self._load_bookings({reminder.booking_id for reminder in reminders})
+        due = []
+        for reminder in reminders:
+            booking = bookings.get(reminder.booking_id)
+            if booking is None or not self._is_current(reminder, booking, now):
+                stats["stale"] += 1
+                continue
+            due.append((reminder, booking))
+
+        rows = await self._render(due, now)
+        if rows:
+            await self.session.execute(insert(NotificationQueue), rows)
+        stats["queued"] = len(rows)
+
+        await self.session.commit()
+        return stats
+
+    @staticmethod
+    def _is_current(reminder: BookingReminder, booking: Booking, now: datetime) -> bool:
+        """Check that the booking still expects this reminder."""
+        if booking.status not in REMINDABLE_STATUSES:
+            return False
+
+        scheduled_at = _as_utc(booking.scheduled_at)
+        if scheduled_at <= now:
+            return False
+
+        # A rescheduled booking whose old entry was not removed
+        return scheduled_at - timedelta(minutes=reminder.minutes_before) == _as_utc(reminder.fire_at)
+
+    async def _load_bookings(self, booking_ids: set[int]) -> Dict[int, Booking]:
+        """Load bookings with the relations the reminder context needs."""
+        result = await self.session.execute(
+            select(Booking)
+            .where(Booking.id.in_(booking_ids))
+            .options(
+                lazyload("*"),
+                selectinload(Booking.client).lazyload("*"),
+                selectinload(Booking.service).lazyload("*"),
+                selectinload(Booking.professional).options(
+                    lazyload("*"),
+                    selectinload(Professional.user).lazyload("*"),
+                    selectinload(Professional.salon).lazyload("*"),
+                ),
+            )
+        )
+        return {booking.id: booking for booking in result.scalars().all()}
+
+    async def _render(self, due: list[tuple[BookingReminder, Booking]], now: datetime) -> List[Dict[str, Any]]:
+        """Render the due reminders into notification queue rows."""
+        if not due:
+            return []
+
+        client_ids = {booking.client_id for _, booking in due}
+        result = await self.session.execute(
+            select(NotificationPreferences.user_id, NotificationPreferences.channel).where(
+                and_(
+                    NotificationPreferences.user_id.in_(client_ids),
+                    NotificationPreferences.event_type == NotificationEventType.BOOKING_REMINDER,
+                    NotificationPreferences.enabled == True,
+                )
+            )
+        )
+        channels_by_client: Dict[int, list[NotificationChannel]] = defaultdict(list)
+        for user_id, channel in result.all():
+            channels_by_client[user_id].append(channel)
+
+        result = await self.session.execute(
+            select(NotificationTemplate).where(
+                and_(
+                    NotificationTemplate.event_type == NotificationEventType.BOOKING_REMINDER,
+                    NotificationTemplate.locale == self.locale,
+                    NotificationTemplate.is_active == True,
+                )
+            )
+        )
+        templates = {template.channel: template for template in result.scalars().all()}
+
+        # Group by channel so each template is rendered in one pass
+        by_channel: Dict[NotificationChannel, list[tuple[BookingReminder, Booking]]] = defaultdict(list)
+        for reminder, booking in due:
+            for channel in channels_by_client.get(booking.client_id, ()):
+                if channel in templates:
+                    by_channel[channel].append((reminder, booking))
+                else:
+                    logger.warning(f"No booking reminder template for channel {channel}")
+
+        rows = []
+        for channel, items in by_channel.items():
+            template = templates[channel]
+            compiled = self.templates.get(template)
+
+            for reminder, booking in items:
+                context = reminder_context(booking, reminder.minutes_before)
+                try:
+                    rendered = compiled.render(context)
+                except Exception as e:
+                    logger.error(f"Failed to render reminder for booking {booking.id} on {channel}: {e}")
+                    continue
+
+                rows.append({
+                    "user_id": booking.client_id,
+                    "template_id": template.id,
+                    "channel": channel,
+                    "priority": NotificationPriority.NORMAL,
+                    "status": NotificationStatus.PENDING,
+                    "subject": rendered.get("subject"),
+                    "body": rendered["body"],
+                    "context_data": context,
+                    "scheduled_at": now,
+                    "correlation_id": f"booking_{booking.id}_reminder_{reminder.minutes_before}min",
+                })
+
+        return rows
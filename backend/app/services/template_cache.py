@@ -0,0 +1,130 @@
+"""
+Compiled notification template cache.
+
+Compiling a Jinja2 template is far more expensive than rendering it, and
+reminder campaigns render the same few templates over and over. Compiled
+subject/body pairs are kept in a process-wide LRU cache keyed by template
+ID and version (``updated_at``), so an edited template is recompiled even
+when the edit happened in another process. ``NotificationService`` also
+invalidates the entry explicitly when it updates a template.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment, Template
+
+from backend.app.core.config import settings
+from backend.app.db.models.notifications import NotificationTemplate
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Compiled subject and body of one template version."""
+
+    subject: Optional[Template]
+    body: Template
+
+    def render(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Render the subject (if any) and body with context data."""
+        rendered = {}
+        if self.subject is not None:
+            rendered["subject"] = self.subject.render(**context)
+        rendered["body"] = self.body.render(**context)
+        return rendered
+
+
+class CompiledTemplateCache:
+    """LRU cache of compiled notification templates."""
+
+    def __init__(self, maxsize: int = 256, environment: Optional[Environment] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of templates kept compiled
+            environment: Jinja2 environment used for compilation
+        """
+        self.maxsize = maxsize
+        # No autoescaping: bodies are plain text for SMS, push and WhatsApp
+        self.environment = environment or Environment(autoescape=False)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, tuple[Optional[datetime], CompiledTemplate]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def compile(self, subject: Optional[str], body: str) -> CompiledTemplate:
+        """
+        Compile template sources without caching.
+
+        Raises:
+            jinja2.TemplateSyntaxError: If a source is not a valid template
+        """
+        return CompiledTemplate(
+            subject=self.environment.from_string(subject) if subject else None,
+            body=self.environment.from_string(body),
+        )
+
+    def get(self, template: NotificationTemplate) -> CompiledTemplate:
+        """
+        Get the compiled form of a template, compiling it on a miss.
+
+        Args:
+            template: Template to compile
+
+        Returns:
+            Compiled subject and body
+        """
+        if template.id is None:
+            # Not persisted yet, so there is no stable key
+            return self.compile(template.subject, template.body_template)
+
+        version = template.updated_at
+        with self._lock:
+            entry = self._entries.get(template.id)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(template.id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        compiled = self.compile(template.subject, template.body_template)
+
+        with self._lock:
+            self._entries[template.id] = (version, compiled)
+            self._entries.move_to_end(template.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return compiled
+
+    def invalidate(self, template_id: int) -> None:
+        """Drop the compiled form of a template."""
+        with self._lock:
+            self._entries.pop(template_id, None)
+
+    def clear(self) -> None:
+        """Drop every compiled template."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+template_cache = CompiledTemplateCache(maxsize=settings.NOTIFICATION_TEMPLATE_CACHE_SIZE)
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from uuid import uuid4
 
 from backend.app.services.overbooking import OverbookingService
+from backend.app.services.overbooking_index import OverbookingConfigIndex
 from backend.app.db.models.overbooking import OverbookingConfig, OverbookingScope, OverbookingTimeframe
 from backend.app.db.models.booking import BookingStatus
 
@@ -52,18 +53,25 @@ class TestOverbookingService:
         return repo
 
     @pytest.fixture
-    def overbooking_service(self, mock_session, mock_booking_repo, mock_overbooking_repo):
+    def mock_config_index(self):
+        """Configuration index without Redis, resolving no configuration."""
+        index = OverbookingConfigIndex(redis_client=None)
+        index.get_effective_config = AsyncMock(return_value=None)
+        return index
+
+    @pytest.fixture
+    def overbooking_service(self, mock_session, mock_booking_repo, mock_overbooking_repo, mock_config_index):
         """Create overbooking service with mocked dependencies."""
-        service = OverbookingService(mock_session)
+        service = OverbookingService(mock_session, config_index=mock_config_index)
         service.booking_repo = mock_booking_repo
         service.overbooking_repo = mock_overbooking_repo
         return service
 
     @pytest.mark.asyncio
-    async def test_calculate_available_capacity_no_config(self, overbooking_service, mock_overbooking_repo, mock_booking_repo):
+    async def test_calculate_available_capacity_no_config(self, overbooking_service, mock_config_index, mock_booking_repo):
         """Test capacity calculation with no overbooking configuration."""
         # Setup - no config found
-        mock_overbooking_repo.get_effective_config.return_value = None
+        mock_config_index.get_effective_config.return_value = None
 
         # Mock overlapping bookings (this is what _count_current_bookings uses)
         mock_bookings_list = [{"id": "1"}, {"id": "2"}]  # 2 bookings
@@ -85,10 +93,10 @@ class TestOverbookingService:
         assert result["available_slots"] == 3
 
     @pytest.mark.asyncio
-    async def test_can_accept_booking_basic(self, overbooking_service, mock_overbooking_repo, mock_booking_repo):
+    async def test_can_accept_booking_basic(self, overbooking_service, mock_config_index, mock_booking_repo):
         """Test basic booking acceptance check."""
         # Setup - no config, should accept based on base capacity
-        mock_overbooking_repo.get_effective_config.return_value = None
+        mock_config_index.get_effective_config.return_value = None
         mock_booking_repo.find_overlapping_bookings.return_value = []  # No overlapping bookings
 
         target_datetime = datetime.utcnow()
@@ -105,7 +113,7 @@ class TestOverbookingService:
         assert isinstance(capacity_info, dict)
 
     @pytest.mark.asyncio
-    async def test_get_overbooking_status(self, overbooking_service, mock_overbooking_repo):
+    async def test_get_overbooking_status(self, overbooking_service, mock_config_index):
         """Test getting overbooking status."""
         # Setup mock config
         mock_config = OverbookingConfig(
@@ -116,7 +124,7 @@ class TestOverbookingService:
             max_overbooking_percentage=20.0,
             is_active=True
         )
-        mock_overbooking_repo.get_effective_config.return_value = mock_config
+        mock_config_index.get_effective_config.return_value = mock_config
 
         result = await overbooking_service.get_overbooking_status(
             professional_id=1,
@@ -9,7 +9,7 @@ from decimal import Decimal
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock
 from typing import Generator, AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
@@ -95,6 +95,29 @@ async def db_session():
     await engine.dispose()
 
 
+async def create_sqlite_tables(engine, *models) -> None:
+    """Create the tables of the given models (every table when none are given)."""
+    tables = [model.__table__ for model in models] or None
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+
+@pytest_asyncio.fixture(scope="function")
+async def sqlite_engine():
+    """Create an in-memory SQLite engine for repository-level tests."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def sqlite_session_maker(sqlite_engine):
+    """Create a session factory bound to the in-memory SQLite engine."""
+    return async_sessionmaker(sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session: AsyncSession):
     """Create test client with database session override."""
@@ -264,13 +264,24 @@ async def test_list_bookings_pagination(
     await db_session.commit()
 
     # Test pagination
-    response = await authenticated_client.get("/v1/bookings?page=1&page_size=3")
+    response = await authenticated_client.get("/v1/bookings?page_size=3")
 
     assert response.status_code == 200
     data = response.json()
-    assert data["page"] == 1
     assert data["page_size"] == 3
     assert len(data["bookings"]) <= 3
+    assert data["next_cursor"] is not None
+
+    # Follow the cursor to the next page
+    response = await authenticated_client.get(
+        f"/v1/bookings?page_size=3&cursor={data['next_cursor']}"
+    )
+
+    assert response.status_code == 200
+    next_page = response.json()
+    assert next_page["total"] is None
+    first_ids = {b["id"] for b in data["bookings"]}
+    assert not first_ids & {b["id"] for b in next_page["bookings"]}
 
 
 @pytest.mark.asyncio
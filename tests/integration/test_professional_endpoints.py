@@ -233,7 +233,7 @@ async def test_list_professionals(
     result = response.json()
     assert "professionals" in result
     assert "total" in result
-    assert "page" in result
+    assert "next_cursor" in result
     assert "page_size" in result
     assert len(result["professionals"]) >= 1
     assert result["professionals"][0]["salon_id"] == test_professional_data["salon"].id
@@ -1,9 +1,6 @@
 """Tests for metrics collection."""
 
-import pytest
 from unittest.mock import MagicMock, patch
-from starlette.requests import Request
-from starlette.responses import Response
 
 from backend.app.core.metrics import (
     PrometheusMiddleware,
@@ -32,28 +29,36 @@ class TestPrometheusMetrics:
 
         assert middleware.app == app
 
-    @pytest.mark.asyncio
-    async def test_middleware_dispatch(self):
-        """Test middleware dispatch functionality."""
-        app = MagicMock()
-        middleware = PrometheusMiddleware(app)
+    def test_middleware_labels_by_route_template(self):
+        """Requests are labelled by route template, not by raw path."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+
+        @app.get("/metrics-test/items/{item_id}")
+        async def read_item(item_id: int):
+            return {"item_id": item_id}
+
+        app.add_middleware(PrometheusMiddleware)
+        client = TestClient(app)
 
-        # Mock request
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-        request.url.path = "/test"
+        def count(endpoint, status_code):
+            return registry.get_sample_value(
+                "http_requests_total",
+                {"method": "GET", "endpoint": endpoint, "status_code": status_code},
+            ) or 0
 
-        # Mock call_next
-        async def call_next(request):
-            response = MagicMock(spec=Response)
-            response.status_code = 200
-            return response
+        before = count("/metrics-test/items/{item_id}", "200")
+        unmatched_before = count("<unmatched>", "404")
 
-        # Call dispatch
-        response = await middleware.dispatch(request, call_next)
+        for item_id in (1, 2, 3):
+            assert client.get(f"/metrics-test/items/{item_id}").status_code == 200
+        assert client.get("/metrics-test/unknown/42").status_code == 404
 
-        # Verify response
-        assert response.status_code == 200
+        assert count("/metrics-test/items/{item_id}", "200") == before + 3
+        assert count("<unmatched>", "404") == unmatched_before + 1
+        assert count("/metrics-test/items/1", "200") == 0
 
 
 class TestMetricsEndpoint:
@@ -0,0 +1,143 @@
+"""Unit tests for the async report cache."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from backend.app.core.performance.reporting import ReportCache
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+def counting_compute(value, delay=0.0):
+    """Report computation that records how often it ran."""
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return value
+
+    return compute, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation():
+    """A burst of misses for the same report runs the query once."""
+    cache = ReportCache(redis_client=FakeRedis())
+    compute, calls = counting_compute({"total": 1}, delay=0.05)
+
+    results = await asyncio.gather(*[
+        cache.get_or_compute("dashboard", {"salon_id": "1"}, compute) for _ in range(20)
+    ])
+
+    assert len(calls) == 1
+    assert all(result == {"total": 1} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing():
+    """Callers get the stale entry while one of them recomputes it."""
+    redis = FakeRedis()
+    cache = ReportCache(redis_client=redis)
+    await cache.get_or_compute("dashboard", {}, counting_compute({"total": 1})[0])
+
+    key = next(key for key in redis.data if key.startswith("reports:dashboard:"))
+    entry = json.loads(redis.data[key])
+    entry["fresh_until"] = time.time() - 1
+    redis.data[key] = json.dumps(entry)
+
+    compute, calls = counting_compute({"total": 2}, delay=0.05)
+    refresher = asyncio.create_task(cache.get_or_compute("dashboard", {}, compute))
+    await asyncio.sleep(0.01)
+
+    assert await cache.get_or_compute("dashboard", {}, compute) == {"total": 1}
+    assert await refresher == {"total": 2}
+    assert len(calls) == 1
+    assert await cache.get_or_compute("dashboard", {}, compute) == {"total": 2}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_version_instead_of_deleting_keys():
+    """Invalidating a report makes its old entries unreachable."""
+    cache = ReportCache(redis_client=FakeRedis())
+    await cache.get_or_compute("dashboard", {}, counting_compute({"total": 1})[0])
+    await cache.get_or_compute("booking_metrics", {}, counting_compute({"total": 1})[0])
+
+    await cache.invalidate("dashboard")
+
+    dashboard, dashboard_calls = counting_compute({"total": 2})
+    bookings, booking_calls = counting_compute({"total": 2})
+    assert await cache.get_or_compute("dashboard", {}, dashboard) == {"total": 2}
+    assert await cache.get_or_compute("booking_metrics", {}, bookings) == {"total": 1}
+    assert (len(dashboard_calls), len(booking_calls)) == (1, 0)
+
+    await cache.invalidate(ReportCache.ALL)
+
+    assert await cache.get_or_compute("booking_metrics", {}, bookings) == {"total": 2}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached_and_reach_waiters():
+    """A failing computation propagates to every coalesced caller."""
+    cache = ReportCache(redis_client=FakeRedis())
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("query failed")
+
+    results = await asyncio.gather(
+        *[cache.get_or_compute("dashboard", {}, failing) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    compute, calls = counting_compute({"total": 1})
+    assert await cache.get_or_compute("dashboard", {}, compute) == {"total": 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_computing():
+    """An unreachable Redis bypasses the cache instead of failing the request."""
+    redis = FakeRedis()
+
+    async def broken(*args, **kwargs):
+        raise ConnectionError("down")
+
+    redis.mget = broken
+    cache = ReportCache(redis_client=redis)
+    compute, calls = counting_compute({"total": 1})
+
+    assert await cache.get_or_compute("dashboard", {}, compute) == {"total": 1}
+    assert await cache.get_or_compute("dashboard", {}, compute) == {"total": 1}
+    assert len(calls) == 2
@@ -0,0 +1,161 @@
+"""Unit tests for the availability cache."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.app.db.models.booking import BookingStatus
+from backend.app.db.repositories.booking import BookingRepository
+from backend.app.domain.scheduling.cache import AvailabilityCache
+from backend.app.domain.scheduling.services.slot_engine import FreeInterval
+from tests.conftest import create_sqlite_tables
+
+MONDAY = date(2025, 10, 20)
+TUESDAY = date(2025, 10, 21)
+INTERVALS = [FreeInterval(540, 600, 540), FreeInterval(660, 1020, 540)]
+
+
+def make_redis(hget_values: list | None = None) -> MagicMock:
+    """Create a Redis client mock whose pipeline returns the given values."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=hget_values or [])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    redis_client.hdel = AsyncMock()
+    redis_client.delete = AsyncMock()
+    return redis_client
+
+
+@pytest.mark.asyncio
+async def test_l1_round_trip_and_invalidation():
+    """Entries are served from L1 until their date is invalidated."""
+    cache = AvailabilityCache(redis_client=None)
+
+    await cache.set(1, MONDAY, INTERVALS)
+    assert await cache.get(1, MONDAY) == INTERVALS
+
+    await cache.invalidate(1, [MONDAY])
+    assert await cache.get(1, MONDAY) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_professional_drops_every_date():
+    """Availability changes drop every cached date of the professional."""
+    cache = AvailabilityCache(redis_client=None)
+    await cache.set_many({(1, MONDAY): INTERVALS, (1, TUESDAY): [], (2, MONDAY): []})
+
+    await cache.invalidate_professional(1)
+
+    found = await cache.get_many([(1, MONDAY), (1, TUESDAY), (2, MONDAY)])
+    assert found == {(2, MONDAY): []}
+
+
+@pytest.mark.asyncio
+async def test_l1_lru_eviction():
+    """The least recently used entry is evicted when L1 is full."""
+    cache = AvailabilityCache(redis_client=None, l1_max_entries=2)
+
+    await cache.set(1, MONDAY, [])
+    await cache.set(2, MONDAY, [])
+    await cache.get(1, MONDAY)
+    await cache.set(3, MONDAY, [])
+
+    assert await cache.get(2, MONDAY) is None
+    assert await cache.get(1, MONDAY) == []
+
+
+@pytest.mark.asyncio
+async def test_l2_hit_populates_l1():
+    """Redis hits are deserialized and kept in L1."""
+    redis_client = make_redis(['[[540, 600, 540], [660, 1020, 540]]', None])
+    cache = AvailabilityCache(redis_client=redis_client)
+
+    found = await cache.get_many([(1, MONDAY), (1, TUESDAY)])
+
+    assert found == {(1, MONDAY): INTERVALS}
+    redis_client.pipeline.return_value.hget.assert_any_call(
+        "availability:free:1", "2025-10-20"
+    )
+
+    # Second read does not touch Redis
+    redis_client.pipeline.reset_mock()
+    assert await cache.get(1, MONDAY) == INTERVALS
+    redis_client.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_deletes_hash_fields():
+    """Date invalidation removes only the touched fields of the hash."""
+    redis_client = make_redis()
+    cache = AvailabilityCache(redis_client=redis_client)
+
+    await cache.invalidate(1, [MONDAY, TUESDAY])
+    await cache.invalidate_professional(2)
+
+    fields = redis_client.hdel.await_args.args
+    assert fields[0] == "availability:free:1"
+    assert sorted(fields[1:]) == ["2025-10-20", "2025-10-21"]
+    redis_client.delete.assert_awaited_once_with("availability:free:2")
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_l1():
+    """Redis failures never propagate and trigger a back-off."""
+    redis_client = make_redis()
+    redis_client.pipeline.return_value.execute = AsyncMock(side_effect=ConnectionError("down"))
+    cache = AvailabilityCache(redis_client=redis_client)
+
+    assert await cache.get(1, MONDAY) is None
+    await cache.set(1, MONDAY, INTERVALS)
+
+    assert await cache.get(1, MONDAY) == INTERVALS
+    assert redis_client.pipeline.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_misses():
+    """A disabled cache ignores writes."""
+    cache = AvailabilityCache(redis_client=None, enabled=False)
+
+    await cache.set(1, MONDAY, INTERVALS)
+
+    assert await cache.get(1, MONDAY) is None
+
+
+@pytest.mark.asyncio
+async def test_booking_writes_invalidate_on_commit(sqlite_engine, sqlite_session_maker):
+    """Agenda days written by a transaction are dropped at commit, not at flush."""
+    # Every table: refreshed bookings eager-load payments, reviews, etc.
+    await create_sqlite_tables(sqlite_engine)
+
+    scheduled_at = datetime(2025, 10, 20, 10, 0)
+    with patch(
+        "backend.app.domain.scheduling.cache.availability_cache.invalidate",
+        new_callable=AsyncMock,
+    ) as invalidate:
+        async with sqlite_session_maker() as session:
+            repo = BookingRepository(session)
+            booking = await repo.create(
+                client_id=10, professional_id=1, service_id=1, scheduled_at=scheduled_at,
+                duration_minutes=60, service_price=100,
+            )
+            invalidate.assert_not_awaited()
+
+            await session.commit()
+            invalidate.assert_awaited_once_with(1, {MONDAY})
+
+            # Moving a booking frees its old day and takes the new one
+            invalidate.reset_mock()
+            await repo.update(booking.id, scheduled_at=scheduled_at + timedelta(days=1))
+            invalidate.assert_awaited_once_with(1, {MONDAY, TUESDAY})
+
+            # Rolled back writes invalidate nothing
+            invalidate.reset_mock()
+            booking.status = BookingStatus.CANCELLED
+            await session.flush()
+            await session.rollback()
+            invalidate.assert_not_awaited()
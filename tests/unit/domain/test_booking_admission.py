@@ -0,0 +1,129 @@
+"""Unit tests for BookingAdmissionService."""
+
+from datetime import datetime, time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.core.exceptions import ConflictError
+from backend.app.db.models.availability import Availability, DayOfWeek
+from backend.app.db.models.service import Service
+from backend.app.domain.scheduling.cache import AvailabilityCache
+from backend.app.domain.scheduling.services.booking_admission import BookingAdmissionService
+from backend.app.domain.scheduling.services.slot_service import SlotService
+
+
+@pytest.fixture
+def admission_service():
+    """Create BookingAdmissionService with mocked session and repositories."""
+    slot_service = SlotService(AsyncMock(), availability_cache=AvailabilityCache(redis_client=None))
+
+    availability = MagicMock(spec=Availability)
+    availability.day_of_week = DayOfWeek.MONDAY
+    availability.start_time = time(9, 0)
+    availability.end_time = time(17, 0)
+
+    slot_service.availability_repo.list_active_by_professional_and_day = AsyncMock(
+        return_value=[availability]
+    )
+    slot_service.booking_repo.lock_professional_agenda = AsyncMock()
+    slot_service.booking_repo.check_conflict = AsyncMock(return_value=False)
+    slot_service.booking_repo.create = AsyncMock(side_effect=lambda **kwargs: kwargs)
+
+    return BookingAdmissionService(slot_service.session, slot_service=slot_service)
+
+
+@pytest.fixture
+def sample_service():
+    """Sample 60-minute service."""
+    service = MagicMock(spec=Service)
+    service.id = 1
+    service.duration_minutes = 60
+    service.price = 50.0
+    return service
+
+
+@pytest.mark.asyncio
+async def test_admit_locks_before_checking_and_creates(admission_service, sample_service):
+    """The agenda lock is taken before the check, and the booking is created."""
+    calls = []
+    repo = admission_service.booking_repo
+    repo.lock_professional_agenda.side_effect = lambda *args: calls.append("lock")
+    repo.check_conflict.side_effect = lambda **kwargs: calls.append("check") or False
+
+    booking = await admission_service.admit(
+        client_id=5,
+        professional_id=1,
+        service=sample_service,
+        scheduled_at=datetime(2025, 10, 20, 10, 0),
+    )
+
+    assert calls == ["lock", "check"]
+    repo.lock_professional_agenda.assert_awaited_once_with(1)
+    assert booking["duration_minutes"] == 60
+    assert booking["service_price"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_conflicting_interval(admission_service, sample_service):
+    """An overlapping booking raises ConflictError and nothing is created."""
+    admission_service.booking_repo.check_conflict = AsyncMock(return_value=True)
+
+    with pytest.raises(ConflictError, match="not available"):
+        await admission_service.admit(
+            client_id=5,
+            professional_id=1,
+            service=sample_service,
+            scheduled_at=datetime(2025, 10, 20, 10, 0),
+        )
+
+    admission_service.booking_repo.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_interval_outside_working_hours(admission_service, sample_service):
+    """Intervals that overflow the availability window are rejected."""
+    with pytest.raises(ConflictError):
+        await admission_service.admit(
+            client_id=5,
+            professional_id=1,
+            service=sample_service,
+            scheduled_at=datetime(2025, 10, 20, 16, 30),
+        )
+
+    admission_service.booking_repo.check_conflict.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_start_off_the_slot_grid(admission_service, sample_service):
+    """Only slot starts on the window's service-duration grid are accepted."""
+    with pytest.raises(ConflictError):
+        await admission_service.admit(
+            client_id=5,
+            professional_id=1,
+            service=sample_service,
+            scheduled_at=datetime(2025, 10, 20, 9, 7),
+        )
+
+    admission_service.booking_repo.check_conflict.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_admit_uses_overbooking_capacity_when_allowed(admission_service, sample_service):
+    """Overlapping bookings are accepted within overbooking capacity."""
+    admission_service.booking_repo.check_conflict = AsyncMock(return_value=True)
+    overbooking = admission_service.slot_service.overbooking_service
+    overbooking.can_accept_booking = AsyncMock(return_value=(True, {}))
+
+    await admission_service.admit(
+        client_id=5,
+        professional_id=1,
+        service=sample_service,
+        scheduled_at=datetime(2025, 10, 20, 10, 0),
+        allow_overbooking=True,
+        salon_id=3,
+    )
+
+    overbooking.can_accept_booking.assert_awaited_once()
+    assert overbooking.can_accept_booking.await_args.kwargs["salon_id"] == 3
+    admission_service.booking_repo.create.assert_awaited_once()
@@ -0,0 +1,217 @@
+"""Tests for the incremental daily booking rollups."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.payment import Payment, PaymentStatus
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.reporting_rollup import (
+    BookingDailyRollup,
+    NoShowDailyRollup,
+    RollupDirtyDay,
+)
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from backend.app.domain.reporting import DailyRollupService
+from backend.app.domain.reporting.rollups import claim_rollup_days, rebuild_rollups
+from tests.conftest import create_sqlite_tables
+
+DAY = datetime(2025, 10, 20, 10, 0)
+
+
+@pytest_asyncio.fixture
+async def rollup_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with two salons, one professional each."""
+    await create_sqlite_tables(
+        sqlite_engine, User, Salon, Professional, Service, Booking, Payment,
+        BookingDailyRollup, NoShowDailyRollup, RollupDirtyDay,
+    )
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": f"User {user_id}", "role": role, "is_active": True, "is_verified": True}
+            for user_id, role in [(1, UserRole.PROFESSIONAL), (2, UserRole.PROFESSIONAL),
+                                  (10, UserRole.CLIENT)]
+        ])
+        await conn.execute(insert(Salon), [
+            {"id": salon_id, "name": name, "cnpj": f"0000000000000{salon_id}",
+             "phone": "11999999999", "address_street": "Rua A", "address_number": "1",
+             "address_neighborhood": "Centro", "address_city": "São Paulo",
+             "address_state": "SP", "address_zipcode": "01000000", "is_active": True,
+             "owner_id": 1}
+            for salon_id, name in [(1, "Salon One"), (2, "Salon Two")]
+        ])
+        await conn.execute(insert(Professional), [
+            {"id": pid, "user_id": pid, "salon_id": pid, "specialties": [], "is_active": True,
+             "commission_percentage": 50.0}
+            for pid in (1, 2)
+        ])
+        await conn.execute(insert(Service), [
+            {"id": 1, "salon_id": 1, "name": "Haircut", "duration_minutes": 60,
+             "price": 100, "category": "hair", "is_active": True, "requires_deposit": False},
+            {"id": 2, "salon_id": 2, "name": "Manicure", "duration_minutes": 30,
+             "price": 40, "category": "nails", "is_active": True, "requires_deposit": False},
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+def make_booking(professional_id, service_id, status, price, when=DAY):
+    """Build a booking for client 10."""
+    return Booking(
+        professional_id=professional_id, client_id=10, service_id=service_id,
+        status=status, service_price=price, duration_minutes=60, scheduled_at=when,
+    )
+
+
+async def dirty_days(session):
+    """Queued (day, professional) pairs."""
+    rows = await session.execute(select(RollupDirtyDay.rollup_date, RollupDirtyDay.professional_id))
+    return set(rows.all())
+
+
+async def apply_rollups(session):
+    """Drain the rebuild queue like the Celery task does."""
+    def apply(sync_session):
+        while keys := claim_rollup_days(sync_session, 100):
+            rebuild_rollups(sync_session, keys)
+
+    await session.run_sync(apply)
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_flush_queues_old_and_new_days_of_a_booking(rollup_session):
+    """Creating and rescheduling a booking queues every day it touched."""
+    booking = make_booking(1, 1, BookingStatus.CONFIRMED, 100)
+    rollup_session.add(booking)
+    await rollup_session.commit()
+
+    assert await dirty_days(rollup_session) == {(DAY.date(), 1)}
+
+    booking.scheduled_at = DAY + timedelta(days=3)
+    await rollup_session.commit()
+
+    assert await dirty_days(rollup_session) == {
+        (DAY.date(), 1),
+        ((DAY + timedelta(days=3)).date(), 1),
+    }
+
+
+@pytest.mark.asyncio
+async def test_irrelevant_change_does_not_queue_days(rollup_session):
+    """Changing a column the rollups do not use leaves the queue alone."""
+    booking = make_booking(1, 1, BookingStatus.CONFIRMED, 100)
+    rollup_session.add(booking)
+    await rollup_session.commit()
+    await apply_rollups(rollup_session)
+
+    booking.notes = "Bring reference photo"
+    await rollup_session.commit()
+
+    assert await dirty_days(rollup_session) == set()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_aggregates_bookings_and_payments(rollup_session):
+    """Late status changes and payments are re-aggregated into their day."""
+    completed = make_booking(1, 1, BookingStatus.COMPLETED, 100)
+    cancelled = make_booking(1, 1, BookingStatus.CANCELLED, 100)
+    rollup_session.add_all([completed, cancelled])
+    await rollup_session.commit()
+    await apply_rollups(rollup_session)
+
+    rollup_session.add(Payment(
+        provider_name="mock", provider_payment_id="p1", amount=100, currency="BRL",
+        payment_method="pix", status=PaymentStatus.SUCCEEDED.value, booking_id=completed.id,
+        user_id=10, webhook_events_count=0,
+    ))
+    cancelled.status = BookingStatus.NO_SHOW
+    await rollup_session.commit()
+    await apply_rollups(rollup_session)
+
+    rollup = await rollup_session.scalar(select(BookingDailyRollup))
+    assert rollup.rollup_date == date(2025, 10, 20)
+    assert rollup.salon_id == 1
+    assert rollup.total_bookings == 2
+    assert rollup.completed_bookings == 1
+    assert rollup.cancelled_bookings == 0
+    assert rollup.no_show_bookings == 1
+    assert float(rollup.completed_revenue) == 100.0
+    assert float(rollup.paid_amount) == 100.0
+    assert await dirty_days(rollup_session) == set()
+
+
+@pytest.mark.asyncio
+async def test_salon_performance_and_category_analytics(rollup_session):
+    """Both platform reports read the rollups, including idle salons."""
+    rollup_session.add_all([
+        make_booking(1, 1, BookingStatus.COMPLETED, 100),
+        make_booking(1, 1, BookingStatus.COMPLETED, 100, DAY + timedelta(days=1)),
+        make_booking(2, 2, BookingStatus.CANCELLED, 40),
+    ])
+    await rollup_session.commit()
+    await apply_rollups(rollup_session)
+    service = DailyRollupService(rollup_session)
+    period = (DAY - timedelta(days=7), DAY + timedelta(days=7))
+
+    salons = await service.get_salon_performance(*period, sort_by="revenue")
+
+    assert [s["salon_id"] for s in salons] == [1, 2]
+    assert salons[0]["total_bookings"] == 2
+    assert salons[0]["completion_rate"] == 100.0
+    assert salons[0]["total_revenue"] == 200.0
+    assert salons[0]["client_count"] == 1
+    assert salons[1]["total_revenue"] == 0.0
+
+    categories = await service.get_category_analytics(*period)
+
+    assert [c["category"] for c in categories] == ["hair", "nails"]
+    assert categories[0]["total_bookings"] == 2
+    assert categories[1]["total_revenue"] == 0.0
+
+    with pytest.raises(ValueError):
+        await service.get_salon_performance(*period, sort_by="name")
+
+
+@pytest.mark.asyncio
+async def test_no_show_statistics_follow_status_changes(rollup_session):
+    """No-show counts, fees and reasons are summed over the days of a window."""
+    late = make_booking(1, 1, BookingStatus.CONFIRMED, 100)
+    rollup_session.add_all([
+        late,
+        make_booking(1, 1, BookingStatus.COMPLETED, 100, DAY - timedelta(days=1)),
+        make_booking(1, 1, BookingStatus.COMPLETED, 100, DAY - timedelta(days=40)),
+        make_booking(2, 2, BookingStatus.NO_SHOW, 40),
+    ])
+    await rollup_session.commit()
+    await apply_rollups(rollup_session)
+
+    late.status = BookingStatus.NO_SHOW
+    late.no_show_reason = "client_no_show"
+    late.no_show_fee_amount = 50
+    await rollup_session.commit()
+    await apply_rollups(rollup_session)
+    service = DailyRollupService(rollup_session)
+    window = (DAY - timedelta(days=30), DAY)
+
+    totals = await service.get_no_show_totals(*window, professional_id=1)
+
+    assert totals["total_bookings"] == 2
+    assert totals["no_show_bookings"] == 1
+    assert totals["no_show_rate"] == 50.0
+
+    assert await service.get_no_show_reasons(*window) == {
+        "client_no_show": {"no_shows": 1, "fees": 50.0},
+        "unknown": {"no_shows": 1, "fees": 0.0},
+    }
+    assert await service.get_no_show_reasons(*window, salon_id=2) == {
+        "unknown": {"no_shows": 1, "fees": 0.0},
+    }
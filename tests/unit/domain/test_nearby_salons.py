@@ -0,0 +1,93 @@
+"""Tests for the nearest-salon lookup."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.user import User, UserRole
+from backend.app.domain.search.nearby import NearbySalonService, bounding_box, haversine_km
+from tests.conftest import create_sqlite_tables
+
+# Praça da Sé, São Paulo
+ORIGIN = (-23.5503, -46.6339)
+
+
+@pytest_asyncio.fixture
+async def geo_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with salons at increasing distances."""
+    await create_sqlite_tables(sqlite_engine, User, Salon, Professional)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": f"User {user_id}", "role": UserRole.PROFESSIONAL, "is_active": True,
+             "is_verified": True}
+            for user_id in (1, 2, 3)
+        ])
+        await conn.execute(insert(Salon), [
+            {"id": salon_id, "name": f"Salon {salon_id}", "cnpj": f"0000000000000{salon_id}",
+             "phone": "11999999999", "address_street": "Rua A", "address_number": "1",
+             "address_neighborhood": "Centro", "address_city": "São Paulo",
+             "address_state": "SP", "address_zipcode": "01000000", "is_active": is_active,
+             "owner_id": 1, "latitude": latitude, "longitude": longitude}
+            for salon_id, latitude, longitude, is_active in [
+                (1, -23.5614, -46.6559, True),   # ~2.6 km
+                (2, -23.5505, -46.6333, True),   # ~0.1 km
+                (3, -23.5558, -46.6396, True),   # ~0.8 km
+                (4, -23.5510, -46.6340, False),  # inactive
+                (5, -22.9068, -43.1729, True),   # Rio de Janeiro
+                (6, None, None, True),           # no coordinates
+            ]
+        ])
+        await conn.execute(insert(Professional), [
+            {"id": salon_id, "user_id": salon_id, "salon_id": salon_id, "specialties": [],
+             "is_active": True, "commission_percentage": 50.0}
+            for salon_id in (1, 2, 3)
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+def test_bounding_box_contains_radius():
+    """A point on the circle lies inside the box and distances are sane."""
+    assert haversine_km(*ORIGIN, -22.9068, -43.1729) == pytest.approx(361, abs=5)
+
+    min_lat, max_lat, min_lon, max_lon = bounding_box(*ORIGIN, 10)
+    assert haversine_km(*ORIGIN, max_lat, ORIGIN[1]) == pytest.approx(10, rel=1e-6)
+    assert haversine_km(*ORIGIN, ORIGIN[0], max_lon) == pytest.approx(10, rel=1e-3)
+    assert min_lat < ORIGIN[0] < max_lat and min_lon < ORIGIN[1] < max_lon
+
+
+@pytest.mark.asyncio
+async def test_nearby_salons_stream_in_distance_order(geo_session):
+    """Active salons with coordinates come nearest first, within the radius."""
+    service = NearbySalonService(geo_session, slot_service=AsyncMock())
+
+    salons = [salon async for salon in service.iter_nearby(*ORIGIN, radius_km=5)]
+
+    assert [salon.salon_id for salon in salons] == [2, 3, 1]
+    assert salons[0].distance_km < salons[1].distance_km < salons[2].distance_km
+
+    nearest = await service.find_nearby(*ORIGIN, radius_km=5, limit=2)
+    assert [salon.salon_id for salon in nearest] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_nearby_salons_available_now(geo_session):
+    """Only salons with a free professional are kept, one check per ring."""
+    slot_service = AsyncMock()
+    slot_service.list_professionals_free_after.return_value = {1, 3}
+    service = NearbySalonService(geo_session, slot_service=slot_service)
+    now = datetime(2025, 10, 20, 15, 0)
+
+    salons = await service.find_nearby(*ORIGIN, radius_km=5, limit=5, available_after=now)
+
+    assert [salon.salon_id for salon in salons] == [3, 1]
+    # Only the 1 km ring (salons 2, 3) and the 4 km ring (salon 1) hold salons
+    assert slot_service.list_professionals_free_after.await_count == 2
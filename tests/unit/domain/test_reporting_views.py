@@ -0,0 +1,103 @@
+"""Unit tests for ReportingViewService."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.app.domain.reporting import ReportingViewService
+
+
+def make_session(rows):
+    """Create a session mock whose execute() returns the given rows."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute.return_value = result
+    return session
+
+
+@pytest.mark.asyncio
+async def test_freshness_uses_oldest_refresh():
+    """Data combined from several views is as old as the oldest one."""
+    now = datetime.now(timezone.utc)
+    session = make_session([
+        ("booking_metrics_mv", now - timedelta(minutes=5)),
+        ("customer_analytics_mv", now - timedelta(hours=2)),
+    ])
+    service = ReportingViewService(session, max_staleness_seconds=3600)
+
+    freshness = await service.get_freshness("booking_metrics_mv", "customer_analytics_mv")
+
+    assert freshness.refreshed_at == now - timedelta(hours=2)
+    assert freshness.age_seconds >= 7200
+    assert freshness.is_stale
+
+
+@pytest.mark.asyncio
+async def test_freshness_of_recent_refresh_is_not_stale():
+    """A refresh within the allowed staleness is reported as fresh."""
+    refreshed_at = datetime.utcnow() - timedelta(minutes=1)  # naive, treated as UTC
+    service = ReportingViewService(
+        make_session([("booking_metrics_mv", refreshed_at)]), max_staleness_seconds=3600
+    )
+
+    freshness = await service.get_freshness("booking_metrics_mv")
+
+    assert freshness.refreshed_at.tzinfo is not None
+    assert not freshness.is_stale
+
+
+@pytest.mark.asyncio
+async def test_freshness_of_never_refreshed_view_is_stale():
+    """A view without a recorded refresh is stale."""
+    service = ReportingViewService(make_session([]))
+
+    freshness = await service.get_freshness("booking_metrics_mv")
+
+    assert freshness.refreshed_at is None
+    assert freshness.is_stale
+
+
+@pytest.mark.asyncio
+async def test_booking_trend_reads_view_grouped_by_period():
+    """Trends aggregate booking_metrics_mv instead of the bookings table."""
+    row = MagicMock(
+        period=datetime(2025, 10, 1),
+        total_bookings=10,
+        completed_bookings=7,
+        cancelled_bookings=2,
+        no_show_bookings=1,
+        confirmed_bookings=0,
+        revenue=700,
+    )
+    session = make_session([row])
+    service = ReportingViewService(session)
+
+    trend = await service.get_booking_trend(
+        datetime(2025, 10, 1), datetime(2025, 10, 31), granularity="month", salon_id=3
+    )
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "FROM booking_metrics_mv" in sql
+    assert "bookings " not in sql.replace("booking_metrics_mv", "")
+    assert "GROUP BY date_trunc('month', booking_metrics_mv.metric_date)" in sql
+    assert trend == [{
+        "period": datetime(2025, 10, 1),
+        "total_bookings": 10,
+        "completed_bookings": 7,
+        "cancelled_bookings": 2,
+        "no_show_bookings": 1,
+        "confirmed_bookings": 0,
+        "revenue": 700.0,
+    }]
+
+
+@pytest.mark.asyncio
+async def test_booking_trend_rejects_unknown_granularity():
+    """Only day, week and month granularities are accepted."""
+    service = ReportingViewService(make_session([]))
+
+    with pytest.raises(ValueError):
+        await service.get_booking_trend(datetime(2025, 10, 1), datetime(2025, 10, 2), "hour")
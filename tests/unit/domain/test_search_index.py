@@ -0,0 +1,159 @@
+"""Tests for the salon discovery search index."""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.review import Review, ReviewStatus
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.search_document import SalonSearchDocument, SearchDirtySalon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from backend.app.domain.search import SalonSearchService
+from backend.app.domain.search.index import claim_search_salons, rebuild_search_documents
+from tests.conftest import create_sqlite_tables
+
+
+@pytest_asyncio.fixture
+async def search_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with two salons, one professional each."""
+    # Every table: loaded users eager-load reviews, payments, etc.
+    await create_sqlite_tables(sqlite_engine)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": name, "role": role, "is_active": True, "is_verified": True}
+            for user_id, name, role in [(1, "Ana Souza", UserRole.PROFESSIONAL),
+                                        (2, "Bruno Lima", UserRole.PROFESSIONAL),
+                                        (10, "Client", UserRole.CLIENT)]
+        ])
+        await conn.execute(insert(Salon), [
+            {"id": salon_id, "name": name, "cnpj": f"0000000000000{salon_id}",
+             "phone": "11999999999", "address_street": "Rua A", "address_number": "1",
+             "address_neighborhood": "Centro", "address_city": city,
+             "address_state": "SP", "address_zipcode": "01000000", "is_active": True,
+             "owner_id": 1}
+            for salon_id, name, city in [(1, "Studio Bela", "São Paulo"), (2, "Unhas & Cia", "Campinas")]
+        ])
+        await conn.execute(insert(Professional), [
+            {"id": 1, "user_id": 1, "salon_id": 1, "specialties": ["coloração"], "is_active": True,
+             "commission_percentage": 50.0},
+            {"id": 2, "user_id": 2, "salon_id": 2, "specialties": [], "is_active": True,
+             "commission_percentage": 50.0},
+        ])
+        await conn.execute(insert(Service), [
+            {"id": 1, "salon_id": 1, "name": "Corte feminino", "duration_minutes": 60,
+             "price": 120, "category": "Hair", "is_active": True, "requires_deposit": False},
+            {"id": 2, "salon_id": 1, "name": "Escova", "duration_minutes": 45,
+             "price": 60, "category": "Hair", "is_active": True, "requires_deposit": False},
+            {"id": 3, "salon_id": 2, "name": "Manicure", "duration_minutes": 30,
+             "price": 40, "category": "Nails", "is_active": True, "requires_deposit": False},
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+def make_review(salon_id, rating, booking_id, status=ReviewStatus.APPROVED):
+    """Build a review of professional 1 by client 10."""
+    return Review(
+        uuid=str(uuid4()), booking_id=booking_id, client_id=10, professional_id=1,
+        salon_id=salon_id, service_id=1, rating=rating, status=status.value,
+    )
+
+
+async def dirty_salons(session):
+    """Queued salon IDs."""
+    return set((await session.execute(select(SearchDirtySalon.salon_id))).scalars().all())
+
+
+async def apply_index(session):
+    """Drain the reindex queue like the Celery task does."""
+    def apply(sync_session):
+        while salon_ids := claim_search_salons(sync_session, 100):
+            rebuild_search_documents(sync_session, salon_ids)
+
+    await session.run_sync(apply)
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_writes_queue_their_salons(search_session):
+    """Catalog, review and professional name changes queue the salon."""
+    service = await search_session.get(Service, 3)
+    service.price = 45
+    search_session.add(make_review(1, 5, booking_id=1))
+    await search_session.commit()
+
+    assert await dirty_salons(search_session) == {1, 2}
+
+    await apply_index(search_session)
+    user = await search_session.get(User, 2)
+    user.full_name = "Bruno Lima Santos"
+    await search_session.commit()
+
+    assert await dirty_salons(search_session) == {2}
+
+
+@pytest.mark.asyncio
+async def test_irrelevant_change_does_not_queue_salon(search_session):
+    """Changing a column the documents do not use leaves the queue alone."""
+    service = await search_session.get(Service, 1)
+    service.duration_minutes = 75
+    await search_session.commit()
+
+    assert await dirty_salons(search_session) == set()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_denormalises_catalog_and_ratings(search_session):
+    """Documents carry categories, price range and approved-review ratings."""
+    search_session.add_all([
+        make_review(1, 5, booking_id=1),
+        make_review(1, 4, booking_id=2),
+        make_review(1, 1, booking_id=3, status=ReviewStatus.PENDING),
+    ])
+    await search_session.commit()
+    await search_session.run_sync(lambda sync_session: rebuild_search_documents(sync_session, [1, 2]))
+    await search_session.commit()
+
+    document = await search_session.get(SalonSearchDocument, 1)
+    assert document.categories == ["hair"]
+    assert float(document.min_price) == 60.0
+    assert float(document.max_price) == 120.0
+    assert document.average_rating == 4.5
+    assert document.review_count == 2
+    assert "Corte feminino" in document.services_text
+    assert document.professionals_text == "Ana Souza coloração"
+
+
+@pytest.mark.asyncio
+async def test_search_filters_and_matches_text(search_session):
+    """Text, category, price and rating filters narrow the salons."""
+    search_session.add(make_review(2, 3, booking_id=1))
+    await search_session.commit()
+    await search_session.run_sync(lambda sync_session: rebuild_search_documents(sync_session, [1, 2]))
+    await search_session.commit()
+    service = SalonSearchService(search_session)
+
+    hits, total = await service.search()
+    assert total == 2
+
+    hits, total = await service.search(query="corte")
+    assert [hit.document.salon_id for hit in hits] == [1]
+
+    hits, total = await service.search(category="NAILS")
+    assert [hit.document.salon_id for hit in hits] == [2]
+
+    hits, total = await service.search(max_price=50)
+    assert [hit.document.salon_id for hit in hits] == [2]
+
+    hits, total = await service.search(min_rating=2)
+    assert [hit.document.salon_id for hit in hits] == [2]
+
+    hits, total = await service.search(city="campinas", limit=1)
+    assert total == 1
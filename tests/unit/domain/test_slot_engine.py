@@ -0,0 +1,101 @@
+"""Unit tests for the interval-based slot engine."""
+
+from datetime import date, datetime, time
+from unittest.mock import MagicMock
+
+from backend.app.db.models.availability import Availability
+from backend.app.db.models.booking import Booking
+from backend.app.domain.scheduling.services.slot_engine import (
+    FreeInterval,
+    booking_intervals,
+    build_time_slots,
+    compute_free_intervals,
+    merge_intervals,
+    slot_start_minutes,
+    subtract_intervals,
+)
+
+TARGET_DATE = date(2025, 10, 20)
+
+
+def make_availability(start: time, end: time) -> MagicMock:
+    """Create an availability window mock."""
+    availability = MagicMock(spec=Availability)
+    availability.start_time = start
+    availability.end_time = end
+    return availability
+
+
+def make_booking(scheduled_at: datetime, duration_minutes: int) -> MagicMock:
+    """Create a booking mock."""
+    booking = MagicMock(spec=Booking)
+    booking.scheduled_at = scheduled_at
+    booking.duration_minutes = duration_minutes
+    return booking
+
+
+def test_merge_intervals_joins_overlapping_and_touching():
+    """Overlapping and adjacent intervals collapse into one."""
+    merged = merge_intervals([(600, 660), (540, 600), (650, 700), (800, 830)])
+
+    assert merged == [(540, 700), (800, 830)]
+
+
+def test_booking_intervals_use_each_booking_duration():
+    """Busy intervals follow Booking.duration_minutes."""
+    bookings = [
+        make_booking(datetime(2025, 10, 20, 10, 0), 90),
+        make_booking(datetime(2025, 10, 20, 9, 0), 15),
+    ]
+
+    assert booking_intervals(bookings, TARGET_DATE) == [(540, 555), (600, 690)]
+
+
+def test_subtract_intervals_overlap_scenarios():
+    """Bookings at the edges, inside and spanning windows are all removed."""
+    windows = [(540, 720), (780, 1020)]
+    busy = [(500, 560), (600, 660), (700, 800), (1000, 1100)]
+
+    free = subtract_intervals(windows, busy)
+
+    assert free == [
+        FreeInterval(560, 600, 540),
+        FreeInterval(660, 700, 540),
+        FreeInterval(800, 1000, 780),
+    ]
+
+
+def test_slot_grid_is_anchored_at_window_start():
+    """Slots after a booking stay on the window's grid."""
+    free = [FreeInterval(555, 720, 540)]
+
+    # 9:15 free, 30-minute grid from 9:00 -> first slot at 9:30
+    assert slot_start_minutes(free, 60, 30) == [570, 600, 630, 660]
+
+
+def test_build_time_slots_mixed_duration_day():
+    """A 60-minute service around bookings of different lengths."""
+    availabilities = [make_availability(time(9, 0), time(13, 0))]
+    bookings = [
+        make_booking(datetime(2025, 10, 20, 9, 30), 45),
+        make_booking(datetime(2025, 10, 20, 11, 30), 30),
+    ]
+
+    free = compute_free_intervals(availabilities, bookings, TARGET_DATE)
+    slots = build_time_slots(TARGET_DATE, free, 60, 30)
+
+    assert [slot.start_time.time() for slot in slots] == [time(10, 30), time(12, 0)]
+    assert all(slot.available for slot in slots)
+    assert slots[0].end_time == datetime(2025, 10, 20, 11, 30)
+
+
+def test_build_time_slots_without_bookings_matches_window():
+    """An empty day yields every grid slot that fits the window."""
+    free = compute_free_intervals(
+        [make_availability(time(9, 0), time(17, 0))], [], TARGET_DATE
+    )
+
+    slots = build_time_slots(TARGET_DATE, free, 60, 30)
+
+    assert len(slots) == 15
+    assert slots[-1].end_time == datetime(2025, 10, 20, 17, 0)
@@ -8,6 +8,7 @@ import pytest
 from backend.app.db.models.availability import Availability, DayOfWeek
 from backend.app.db.models.booking import Booking, BookingStatus
 from backend.app.db.models.service import Service
+from backend.app.domain.scheduling.cache import AvailabilityCache
 from backend.app.domain.scheduling.services.slot_service import SlotService
 
 
@@ -19,8 +20,8 @@ def mock_session():
 
 @pytest.fixture
 def slot_service(mock_session):
-    """Create SlotService instance with mocked session."""
-    return SlotService(mock_session)
+    """Create SlotService instance with mocked session and an empty L1-only cache."""
+    return SlotService(mock_session, availability_cache=AvailabilityCache(redis_client=None))
 
 
 @pytest.fixture
@@ -133,6 +134,7 @@ async def test_calculate_available_slots_with_existing_booking(
     booking = MagicMock(spec=Booking)
     booking.id = 1
     booking.scheduled_at = datetime(2025, 10, 20, 10, 0)
+    booking.duration_minutes = 60
     booking.status = BookingStatus.CONFIRMED
 
     # Mock repositories
@@ -266,79 +268,138 @@ async def test_get_next_available_slot_found(
     slot_service, sample_service, sample_availability
 ):
     """Test finding the next available slot."""
-    # Mock repositories
-    slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
-
-    # First call returns slots
-    async def mock_calculate_slots(professional_id, target_date, service_id):
-        from backend.app.domain.scheduling.schemas import SlotResponse, TimeSlot
-
-        slots = [
-            TimeSlot(
-                start_time=datetime.combine(target_date, time(9, 0)),
-                end_time=datetime.combine(target_date, time(10, 0)),
-                available=True,
-            )
-        ]
-        return SlotResponse(
-            professional_id=professional_id,
-            date=target_date.isoformat(),
-            service_id=service_id,
-            service_duration_minutes=60,
-            slots=slots,
-            total_slots=1,
-        )
+    # Monday is fully booked, Tuesday has a free morning
+    tuesday_availability = MagicMock(spec=Availability)
+    tuesday_availability.professional_id = 1
+    tuesday_availability.day_of_week = DayOfWeek.TUESDAY
+    tuesday_availability.start_time = time(9, 0)
+    tuesday_availability.end_time = time(12, 0)
+
+    full_day_booking = MagicMock(spec=Booking)
+    full_day_booking.professional_id = 1
+    full_day_booking.scheduled_at = datetime(2025, 10, 20, 9, 0)
+    full_day_booking.duration_minutes = 480
 
-    slot_service.calculate_available_slots = AsyncMock(
-        side_effect=mock_calculate_slots
+    slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
+    slot_service.availability_repo.list_active_by_professional_ids = AsyncMock(
+        return_value=[sample_availability, tuesday_availability]
+    )
+    slot_service.booking_repo.list_by_professionals_and_date_range = AsyncMock(
+        return_value=[full_day_booking]
     )
-
-    from_date = date(2025, 10, 20)
 
     next_slot = await slot_service.get_next_available_slot(
         professional_id=1,
         service_id=1,
-        from_date=from_date,
+        from_date=date(2025, 10, 20),
     )
 
     assert next_slot is not None
-    assert next_slot.start_time == datetime(2025, 10, 20, 9, 0)
-    assert next_slot.end_time == datetime(2025, 10, 20, 10, 0)
+    assert next_slot.start_time == datetime(2025, 10, 21, 9, 0)
+    assert next_slot.end_time == datetime(2025, 10, 21, 10, 0)
 
 
 @pytest.mark.asyncio
 async def test_get_next_available_slot_not_found(slot_service, sample_service):
     """Test when no available slots are found within search window."""
-    # Mock repositories
     slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
-
-    # Always return empty slots
-    async def mock_calculate_slots(professional_id, target_date, service_id):
-        from backend.app.domain.scheduling.schemas import SlotResponse
-
-        return SlotResponse(
-            professional_id=professional_id,
-            date=target_date.isoformat(),
-            service_id=service_id,
-            service_duration_minutes=60,
-            slots=[],
-            total_slots=0,
-        )
-
-    slot_service.calculate_available_slots = AsyncMock(
-        side_effect=mock_calculate_slots
+    slot_service.availability_repo.list_active_by_professional_ids = AsyncMock(
+        return_value=[]
+    )
+    slot_service.booking_repo.list_by_professionals_and_date_range = AsyncMock(
+        return_value=[]
     )
-
-    from_date = date(2025, 10, 20)
 
     next_slot = await slot_service.get_next_available_slot(
         professional_id=1,
         service_id=1,
-        from_date=from_date,
+        from_date=date(2025, 10, 20),
         max_days_ahead=5,  # Search only 5 days
     )
 
     assert next_slot is None
+    slot_service.booking_repo.list_by_professionals_and_date_range.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_next_available_slot_loads_bookings_per_chunk(
+    slot_service, sample_service, sample_availability
+):
+    """Test that bookings are fetched once per search chunk, not once per day."""
+    slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
+    slot_service.availability_repo.list_active_by_professional_ids = AsyncMock(
+        return_value=[sample_availability]
+    )
+    slot_service.booking_repo.list_by_professionals_and_date_range = AsyncMock(
+        return_value=[]
+    )
+
+    # Starting on a Tuesday, the Monday window is six days away
+    next_slot = await slot_service.get_next_available_slot(
+        professional_id=1,
+        service_id=1,
+        from_date=date(2025, 10, 21),
+    )
+
+    assert next_slot.start_time == datetime(2025, 10, 27, 9, 0)
+    slot_service.service_repo.get_by_id.assert_awaited_once()
+    slot_service.availability_repo.list_active_by_professional_ids.assert_awaited_once()
+    slot_service.booking_repo.list_by_professionals_and_date_range.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_calculate_batch_slots_matrix(
+    slot_service, sample_service, sample_availability
+):
+    """Test batch slot calculation across professionals and dates."""
+    other_availability = MagicMock(spec=Availability)
+    other_availability.professional_id = 2
+    other_availability.day_of_week = DayOfWeek.MONDAY
+    other_availability.start_time = time(9, 0)
+    other_availability.end_time = time(11, 0)
+
+    booking = MagicMock(spec=Booking)
+    booking.professional_id = 2
+    booking.scheduled_at = datetime(2025, 10, 20, 9, 0)
+    booking.duration_minutes = 60
+
+    slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
+    slot_service.availability_repo.list_active_by_professional_ids = AsyncMock(
+        return_value=[sample_availability, other_availability]
+    )
+    slot_service.booking_repo.list_by_professionals_and_date_range = AsyncMock(
+        return_value=[booking]
+    )
+
+    result = await slot_service.calculate_batch_slots(
+        professional_ids=[1, 2],
+        start_date=date(2025, 10, 20),
+        end_date=date(2025, 10, 21),
+        service_id=1,
+        slot_interval_minutes=60,
+    )
+
+    cells = {(r.professional_id, r.date): r.total_slots for r in result.results}
+    assert cells == {
+        (1, "2025-10-20"): 8,
+        (1, "2025-10-21"): 0,
+        (2, "2025-10-20"): 1,
+        (2, "2025-10-21"): 0,
+    }
+    assert result.total_slots == 9
+    slot_service.booking_repo.list_by_professionals_and_date_range.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_calculate_batch_slots_invalid_range(slot_service):
+    """Test that an inverted date range is rejected."""
+    with pytest.raises(ValueError, match="end_date must be on or after start_date"):
+        await slot_service.calculate_batch_slots(
+            professional_ids=[1],
+            start_date=date(2025, 10, 21),
+            end_date=date(2025, 10, 20),
+            service_id=1,
+        )
 
 
 @pytest.mark.asyncio
@@ -366,43 +427,102 @@ async def test_generate_slots_respects_service_duration(
 
 
 @pytest.mark.asyncio
-async def test_filter_conflicting_slots_overlap_scenarios(slot_service):
-    """Test different overlap scenarios for conflict detection."""
-    from backend.app.domain.scheduling.schemas import TimeSlot
+async def test_calculate_available_slots_uses_booking_duration(
+    slot_service, sample_service, sample_availability
+):
+    """Test that existing bookings block their own duration, not the service's."""
+    # 90-minute booking at 10 AM and a 30-minute booking at 2 PM
+    long_booking = MagicMock(spec=Booking)
+    long_booking.scheduled_at = datetime(2025, 10, 20, 10, 0)
+    long_booking.duration_minutes = 90
 
-    service = MagicMock(spec=Service)
-    service.duration_minutes = 60
+    short_booking = MagicMock(spec=Booking)
+    short_booking.scheduled_at = datetime(2025, 10, 20, 14, 0)
+    short_booking.duration_minutes = 30
 
-    # Create test slots
-    slots = [
-        TimeSlot(
-            start_time=datetime(2025, 10, 20, 9, 0),
-            end_time=datetime(2025, 10, 20, 10, 0),
-            available=True,
-        ),
-        TimeSlot(
-            start_time=datetime(2025, 10, 20, 10, 0),
-            end_time=datetime(2025, 10, 20, 11, 0),
-            available=True,
-        ),
-        TimeSlot(
-            start_time=datetime(2025, 10, 20, 11, 0),
-            end_time=datetime(2025, 10, 20, 12, 0),
-            available=True,
-        ),
-    ]
-
-    # Create booking that conflicts with 10 AM slot
-    booking = MagicMock(spec=Booking)
-    booking.scheduled_at = datetime(2025, 10, 20, 10, 0)
+    slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
+    slot_service.availability_repo.list_active_by_professional_and_day = AsyncMock(
+        return_value=[sample_availability]
+    )
+    slot_service.booking_repo.list_by_professional_and_date = AsyncMock(
+        return_value=[long_booking, short_booking]
+    )
+
+    result = await slot_service.calculate_available_slots(
+        professional_id=1,
+        target_date=date(2025, 10, 20),
+        service_id=1,
+        slot_interval_minutes=30,
+    )
+
+    slot_times = [slot.start_time.time() for slot in result.slots]
+
+    # 10:00-11:30 is busy, so 11:00 is blocked but 11:30 is free
+    assert time(9, 0) in slot_times
+    assert time(9, 30) not in slot_times
+    assert time(11, 0) not in slot_times
+    assert time(11, 30) in slot_times
+
+    # 14:00-14:30 is busy, so 13:30 and 14:00 are blocked but 14:30 is free
+    assert time(13, 0) in slot_times
+    assert time(13, 30) not in slot_times
+    assert time(14, 0) not in slot_times
+    assert time(14, 30) in slot_times
+    assert result.total_slots == len(result.slots)
 
-    available = slot_service._filter_conflicting_slots(
-        slots=slots,
-        bookings=[booking],
-        service=service,
+
+@pytest.mark.asyncio
+async def test_calculate_available_slots_served_from_cache(
+    slot_service, sample_service, sample_availability
+):
+    """Test that repeated reads of the same day skip the database."""
+    slot_service.service_repo.get_by_id = AsyncMock(return_value=sample_service)
+    slot_service.availability_repo.list_active_by_professional_and_day = AsyncMock(
+        return_value=[sample_availability]
+    )
+    slot_service.booking_repo.list_by_professional_and_date = AsyncMock(
+        return_value=[]
+    )
+
+    first = await slot_service.calculate_available_slots(
+        professional_id=1, target_date=date(2025, 10, 20), service_id=1
     )
+    second = await slot_service.calculate_available_slots(
+        professional_id=1, target_date=date(2025, 10, 20), service_id=1
+    )
+
+    assert first.slots == second.slots
+    slot_service.availability_repo.list_active_by_professional_and_day.assert_awaited_once()
+    slot_service.booking_repo.list_by_professional_and_date.assert_awaited_once()
+
+    # Invalidating the day forces a recomputation
+    await slot_service.availability_cache.invalidate(1, [date(2025, 10, 20)])
+    await slot_service.calculate_available_slots(
+        professional_id=1, target_date=date(2025, 10, 20), service_id=1
+    )
+
+    assert slot_service.booking_repo.list_by_professional_and_date.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_professionals_free_after(slot_service, sample_availability):
+    """Only professionals with a long enough free stretch later that day are kept."""
+    afternoon_booking = MagicMock(spec=Booking)
+    afternoon_booking.professional_id = 1
+    afternoon_booking.scheduled_at = datetime(2025, 10, 20, 16, 0)
+    afternoon_booking.duration_minutes = 60
+
+    slot_service.availability_repo.list_active_by_professional_ids = AsyncMock(
+        return_value=[sample_availability]
+    )
+    slot_service.booking_repo.list_by_professionals_and_date_range = AsyncMock(
+        return_value=[afternoon_booking]
+    )
+
+    # Professional 1 is free 15:30-16:00; professional 2 does not work
+    after = datetime(2025, 10, 20, 15, 30)
+    assert await slot_service.list_professionals_free_after([1, 2], after, 30) == {1}
+    assert await slot_service.list_professionals_free_after([1, 2], after, 60) == set()
 
-    # Only 9 AM and 11 AM slots should be available
-    assert len(available) == 2
-    assert available[0].start_time == datetime(2025, 10, 20, 9, 0)
-    assert available[1].start_time == datetime(2025, 10, 20, 11, 0)
+    # Both answers came from one load of the day
+    slot_service.booking_repo.list_by_professionals_and_date_range.assert_awaited_once()
@@ -0,0 +1,62 @@
+"""Tests for the optimized report endpoints."""
+
+import inspect
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.app.api.v1.routes.optimized_reports import (
+    OptimizedDashboardMetrics,
+    get_optimized_dashboard_metrics,
+)
+from backend.app.db.models.user import UserRole
+from backend.app.domain.reporting import ViewFreshness
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reports_view_freshness():
+    """The dashboard carries the refresh time of booking_metrics_mv."""
+    freshness = ViewFreshness(
+        views=["booking_metrics_mv"],
+        refreshed_at=datetime(2025, 10, 20, 9, 0, tzinfo=timezone.utc),
+        age_seconds=300.0,
+        is_stale=False,
+    )
+    view_service = MagicMock()
+    view_service.get_booking_trend = AsyncMock(return_value=[{
+        "period": datetime(2025, 10, 20),
+        "total_bookings": 3,
+        "completed_bookings": 2,
+        "cancelled_bookings": 1,
+        "no_show_bookings": 0,
+        "revenue": 200.0,
+    }])
+    view_service.get_freshness = AsyncMock(return_value=freshness)
+
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(
+        fetchone=MagicMock(return_value=None),
+        fetchall=MagicMock(return_value=[]),
+    )
+
+    # Call the endpoint body, bypassing the report cache
+    endpoint = inspect.unwrap(get_optimized_dashboard_metrics)
+    with patch(
+        "backend.app.api.v1.routes.optimized_reports.ReportingViewService",
+        return_value=view_service,
+    ):
+        metrics = await endpoint(
+            start_date=datetime(2025, 10, 1),
+            end_date=datetime(2025, 10, 31),
+            salon_id=None,
+            current_user={"role": UserRole.ADMIN},
+            db=db,
+        )
+
+    view_service.get_freshness.assert_awaited_once_with("booking_metrics_mv")
+    assert isinstance(metrics, OptimizedDashboardMetrics)
+
+    body = metrics.model_dump(mode="json")
+    assert body["data_freshness"] == freshness.model_dump(mode="json")
+    assert body["booking_trend"][0]["total_bookings"] == 3
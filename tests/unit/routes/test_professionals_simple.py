@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from backend.app.main import app
 from backend.app.db.models.professional import Professional
+from backend.app.db.repositories.pagination import KeysetPage
 
 
 class TestProfessionalRoutesSimple:
@@ -39,7 +40,7 @@ class TestProfessionalRoutesSimple:
         """Test listing professionals for specific salon."""
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_salon_id.return_value = [mock_professional]
+        mock_repo.list_page.return_value = KeysetPage([mock_professional], total=1)
         mock_professional_repo_class.return_value = mock_repo
 
         # Make request
@@ -57,7 +58,7 @@ class TestProfessionalRoutesSimple:
         """Test listing professionals with empty result."""
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_salon_id.return_value = []
+        mock_repo.list_page.return_value = KeysetPage([], total=0)
         mock_professional_repo_class.return_value = mock_repo
 
         # Make request with salon_id to trigger repository call
@@ -69,16 +70,26 @@ class TestProfessionalRoutesSimple:
         assert "professionals" in data
         assert len(data["professionals"]) == 0
 
-    def test_list_professionals_without_filters(self, client):
+    @patch('backend.app.api.v1.routes.professionals.ProfessionalRepository')
+    def test_list_professionals_without_filters(self, mock_professional_repo_class, client, mock_professional):
         """Test listing professionals without any filters."""
+        # Mock repository
+        mock_repo = AsyncMock()
+        mock_repo.list_page.return_value = KeysetPage([mock_professional], next_cursor="abc", total=11)
+        mock_professional_repo_class.return_value = mock_repo
+
         # Make request without filters
         response = client.get("/api/v1/professionals/")
 
-        # Assert - should return empty list when no salon_id provided
+        # Assert - lists professionals of every salon
         assert response.status_code == 200
         data = response.json()
-        assert len(data["professionals"]) == 0
-        assert data["total"] == 0
+        assert len(data["professionals"]) == 1
+        assert data["total"] == 11
+        assert data["next_cursor"] == "abc"
+        mock_repo.list_page.assert_awaited_once_with(
+            salon_id=None, is_active=None, limit=10, cursor=None
+        )
 
     @patch('backend.app.api.v1.routes.professionals.ProfessionalRepository')
     def test_get_professional_by_id_success(self, mock_professional_repo_class, client, mock_professional):
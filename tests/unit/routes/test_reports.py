@@ -0,0 +1,140 @@
+"""Tests for the SQL aggregates behind the operational report endpoints."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.api.v1.routes.reports import (
+    _booking_filters,
+    _query_booking_metrics,
+    _query_daily_trends,
+    _query_professional_metrics,
+    _query_service_metrics,
+)
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from tests.conftest import create_sqlite_tables
+
+DAY = datetime(2025, 10, 20, 10, 0)
+PERIOD = (DAY - timedelta(days=7), DAY + timedelta(days=7))
+
+
+@pytest_asyncio.fixture
+async def report_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with two professionals and their bookings."""
+    await create_sqlite_tables(sqlite_engine, User, Professional, Service, Booking)
+
+    async with sqlite_engine.begin() as conn:
+        users = [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": name, "role": role, "is_active": True, "is_verified": True}
+            for user_id, name, role in [
+                (1, "Ana", UserRole.PROFESSIONAL),
+                (2, "Bruno", UserRole.PROFESSIONAL),
+                (10, "Client A", UserRole.CLIENT),
+                (11, "Client B", UserRole.CLIENT),
+            ]
+        ]
+        await conn.execute(insert(User), users)
+        await conn.execute(insert(Professional), [
+            {"id": 1, "user_id": 1, "salon_id": 1, "specialties": [], "is_active": True,
+             "commission_percentage": 50.0},
+            {"id": 2, "user_id": 2, "salon_id": 2, "specialties": [], "is_active": True,
+             "commission_percentage": 50.0},
+        ])
+        await conn.execute(insert(Service), [
+            {"id": 1, "salon_id": 1, "name": "Haircut", "duration_minutes": 60,
+             "price": 100, "category": "hair", "is_active": True, "requires_deposit": False},
+            {"id": 2, "salon_id": 1, "name": "Manicure", "duration_minutes": 30,
+             "price": 40, "category": "nails", "is_active": True, "requires_deposit": False},
+        ])
+
+        bookings = [
+            # professional, client, service, status, price, day offset
+            (1, 10, 1, BookingStatus.COMPLETED, 100, 0),
+            (1, 10, 1, BookingStatus.COMPLETED, 100, 1),
+            (1, 11, 2, BookingStatus.CANCELLED, 40, 1),
+            (2, 11, 2, BookingStatus.NO_SHOW, 40, 0),
+            (2, 10, 2, BookingStatus.CONFIRMED, 40, 0),
+            # Outside the period
+            (1, 10, 1, BookingStatus.COMPLETED, 100, 30),
+        ]
+        await conn.execute(insert(Booking), [
+            {"professional_id": pid, "client_id": cid, "service_id": sid, "status": st,
+             "service_price": price, "duration_minutes": 60,
+             "scheduled_at": DAY + timedelta(days=offset)}
+            for pid, cid, sid, st, price, offset in bookings
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_booking_metrics_counts_statuses_and_revenue(report_session):
+    """Status counts, rates and revenue come from one aggregate row."""
+    metrics = await _query_booking_metrics(report_session, _booking_filters(*PERIOD))
+
+    assert metrics.total_bookings == 5
+    assert metrics.completed_bookings == 2
+    assert metrics.cancelled_bookings == 1
+    assert metrics.no_show_bookings == 1
+    assert metrics.confirmed_bookings == 1
+    assert metrics.completion_rate == 40.0
+    assert metrics.total_revenue == 200.0
+    assert metrics.avg_booking_value == 100.0
+
+
+@pytest.mark.asyncio
+async def test_booking_metrics_filters_by_salon(report_session):
+    """The salon filter keeps only bookings of that salon's professionals."""
+    metrics = await _query_booking_metrics(
+        report_session, _booking_filters(*PERIOD, salon_id=2)
+    )
+
+    assert metrics.total_bookings == 2
+    assert metrics.total_revenue == 0.0
+    assert metrics.avg_booking_value is None
+
+
+@pytest.mark.asyncio
+async def test_professional_metrics_rank_by_revenue_with_repeat_clients(report_session):
+    """Per-professional rows include unique and repeat client counts."""
+    metrics = await _query_professional_metrics(report_session, _booking_filters(*PERIOD), 10)
+
+    assert [m.professional_id for m in metrics] == [1, 2]
+    top = metrics[0]
+    assert top.professional_name == "Ana"
+    assert top.total_bookings == 3
+    assert top.total_revenue == 200.0
+    assert top.unique_clients == 2
+    assert top.repeat_clients == 1
+    assert top.client_retention_rate == 50.0
+
+
+@pytest.mark.asyncio
+async def test_service_metrics_rank_by_bookings(report_session):
+    """Services are ordered by number of bookings in the period."""
+    metrics = await _query_service_metrics(report_session, _booking_filters(*PERIOD), 1)
+
+    assert len(metrics) == 1
+    assert metrics[0].service_name == "Manicure"
+    assert metrics[0].total_bookings == 3
+    assert metrics[0].avg_price == 40.0
+
+
+@pytest.mark.asyncio
+async def test_daily_trends_group_by_day(report_session):
+    """Trends contain one entry per day with bookings."""
+    revenue_trend, booking_trend = await _query_daily_trends(
+        report_session, _booking_filters(*PERIOD)
+    )
+
+    assert [point["date"] for point in revenue_trend] == ["2025-10-20", "2025-10-21"]
+    assert [point["revenue"] for point in revenue_trend] == [100.0, 100.0]
+    assert booking_trend[0]["total_bookings"] == 3
+    assert booking_trend[1]["cancelled_bookings"] == 1
@@ -5,8 +5,10 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 
+from backend.app.core.exceptions import ValidationError
 from backend.app.main import app
 from backend.app.db.models.service import Service
+from backend.app.db.repositories.pagination import KeysetPage
 
 
 class TestServicesRoutesSimple:
@@ -41,7 +43,7 @@ class TestServicesRoutesSimple:
         """Test listing services with empty result."""
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_salon_id.return_value = []
+        mock_repo.list_page.return_value = KeysetPage([], total=0)
         mock_service_repo_class.return_value = mock_repo
 
         # Make request with salon_id to trigger repository call
@@ -58,7 +60,7 @@ class TestServicesRoutesSimple:
         """Test listing services for specific salon."""
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_salon_id.return_value = [mock_service]
+        mock_repo.list_page.return_value = KeysetPage([mock_service], total=1)
         mock_service_repo_class.return_value = mock_repo
 
         # Make request
@@ -75,7 +77,7 @@ class TestServicesRoutesSimple:
         """Test listing services by salon and category."""
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_category.return_value = [mock_service]
+        mock_repo.list_page.return_value = KeysetPage([mock_service], total=1)
         mock_service_repo_class.return_value = mock_repo
 
         # Make request with both salon_id and category
@@ -86,25 +88,37 @@ class TestServicesRoutesSimple:
         data = response.json()
         assert len(data["services"]) == 1
         assert data["services"][0]["category"] == "hair"
+        mock_repo.list_page.assert_awaited_once_with(
+            salon_id=1, category="hair", is_active=None, limit=50, cursor=None
+        )
 
-    def test_list_services_without_filters(self, client):
+    @patch('backend.app.api.v1.routes.services.ServiceRepository')
+    def test_list_services_without_filters(self, mock_service_repo_class, client):
         """Test listing services without any filters."""
+        # Mock repository
+        mock_repo = AsyncMock()
+        mock_repo.list_page.return_value = KeysetPage([], total=0)
+        mock_service_repo_class.return_value = mock_repo
+
         # Make request without filters
         response = client.get("/api/v1/services/")
 
-        # Assert - should return empty list when no salon_id provided
+        # Assert - lists every service
         assert response.status_code == 200
         data = response.json()
         assert len(data["services"]) == 0
         assert data["total"] == 0
+        mock_repo.list_page.assert_awaited_once_with(
+            salon_id=None, category=None, is_active=None, limit=50, cursor=None
+        )
 
     @patch('backend.app.api.v1.routes.services.ServiceRepository')
     def test_list_services_pagination(self, mock_service_repo_class, client):
-        """Test services pagination."""
-        # Create multiple mock services
+        """Test services cursor pagination."""
+        # Create mock services for the first page
         now = datetime.now()
         mock_services = []
-        for i in range(5):
+        for i in range(3):
             service = Service(
                 id=i + 1,
                 salon_id=1,
@@ -120,49 +134,58 @@ class TestServicesRoutesSimple:
 
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_salon_id.return_value = mock_services
+        mock_repo.list_page.return_value = KeysetPage(mock_services, next_cursor="abc", total=5)
         mock_service_repo_class.return_value = mock_repo
 
         # Make request with pagination
-        response = client.get("/api/v1/services/?salon_id=1&page=1&page_size=3")
+        response = client.get("/api/v1/services/?salon_id=1&page_size=3&cursor=xyz")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
         assert len(data["services"]) == 3
         assert data["total"] == 5
-        assert data["page"] == 1
+        assert data["next_cursor"] == "abc"
         assert data["page_size"] == 3
+        mock_repo.list_page.assert_awaited_once_with(
+            salon_id=1, category=None, is_active=None, limit=3, cursor="xyz"
+        )
 
     @patch('backend.app.api.v1.routes.services.ServiceRepository')
     def test_list_services_filter_active(self, mock_service_repo_class, client):
         """Test filtering services by active status."""
-        # Create mock services with different active status
         now = datetime.now()
         active_service = Service(
             id=1, salon_id=1, name="Active Service",
             price=50.00, duration_minutes=60, is_active=True,
             requires_deposit=False, created_at=now, updated_at=now
         )
-        inactive_service = Service(
-            id=2, salon_id=1, name="Inactive Service",
-            price=60.00, duration_minutes=45, is_active=False,
-            requires_deposit=False, created_at=now, updated_at=now
-        )
 
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.list_by_salon_id.return_value = [active_service, inactive_service]
+        mock_repo.list_page.return_value = KeysetPage([active_service], total=1)
         mock_service_repo_class.return_value = mock_repo
 
         # Make request filtering for active services only
         response = client.get("/api/v1/services/?salon_id=1&is_active=true")
 
-        # Assert
+        # Assert - the filter is applied by the repository query
         assert response.status_code == 200
         data = response.json()
         assert len(data["services"]) == 1
         assert data["services"][0]["name"] == "Active Service"
+        assert mock_repo.list_page.await_args.kwargs["is_active"] is True
+
+    @patch('backend.app.api.v1.routes.services.ServiceRepository')
+    def test_list_services_invalid_cursor(self, mock_service_repo_class, client):
+        """Test a malformed cursor is rejected."""
+        mock_repo = AsyncMock()
+        mock_repo.list_page.side_effect = ValidationError("Invalid cursor", field="cursor")
+        mock_service_repo_class.return_value = mock_repo
+
+        response = client.get("/api/v1/services/?cursor=bogus")
+
+        assert response.status_code == 400
 
 
 class TestServiceCategoriesEndpoint:
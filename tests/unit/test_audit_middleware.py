@@ -0,0 +1,69 @@
+"""Unit tests for the ASGI audit middleware."""
+
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.app.middleware.audit import AuditMiddleware
+
+
+def make_client(**middleware_options):
+    """Application with a templated JSON route and a streaming route."""
+    app = FastAPI()
+
+    @app.post("/bookings/{booking_id}/notes")
+    async def add_note(booking_id: int, payload: dict):
+        return {"booking_id": booking_id, **payload}
+
+    @app.get("/exports/stream")
+    async def stream():
+        async def chunks():
+            for number in range(3):
+                yield f"line {number}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(AuditMiddleware, **middleware_options)
+    return TestClient(app)
+
+
+def test_audit_event_uses_route_template_and_path():
+    """The action is grouped by route template; the endpoint keeps the real path."""
+    sink_put = AsyncMock()
+    with patch("backend.app.middleware.audit.audit_sink.put", sink_put):
+        response = make_client(log_request_body=True, log_response_body=True).post(
+            "/bookings/42/notes?source=app", json={"note": "late"}
+        )
+
+    assert response.status_code == 200
+    row = sink_put.await_args.args[0]
+    assert row["action"] == "POST /bookings/{booking_id}/notes"
+    assert row["endpoint"] == "/bookings/42/notes"
+    assert row["resource_id"] == "42"
+    assert row["event_type"] == "booking_created"
+    assert row["event_metadata"]["query_params"] == {"source": "app"}
+    assert row["event_metadata"]["request_size"] > 0
+    assert row["event_metadata"]["response_size"] > 0
+
+
+def test_streaming_response_passes_through():
+    """Streaming bodies reach the client unchanged and are still audited."""
+    sink_put = AsyncMock()
+    with patch("backend.app.middleware.audit.audit_sink.put", sink_put):
+        response = make_client().get("/exports/stream")
+
+    assert response.text == "line 0\nline 1\nline 2\n"
+    row = sink_put.await_args.args[0]
+    assert row["action"] == "GET /exports/stream"
+    assert row["success"] == "success"
+
+
+def test_excluded_paths_are_not_audited():
+    """Health and documentation endpoints are skipped."""
+    sink_put = AsyncMock()
+    with patch("backend.app.middleware.audit.audit_sink.put", sink_put):
+        make_client().get("/docs")
+
+    sink_put.assert_not_awaited()
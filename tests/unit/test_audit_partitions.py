@@ -0,0 +1,84 @@
+"""Unit tests for the monthly partition helpers."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from backend.app.db.partitions import (
+    add_months,
+    drop_monthly_partitions_before,
+    ensure_monthly_partitions,
+    partition_bounds,
+    partition_month,
+    partition_name,
+)
+
+
+def test_partition_naming_and_bounds():
+    """Partitions are named after their month and cover it exactly."""
+    month = datetime(2026, 12, 17, 9, 30)
+
+    assert partition_name("audit_events", month) == "audit_events_y2026m12"
+    assert partition_bounds(month) == (datetime(2026, 12, 1), datetime(2027, 1, 1))
+    assert add_months(datetime(2026, 1, 1), -13) == datetime(2024, 12, 1)
+
+    assert partition_month("audit_events", "audit_events_y2026m12") == datetime(2026, 12, 1)
+    assert partition_month("audit_events", "audit_events_default") is None
+    assert partition_month("audit_events", "other_y2026m12") is None
+
+
+def test_ensure_creates_only_missing_months():
+    """The current month and months_ahead future months exist afterwards."""
+    db = MagicMock()
+
+    with patch(
+        "backend.app.db.partitions.list_partitions",
+        return_value=["audit_events_y2026m10", "audit_events_y2026m11"],
+    ):
+        created = ensure_monthly_partitions(db, "audit_events", 3, now=datetime(2026, 10, 16))
+
+    assert created == ["audit_events_y2026m12", "audit_events_y2027m01"]
+    statement = str(db.execute.call_args_list[0].args[0])
+    assert "PARTITION OF \"audit_events\"" in statement
+    assert "FROM ('2026-12-01T00:00:00') TO ('2027-01-01T00:00:00')" in statement
+
+
+def test_drop_only_fully_expired_months():
+    """A month is dropped only once all of it is older than the cutoff."""
+    db = MagicMock()
+    db.execute.return_value.scalar.return_value = 1200
+
+    with patch(
+        "backend.app.db.partitions.list_partitions",
+        return_value=["audit_events_y2025m08", "audit_events_y2025m09", "audit_events_y2025m10"],
+    ):
+        dropped = drop_monthly_partitions_before(db, "audit_events", datetime(2025, 10, 16))
+
+    assert dropped == [("audit_events_y2025m08", 1200), ("audit_events_y2025m09", 1200)]
+    statements = [str(call.args[0]) for call in db.execute.call_args_list]
+    assert 'ALTER TABLE "audit_events" DETACH PARTITION "audit_events_y2025m09"' in statements
+    assert 'DROP TABLE "audit_events_y2025m09"' in statements
+
+
+def test_ensure_moves_rows_out_of_the_default_partition():
+    """Rows of a new month parked in the default partition end up in it."""
+    db = MagicMock()
+    db.execute.return_value.scalar.return_value = True
+
+    with patch(
+        "backend.app.db.partitions.list_partitions",
+        return_value=["audit_events_default"],
+    ), patch(
+        "backend.app.db.partitions.insertable_columns",
+        return_value=["id", "timestamp"],
+    ):
+        created = ensure_monthly_partitions(db, "audit_events", 0, now=datetime(2026, 10, 16))
+
+    assert created == ["audit_events_y2026m10"]
+    statements = [str(call.args[0]) for call in db.execute.call_args_list]
+    assert statements[1].startswith('CREATE TEMPORARY TABLE "audit_events_y2026m10_moved"')
+    assert statements[2].startswith('DELETE FROM "audit_events_default"')
+    assert "PARTITION OF \"audit_events\"" in statements[3]
+    assert statements[4] == (
+        'INSERT INTO "audit_events" ("id", "timestamp") '
+        'SELECT "id", "timestamp" FROM "audit_events_y2026m10_moved"'
+    )
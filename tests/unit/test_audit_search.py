@@ -0,0 +1,79 @@
+"""Unit tests for ranked audit event search."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.db.models.audit_event import AuditEvent, AuditEventSeverity, AuditEventType
+from backend.app.db.repositories.audit_event import AuditEventRepository
+from tests.conftest import create_sqlite_tables
+
+START = datetime(2026, 10, 1, 12, 0)
+
+
+@pytest_asyncio.fixture
+async def audit_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with login and booking audit events."""
+    await create_sqlite_tables(sqlite_engine, AuditEvent)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(AuditEvent), [
+            {
+                "id": number,
+                "event_type": AuditEventType.LOGIN_FAILED if number % 2 else AuditEventType.BOOKING_CREATED,
+                "severity": AuditEventSeverity.MEDIUM,
+                "action": "POST /auth/login" if number % 2 else "POST /bookings",
+                "description": f"Event {number}",
+                "timestamp": START + timedelta(minutes=number),
+            }
+            for number in range(1, 8)
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_search_pages_follow_the_cursor(audit_session):
+    """Matches come newest first among equal ranks, page by page."""
+    repo = AuditEventRepository(audit_session)
+
+    first, total, is_estimate = await repo.search_events("login", limit=3)
+    assert [event.id for event in first] == [7, 5, 3]
+    assert (total, is_estimate) == (4, False)
+    assert first[0].search_rank == 0.0
+
+    second, total, _ = await repo.search_events("login", limit=3, cursor=first.next_cursor)
+    assert [event.id for event in second] == [1]
+    assert second.next_cursor is None
+    assert total is None
+
+
+@pytest.mark.asyncio
+async def test_search_filters_and_count_modes(audit_session):
+    """Date ranges narrow the matches and counting can be skipped or capped."""
+    repo = AuditEventRepository(audit_session)
+
+    page, total, _ = await repo.search_events(
+        "bookings",
+        start_date=START + timedelta(minutes=3),
+        count_mode="exact",
+    )
+    assert [event.id for event in page] == [6, 4]
+    assert total == 2
+
+    _, total, is_estimate = await repo.search_events("login", count_mode="none")
+    assert (total, is_estimate) == (None, False)
+
+
+@pytest.mark.asyncio
+async def test_search_count_is_capped(audit_session, monkeypatch):
+    """Past the cap the total is reported as an estimate."""
+    monkeypatch.setattr("backend.app.db.repositories.audit_event.SEARCH_COUNT_CAP", 2)
+    repo = AuditEventRepository(audit_session)
+
+    _, total, is_estimate = await repo.search_events("login")
+
+    assert (total, is_estimate) == (2, True)
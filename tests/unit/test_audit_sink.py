@@ -0,0 +1,128 @@
+"""Unit tests for the batched audit sink."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from backend.app.db.models.audit_event import AuditEvent, AuditEventSeverity, AuditEventType
+from backend.app.middleware.audit_sink import AuditSink, build_audit_row
+from tests.conftest import create_sqlite_tables
+
+
+class CountingSessionFactory:
+    """Session factory that counts the sessions (transactions) it opens."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.sessions = 0
+
+    def __call__(self):
+        self.sessions += 1
+        return self.factory()
+
+
+@pytest_asyncio.fixture
+async def session_factory(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite database with the audit_events table."""
+    await create_sqlite_tables(sqlite_engine, AuditEvent)
+
+    return CountingSessionFactory(sqlite_session_maker)
+
+
+def make_row(number: int) -> dict:
+    """Build a request audit row."""
+    return build_audit_row(
+        event_type=AuditEventType.BOOKING_CREATED,
+        action=f"POST /bookings/{number}",
+        metadata={"processing_time_ms": 1.0},
+        severity=AuditEventSeverity.LOW,
+        success="success",
+    )
+
+
+async def count_events(factory) -> int:
+    async with factory.factory() as session:
+        return await session.scalar(select(func.count()).select_from(AuditEvent))
+
+
+def test_build_audit_row_sets_every_column():
+    """Rows share one key set so that they can go into a multi-row INSERT."""
+    row = make_row(1)
+
+    assert set(row) == {c.name for c in AuditEvent.__table__.columns} - {"id"}
+    assert row["event_type"] == "booking_created"
+    assert row["event_metadata"] == {"processing_time_ms": 1.0}
+    assert row["timestamp"] is not None
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_in_batches(session_factory):
+    """Queued events are written with one transaction per batch."""
+    sink = AuditSink(session_factory, batch_size=10, flush_interval_seconds=0.05)
+
+    for number in range(25):
+        assert await sink.put(make_row(number))
+    await sink.stop()
+
+    assert await count_events(session_factory) == 25
+    assert session_factory.sessions == 3
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_interval(session_factory):
+    """An event does not wait for a full batch longer than the flush interval."""
+    sink = AuditSink(session_factory, batch_size=100, flush_interval_seconds=0.05)
+
+    await sink.put(make_row(1))
+    await asyncio.sleep(0.2)
+
+    assert await count_events(session_factory) == 1
+    await sink.stop()
+
+
+class BlockedSession:
+    """Session whose transaction never starts, like a saturated pool."""
+
+    async def __aenter__(self):
+        await asyncio.Event().wait()
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure_then_drops():
+    """Request events are dropped at once; explicit events wait for room first."""
+    sink = AuditSink(BlockedSession, max_queue_size=1, batch_size=1, put_timeout_seconds=0.05)
+
+    assert await sink.put(make_row(1)) is True
+    assert await sink.put(make_row(2)) is False
+
+    # The blocked writer takes row 1 off the queue, which makes room
+    assert await sink.put(make_row(3), wait=True) is True
+    assert await sink.put(make_row(4), wait=True) is False
+
+    sink._worker.cancel()
+
+
+@pytest.mark.asyncio
+async def test_write_errors_do_not_stop_the_sink(session_factory):
+    """A failed batch is dropped and later batches are still written."""
+    calls = []
+
+    def flaky_factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("database unavailable")
+        return session_factory()
+
+    sink = AuditSink(flaky_factory, batch_size=1, flush_interval_seconds=0.01)
+
+    await sink.put(make_row(1))
+    await asyncio.sleep(0.05)
+    await sink.put(make_row(2))
+    await sink.stop()
+
+    assert await count_events(session_factory) == 1
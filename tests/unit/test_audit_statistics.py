@@ -0,0 +1,85 @@
+"""Unit tests for single-pass audit statistics."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.db.models.audit_event import AuditEvent, AuditEventSeverity, AuditEventType
+from backend.app.db.repositories.audit_event import AuditEventRepository
+from tests.conftest import create_sqlite_tables
+
+START = datetime(2026, 10, 1, 12, 0)
+
+
+@pytest_asyncio.fixture
+async def audit_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with events of several users and types."""
+    await create_sqlite_tables(sqlite_engine, AuditEvent)
+
+    async with sqlite_engine.begin() as conn:
+        events = [
+            # (user_id, event_type, severity, success)
+            (1, AuditEventType.LOGIN, AuditEventSeverity.LOW, "success"),
+            (1, AuditEventType.LOGIN, AuditEventSeverity.LOW, "success"),
+            (1, AuditEventType.LOGIN_FAILED, AuditEventSeverity.MEDIUM, "failure"),
+            (2, AuditEventType.LOGIN, AuditEventSeverity.LOW, "success"),
+            (None, AuditEventType.RATE_LIMIT_EXCEEDED, AuditEventSeverity.HIGH, "failure"),
+            (None, AuditEventType.RATE_LIMIT_EXCEEDED, AuditEventSeverity.HIGH, "failure"),
+            (None, AuditEventType.RATE_LIMIT_EXCEEDED, AuditEventSeverity.HIGH, "failure"),
+        ]
+        await conn.execute(insert(AuditEvent), [
+            {
+                "user_id": user_id,
+                "event_type": event_type,
+                "severity": severity,
+                "success": success,
+                "action": event_type.value,
+                "timestamp": START + timedelta(minutes=number),
+            }
+            for number, (user_id, event_type, severity, success) in enumerate(events)
+        ])
+        # Outside the requested range
+        await conn.execute(insert(AuditEvent), [{
+            "user_id": 3,
+            "event_type": AuditEventType.LOGIN,
+            "severity": AuditEventSeverity.LOW,
+            "action": "login",
+            "timestamp": START - timedelta(days=1),
+        }])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_statistics_breakdowns(audit_session):
+    """Totals and every breakdown come from one grouped query."""
+    stats = await AuditEventRepository(audit_session).get_statistics(
+        start_date=START,
+        end_date=START + timedelta(hours=1),
+    )
+
+    assert stats["total_events"] == 7
+    assert stats["failed_events"] == 4
+    assert stats["success_rate"] == pytest.approx(3 / 7)
+    assert stats["events_by_type"] == {"login": 3, "rate_limit_exceeded": 3, "login_failed": 1}
+    assert list(stats["events_by_type"].values()) == [3, 3, 1]
+    assert stats["events_by_severity"] == {"low": 3, "high": 3, "medium": 1}
+    # Anonymous events are not a "user"
+    assert list(stats["top_users_by_activity"].items()) == [(1, 3), (2, 1)]
+
+
+@pytest.mark.asyncio
+async def test_statistics_of_empty_range(audit_session):
+    """An empty range reports zeros."""
+    stats = await AuditEventRepository(audit_session).get_statistics(
+        start_date=START + timedelta(days=1),
+        end_date=START + timedelta(days=2),
+    )
+
+    assert stats["total_events"] == 0
+    assert stats["failed_events"] == 0
+    assert stats["events_by_type"] == {}
+    assert stats["top_users_by_activity"] == {}
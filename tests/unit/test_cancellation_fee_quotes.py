@@ -0,0 +1,155 @@
+"""Tests for batch cancellation fee quotes."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.cancellation_policy import (
+    CancellationPolicy as CancellationPolicyModel,
+    CancellationPolicyStatus,
+    CancellationTier as CancellationTierModel,
+)
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from backend.app.db.repositories.booking import BookingRepository
+from backend.app.domain.policies.booking_cancellation import BookingCancellationService
+from backend.app.domain.policies.cancellation import CancellationContext
+from backend.app.domain.policies.registry import CancellationPolicyRegistry
+from tests.conftest import create_sqlite_tables
+
+NOW = datetime(2026, 10, 16, 12, 0)
+
+
+@pytest_asyncio.fixture
+async def quote_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with two salons, their policies and bookings."""
+    await create_sqlite_tables(
+        sqlite_engine, User, Salon, Professional, Service, CancellationPolicyModel,
+        CancellationTierModel, Booking,
+    )
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": f"User {user_id}", "role": role, "is_active": True, "is_verified": True}
+            for user_id, role in [
+                (1, UserRole.PROFESSIONAL), (2, UserRole.PROFESSIONAL),
+                (10, UserRole.CLIENT), (11, UserRole.CLIENT),
+            ]
+        ])
+        await conn.execute(insert(Salon), [
+            {"id": salon_id, "name": f"Salon {salon_id}", "cnpj": f"0000000000000{salon_id}",
+             "phone": "11999999999", "address_street": "Rua A", "address_number": "1",
+             "address_neighborhood": "Centro", "address_city": "São Paulo", "address_state": "SP",
+             "address_zipcode": "01000000", "is_active": True, "owner_id": salon_id}
+            for salon_id in (1, 2)
+        ])
+        await conn.execute(insert(Professional), [
+            {"id": salon_id, "user_id": salon_id, "salon_id": salon_id, "specialties": [],
+             "is_active": True, "commission_percentage": 50.0}
+            for salon_id in (1, 2)
+        ])
+        await conn.execute(insert(Service), [{
+            "id": 1, "salon_id": 1, "name": "Haircut", "duration_minutes": 60, "price": 100,
+            "category": "hair", "is_active": True, "requires_deposit": False,
+        }])
+        await conn.execute(insert(CancellationPolicyModel), [
+            {"id": 1, "name": "Platform", "status": CancellationPolicyStatus.ACTIVE,
+             "salon_id": None, "is_default": True, "effective_from": datetime(2025, 1, 1)},
+            {"id": 2, "name": "Salon 2", "status": CancellationPolicyStatus.ACTIVE,
+             "salon_id": 2, "is_default": False, "effective_from": datetime(2025, 1, 1)},
+        ])
+        await conn.execute(insert(CancellationTierModel), [
+            {"policy_id": 1, "name": "Early Bird", "advance_notice_hours": 72, "fee_type": "percentage",
+             "fee_value": 0, "allows_refund": True, "display_order": 1},
+            {"policy_id": 1, "name": "Standard", "advance_notice_hours": 24, "fee_type": "percentage",
+             "fee_value": 20, "allows_refund": True, "display_order": 2},
+            {"policy_id": 1, "name": "Last Minute", "advance_notice_hours": 2, "fee_type": "fixed",
+             "fee_value": 50, "allows_refund": True, "display_order": 3},
+            {"policy_id": 2, "name": "Flat", "advance_notice_hours": 0, "fee_type": "percentage",
+             "fee_value": 10, "allows_refund": True, "display_order": 1},
+        ])
+        await conn.execute(insert(Booking), [
+            {"id": booking_id, "client_id": client_id, "professional_id": professional_id,
+             "service_id": 1, "scheduled_at": NOW + timedelta(hours=hours_ahead), "status": status,
+             "service_price": price, "duration_minutes": 60}
+            for booking_id, client_id, professional_id, hours_ahead, status, price in [
+                (1, 10, 1, 100, BookingStatus.CONFIRMED, 100),
+                (2, 10, 1, 30, BookingStatus.CONFIRMED, 100),
+                (3, 10, 1, 1, BookingStatus.PENDING, 100),
+                (4, 10, 2, 5, BookingStatus.CONFIRMED, 200),
+                (5, 10, 1, 50, BookingStatus.CANCELLED, 100),
+                (6, 10, 1, -2, BookingStatus.CONFIRMED, 100),
+                (7, 11, 1, 100, BookingStatus.CONFIRMED, 100),
+            ]
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_batch_tier_lookup_matches_single_lookup(quote_session):
+    """Evaluating many contexts at once gives the per-context results."""
+    snapshot = await CancellationPolicyRegistry().snapshot(quote_session)
+    policy = snapshot.get(1)
+    notices = [-1, 0, 1.9, 2, 23.9, 24, 71, 72, 500]
+
+    assert policy.find_applicable_tiers(notices) == [policy.find_applicable_tier(hours) for hours in notices]
+
+    cancellation_time = NOW.replace(tzinfo=timezone.utc)
+    contexts = [
+        CancellationContext(
+            booking_id=index, scheduled_time=cancellation_time + timedelta(hours=hours),
+            cancellation_time=cancellation_time, service_price=Decimal("100"),
+            client_id=10, professional_id=1,
+        )
+        for index, hours in enumerate(notices)
+    ]
+    assert policy.evaluate_cancellations(contexts) == [
+        policy.evaluate_cancellation(context) for context in contexts
+    ]
+
+
+@pytest.mark.asyncio
+async def test_quote_cancellation_fees(quote_session):
+    """Each booking gets its fee, refund and deadline, or why it cannot be cancelled."""
+    service = BookingCancellationService(
+        BookingRepository(quote_session), AsyncMock(), CancellationPolicyRegistry(),
+    )
+
+    quotes = await service.quote_cancellation_fees(
+        [2, 1, 99, 3, 4, 5, 6, 7, 2], cancellation_time=NOW, client_id=10,
+    )
+
+    assert [quote['booking_id'] for quote in quotes] == [2, 1, 99, 3, 4, 5, 6, 7]
+    by_id = {quote['booking_id']: quote for quote in quotes}
+
+    now = NOW.replace(tzinfo=timezone.utc)
+    assert by_id[1]['fee_amount'] == 0 and by_id[1]['refund_amount'] == 100
+    assert by_id[1]['tier_name'] == "Early Bird"
+    assert by_id[1]['deadline'] == now + timedelta(hours=28)
+
+    assert by_id[2]['fee_amount'] == 20 and by_id[2]['refund_amount'] == 80
+    assert by_id[2]['advance_hours'] == 30
+    assert by_id[2]['deadline'] == now + timedelta(hours=6)
+
+    # Salon policy instead of the platform default
+    assert by_id[4]['policy_name'] == "Salon 2"
+    assert by_id[4]['fee_amount'] == 20 and by_id[4]['refund_amount'] == 180
+    assert by_id[4]['deadline'] == now + timedelta(hours=5)
+
+    assert {booking_id: quote['reason'] for booking_id, quote in by_id.items() if not quote['can_cancel']} == {
+        99: "Booking not found",
+        3: "Insufficient advance notice for cancellation",
+        5: "Booking already cancelled",
+        6: "Cannot cancel past bookings",
+        7: "Booking not found",  # another client's booking
+    }
@@ -0,0 +1,101 @@
+"""Tests for the in-memory cancellation policy registry."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.db.models.cancellation_policy import (
+    CancellationPolicy as CancellationPolicyModel,
+    CancellationPolicyStatus,
+    CancellationTier as CancellationTierModel,
+)
+from backend.app.db.models.salon import Salon  # noqa: F401 - FK target
+from backend.app.domain.policies.cancellation import CancellationPolicyService
+from backend.app.domain.policies.registry import CancellationPolicyRegistry
+from tests.conftest import create_sqlite_tables
+
+EFFECTIVE_FROM = datetime(2025, 1, 1)
+
+
+@pytest_asyncio.fixture
+async def policy_session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with a platform default and salon policies."""
+    await create_sqlite_tables(sqlite_engine, CancellationPolicyModel, CancellationTierModel)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(CancellationPolicyModel), [
+            {"id": 1, "name": "Platform", "status": CancellationPolicyStatus.ACTIVE,
+             "salon_id": None, "is_default": True, "effective_from": EFFECTIVE_FROM},
+            {"id": 2, "name": "Salon 5", "status": CancellationPolicyStatus.ACTIVE,
+             "salon_id": 5, "is_default": False, "effective_from": EFFECTIVE_FROM},
+            {"id": 3, "name": "Salon 6 draft", "status": CancellationPolicyStatus.DRAFT,
+             "salon_id": 6, "is_default": False, "effective_from": EFFECTIVE_FROM},
+        ])
+        await conn.execute(insert(CancellationTierModel), [
+            {"policy_id": 1, "name": "Early Bird", "advance_notice_hours": 72, "fee_type": "percentage",
+             "fee_value": 0, "allows_refund": True, "display_order": 1},
+            {"policy_id": 1, "name": "Standard", "advance_notice_hours": 24, "fee_type": "percentage",
+             "fee_value": 20, "allows_refund": True, "display_order": 2},
+            {"policy_id": 1, "name": "Last Minute", "advance_notice_hours": 2, "fee_type": "fixed",
+             "fee_value": 50, "allows_refund": True, "display_order": 3},
+            {"policy_id": 2, "name": "Flat", "advance_notice_hours": 0, "fee_type": "percentage",
+             "fee_value": 10, "allows_refund": True, "display_order": 1},
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_resolve_salon_then_platform_default(policy_session):
+    """A salon's active policy wins; drafts fall back to the default."""
+    snapshot = await CancellationPolicyRegistry().snapshot(policy_session)
+    now = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+
+    assert snapshot.resolve(5, now).name == "Salon 5"
+    assert snapshot.resolve(6, now).name == "Platform"
+    assert snapshot.resolve(None, now).name == "Platform"
+    assert snapshot.resolve(None, datetime(2024, 1, 1)) is None
+    assert snapshot.get(3).name == "Salon 6 draft"
+
+    platform = snapshot.get(1)
+    assert platform.find_applicable_tier(100).name == "Early Bird"
+    assert platform.find_applicable_tier(24).name == "Standard"
+    assert platform.find_applicable_tier(23.9).name == "Last Minute"
+    assert platform.find_applicable_tier(1) is None
+    assert platform.find_applicable_tier(30).calculate_fee(Decimal("100")) == Decimal("20")
+
+
+@pytest.mark.asyncio
+async def test_reload_on_version_change(policy_session):
+    """Snapshots are reused until the policy tables change."""
+    registry = CancellationPolicyRegistry(refresh_interval_seconds=3600)
+    first = await registry.snapshot(policy_session)
+
+    await policy_session.execute(insert(CancellationTierModel).values(
+        policy_id=2, name="Early", advance_notice_hours=48, fee_type="percentage",
+        fee_value=0, allows_refund=True, display_order=2,
+    ))
+
+    assert await registry.snapshot(policy_session) is first
+
+    registry.invalidate()
+    second = await registry.snapshot(policy_session)
+    assert second is not first
+    assert second.get(2).find_applicable_tier(50).name == "Early"
+
+    registry.invalidate()
+    assert await registry.snapshot(policy_session) is second
+
+
+@pytest.mark.asyncio
+async def test_policy_service_uses_registry(policy_session):
+    """The service resolves policies without querying per call."""
+    service = CancellationPolicyService(policy_session, registry=CancellationPolicyRegistry())
+
+    policy = await service.get_applicable_policy(salon_id=5, evaluation_time=datetime(2026, 10, 16))
+
+    assert policy.name == "Salon 5"
@@ -54,3 +54,90 @@ class TestTaskRegistry:
         # Check that celery app is configured
         assert celery_app is not None
         assert hasattr(celery_app, 'tasks')
+
+
+class TestReportingTasks:
+    """Test reporting materialized view refresh task."""
+
+    @staticmethod
+    def _run_refresh(lock_acquired=True, views=None):
+        from contextlib import contextmanager
+        from unittest.mock import patch
+
+        from backend.app.core.celery.tasks.reporting_tasks import refresh_materialized_views
+
+        db = Mock()
+        db.execute.return_value.scalar.return_value = lock_acquired
+
+        @contextmanager
+        def fake_sync_db():
+            yield db
+
+        with patch(
+            "backend.app.core.celery.tasks.reporting_tasks.get_sync_db", fake_sync_db
+        ):
+            result = refresh_materialized_views(views=views)
+
+        statements = [str(call.args[0]) for call in db.execute.call_args_list]
+        return result, statements, db
+
+    def test_refreshes_views_concurrently_and_records_time(self):
+        """Each view is refreshed concurrently and its refresh is recorded."""
+        result, statements, db = self._run_refresh(views=["booking_metrics_mv"])
+
+        assert "booking_metrics_mv" in result["refreshed"]
+        assert any(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY booking_metrics_mv" in sql
+            for sql in statements
+        )
+        assert any("report_view_refreshes" in sql for sql in statements)
+        db.commit.assert_called_once()
+
+    def test_skips_view_being_refreshed_elsewhere(self):
+        """A view whose advisory lock is held is skipped."""
+        result, statements, _ = self._run_refresh(
+            lock_acquired=False, views=["booking_metrics_mv"]
+        )
+
+        assert result["skipped"] == ["booking_metrics_mv"]
+        assert not any("REFRESH" in sql for sql in statements)
+
+    def test_rejects_unknown_view(self):
+        """Only known reporting views can be refreshed."""
+        result, statements, _ = self._run_refresh(views=["users; DROP TABLE users"])
+
+        assert result["failed"] == {"users; DROP TABLE users": "unknown view"}
+        assert statements == []
+
+    def test_refresh_is_scheduled_with_beat(self):
+        """The refresh task is part of the beat schedule."""
+        from backend.app.core.celery.app import celery_app
+
+        tasks = [entry["task"] for entry in celery_app.conf.beat_schedule.values()]
+        assert "reporting.refresh_materialized_views" in tasks
+
+    def test_apply_daily_rollups_drains_queue_in_batches(self):
+        """Claimed batches are rebuilt and committed until the queue is empty."""
+        from contextlib import contextmanager
+        from datetime import date
+        from unittest.mock import patch
+
+        from backend.app.core.celery.tasks.reporting_tasks import apply_daily_rollups
+
+        db = Mock()
+        batches = [[(date(2025, 10, 20), 1), (date(2025, 10, 21), 1)], [(date(2025, 10, 20), 2)], []]
+
+        @contextmanager
+        def fake_sync_db():
+            yield db
+
+        module = "backend.app.core.celery.tasks.reporting_tasks"
+        with patch(f"{module}.get_sync_db", fake_sync_db), \
+                patch(f"{module}.claim_rollup_days", side_effect=batches) as claim, \
+                patch(f"{module}.rebuild_rollups") as rebuild:
+            result = apply_daily_rollups(batch_size=2)
+
+        assert result == {"rebuilt_days": 3, "batches": 2}
+        assert claim.call_args.args == (db, 2)
+        assert rebuild.call_count == 2
+        assert db.commit.call_count == 2
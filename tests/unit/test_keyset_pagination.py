@@ -0,0 +1,118 @@
+"""Unit tests for keyset pagination of catalog and booking listings."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from backend.app.core.exceptions import ValidationError
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from backend.app.db.repositories.booking import BookingRepository
+from backend.app.db.repositories.pagination import decode_cursor, encode_cursor
+from backend.app.db.repositories.service import ServiceRepository
+from tests.conftest import create_sqlite_tables
+
+START = datetime(2025, 10, 20, 9, 0)
+
+
+@pytest_asyncio.fixture
+async def session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with one salon's catalog and bookings."""
+    # Every table: listed rows eager-load reviews, payments, etc.
+    await create_sqlite_tables(sqlite_engine)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": f"User {user_id}", "role": role, "is_active": True, "is_verified": True}
+            for user_id, role in [(1, UserRole.PROFESSIONAL), (10, UserRole.CLIENT)]
+        ])
+        await conn.execute(insert(Salon), [{
+            "id": 1, "name": "Salon One", "cnpj": "00000000000001", "phone": "11999999999",
+            "address_street": "Rua A", "address_number": "1", "address_neighborhood": "Centro",
+            "address_city": "São Paulo", "address_state": "SP", "address_zipcode": "01000000",
+            "is_active": True, "owner_id": 1,
+        }])
+        await conn.execute(insert(Professional), [{
+            "id": 1, "user_id": 1, "salon_id": 1, "specialties": [], "is_active": True,
+            "commission_percentage": 50.0,
+        }])
+        # Two services share a name so the id tie-breaker is exercised
+        await conn.execute(insert(Service), [
+            {"id": service_id, "salon_id": 1, "name": name, "duration_minutes": 60, "price": 100,
+             "category": category, "is_active": is_active, "requires_deposit": False}
+            for service_id, name, category, is_active in [
+                (1, "Coloring", "hair", True),
+                (2, "Haircut", "hair", True),
+                (3, "Haircut", "hair", True),
+                (4, "Manicure", "nails", True),
+                (5, "Perm", "hair", False),
+                (6, "Styling", "hair", True),
+            ]
+        ])
+        await conn.execute(insert(Booking), [
+            {"id": booking_id, "client_id": 10, "professional_id": 1, "service_id": 2,
+             "scheduled_at": START + timedelta(days=booking_id), "status": BookingStatus.COMPLETED,
+             "service_price": 100, "duration_minutes": 60}
+            for booking_id in range(1, 6)
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+def test_cursor_round_trip():
+    """Datetimes survive the opaque cursor and garbage is rejected."""
+    values = [datetime(2025, 10, 20, 9, 30, tzinfo=timezone.utc), 42]
+
+    assert decode_cursor(encode_cursor(values), 2) == values
+
+    with pytest.raises(ValidationError):
+        decode_cursor("not-a-cursor", 2)
+    with pytest.raises(ValidationError):
+        decode_cursor(encode_cursor([1]), 2)
+
+
+@pytest.mark.asyncio
+async def test_service_pages_are_filtered_in_sql(session):
+    """Pages follow (name, id) and only the first page carries a total."""
+    repo = ServiceRepository(session)
+
+    first = await repo.list_page(salon_id=1, category="hair", is_active=True, limit=2)
+    assert [service.id for service in first] == [1, 2]
+    assert first.total == 4
+    assert first.next_cursor is not None
+
+    second = await repo.list_page(
+        salon_id=1, category="hair", is_active=True, limit=2, cursor=first.next_cursor
+    )
+    assert [service.id for service in second] == [3, 6]
+    assert second.total is None
+    assert second.next_cursor is None
+
+    # A page holding every row needs no COUNT and has no next page
+    everything = await repo.list_page(limit=10)
+    assert everything.total == 6
+    assert everything.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_client_bookings_page_newest_first(session):
+    """Client bookings page by (scheduled_at, id) descending."""
+    repo = BookingRepository(session)
+
+    first = await repo.list_by_client_id(10, limit=3)
+    assert [booking.id for booking in first] == [5, 4, 3]
+    assert first.total == 5
+
+    second = await repo.list_by_client_id(10, limit=3, cursor=first.next_cursor)
+    assert [booking.id for booking in second] == [2, 1]
+    assert second.next_cursor is None
+
+    # Without a limit every booking is returned in one query
+    assert [booking.id for booking in await repo.list_by_client_id(10)] == [5, 4, 3, 2, 1]
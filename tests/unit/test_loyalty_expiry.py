@@ -0,0 +1,101 @@
+"""Unit tests for bulk loyalty points expiry."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from backend.app.db.models.loyalty import LoyaltyAccount, PointTransaction, PointTransactionType
+from backend.app.db.models.user import User, UserRole
+from backend.app.db.repositories.loyalty import LoyaltyRepository
+from backend.app.services.loyalty import LoyaltyService
+from tests.conftest import create_sqlite_tables
+
+NOW = datetime(2025, 10, 20, 3, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with three loyalty accounts."""
+    await create_sqlite_tables(sqlite_engine, User, LoyaltyAccount, PointTransaction)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": f"User {user_id}", "role": UserRole.CLIENT, "is_active": True,
+             "is_verified": True}
+            for user_id in (1, 2, 3)
+        ])
+        await conn.execute(insert(LoyaltyAccount), [
+            {"id": 1, "user_id": 1, "current_points": 500},
+            {"id": 2, "user_id": 2, "current_points": 150},
+            {"id": 3, "user_id": 3, "current_points": 300},
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+async def earn(session, account_id, points, expires_in_days):
+    """Add an earned transaction expiring relative to NOW."""
+    await session.execute(insert(PointTransaction), [{
+        "loyalty_account_id": account_id,
+        "transaction_type": PointTransactionType.EARNED,
+        "points_amount": points,
+        "balance_after": 0,
+        "expiry_date": NOW + timedelta(days=expires_in_days),
+    }])
+    await session.commit()
+
+
+def make_service(session):
+    return LoyaltyService(LoyaltyRepository(session), MagicMock(), MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_due_points_are_expired_across_accounts_in_chunks(session):
+    """Every due transaction is expired once, in keyset chunks, with ledger rows."""
+    await earn(session, 1, 100, expires_in_days=-30)
+    await earn(session, 1, 200, expires_in_days=-1)
+    await earn(session, 2, 100, expires_in_days=-10)
+    await earn(session, 3, 300, expires_in_days=10)
+
+    stats = await make_service(session).expire_all_points(now=NOW, chunk_size=2)
+
+    assert stats == {
+        "expired_accounts": 2,
+        "total_expired_points": 400,
+        "expired_transactions": 3,
+        "chunks": 2,
+    }
+
+    balances = dict((await session.execute(
+        select(LoyaltyAccount.id, LoyaltyAccount.current_points)
+    )).all())
+    assert balances == {1: 200, 2: 50, 3: 300}
+
+    ledger = (await session.execute(
+        select(PointTransaction.loyalty_account_id, PointTransaction.points_amount,
+               PointTransaction.balance_after)
+        .where(PointTransaction.transaction_type == PointTransactionType.EXPIRED)
+        .order_by(PointTransaction.id)
+    )).all()
+    assert ledger == [(1, -100, 400), (2, -100, 50), (1, -200, 200)]
+
+    # A second run finds nothing left to expire
+    again = await make_service(session).expire_all_points(now=NOW, chunk_size=2)
+    assert again["expired_transactions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_balance_never_goes_negative(session):
+    """Points already spent are not expired below zero."""
+    await earn(session, 2, 400, expires_in_days=-1)
+
+    stats = await make_service(session).expire_all_points(now=NOW)
+
+    assert stats["total_expired_points"] == 400
+    balance = await session.scalar(select(LoyaltyAccount.current_points).where(LoyaltyAccount.id == 2))
+    assert balance == 0
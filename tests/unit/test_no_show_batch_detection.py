@@ -0,0 +1,152 @@
+"""Tests for the batch no-show detection mode."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.job_checkpoint import JobCheckpoint
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.reporting_rollup import RollupDirtyDay
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from backend.app.jobs.no_show_detection import (
+    CHECKPOINT_JOB_NAME,
+    PHASE_COMPLETED,
+    PHASE_NOTIFYING,
+    NoShowDetectionJob,
+)
+from tests.conftest import create_sqlite_tables
+
+NOW = datetime.utcnow().replace(microsecond=0)
+
+
+@contextmanager
+def patched_notifications(notify):
+    """Replace the job's booking notification service."""
+    with patch("backend.app.jobs.no_show_detection.BookingNotificationService") as service_class:
+        service_class.return_value.notify_no_show_detected = notify
+        yield
+
+
+@pytest_asyncio.fixture
+async def session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with one professional and one client."""
+    await create_sqlite_tables(
+        sqlite_engine, User, Salon, Professional, Service, Booking, RollupDirtyDay,
+        JobCheckpoint,
+    )
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": f"User {user_id}", "role": role, "is_active": True, "is_verified": True}
+            for user_id, role in [(1, UserRole.PROFESSIONAL), (10, UserRole.CLIENT)]
+        ])
+        await conn.execute(insert(Salon), [{
+            "id": 1, "name": "Salon One", "cnpj": "00000000000001", "phone": "11999999999",
+            "address_street": "Rua A", "address_number": "1", "address_neighborhood": "Centro",
+            "address_city": "São Paulo", "address_state": "SP", "address_zipcode": "01000000",
+            "is_active": True, "owner_id": 1,
+        }])
+        await conn.execute(insert(Professional), [{
+            "id": 1, "user_id": 1, "salon_id": 1, "specialties": [], "is_active": True,
+            "commission_percentage": 50.0,
+        }])
+        await conn.execute(insert(Service), [{
+            "id": 1, "salon_id": 1, "name": "Haircut", "duration_minutes": 60, "price": 100,
+            "category": "hair", "is_active": True, "requires_deposit": False,
+        }])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+async def add_bookings(session, *specs):
+    """Add bookings given as (hours ago, status, price)."""
+    bookings = [
+        Booking(
+            professional_id=1, client_id=10, service_id=1, status=status,
+            service_price=price, duration_minutes=60,
+            scheduled_at=NOW - timedelta(hours=hours_ago),
+        )
+        for hours_ago, status, price in specs
+    ]
+    session.add_all(bookings)
+    await session.commit()
+    await session.execute(RollupDirtyDay.__table__.delete())
+    await session.commit()
+    return bookings
+
+
+@pytest.mark.asyncio
+async def test_batch_run_marks_eligible_bookings_and_notifies(session):
+    """Eligible bookings are marked with the policy fee, in batches, then notified."""
+    late, cheap, expensive, recent, completed = await add_bookings(
+        session,
+        (5, BookingStatus.CONFIRMED, 80),
+        (4, BookingStatus.IN_PROGRESS, 10),
+        (3, BookingStatus.CONFIRMED, 500),
+        (1, BookingStatus.CONFIRMED, 80),
+        (5, BookingStatus.COMPLETED, 80),
+    )
+    notify = AsyncMock()
+    job = NoShowDetectionJob(detection_window_hours=2, batch_size=2, notification_chunk_size=2)
+
+    with patched_notifications(notify):
+        stats = await job.run_batch(db_session=session)
+
+    assert stats["no_shows_detected"] == 3
+    assert stats["batches"] == 2
+    assert stats["notifications_sent"] == 3
+
+    rows = dict((await session.execute(
+        select(Booking.id, Booking.no_show_fee_amount).where(Booking.status == BookingStatus.NO_SHOW)
+    )).all())
+    # 50% of the price, clamped to the policy's 10-100 BRL
+    assert {k: float(v) for k, v in rows.items()} == {late.id: 40.0, cheap.id: 10.0, expensive.id: 100.0}
+
+    notified = [call.kwargs["booking_id"] for call in notify.await_args_list]
+    assert notified == [late.id, cheap.id, expensive.id]
+    assert notify.await_args_list[0].kwargs["no_show_reason"] == "client_no_show"
+
+    # The bulk UPDATE queues its rollup days itself
+    assert await session.scalar(select(RollupDirtyDay.professional_id)) == 1
+
+    checkpoint = await session.get(JobCheckpoint, CHECKPOINT_JOB_NAME)
+    assert checkpoint.phase == PHASE_COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_interrupted_run_is_resumed_from_checkpoint(session):
+    """A run that stopped while notifying continues after its cursor."""
+    first, second = await add_bookings(
+        session,
+        (5, BookingStatus.CONFIRMED, 80),
+        (4, BookingStatus.CONFIRMED, 80),
+    )
+    job = NoShowDetectionJob(detection_window_hours=2)
+
+    with patched_notifications(AsyncMock(side_effect=RuntimeError("broker down"))):
+        await job.run_batch(db_session=session)
+
+    # Simulate a crash after the first notification of an earlier run
+    checkpoint = await session.get(JobCheckpoint, CHECKPOINT_JOB_NAME)
+    run_time = checkpoint.run_started_at
+    checkpoint.phase = PHASE_NOTIFYING
+    checkpoint.cursor = first.id
+    await session.commit()
+
+    notify = AsyncMock()
+    with patched_notifications(notify):
+        stats = await job.run_batch(db_session=session)
+
+    assert stats["resumed"] is True
+    assert stats["run_started_at"] == run_time
+    assert stats["no_shows_detected"] == 0
+    assert [call.kwargs["booking_id"] for call in notify.await_args_list] == [second.id]
@@ -360,26 +360,16 @@ class TestNoShowService:
     @pytest.mark.asyncio
     async def test_get_no_show_statistics(self):
         """Test getting no-show statistics."""
-        # Setup bookings
-        booking1 = self.create_mock_booking(booking_id=1)  # Normal booking
-
-        booking2 = self.create_mock_booking(
-            booking_id=2,
-            marked_no_show_at=datetime.utcnow()
-        )
-        booking2.no_show_fee_amount = 25.0
-        booking2.no_show_reason = "client_no_show"
-
-        booking3 = self.create_mock_booking(
-            booking_id=3,
-            marked_no_show_at=datetime.utcnow()
-        )
-        booking3.no_show_fee_amount = 30.0
-        booking3.no_show_reason = "professional_no_show"
-
-        all_bookings = [booking1, booking2, booking3]
-
-        self.booking_repository.find_by_criteria.return_value = all_bookings
+        self.service.rollup_service = AsyncMock()
+        self.service.rollup_service.get_no_show_totals.return_value = {
+            "total_bookings": 3,
+            "no_show_bookings": 2,
+            "no_show_rate": 2 / 3 * 100,
+        }
+        self.service.rollup_service.get_no_show_reasons.return_value = {
+            "client_no_show": {"no_shows": 1, "fees": 25.0},
+            "professional_no_show": {"no_shows": 1, "fees": 30.0},
+        }
 
         stats = await self.service.get_no_show_statistics()
 
@@ -0,0 +1,159 @@
+"""Unit tests for the notification dispatcher."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from backend.app.db.models.notifications import (
+    NotificationChannel,
+    NotificationEventType,
+    NotificationLog,
+    NotificationPriority,
+    NotificationQueue,
+    NotificationStatus,
+    NotificationTemplate,
+)
+from backend.app.db.models.user import User, UserRole
+from backend.app.services.notification_dispatcher import ChannelLimit, NotificationDispatcher
+from backend.app.services.notifications import EmailHandler
+from tests.conftest import create_sqlite_tables
+
+
+class RecordingHandler(EmailHandler):
+    """Email handler that records sends and tracks concurrency."""
+
+    def __init__(self, fail_for=(), delay=0.0):
+        super().__init__()
+        self.fail_for = set(fail_for)
+        self.delay = delay
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+
+    async def send(self, recipient, subject, body, context):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if subject in self.fail_for:
+                raise ConnectionError("provider unavailable")
+            self.sent.append(subject)
+            return {"external_id": f"ext-{subject}", "provider_response": {"ok": True}}
+        finally:
+            self.active -= 1
+
+
+@pytest_asyncio.fixture
+async def session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with a user and an email template."""
+    await create_sqlite_tables(
+        sqlite_engine, User, NotificationTemplate, NotificationQueue, NotificationLog,
+    )
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": 1, "email": "client@example.com", "password_hash": "x", "full_name": "Client",
+             "role": UserRole.CLIENT, "is_active": True, "is_verified": True},
+            {"id": 2, "email": "not-an-email", "password_hash": "x", "full_name": "Broken",
+             "role": UserRole.CLIENT, "is_active": True, "is_verified": True},
+        ])
+        await conn.execute(insert(NotificationTemplate), [{
+            "id": 1, "name": "reminder_email", "event_type": NotificationEventType.BOOKING_REMINDER,
+            "channel": NotificationChannel.EMAIL, "body_template": "Reminder", "variables": {},
+        }])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+async def enqueue(session, subject, user_id=1, priority=NotificationPriority.NORMAL, delay=None):
+    """Queue an email notification, due now unless delayed."""
+    notification = NotificationQueue(
+        user_id=user_id, template_id=1, channel=NotificationChannel.EMAIL, priority=priority,
+        subject=subject, body="Reminder", context_data={},
+        scheduled_at=datetime.now(timezone.utc) + (delay or timedelta(seconds=-1)),
+    )
+    session.add(notification)
+    await session.commit()
+    return notification
+
+
+async def statuses(session):
+    rows = await session.execute(select(NotificationQueue.subject, NotificationQueue.status))
+    return dict(rows.all())
+
+
+@pytest.mark.asyncio
+async def test_due_notifications_are_sent_by_priority_and_logged(session):
+    """A batch is claimed most urgent first; statuses and logs are written in bulk."""
+    await enqueue(session, "low", priority=NotificationPriority.LOW)
+    await enqueue(session, "critical", priority=NotificationPriority.CRITICAL)
+    await enqueue(session, "high", priority=NotificationPriority.HIGH)
+    await enqueue(session, "later", delay=timedelta(hours=1))
+    handler = RecordingHandler()
+    dispatcher = NotificationDispatcher(
+        handlers={NotificationChannel.EMAIL: handler},
+        channel_limits={NotificationChannel.EMAIL: ChannelLimit(concurrency=1)},
+    )
+
+    stats = await dispatcher.dispatch_batch(session, limit=2)
+
+    assert stats == {"claimed": 2, "sent": 2, "retrying": 0, "failed": 0}
+    assert handler.sent == ["critical", "high"]
+
+    stats = await dispatcher.dispatch_batch(session)
+
+    assert stats["sent"] == 1
+    assert await statuses(session) == {
+        "low": NotificationStatus.SENT,
+        "critical": NotificationStatus.SENT,
+        "high": NotificationStatus.SENT,
+        "later": NotificationStatus.PENDING,
+    }
+    logs = (await session.execute(select(NotificationLog.external_id))).scalars().all()
+    assert sorted(logs) == ["ext-critical", "ext-high", "ext-low"]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_retried_with_backoff(session):
+    """Provider errors schedule a retry; unusable recipients fail at once."""
+    await enqueue(session, "flaky")
+    await enqueue(session, "bad-address", user_id=2)
+    dispatcher = NotificationDispatcher(
+        handlers={NotificationChannel.EMAIL: RecordingHandler(fail_for={"flaky"})},
+    )
+
+    stats = await dispatcher.dispatch_batch(session)
+
+    assert stats == {"claimed": 2, "sent": 0, "retrying": 1, "failed": 1}
+    flaky = await session.scalar(select(NotificationQueue).where(NotificationQueue.subject == "flaky"))
+    assert flaky.status == NotificationStatus.RETRYING
+    assert flaky.retry_count == 1
+    assert flaky.last_error == "provider unavailable"
+
+    # Only the provider attempt is logged
+    logged = (await session.execute(select(NotificationLog.status))).scalars().all()
+    assert logged == [NotificationStatus.FAILED]
+
+    # Not due again until the backoff expires
+    assert (await dispatcher.dispatch_batch(session))["claimed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_channel_concurrency_is_bounded(session):
+    """Sends of one channel never exceed its concurrency limit."""
+    for number in range(6):
+        await enqueue(session, f"n{number}")
+    handler = RecordingHandler(delay=0.01)
+    dispatcher = NotificationDispatcher(
+        handlers={NotificationChannel.EMAIL: handler},
+        channel_limits={NotificationChannel.EMAIL: ChannelLimit(concurrency=2, rate_per_second=1000)},
+    )
+
+    stats = await dispatcher.dispatch_batch(session)
+
+    assert stats["sent"] == 6
+    assert handler.max_active == 2
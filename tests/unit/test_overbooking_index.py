@@ -0,0 +1,115 @@
+"""Unit tests for the overbooking configuration index."""
+
+from datetime import datetime, time, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.db.models.overbooking import OverbookingScope, OverbookingTimeframe
+from backend.app.services.overbooking_index import (
+    CHANGES_CHANNEL,
+    OverbookingConfigIndex,
+    OverbookingConfigSnapshot,
+    ResolvedOverbookingConfig,
+)
+
+NOW = datetime(2025, 10, 20, 10, 0)
+
+
+def make_config(config_id, scope, scope_id=None, **overrides):
+    """Build a resolved configuration for a scope."""
+    values = dict(
+        id=config_id,
+        name=f"config {config_id}",
+        scope=scope,
+        salon_id=scope_id if scope == OverbookingScope.SALON else None,
+        professional_id=scope_id if scope == OverbookingScope.PROFESSIONAL else None,
+        service_id=scope_id if scope == OverbookingScope.SERVICE else None,
+        max_overbooking_percentage=20.0,
+        timeframe=OverbookingTimeframe.HOURLY,
+        start_time=None,
+        end_time=None,
+        min_historical_bookings=10,
+        historical_period_days=30,
+        min_no_show_rate=5.0,
+        max_no_show_rate=50.0,
+        effective_from=None,
+        effective_until=None,
+    )
+    values.update(overrides)
+    return ResolvedOverbookingConfig(**values)
+
+
+SNAPSHOT = OverbookingConfigSnapshot([
+    make_config(1, OverbookingScope.GLOBAL),
+    make_config(2, OverbookingScope.SALON, 10),
+    make_config(3, OverbookingScope.PROFESSIONAL, 20,
+                start_time=time(9, 0), end_time=time(12, 0)),
+    make_config(4, OverbookingScope.SERVICE, 30, effective_until=NOW - timedelta(days=1)),
+])
+
+
+def test_most_specific_scope_wins():
+    """Professional beats salon, which beats the global default."""
+    resolved = SNAPSHOT.resolve(salon_id=10, professional_id=20, check_datetime=NOW)
+    assert resolved.id == 3
+
+    assert SNAPSHOT.resolve(salon_id=10, professional_id=21, check_datetime=NOW).id == 2
+    assert SNAPSHOT.resolve(salon_id=11, check_datetime=NOW).id == 1
+
+
+def test_time_window_and_effective_period_fall_through():
+    """Configs outside their time window or effective period are skipped."""
+    evening = SNAPSHOT.resolve(
+        salon_id=10, professional_id=20, check_time=time(18, 0), check_datetime=NOW
+    )
+    assert evening.id == 2
+
+    expired_service = SNAPSHOT.resolve(salon_id=11, service_id=30, check_datetime=NOW)
+    assert expired_service.id == 1
+
+
+def test_aware_datetimes_are_compared_as_utc():
+    """Effective periods are naive UTC; aware check times are converted."""
+    snapshot = OverbookingConfigSnapshot([
+        make_config(1, OverbookingScope.SALON, 10, effective_from=NOW),
+    ])
+    just_before = (NOW - timedelta(minutes=1)).replace(tzinfo=timezone.utc)
+
+    assert snapshot.resolve(salon_id=10, check_datetime=just_before) is None
+    assert snapshot.resolve(salon_id=10, check_datetime=just_before + timedelta(minutes=2)).id == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_loaded_once_until_invalidated():
+    """Lookups reuse the snapshot; a published change forces one reload."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalars=MagicMock(return_value=[]))
+    redis = MagicMock()
+    redis.incr = AsyncMock(return_value=1)
+    redis.publish = AsyncMock()
+    index = OverbookingConfigIndex(redis_client=None)
+
+    for _ in range(5):
+        assert await index.get_effective_config(session, salon_id=10) is None
+    assert session.execute.await_count == 1
+
+    index.redis = redis
+    await index.publish_change()
+    await index.get_effective_config(session, salon_id=10)
+
+    assert session.execute.await_count == 2
+    redis.publish.assert_awaited_once_with(CHANGES_CHANNEL, 1)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_expires_by_age():
+    """Without notifications a snapshot is reloaded after max_age_seconds."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalars=MagicMock(return_value=[]))
+    index = OverbookingConfigIndex(redis_client=None, max_age_seconds=0)
+
+    await index.get_effective_config(session, salon_id=10)
+    await index.get_effective_config(session, salon_id=10)
+
+    assert session.execute.await_count == 2
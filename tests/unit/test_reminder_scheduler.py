@@ -0,0 +1,160 @@
+"""Unit tests for the booking reminder time wheel."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from backend.app.db.models.booking import Booking, BookingStatus
+from backend.app.db.models.booking_reminder import BookingReminder
+from backend.app.db.models.notifications import (
+    NotificationChannel,
+    NotificationEventType,
+    NotificationPreferences,
+    NotificationQueue,
+    NotificationStatus,
+    NotificationTemplate,
+)
+from backend.app.db.models.professional import Professional
+from backend.app.db.models.reporting_rollup import RollupDirtyDay
+from backend.app.db.models.salon import Salon
+from backend.app.db.models.service import Service
+from backend.app.db.models.user import User, UserRole
+from backend.app.services.reminder_scheduler import ReminderScheduler
+from backend.app.services.template_cache import CompiledTemplateCache
+from tests.conftest import create_sqlite_tables
+
+NOW = datetime(2025, 10, 20, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def session(sqlite_engine, sqlite_session_maker):
+    """In-memory SQLite session with a client opted in to SMS and push reminders."""
+    await create_sqlite_tables(
+        sqlite_engine, User, Salon, Professional, Service, Booking, RollupDirtyDay,
+        BookingReminder, NotificationPreferences, NotificationTemplate, NotificationQueue,
+    )
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "password_hash": "x",
+             "full_name": name, "role": role, "is_active": True, "is_verified": True}
+            for user_id, name, role in [(1, "Paula", UserRole.PROFESSIONAL), (10, "Ana", UserRole.CLIENT)]
+        ])
+        await conn.execute(insert(Salon), [{
+            "id": 1, "name": "Salon One", "cnpj": "00000000000001", "phone": "11999999999",
+            "address_street": "Rua A", "address_number": "1", "address_neighborhood": "Centro",
+            "address_city": "São Paulo", "address_state": "SP", "address_zipcode": "01000000",
+            "is_active": True, "owner_id": 1,
+        }])
+        await conn.execute(insert(Professional), [{
+            "id": 1, "user_id": 1, "salon_id": 1, "specialties": [], "is_active": True,
+            "commission_percentage": 50.0,
+        }])
+        await conn.execute(insert(Service), [{
+            "id": 1, "salon_id": 1, "name": "Haircut", "duration_minutes": 60, "price": 100,
+            "category": "hair", "is_active": True, "requires_deposit": False,
+        }])
+        await conn.execute(insert(NotificationPreferences), [
+            {"user_id": 10, "event_type": NotificationEventType.BOOKING_REMINDER,
+             "channel": channel, "enabled": enabled}
+            for channel, enabled in [
+                (NotificationChannel.SMS, True),
+                (NotificationChannel.PUSH, True),
+                (NotificationChannel.EMAIL, False),
+            ]
+        ])
+        await conn.execute(insert(NotificationTemplate), [
+            {"id": template_id, "name": f"booking_reminder_{channel.value}",
+             "event_type": NotificationEventType.BOOKING_REMINDER, "channel": channel,
+             "subject": None, "body_template": body, "variables": {}}
+            for template_id, channel, body in [
+                (1, NotificationChannel.SMS, "{{user_name}}: {{service_name}} {{reminder_period}}"),
+                (2, NotificationChannel.PUSH, "{{service_name}} às {{appointment_time}}"),
+            ]
+        ])
+
+    async with sqlite_session_maker() as session:
+        yield session
+
+
+async def add_booking(session, hours_ahead, status=BookingStatus.CONFIRMED):
+    """Add a booking scheduled hours_ahead from NOW."""
+    booking = Booking(
+        professional_id=1, client_id=10, service_id=1, status=status,
+        service_price=100, duration_minutes=60,
+        scheduled_at=NOW + timedelta(hours=hours_ahead),
+    )
+    session.add(booking)
+    await session.flush()
+    return booking
+
+
+async def reminder_offsets(session):
+    result = await session.execute(select(BookingReminder.minutes_before))
+    return sorted(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_schedule_stores_only_future_firing_times(session):
+    """Offsets already past are skipped and rescheduling replaces the entries."""
+    booking = await add_booking(session, hours_ahead=3)
+    scheduler = ReminderScheduler(session, templates=CompiledTemplateCache())
+
+    rows = await scheduler.schedule(booking, now=NOW)
+
+    assert [row["minutes_before"] for row in rows] == [120, 30]
+    assert await reminder_offsets(session) == [30, 120]
+
+    booking.scheduled_at = NOW + timedelta(days=2)
+    await scheduler.schedule(booking, now=NOW)
+    assert await reminder_offsets(session) == [30, 120, 1440]
+
+    await scheduler.cancel(booking.id)
+    assert await reminder_offsets(session) == []
+
+
+@pytest.mark.asyncio
+async def test_due_reminders_are_rendered_per_enabled_channel(session):
+    """Firing renders at fire time and queues one notification per channel."""
+    booking = await add_booking(session, hours_ahead=3)
+    scheduler = ReminderScheduler(session, templates=CompiledTemplateCache())
+    await scheduler.schedule(booking, now=NOW)
+    await session.commit()
+
+    stats = await scheduler.fire_due(now=NOW + timedelta(hours=1, minutes=1))
+
+    assert stats == {"claimed": 1, "stale": 0, "queued": 2}
+    assert await reminder_offsets(session) == [30]
+
+    result = await session.execute(
+        select(NotificationQueue.channel, NotificationQueue.body, NotificationQueue.status,
+               NotificationQueue.correlation_id)
+        .order_by(NotificationQueue.template_id)
+    )
+    assert result.all() == [
+        (NotificationChannel.SMS, "Ana: Haircut em 2 horas", NotificationStatus.PENDING,
+         f"booking_{booking.id}_reminder_120min"),
+        (NotificationChannel.PUSH, "Haircut às 15:00", NotificationStatus.PENDING,
+         f"booking_{booking.id}_reminder_120min"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stale_reminders_are_dropped_when_they_fire(session):
+    """Cancelled or moved bookings never produce a reminder."""
+    cancelled = await add_booking(session, hours_ahead=3)
+    moved = await add_booking(session, hours_ahead=3)
+    scheduler = ReminderScheduler(session, templates=CompiledTemplateCache())
+    await scheduler.schedule(cancelled, offsets=[120], now=NOW)
+    await scheduler.schedule(moved, offsets=[120], now=NOW)
+
+    cancelled.status = BookingStatus.CANCELLED
+    moved.scheduled_at = NOW + timedelta(hours=5)
+    await session.commit()
+
+    stats = await scheduler.fire_due(now=NOW + timedelta(hours=2))
+
+    assert stats == {"claimed": 2, "stale": 2, "queued": 0}
+    assert await reminder_offsets(session) == []
@@ -0,0 +1,92 @@
+"""Unit tests for the compiled notification template cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.core.exceptions import ValidationError
+from backend.app.db.models.notifications import (
+    NotificationChannel,
+    NotificationEventType,
+    NotificationTemplate,
+)
+from backend.app.services.notifications import NotificationService
+from backend.app.services.template_cache import CompiledTemplateCache
+
+UPDATED_AT = datetime(2025, 10, 20, 10, 0, tzinfo=timezone.utc)
+
+
+def make_template(template_id, body="Olá {{user_name}}", subject="Lembrete - {{salon_name}}"):
+    """Build a persisted-looking template."""
+    return NotificationTemplate(
+        id=template_id,
+        name=f"template_{template_id}",
+        event_type=NotificationEventType.BOOKING_REMINDER,
+        channel=NotificationChannel.SMS,
+        subject=subject,
+        body_template=body,
+        variables={},
+        updated_at=UPDATED_AT,
+    )
+
+
+def test_templates_are_compiled_once_per_version():
+    """Repeated lookups hit the cache; a new updated_at recompiles."""
+    cache = CompiledTemplateCache()
+    template = make_template(1)
+
+    first = cache.get(template)
+    assert cache.get(template) is first
+    assert cache.get_stats()["hits"] == 1
+
+    template.body_template = "Oi {{user_name}}"
+    template.updated_at = UPDATED_AT + timedelta(minutes=1)
+
+    assert cache.get(template).render({"user_name": "Ana"})["body"] == "Oi Ana"
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_least_recently_used_template_is_evicted():
+    """The cache never holds more than maxsize templates."""
+    cache = CompiledTemplateCache(maxsize=2)
+    one, two, three = make_template(1), make_template(2), make_template(3)
+
+    compiled_one = cache.get(one)
+    cache.get(two)
+    cache.get(one)
+    cache.get(three)
+
+    assert len(cache) == 2
+    assert cache.get(one) is compiled_one
+    cache.get(two)
+    assert cache.get_stats()["misses"] == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_render_and_update_invalidation():
+    """Batch rendering keeps context order; updating a template drops its entry."""
+    cache = CompiledTemplateCache()
+    template = make_template(1)
+    repo = MagicMock()
+    repo.update_template = AsyncMock(return_value=template)
+    service = NotificationService(repo, MagicMock(), templates=cache)
+
+    rendered = await service.render_template_batch(
+        template,
+        [{"user_name": "Ana", "salon_name": "Centro"}, {"user_name": "Bia", "salon_name": "Sul"}],
+    )
+
+    assert rendered == [
+        {"subject": "Lembrete - Centro", "body": "Olá Ana"},
+        {"subject": "Lembrete - Sul", "body": "Olá Bia"},
+    ]
+    assert len(cache) == 1
+
+    await service.update_template(1, body_template="Oi {{user_name}}")
+
+    repo.update_template.assert_awaited_once_with(1, body_template="Oi {{user_name}}")
+    assert len(cache) == 0
+
+    with pytest.raises(ValidationError):
+        await service.update_template(1, body_template="{% if %}")